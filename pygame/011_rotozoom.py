@@ -19,6 +19,7 @@ from __future__ import print_function, division
 
 import pygame
 import os
+from lib import rotocache # cached rotated images, see lib/rotocache.py
 
 try:
     # load from subfolder 'data'
@@ -38,6 +39,7 @@ speed = 60                       # in pixel / second
 angle = 0                        # current orientation of snake
 zoom = 1.0                       # current zoom factor
 zoomspeed = 0.01                   
+rotations = rotocache.RotationCache(360, smooth=True) # angle rounded to 1 degree, zoom to 1%
 turnspeed = 180                  # in Grad (360) per second
 screen.blit(background, (0,0))     # blit background on screen (overwriting all)
 screen.blit(snake, (snakex, snakey))  # blit the snake shape 
@@ -104,7 +106,7 @@ while mainloop:
         zoom *= zoomfactor 
         # the surface shrinks and zooms and moves by rotating
         oldrect = snake.get_rect() # store current surface rect
-        snake = pygame.transform.rotozoom(snake_original, angle, zoom)
+        snake = rotations.get(snake_original, angle, zoom=zoom)[0] # like pygame.transform.rotozoom
         newrect = snake.get_rect() # store new surface rect
         # put new surface rect center on same spot as old surface rect center
         snakex += oldrect.centerx - newrect.centerx
@@ -25,6 +25,7 @@ def game():
     import pygame
     import os
     import random
+    from lib import assets # loads each file only once, see lib/assets.py
 
 
     pygame.mixer.pre_init(44100, -16, 2, 2048) # setup mixer to avoid sound lag
@@ -400,8 +401,9 @@ def game():
 
     
     try: # load images into classes (class variable !). if not possible, draw ugly images
-        Bird.image.append(pygame.image.load(os.path.join("data","babytux.png")))
-        Bird.image.append(pygame.image.load(os.path.join("data","babytux_neg.png")))
+        data = assets.manager("data") # converted images, shared with the other games
+        Bird.image.append(data.image("babytux.png"))
+        Bird.image.append(data.image("babytux_neg.png"))
     except:
         print("no image files 'babytux.png' and 'babytux_neg.png' in subfolder 'data'")
         print("therfore drawing ugly sprites instead")
@@ -424,7 +426,7 @@ def game():
 
     
     try: # ------- load sound -------
-        cry = pygame.mixer.Sound(os.path.join('data','claws.ogg'))  #load sound
+        cry = assets.sound('claws.ogg', folder='data')  #load sound
     except:
         raise(SystemExit, "could not load sound claws.ogg from 'data'")
         #print"could not load sound file claws.ogg from folder data. no sound, sorry"
@@ -15,6 +15,7 @@ move the small babytux around with the keys w,a,s,d  and q and e
 fire with space, toggle gravity with g
 toggle collision detection with c
 Shoot on the giant monsters and watch the yellow impact "wounds"
+python 018_perfect_collision_detection.py --stats : print the hit rates of the text cache at exit
 
 works with python3.4 and python2.7
 """
@@ -22,11 +23,14 @@ works with python3.4 and python2.7
 #the next line is only needed for python2.x and not necessary for python3.x
 from __future__ import print_function, division
 
-def game(folder = "data"):
+def game(folder = "data", stats = False):
     import pygame
     import os
     import random
     import math 
+    from lib import textcache # cached fonts and text, see lib/textcache.py
+    from lib import rotocache # cached rotated images, see lib/rotocache.py
+    from lib import assets # loads and converts each file only once, see lib/assets.py
     #------ starting pygame -------------
     pygame.mixer.pre_init(44100, -16, 2, 2048) # setup mixer to avoid sound lag
     pygame.init()
@@ -41,11 +45,8 @@ def game(folder = "data"):
     GRAD = math.pi / 180 # 2 * pi / 360   # math module needs Radiant instead of Grad
     # ----------- functions -----------
     def write(msg="pygame is cool", color=(0,0,0)):
-        """write text into pygame surfaces"""
-        myfont = pygame.font.SysFont("None", 32)
-        mytext = myfont.render(msg, True, color)
-        mytext = mytext.convert_alpha()
-        return mytext
+        """write text into pygame surfaces. The returned surface is cached, do not paint on it"""
+        return textcache.render(msg, color, "None", 32)
     def getclassname(class_instance):
         """this function extract the class name of a class instance.
         For an instance of a XWing class, it will return 'Wing'."""
@@ -109,6 +110,7 @@ def game(folder = "data"):
         image=[]  # list of all images
         birds = {} # a dictionary of all Birds, each Bird has its own number
         number = 0  
+        rotations = rotocache.RotationCache(360, masks=True) # rotated images, shared by all Birds
         waittime = 1.0 # seconds
         def __init__(self, layer = 4 ):
             if getclassname(self) == "Monster":
@@ -287,10 +289,7 @@ def game(folder = "data"):
                 self.angle += self.rotatespeed
             if pressedkeys[pygame.K_d]: # right turn, clockwise
                 self.angle -= self.rotatespeed
-            self.oldcenter = self.rect.center
-            self.image = pygame.transform.rotate(self.image0, self.angle)
-            self.rect = self.image.get_rect()
-            self.rect.center = self.oldcenter
+            Bird.rotations.rotate_sprite(self) # cached image, rect and mask
             #--- calculate new position on screen -----
             self.rect.centerx = round(self.pos[0],0)
             self.rect.centery = round(self.pos[1],0)
@@ -377,6 +376,7 @@ def game(folder = "data"):
     class Bullet(Fragment):
         """a bullet flying in the direction of the BigBird's heading. May 
            be subject to gravity"""
+        rotations = rotocache.RotationCache(360, smooth=True) # rotozoomed images of all bullets
         def __init__(self, boss, dx, dy):
             self.color = (200,0,200)
             self.boss = boss
@@ -414,7 +414,7 @@ def game(folder = "data"):
                     self.angle = -90-math.atan(ratio)/math.pi*180.0 # in grad
                 else:
                     self.angle = 90-math.atan(ratio)/math.pi*180.0 # in grad
-            self.image = pygame.transform.rotozoom(self.image0,self.angle,1.0)
+            self.image = Bullet.rotations.get(self.image0, self.angle, ("bullet", self.color))[0]
             
     # ----------------- end of definitions ------------  
     # ----------------- background artwork -------------  
@@ -440,21 +440,19 @@ def game(folder = "data"):
 
     #-------------loading files from data subdirectory -------------------------------
     try: # load images into classes (class variable !). if not possible, draw ugly images
-        Bird.image.append(pygame.image.load(os.path.join(folder,"babytux.png")))
-        Bird.image.append(pygame.image.load(os.path.join(folder,"crossmonster.png")))
-        Bird.image.append(pygame.image.load(os.path.join(folder,"xmonster.png")))
+        data = assets.manager(folder) # images are already converted (all 3, not only 2)
+        Bird.image.append(data.image("babytux.png"))
+        Bird.image.append(data.image("crossmonster.png"))
+        Bird.image.append(data.image("xmonster.png"))
     except:
         raise(UserWarning, "could not load images from folder %s" % folder)
         # ------------
-    Bird.image[0] = Bird.image[0].convert_alpha()
-    Bird.image[1] = Bird.image[1].convert_alpha()
-    Bird.image[2] = Bird.image[2].convert_alpha()
     
     try: # ------- load sound -------
-        crysound = pygame.mixer.Sound(os.path.join(folder,'claws.ogg'))  #load sound
-        bombsound = pygame.mixer.Sound(os.path.join(folder,'bomb.ogg'))
-        lasersound = pygame.mixer.Sound(os.path.join(folder,'shoot.ogg'))
-        hitsound = pygame.mixer.Sound(os.path.join(folder,'beep.ogg'))
+        crysound = data.sound('claws.ogg')  #load sound
+        bombsound = data.sound('bomb.ogg')
+        lasersound = data.sound('shoot.ogg')
+        hitsound = data.sound('beep.ogg')
     except:
         print( "could not load one of the sound files from folder %s. no sound, sorry" %folder)
     # ------------- before the main loop ----------------------
@@ -574,6 +572,9 @@ def game(folder = "data"):
         allgroup.update(seconds)
         allgroup.draw(screen)           
         pygame.display.flip()         
+    if stats:
+        print(textcache.report()) # hit rates of font and text caches
 
 if __name__ == "__main__":
-    game()
+    import sys
+    game(stats = "--stats" in sys.argv)
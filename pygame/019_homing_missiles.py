@@ -11,6 +11,10 @@ licence: gpl, see http://www.gnu.org/licenses/gpl.html
 2 player can shoot at each other and/or at monster(s).
 2 types of homing missiles (can also be shot down)
 create new monsters with key m
+toggle the spatial hash broadphase for collision detection with key b
+toggle the sprite pools (reused fragments, smoke, bullets) with key p
+stress test: blow up 50 monsters at once with key x
+python 019_homing_missiles.py --stats : print the hit rates of the text cache and the sprite pools at exit
 
 works with python3.4 and python2.7
 """
@@ -18,11 +22,15 @@ works with python3.4 and python2.7
 #the next line is only needed for python2.x and not necessary for python3.x
 from __future__ import print_function, division
 
-def game(folder = "data"):
+def game(folder = "data", broadphase = True, pools = True, stats = False):
     import pygame
     import os
     import random
     import math 
+    from lib import spatialhash # uniform grid broadphase, see lib/spatialhash.py
+    from lib import textcache # cached fonts and text, see lib/textcache.py
+    from lib import rotocache # cached rotated images, see lib/rotocache.py
+    from lib import spritepool # reuse killed fragments, smoke and bullets, see lib/spritepool.py
     #------ starting pygame -------------
     pygame.mixer.pre_init(44100, -16, 2, 2048) # setup mixer to avoid sound lag
     pygame.init()
@@ -34,11 +42,8 @@ def game(folder = "data"):
     GRAD = math.pi / 180 # 2 * pi / 360   # math module needs Radiant instead of Grad
     # ----------- functions -----------
     def write(msg="pygame is cool", color=(0,0,0)):
-        """write text into pygame surfaces"""
-        myfont = pygame.font.SysFont("None", 32)
-        mytext = myfont.render(msg, True, color)
-        mytext = mytext.convert_alpha()
-        return mytext
+        """write text into pygame surfaces. The returned surface is cached, do not paint on it"""
+        return textcache.render(msg, color, "None", 32)
     def getclassname(class_instance):
         """this function extract the class name of a class instance.
         For an instance of a XWing class, it will return 'XWing'."""
@@ -189,6 +194,7 @@ def game(folder = "data"):
         image=[]  # list of all images
         gameobjects = {} # a dictionary of all GameObjects, each GameObject has its own number
         number = 0  
+        rotations = rotocache.RotationCache(360, masks=True) # rotated images, shared by all GameObjects
         #def __init__(self, pos, layer= 4, area=screenrect, areastop = False, areabounce = False, angle=0, speedmax = 500, friction = 0.95, lifetime = -1):
         def __init__(self, layer= 4, area=screenrect, areastop = False, areabounce = False, angle=0, speedmax = 500, friction = 0.95, lifetime = -1):
             #self.pos = pos
@@ -229,6 +235,7 @@ def game(folder = "data"):
         image=[]  # list of all images
         gameobjects = {} # a dictionary of all GameObjects, each GameObject has its own number
         number = 0  
+        rotations = rotocache.RotationCache(360, masks=True) # rotated images, shared by all GameObjects
         #def __init__(self, pos, layer= 4, area=screenrect, areastop = False, areabounce = False, angle=0, speedmax = 500, friction = 0.95, lifetime = -1):
         def __init__(self, layer= 4, area=screenrect, areastop = False, areabounce = False, angle=0, speedmax = 500, friction = 0.95, lifetime = -1):
             #self.pos = pos
@@ -311,10 +318,7 @@ def game(folder = "data"):
                     self.kill() # end of natural lifetime
             # --------- rotated ? -------------------
             if self.angle != self.oldangle:            
-                self.oldcenter = self.rect.center
-                self.image = pygame.transform.rotate(self.image0, self.angle)
-                self.rect = self.image.get_rect()
-                self.rect.center = self.oldcenter
+                GameObject.rotations.rotate_sprite(self) # cached image, rect and mask
                 self.oldangle = self.angle
 
             #----------moving ----------------
@@ -382,7 +386,7 @@ def game(folder = "data"):
         def kill(self):
             bombsound.play()
             for _ in range(self.frags):
-                RedFragment(self.pos)
+                RedFragment.pool.acquire(self.pos)
             GameObject.kill(self) # call parent method
         
         def get_target_nr(self):
@@ -411,36 +415,36 @@ def game(folder = "data"):
                     if pressedkeys[pygame.K_w]: # forward
                              self.ddx = -math.sin(self.angle*GRAD) 
                              self.ddy = -math.cos(self.angle*GRAD) 
-                             Smoke(self.rect.center, -self.ddx , -self.ddy )
+                             Smoke.pool.acquire(self.rect.center, -self.ddx , -self.ddy )
                     if pressedkeys[pygame.K_s]: # backward
                              self.ddx = +math.sin(self.angle*GRAD) 
                              self.ddy = +math.cos(self.angle*GRAD) 
-                             Smoke(self.rect.center, -self.ddx, -self.ddy )
+                             Smoke.pool.acquire(self.rect.center, -self.ddx, -self.ddy )
                     if pressedkeys[pygame.K_e]: # right side
                              self.ddx = +math.cos(self.angle*GRAD)
                              self.ddy = -math.sin(self.angle*GRAD)
-                             Smoke(self.rect.center, -self.ddx , -self.ddy )
+                             Smoke.pool.acquire(self.rect.center, -self.ddx , -self.ddy )
                     if pressedkeys[pygame.K_q]: # left side
                              self.ddx = -math.cos(self.angle*GRAD) 
                              self.ddy = +math.sin(self.angle*GRAD) 
-                             Smoke(self.rect.center, -self.ddx , -self.ddy )
+                             Smoke.pool.acquire(self.rect.center, -self.ddx , -self.ddy )
               elif self.playernumber == 1:
                     if pressedkeys[pygame.K_KP8]: # forward
                              self.ddx = -math.sin(self.angle*GRAD) 
                              self.ddy = -math.cos(self.angle*GRAD) 
-                             Smoke(self.rect.center, -self.ddx , -self.ddy )
+                             Smoke.pool.acquire(self.rect.center, -self.ddx , -self.ddy )
                     if pressedkeys[pygame.K_KP5] or pressedkeys[pygame.K_KP2]: # backward
                              self.ddx = +math.sin(self.angle*GRAD) 
                              self.ddy = +math.cos(self.angle*GRAD) 
-                             Smoke(self.rect.center, -self.ddx, -self.ddy )
+                             Smoke.pool.acquire(self.rect.center, -self.ddx, -self.ddy )
                     if pressedkeys[pygame.K_KP9]: # right side
                              self.ddx = +math.cos(self.angle*GRAD)
                              self.ddy = -math.sin(self.angle*GRAD)
-                             Smoke(self.rect.center, -self.ddx , -self.ddy )
+                             Smoke.pool.acquire(self.rect.center, -self.ddx , -self.ddy )
                     if pressedkeys[pygame.K_KP7]: # left side
                              self.ddx = -math.cos(self.angle*GRAD) 
                              self.ddy = +math.sin(self.angle*GRAD) 
-                             Smoke(self.rect.center, -self.ddx , -self.ddy )                        
+                             Smoke.pool.acquire(self.rect.center, -self.ddx , -self.ddy )                        
               # ------------shoot-----------------
               self.peacetime += seconds # increase peacetime if no shot was fired
               if self.cooldown > 0: # ------ can not shoot
@@ -451,7 +455,7 @@ def game(folder = "data"):
                             self.ddx = +math.sin(self.angle*GRAD)#recoil
                             self.ddy = +math.cos(self.angle*GRAD)
                             lasersound.play() # play sound
-                            Bullet(self, None, self.max_abberation )
+                            Bullet.pool.acquire(self, None, self.max_abberation )
                             self.peacetime = 0 # reset peacetime
                             self.cooldown = self.cooldowntime 
                             self.bullets_fired += 1
@@ -536,7 +540,7 @@ def game(folder = "data"):
         def kill(self):
             bombsound.play()
             for  _ in range(self.frags):
-                RedFragment(self.pos)
+                RedFragment.pool.acquire(self.pos)
             Monster.monsters.remove(self.number)
             GameObject.kill(self)
             
@@ -592,7 +596,7 @@ def game(folder = "data"):
                     pass # do not shoot
                 elif self.phase == "bullets":
                     if random.randint(1,2) == 1:
-                        Bullet(self, GameObject.rotate_toward_moving(self, self.targetdistancex, self.targetdistancey), self.max_abberation)
+                        Bullet.pool.acquire(self, GameObject.rotate_toward_moving(self, self.targetdistancex, self.targetdistancey), self.max_abberation)
                         self.bullets_fired += 1
                         self.firetime = 0.1
                 elif self.phase == "heavy rockets":
@@ -616,26 +620,37 @@ def game(folder = "data"):
             
             
     class Fragment(pygame.sprite.Sprite):
-        """generic Fragment class. """
+        """generic Fragment class. Fragments are reused: get a new one with
+           RedFragment.pool.acquire(...) instead of RedFragment(...),
+           kill() gives the Fragment back to the pool"""
         number = 0
-        def __init__(self, pos, layer = 9):
+        def __init__(self, layer = 9):
             self._layer = layer
-            pygame.sprite.Sprite.__init__(self, self.groups)
+            pygame.sprite.Sprite.__init__(self) # the groups are joined in reset
             self.pos = [0.0,0.0]
             self.fragmentmaxspeed = 200# try out other factors !
+            self.image = pygame.Surface((10,10), pygame.SRCALPHA) # transparent, painted again in each reset
+            self.image = self.image.convert_alpha()
+            self.rect = self.image.get_rect()
+            
+        def reset(self, pos):
             self.number = Fragment.number
             Fragment.number += 1
+            self.pos[0] = pos[0]
+            self.pos[1] = pos[1]
+            self.add(self.groups)
             
-        def init2(self):  # split the init method into 2 parts for better access from subclasses
-            self.image = pygame.Surface((10,10))
-            self.image.set_colorkey((0,0,0)) # black transparent
+        def init2(self):  # split the reset method into 2 parts for better access from subclasses
+            self.image.fill((0,0,0,0)) # clear the image of the last use
             self.fragmentradius = random.randint(2,5)
             pygame.draw.circle(self.image, self.color, (5,5), self.fragmentradius)
-            self.image = self.image.convert_alpha()
-            self.rect = self.image.get_rect()
             self.rect.center = self.pos #if you forget this line the sprite sit in the topleft corner
             self.time = 0.0
             
+        def kill(self):
+            pygame.sprite.Sprite.kill(self)
+            self.pool.release(self) # ready for the next acquire
+            
         def update(self, seconds):
             self.time += seconds
             if self.time > self.lifetime:
@@ -647,13 +662,15 @@ def game(folder = "data"):
     
     class RedFragment(Fragment):
         """explodes outward from (killed) sprite"""
-        def __init__(self,pos, stay = False):
+        def __init__(self):
             self.groups = allgroup, fragmentgroup, gravitygroup
-            Fragment.__init__(self,pos)
+            Fragment.__init__(self)
+            self.mass = 48.0
+            
+        def reset(self, pos, stay = False):
+            Fragment.reset(self, pos)
             self.stay = stay # if the Fragment stay still or moves
             self.color = (random.randint(25,255),0,0) # red            
-            self.pos[0] = pos[0]
-            self.pos[1] = pos[1]
             if self.stay:
                 self.dx = 0
                 self.dy = 0
@@ -662,18 +679,18 @@ def game(folder = "data"):
                 self.dy = random.randint(-self.fragmentmaxspeed,self.fragmentmaxspeed)
             self.lifetime = 0.5 + random.random() # max 1.5 seconds
             self.init2() # continue with generic Fragment class
-            self.mass = 48.0
             
     class Wound(Fragment):
         """yellow impact wound that shows the exact location of the hit"""
-        def __init__(self, pos, greenmin = 200, greenmax = 255 ):
+        def __init__(self):
+            self.groups = allgroup
+            Fragment.__init__(self, 7) # layer
+            
+        def reset(self, pos, greenmin = 200, greenmax = 255 ):
             self.greenmin = greenmin
             self.greenmax = greenmax
             self.color = ( random.randint(200,255), random.randint(self.greenmin,self.greenmax), random.randint(0,50))
-            self.groups = allgroup
-            Fragment.__init__(self, pos, 7) # layer
-            self.pos[0] = pos[0]
-            self.pos[1] = pos[1]
+            Fragment.reset(self, pos)
             self.lifetime = 1 + random.random()*2 # max 3 seconds
             Fragment.init2(self)
             self.dx = 0
@@ -681,23 +698,23 @@ def game(folder = "data"):
         
         def update(self,time):
             self.color = ( random.randint(200,255), random.randint(self.greenmin,self.greenmax), random.randint(0,50))
-            pygame.draw.circle(self.image, self.color, (5,5), self.fragmentradius)
-            self.image = self.image.convert_alpha()
+            pygame.draw.circle(self.image, self.color, (5,5), self.fragmentradius) # paint on the own image, no new surface
             Fragment.update(self, time)
             
     class Smoke(Fragment):
         """black exhaust indicating that the sprite is moved.
            Exhaust direction is inverse of players movement direction"""
-        def __init__(self, pos, dx, dy, colmin=1, colmax=50):
-           self.color = ( random.randint(colmin,colmax), random.randint(colmin,colmax), random.randint(colmin,colmax) )
+        def __init__(self):
            self.groups = allgroup
-           Fragment.__init__(self,pos, 3) # give startpos and layer 
-           self.pos[0] = pos[0]
-           self.pos[1] = pos[1]
-           self.lifetime = 0.25 + random.random()*0.5 # 
-           Fragment.init2(self)
+           Fragment.__init__(self, 3) # layer
            self.smokespeed = 120.0 # how fast the smoke leaves the Bird
            self.smokearc = .3 # 0 = thin smoke stream, 1 = 180 Degrees
+           
+        def reset(self, pos, dx, dy, colmin=1, colmax=50):
+           self.color = ( random.randint(colmin,colmax), random.randint(colmin,colmax), random.randint(colmin,colmax) )
+           Fragment.reset(self, pos) # give startpos
+           self.lifetime = 0.25 + random.random()*0.5 # 
+           Fragment.init2(self)
            arc = self.smokespeed * self.smokearc
            self.dx = dx * self.smokespeed + random.random()*2*arc - arc
            self.dy = dy * self.smokespeed + random.random()*2*arc - arc
@@ -705,8 +722,13 @@ def game(folder = "data"):
     class Bullet(GameObject):
         """a bullet flying in the direction of the boss sprite's facing.
            If shooting direction should be independent of boss sprite's facing,
-           angle can be given as argument"""
-        def __init__(self, boss, myangle = None, max_abberation = 5.5):
+           angle can be given as argument.
+           Bullets are reused: get a new one with Bullet.pool.acquire(boss, ...)"""
+        images = {} # bulletcolor: (image, mask), shared by all bullets of this color
+        def __init__(self):
+            pygame.sprite.Sprite.__init__(self) # the groups are joined in reset
+            
+        def reset(self, boss, myangle = None, max_abberation = 5.5):
             self.boss = boss
             if myangle is None:
                 myangle = self.boss.angle 
@@ -717,12 +739,16 @@ def game(folder = "data"):
             self.color = self.boss.bulletcolor
             self.groups = allgroup, bulletgroup, gravitygroup,projectilegroup
             self.lifetime = self.boss.bulletlifetime 
-            self.image = pygame.Surface((4,20))
-            self.image.set_colorkey((0,0,0)) # black transparent
-            pygame.draw.rect(self.image, self.color, (0,0,4,20) )
-            pygame.draw.rect(self.image, (10,0,0), (0,0,4,4)) # point
-            self.image = self.image.convert_alpha()
-            self.image0 = self.image.copy()
+            self.rotationkey = ("bullet", self.color) # all bullets of one color share rotated images
+            if self.color not in Bullet.images:
+                image = pygame.Surface((4,20))
+                image.set_colorkey((0,0,0)) # black transparent
+                pygame.draw.rect(image, self.color, (0,0,4,20) )
+                pygame.draw.rect(image, (10,0,0), (0,0,4,4)) # point
+                image = image.convert_alpha()
+                Bullet.images[self.color] = (image, pygame.mask.from_surface(image))
+            self.image0, self.mask = Bullet.images[self.color] # shared, never paint on it
+            self.image = self.image0
             self.rect = self.image.get_rect()
             self.pos = self.boss.pos[:]
             self.rect.centerx = round(self.pos[0],0)
@@ -736,6 +762,10 @@ def game(folder = "data"):
             self.mass = 50
             self.radius = self.rect.width / 2.0
             
+        def kill(self):
+            GameObject.kill(self)
+            Bullet.pool.release(self) # ready for the next acquire
+            
         def update(self, seconds):
             self.angle = GameObject.rotate_toward_moving(self)
             #GameObject.speedcheck(self)
@@ -746,6 +776,7 @@ def game(folder = "data"):
         """a rocket flying and steering toward a target
            type 1 is a haevy damage, slow-flying, sliding rocket
            type 2 is a light damage, fast-flying, direct seeking rocket"""
+        rotations = rotocache.RotationCache(360, masks=True, smooth=True) # rotozoomed images of all rockets
         def __init__(self, boss, targetnr, type=1, launchangle = 0):
             self.boss = boss
             if type == 1:   # --------heavy sliding missile ----------
@@ -773,6 +804,7 @@ def game(folder = "data"):
             self.target = GameObject.gameobjects[targetnr] # player ?
             self.type = type
             #---------- image --------------
+            self.rotationkey = ("rocket", self.size, self.color) # share rotated images
             self.image = pygame.Surface((self.size,20))
             self.image.set_colorkey((0,0,0)) # black transparent
             pygame.draw.rect(self.image, self.color, (0,0,self.size,20) )
@@ -797,7 +829,7 @@ def game(folder = "data"):
         def kill(self):
             #for _ in range(self.frags):
             #    RedFragment(self.pos)
-            Wound(self.pos, 0,50)
+            Wound.pool.acquire(self.pos, 0,50)
             GameObject.kill(self)
             
         def update(self, seconds):
@@ -824,18 +856,15 @@ def game(folder = "data"):
                 self.dx += self.ddx  #* self.speed
                 self.dy += self.ddy  #* self.speed
                 if random.randint(1,self.smokechance) ==1:
-                    Smoke(self.pos, -self.ddx * 2, -self.ddy * 2)
+                    Smoke.pool.acquire(self.pos, -self.ddx * 2, -self.ddy * 2)
             elif self.type == 2: #seeking
                 self.dx = self.ddx * self.speed
                 self.dy = self.ddy * self.speed
                 if random.randint(1, self.smokechance) ==1:
-                    Smoke(self.pos, -self.ddx, -self.ddy, 25, 75)
+                    Smoke.pool.acquire(self.pos, -self.ddx, -self.ddy, 25, 75)
             #----------- both ------------
             GameObject.speedcheck(self)
-            oldrect = self.rect.center
-            self.image = pygame.transform.rotozoom(self.image0,self.angle,1.0) 
-            self.rect = self.image.get_rect()   
-            self.rect.center = oldrect
+            Rocket.rotations.rotate_sprite(self) # cached image, rect and mask
             self.pos[0] += self.dx * seconds
             self.pos[1] += self.dy * seconds
             self.rect.centerx = round(self.pos[0],0)
@@ -847,7 +876,8 @@ def game(folder = "data"):
     background.blit(write("red player:  w,a,s,d,q,e fire: SPACE", (130,130,130)),(50,110))
     background.blit(write("blue player: Numpad 8,4,5,6,7,9 fire: 0", (130,130,130)),(50,140))
     background.blit(write("icrease # of rockets by not firing", (130,130,130)), (50, 170))
-    background.blit(write("ESC=quit, m=new monster o=more overtime", (130,130,130)), (50,200))
+    background.blit(write("ESC=quit, m=new monster o=more overtime b=broadphase", (130,130,130)), (50,200))
+    background.blit(write("p=sprite pools x=blow up 50 monsters", (130,130,130)), (50,230))
     background = background.convert()  # jpg can not have transparency
     screen.blit(background, (0,0))     # blit background on screen (overwriting all)
     #-----------------define sprite groups------------------------
@@ -860,6 +890,12 @@ def game(folder = "data"):
     projectilegroup = pygame.sprite.Group()
     # only the allgroup draws the sprite, so i use LayeredUpdates() instead Group()
     allgroup = pygame.sprite.LayeredUpdates() # more sophisticated, can draw sprites in layers 
+    # ---------- sprite pools: short-lived sprites made in advance and reused -----------
+    RedFragment.pool = spritepool.SpritePool(RedFragment, 3000, enabled = pools)
+    Smoke.pool = spritepool.SpritePool(Smoke, 300, enabled = pools)
+    Wound.pool = spritepool.SpritePool(Wound, 50, enabled = pools)
+    Bullet.pool = spritepool.SpritePool(Bullet, 100, enabled = pools)
+    spritepools = [RedFragment.pool, Smoke.pool, Wound.pool, Bullet.pool]
 
     #-------------loading files from data subdirectory -------------------------------
     try:
@@ -898,12 +934,21 @@ def game(folder = "data"):
     gametime = 360 # how long to play (seconds)
     playtime = 0  # how long the game was played
     gravity = False # gravity can be toggled
+    projectilehash = spatialhash.SpatialHash() # rebuilt each frame if broadphase is True
+    stresstime = 0.0 # seconds left to watch the frame times after key x
+    stresslongest = 0 # longest frame (milliseconds) since key x
     
         
     while mainloop:
         milliseconds = clock.tick(FPS)  # milliseconds passed since last frame
         seconds = milliseconds / 1000.0 # seconds passed since last frame
         playtime += seconds # keep track of playtime
+        if stresstime > 0: # measure the frames after the explosion of 50 monsters
+            stresslongest = max(stresslongest, milliseconds)
+            stresstime -= seconds
+            if stresstime <= 0:
+                print("50 monsters exploded, sprite pools %s: longest frame %i milliseconds" %
+                      ("on" if pools else "off", stresslongest))
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 mainloop = False # pygame window closed by user
@@ -912,6 +957,18 @@ def game(folder = "data"):
                     mainloop = False # user pressed ESC
                 elif event.key == pygame.K_g:
                     gravity = not gravity # toggle gravity
+                elif event.key == pygame.K_b:
+                    broadphase = not broadphase # toggle spatial hash
+                elif event.key == pygame.K_p:
+                    pools = not pools # toggle sprite pools
+                    for pool in spritepools:
+                        pool.set_enabled(pools)
+                elif event.key == pygame.K_x:
+                    for _ in range(50): # they all explode in this frame's update
+                        Monster((random.randint(100, screenrect.width - 100),
+                                 random.randint(100, screenrect.height - 100))).hitpoints = 0
+                    stresstime = 2.0
+                    stresslongest = 0
                 elif event.key == pygame.K_m:
                     warpsound.play()
                     Monster() # create a new monster
@@ -922,14 +979,20 @@ def game(folder = "data"):
         #---- new Monster ?
         #if random.randint(1,1000) == 1:
         #    Monster()
-        pygame.display.set_caption("Monster duel. FPS: %.2f"   % clock.get_fps())
+        pygame.display.set_caption("Monster duel. FPS: %.2f broadphase: %s sprite pools: %s" % (clock.get_fps(), broadphase, pools))
         if len(monstergroup) == 0:
             Player.duel = True
         else:
             Player.duel = False
             
+        if broadphase:
+            # sort all projectiles into grid cells, only projectiles sharing a cell are tested
+            projectilehash.rebuild(projectilegroup)
         for player in playergroup:  # test if a player crash into enemy bullet ... vamipr health stealing effect !
-            crashgroup = pygame.sprite.spritecollide(player, bulletgroup, False, pygame.sprite.collide_mask)
+            if broadphase:
+                crashgroup = projectilehash.spritecollide(player, bulletgroup, pygame.sprite.collide_mask)
+            else:
+                crashgroup = pygame.sprite.spritecollide(player, bulletgroup, False, pygame.sprite.collide_mask)
             for bullet in crashgroup: # this include friendly fire
                 if bullet.boss.playernumber != player.playernumber: # only care for unfriendly fire
                     if bullet.boss.number < 2:
@@ -937,7 +1000,7 @@ def game(folder = "data"):
                     player.hitpoints -= bullet.damage
                     bullet.boss.bullets_hit += 1
                     bullet.boss.hitpoints += 1 # shooter steals at least one hitpoint from victim. Vampire effect
-                    Wound(bullet.pos[:]) # pos, victim, move_with_victim = False
+                    Wound.pool.acquire(bullet.pos[:]) # pos, victim, move_with_victim = False
                     elastic_collision(bullet, player) # impact on player
                     bullet.kill()
             # player vs player
@@ -949,20 +1012,26 @@ def game(folder = "data"):
                 # no damage ?
         
             # test if player crash into enemy rocket
-            crashgroup = pygame.sprite.spritecollide(player, rocketgroup, False, pygame.sprite.collide_mask)
+            if broadphase:
+                crashgroup = projectilehash.spritecollide(player, rocketgroup, pygame.sprite.collide_mask)
+            else:
+                crashgroup = pygame.sprite.spritecollide(player, rocketgroup, False, pygame.sprite.collide_mask)
             for rocket in crashgroup:
                 #if projectile.physicnumber > crashbody.physicnumber: #avoid checking twice
                 if rocket.boss.playernumber != player.playernumber: # avoid friendly fire
                    impactsound.play()
                    player.hitpoints -= rocket.damage
                    rocket.boss.rockets_hit += 1
-                   Wound(rocket.pos[:])
+                   Wound.pool.acquire(rocket.pos[:])
                    elastic_collision(rocket, player)
                    rocket.kill()
         
         for projectile in projectilegroup:
             # rocket vs rocket vs bullet vs bullet
-            crashgroup = pygame.sprite.spritecollide(projectile, projectilegroup, False )
+            if broadphase:
+                crashgroup = projectilehash.spritecollide(projectile, projectilegroup)
+            else:
+                crashgroup = pygame.sprite.spritecollide(projectile, projectilegroup, False )
             for crashthing in crashgroup:
                 if projectile.number > crashthing.number:
                     if crashthing.boss.playernumber != projectile.boss.playernumber:
@@ -1024,6 +1093,11 @@ def game(folder = "data"):
         allgroup.update(seconds)
         allgroup.draw(screen)           
         pygame.display.flip()         
+    if stats:
+        print(textcache.report()) # hit rates of font and text caches
+        for pool in spritepools:
+            print(pool.report())
 
 if __name__ == "__main__":
-    game()
+    import sys
+    game(stats = "--stats" in sys.argv)
@@ -10,6 +10,12 @@ licence: gpl, see http://www.gnu.org/licenses/gpl.html
 the minimap displays tanks, traces and bullets even for elements
 currently not visible on the playfield.
 
+the bigmap is not one big surface but a ChunkMap: small chunks of the
+map are painted when they come near the screen, so the map can be very
+big (try bigmapwidth = bigmapheight = 20000), see lib/chunkmap.py
+python 022_minimap.py check : compare the chunks with one big surface of
+the whole bigmap, at many viewports
+
 works with python3.4 and python2.7
 """
 
@@ -19,6 +25,10 @@ from __future__ import print_function, division
 import pygame
 import random
 import math
+import sys
+from lib import rotocache # cached rotated images, see lib/rotocache.py
+from lib import chunkmap # bigmap in chunks, see lib/chunkmap.py
+from lib import radardots # many dots at once, see lib/radardots.py
 GRAD = math.pi / 180 # 2 * pi / 360   # math module needs Radiant instead of Grad
 
 class Config(object):
@@ -37,6 +47,9 @@ class Config(object):
     cornerpoint = [0,0] # left upper edge of visible screen rect inside bigmap
     radarmapwidth = 200
     radarmapheight = 150
+    radarfps = 0 # how often to repaint the radarmap per second, 0 means each frame
+    chunksize = 256 # side of one bigmap chunk in pixel
+    chunkbudget = 16 * 1024 * 1024 # maximum memory for bigmap chunks in bytes
 
 class Text(pygame.sprite.Sprite):
     """ a helper class to write text on the screen """
@@ -65,6 +78,7 @@ class Text(pygame.sprite.Sprite):
         
 class Bullet(pygame.sprite.Sprite):
     """ a big projectile fired by the tank's main cannon"""
+    rotations = rotocache.RotationCache(360) # rotated images of all bullets and tracers
     side = 7 # small side of bullet rectangle
     vel = 180 # velocity
     mass = 50
@@ -104,8 +118,7 @@ class Bullet(pygame.sprite.Sprite):
         pygame.draw.circle(image, (0,0,0), (int(Bullet.side * 1.5) , Bullet.side // 2) , 2) # point circle
         image.set_colorkey((128,128,128)) # grey transparent
         self.image0 = image.convert_alpha()
-        self.image = pygame.transform.rotate(self.image0, self.angle)
-        self.rect = self.image.get_rect()
+        self.image, self.rect, mask = Bullet.rotations.get(self.image0, self.angle, ("bullet", self.color))
         self.dx = math.cos(degrees_to_radians(self.boss.turretAngle)) * self.vel
         self.dy = math.sin(degrees_to_radians(-self.boss.turretAngle)) * self.vel
         
@@ -173,8 +186,7 @@ class Tracer(Bullet):
         pygame.draw.rect(image, (0,0,0), (Tracer.side * .75, 0, Tracer.side, Tracer.side // 4)) # red dot at front
         image.set_colorkey((128,128,128)) # grey transparent
         self.image0 = image.convert_alpha()
-        self.image = pygame.transform.rotate(self.image0, self.angle)
-        self.rect = self.image.get_rect()
+        self.image, self.rect, mask = Bullet.rotations.get(self.image0, self.angle, ("tracer", self.boss.color))
         if self.turret:
             # turret mg
             self.dx = math.cos(degrees_to_radians(self.boss.turretAngle)) * self.vel
@@ -198,22 +210,34 @@ class Radarmap(pygame.sprite.Sprite):
     """a classic radarmap of the bigmap, 
     to be displayed alsways in the upper right corner 
     of the screen. With colored dots for the tanks
-    and a rect for the visible screen area"""
+    and a rect for the visible screen area.
+    The map itself (static layer) is painted only once into self.static,
+    all bullet dots are painted together by radardots.paint_dots"""
     def __init__(self):
         pygame.sprite.Sprite.__init__(self, self.groups) # THE most important line !
-        self.image = pygame.Surface((Config.radarmapwidth, Config.radarmapheight))
+        self.static = pygame.Surface((Config.radarmapwidth, Config.radarmapheight))
         self.paintmap() # self image's color is not defined, therfore it remains black
+        self.static = self.static.convert()
+        self.image = self.static.copy()
         self.rect = self.image.get_rect()
         self.rect.topleft = (Config.width - Config.radarmapwidth, 0) # topleft is a pygame variable
         self.factorx = Config.radarmapwidth  * 1.0 / Config.bigmapwidth # 1.0 to force decimapl point calculation 
         self.factory = Config.radarmapheight *1.0 / Config.bigmapheight
+        self.cooldown = 0.0 # seconds until next repaint, if Config.radarfps > 0
         
     def paintmap(self):
-        self.image.fill((0,0,0))
-        pygame.draw.rect(self.image, (150,0,0), (0,0, Config.radarmapwidth, Config.radarmapheight),1)    
+        """paint the static layer: black map with red edge"""
+        self.static.fill((0,0,0))
+        pygame.draw.rect(self.static, (150,0,0), (0,0, Config.radarmapwidth, Config.radarmapheight),1)    
     
     def update(self, seconds):
-        self.paintmap() # redraw black map # outcomment for funny painting effect
+        if Config.radarfps > 0:
+            # repaint only Config.radarfps times per second, not each frame
+            self.cooldown -= seconds
+            if self.cooldown > 0:
+                return
+            self.cooldown = max(0.0, self.cooldown + 1.0 / Config.radarfps)
+        self.image.blit(self.static, (0,0)) # redraw black map # outcomment for funny painting effect
         # draw a withe rect to show the visible area of the bigmap
         pygame.draw.rect(self.image, (255,255,255), (round(Config.cornerpoint[0] * self.factorx,0),
                                                      round(Config.cornerpoint[1] * self.factory,0),
@@ -224,16 +248,15 @@ class Radarmap(pygame.sprite.Sprite):
             color = Tank.book[tanknumber].color
             pygame.draw.circle(self.image,color, (int(pos[0] * self.factorx),
                                                   int(pos[1] * self.factory)), 4 )
-        for bulletnumber in Bullet.book:
-            if Bullet.book[bulletnumber].tracer:
-                dotlength = 2 # bullets are rectangles with sidelength 4 (bullets) or 2 (tracer)
-            else:
-                dotlength = 4 # rect with length 1 is not visible
-            pos = Bullet.book[bulletnumber].pos
-            color = Bullet.book[bulletnumber].color
-            pygame.draw.rect(self.image, color,(int(pos[0] * self.factorx),
-                                                int(pos[1] * self.factory),
-                                                dotlength, dotlength))
+        # bullets are rectangles with sidelength 4 (bullets) or 2 (tracer)
+        # rect with length 1 is not visible. Painted in the order of Bullet.book
+        bullets = list(Bullet.book.values())
+        radardots.paint_dots(self.image,
+                             [bullet.pos[0] for bullet in bullets],
+                             [bullet.pos[1] for bullet in bullets],
+                             [bullet.color for bullet in bullets],
+                             [2 if bullet.tracer else 4 for bullet in bullets],
+                             self.factorx, self.factory)
     
 class Tank(pygame.sprite.Sprite):
     """ A Tank, controlled by the Player with Keyboard commands.
@@ -248,6 +271,7 @@ class Tank(pygame.sprite.Sprite):
     #maxrotate = 360 # maximum amount of degree the turret is allowed to rotate
     book = {} # a book of tanks to store all tanks
     number = 0 # each tank gets his own number
+    rotations = rotocache.RotationCache(360) # rotated images of all tanks
     # keys for tank control, expand if you need more tanks
     #          player1,        player2    etc
     firekey = (pygame.K_k, pygame.K_KP0)
@@ -350,8 +374,7 @@ class Tank(pygame.sprite.Sprite):
         # angle etc from Tank (boss)
         oldcenter = self.rect.center
         oldrect = self.image.get_rect() # store current surface rect
-        self.image  = pygame.transform.rotate(self.image0, self.tankAngle) 
-        self.rect = self.image.get_rect()
+        self.image, self.rect, mask = Tank.rotations.get(self.image0, self.tankAngle)
         self.rect.center = oldcenter 
         # if tank is rotating, turret is also rotating with tank !
         # -------- turret autorotate ----------
@@ -434,6 +457,7 @@ class Tank(pygame.sprite.Sprite):
      
 class Turret(pygame.sprite.Sprite):
     """turret on top of tank"""
+    rotations = rotocache.RotationCache(360) # rotated images of all turrets
     def __init__(self, boss):
         pygame.sprite.Sprite.__init__(self, self.groups) # THE most important line !
         self.boss = boss
@@ -460,8 +484,7 @@ class Turret(pygame.sprite.Sprite):
         # --------- rotating -------------
         # angle etc from Tank (boss)
         oldrect = self.image.get_rect() # store current surface rect
-        self.image  = pygame.transform.rotate(self.image, self.boss.turretAngle) 
-        self.rect = self.image.get_rect()
+        self.image, self.rect, mask = Turret.rotations.get(self.image, self.boss.turretAngle)
         # ---------- move with boss ---------
         self.rect = self.image.get_rect()
         self.rect.center = self.boss.rect.center
@@ -486,6 +509,26 @@ def radians_to_degrees(radians):
 def degrees_to_radians(degrees):
     return degrees * (math.pi / 180.0)
 
+def paint_bigmap(surface, area):
+    """paint the part of the bigmap inside area (a Rect) onto surface,
+       for chunkmap.ChunkMap. All coordinates are moved by -area.x, -area.y"""
+    dx, dy = -area.x, -area.y
+    surface.fill((128,128,128)) # fill grey 
+    # paint a grid of dark lines
+    for x in range(0,Config.bigmapwidth,Config.bigmapwidth//Config.xtiles): #start, stop, step
+        pygame.draw.line(surface, (64,64,64), (x+dx,dy), (x+dx,Config.bigmapheight+dy))
+    for y in range(0,Config.bigmapheight,Config.bigmapheight//Config.ytiles): #start, stop, step
+        pygame.draw.line(surface, (64,64,64), (dx,y+dy), (Config.bigmapwidth+dx,y+dy))
+    # red bigmap edge, 25 pixel wide. Four filled rects instead of pygame.draw.rect(..., 25):
+    # the thick rect is clipped differently in a small chunk at the border of the bigmap
+    edge = 25
+    for rect in ((0, 0, Config.bigmapwidth, edge), (0, Config.bigmapheight - edge, Config.bigmapwidth, edge),
+                 (0, 0, edge, Config.bigmapheight), (Config.bigmapwidth - edge, 0, edge, Config.bigmapheight)):
+        surface.fill((255,0,0), pygame.Rect(rect).move(dx, dy))
+    # paint thin red cross in the middle of the map
+    pygame.draw.line(surface, (200,0,0), (Config.bigmapwidth /2 + dx, dy),( Config.bigmapwidth / 2 + dx, Config.bigmapheight + dy),1)
+    pygame.draw.line(surface, (200,0,0), (dx, Config.bigmapheight/2 + dy),( Config.bigmapwidth + dx, Config.bigmapheight/2 + dy),1)
+
 def write(msg="pygame is cool"):
     """helper function for the Text sprite"""
     myfont = pygame.font.SysFont("None", 28)
@@ -498,28 +541,16 @@ def main():
     pygame.init()
     screen=pygame.display.set_mode((Config.width,Config.height)) 
     # note that "map" is an pygame function and can not be used as a name for a variable
-    bigmap = pygame.Surface((Config.bigmapwidth, Config.bigmapheight))
     # ----------------- create bigmap -------------------
-    bigmap.fill((128,128,128)) # fill grey 
-    # paint a grid of dark lines
-    for x in range(0,Config.bigmapwidth,Config.bigmapwidth//Config.xtiles): #start, stop, step
-        pygame.draw.line(bigmap, (64,64,64), (x,0), (x,Config.bigmapheight))
-    for y in range(0,Config.bigmapheight,Config.bigmapheight//Config.ytiles): #start, stop, step
-        pygame.draw.line(bigmap, (64,64,64), (0,y), (Config.bigmapwidth,y))
-    pygame.draw.rect(bigmap, (255,0,0), (0,0,Config.bigmapwidth, Config.bigmapheight), 25) # red bigmap edge
-    # paint thin red cross in the middle of the map
-    pygame.draw.line(bigmap, (200,0,0), (Config.bigmapwidth /2, 0),( Config.bigmapwidth / 2, Config.bigmapheight),1)
-    pygame.draw.line(bigmap, (200,0,0), (0, Config.bigmapheight/2),( Config.bigmapwidth , Config.bigmapheight/2),1)
-    bigmap = bigmap.convert()
-    # ------- background is a subsurface of bigmap ----------
+    # the chunks of the bigmap are painted by paint_bigmap when they are needed
+    bigmap = chunkmap.ChunkMap(Config.bigmapwidth, Config.bigmapheight, paint_bigmap,
+                               Config.chunksize, Config.chunkbudget)
+    # ------- background is the visible part of bigmap ----------
     background = pygame.Surface((screen.get_size()))
+    background = background.convert()
     backgroundrect = background.get_rect()
-    background = bigmap.subsurface((Config.cornerpoint[0],
-                                    Config.cornerpoint[1],
-                                    Config.width,
-                                    Config.height)) # take snapshot of bigmap
+    bigmap.draw(background, Config.cornerpoint) # take snapshot of bigmap
     # -----------------------------------
-    background = background.convert()
     screen.blit(background, (0,0)) # delete all
     clock = pygame.time.Clock()    # create pygame clock object
     FPS = Config.fps               # desired max. framerate 
@@ -604,15 +635,26 @@ def main():
         if scrollx == 0 and scrolly == 0:    # only necessery if there was no scrolling
             allgroup.clear(screen, background) # funny effect if you outcomment this line
         else:
-            background = bigmap.subsurface((Config.cornerpoint[0],
-                                            Config.cornerpoint[1],
-                                            Config.width,
-                                            Config.height)) # take snapshot of bigmap
+            bigmap.draw(background, Config.cornerpoint) # take snapshot of bigmap
             screen.blit(background, (0,0))
+        # paint some chunks near the screen now, before scrolling needs them
+        bigmap.prefetch(Config.cornerpoint, (Config.width, Config.height))
         allgroup.update(seconds) 
         allgroup.draw(screen)
         pygame.display.flip() # flip the screen 30 times a second
     return 0
 
+def check():
+    """compare the ChunkMap of the bigmap with one big surface of the whole bigmap"""
+    pygame.init()
+    screen = pygame.display.set_mode((Config.width, Config.height))
+    wrong = chunkmap.check(Config.bigmapwidth, Config.bigmapheight, paint_bigmap,
+                           Config.chunksize, (Config.width, Config.height))
+    print("chunks and bigmap differ at %i viewports %s" % (len(wrong), wrong[:5]))
+    pygame.quit()
+    return not wrong
+
 if __name__ == '__main__':
+    if sys.argv[1:] == ["check"]:
+        sys.exit(0 if check() else 1)
     main()
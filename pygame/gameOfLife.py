@@ -5,11 +5,14 @@
 # game by Horst JENS http://ThePythonGameBook
 # bug hunting & making thinks work by yipyip
 # license: gpl, see http://www.gnu.org/licenses/gpl.html
+# the playfield is calculated by an engine from lib/lifeengine.py,
+# press e to switch to the next engine while the game is running
 
 
 import pygame
 import sys
 import random
+from lib import lifeengine
 
 #from pygame.locals import *
 
@@ -21,7 +24,7 @@ pygame.display.set_caption("Conway's Game of Life")
 
 msg = "Conway's Game of Life"
 fontObj = pygame.font.Font("freesansbold.ttf", 32)
-msg2 = "right click: toggle pause mode. left click while in pause mode: paint"
+msg2 = "right click: toggle pause mode. left click while in pause mode: paint. e: next engine"
 fontObj2 = pygame.font.Font("freesansbold.ttf", 14)
 
 screen.fill((255,255,255)) # white
@@ -29,10 +32,6 @@ ymove = 50 # move playfield down to have room for text
 
 
 
-cellA = {} # the playfield
-#cellB = {}
-#cellC = {}
-
 maxX = 150 # maximum lenght of x dimension
 maxY = 100 # maximum lenght of y dimension
 
@@ -47,92 +46,15 @@ msgRectobj2 = helpTextObj.get_rect()
 msgRectobj2.topleft = (10, ymove + maxY*4 + 10)
 screen.blit(helpTextObj, msgRectobj2)
 
-# pxSurfaceObj = pygame.surface.Surface((maxX, maxY))
-
-#create 100 x 100 cells
-# with random value
-for x in range(maxX):    
-    for y in range(maxY):
-        cellA[x, y] = 0 # clean all
-
-# make a copy of cellA
-#cellB = cellA.copy() # full copy of clean
-#cellC = cellA.copy() # a clean copy
-
-for x in range(maxX):
-    for x in range(maxX):
-        for y in range(maxY):
-            cellA[x, y] = random.choice([0,0,0,0,0,0,0,0,1]) # random pattern
-
-
-
-# fill some random values in cella
-
-def checkcell(c, x, y, direction):
-    """check a neighboring cell and return it's value
-       assuming a 100x100 playfield with wrap-around
-       borders"""
-    dx=0 # delta to calculate next cell
-    dy=0 
-    if direction == 0: # east
-        if x == 0: 
-            dx = maxX-1 
-        else:
-            dx = -1
-    elif direction ==4: #west:
-        if x == maxX-1:
-            dx = -1 * (maxX-1)
-        else:
-            dx = 1
-    elif direction ==2: # north
-        if y ==0:
-            dy = maxY-1
-        else: dy = -1
-    elif direction ==6: # south
-        if y ==maxY-1:
-            dy = -1 * (maxY - 1)
-        else:
-            dy = 1
-    elif direction == 1: # northeast
-        if y ==0:
-            dy = maxY-1
-        else: dy = -1
-        if x == 0: 
-            dx = maxX-1 
-        else:
-            dx = -1
-    elif direction == 3: # northwest
-        if y ==0:
-            dy = maxY-1
-        else: 
-            dy = -1
-        if x == maxX-1:
-            dx = -1 * (maxX-1)
-        else:
-            dx = 1
-    elif direction == 5: #southwest
-        if x == maxX-1:
-            dx = -1 * (maxX-1)
-        else:
-            dx = 1
-        if y ==maxY-1:
-            dy = -1 * (maxY - 1)
-        else:
-            dy = 1
-    elif direction == 7: # southeast
-        if x == 0: 
-            dx = maxX-1 
-        else:
-            dx = -1
-        if y ==maxY-1:
-            dy = -1 * (maxY - 1)
-        else:
-            dy = 1
-    else:
-        print "wtf???"
-    return c[x+dx, y+dy]
+# all engines that can run on this computer (NumpyLife needs numpy)
+engines = [engine for engine in lifeengine.ENGINES
+           if engine is not lifeengine.NumpyLife or lifeengine.numpy is not None]
+enginenumber = 0
+# the playfield with a random pattern
+playfield = engines[enginenumber](maxX, maxY, 1/9.0)
 
-def paint(cells ):
+
+def paint(life):
     x = pygame.mouse.get_pos()[0]
     y = pygame.mouse.get_pos()[1]
     #print "x,y:", x,y
@@ -140,73 +62,25 @@ def paint(cells ):
          y < maxY*4 + ymove and
          y > ymove):
        #print x/4, (y-ymove)/4
-       cells[x/4, (y-ymove)/4] = 1
-    
-        
-def newvalue(ca, cb, x, y):
-    """count the neighbors of a cell (8 directions). If too few or
-    too many neighbors, the cell dies., else it become or stay alife.
-    rules: 
-    0 or 1 neigbors: cell dies because of underpopulation
-    2 or 3 neigbors: cell stay alive
-    4 or more cells: cell dies because of overpopulation
-    3 neignors and cell dead: cell becomes alive.
-    Returns 0 for a dead cell, 1 for an alive cell
-    also see http://en.wikipedia.org/wiki/Conway's_Game_of_Life"""
-    neighbors = 0
-    for direction in range(8):
-        neighbors += checkcell(ca, x,y,direction)
-    # cell is dead and become alive ?
-    if ca[x, y] == 0:
-        if neighbors == 3:
-            cb[x, y] = 1 # born again
-            return 1
-        else:
-            cb[x, y] = 0 # stay dead
-            return 0
-    else:
-        # cell is alive
-        if neighbors < 2 or neighbors > 3:
-            cb[x, y] = 0 # dead 
-            return 0
-        else:
-            # stay alivie
-            cb[x, y] = 1
-            return 1
-        
-       
+       life.set_cell(x//4, (y-ymove)//4, 1)
 
 
 gameloop = True
-old_cells = cellA
-new_cells = {}
 mousepainting = False
 pause = False
+cellsum = playfield.count()
 while gameloop:
 
     if not pause:
-        cellsum = 0
         # calculate cells birth and dead
-        for x in range(maxX):
-            for y in range(maxY):
-                # cellsum is the number of alive cells in the whole playfield
-                # in this frame
-                cellsum += newvalue(old_cells, new_cells, x, y) # calculate values of CellB
-    
+        # cellsum is the number of alive cells in the whole playfield
+        cellsum = playfield.step()
     else:
         if mousepainting:
-           paint(old_cells) 
-    
-    # paint the cells on the screen       
-    for x in range(maxX):
-        for y in range(maxY):
-            color = pygame.Color(old_cells[x, y] * 255,0,0) # red or black
-            ## paint 4 x 4 dots instead of 1 dot (fatx, faty) is the size of a dot
-            pygame.draw.rect(screen, color, (x*4,ymove+y*4, 4,4), 0)
+           paint(playfield) 
     
-    if not pause:        
-        old_cells  = new_cells
-        new_cells = {}
+    # paint the cells on the screen, 4 x 4 dots for each cell
+    playfield.render(screen, (0, ymove), 4)
 
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
@@ -214,6 +88,11 @@ while gameloop:
         elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 gameloop = False
+            elif event.key == pygame.K_e:
+                # switch to the next engine, keep all cells
+                # (HashLife has no borders: prints a warning)
+                enginenumber = (enginenumber + 1) % len(engines)
+                playfield = lifeengine.switch(playfield, engines[enginenumber])
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1: # left click
                 if pause:
@@ -227,7 +106,8 @@ while gameloop:
     
   
     if not pause:    
-        statusmsg =  'Game of Life fps: %.2f cells:%i:%i' % (fpsClock.get_fps(), cellsum, 10000-cellsum)       
+        statusmsg =  'Game of Life (%s%s) fps: %.2f cells:%i:%i' % (playfield.__class__.__name__,
+                     "" if playfield.wraps else ", no borders", fpsClock.get_fps(), cellsum, maxX*maxY-cellsum)
     else: 
         statusmsg = " pause mode. right-click to continue"
     pygame.display.set_caption(statusmsg)
@@ -14,30 +14,32 @@ import random
 import os
 import sys
 
+# shared helper modules are in the lib folder of the pygame folder
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from lib import textcache
+from lib import rotocache
+from lib import dirtyrects
+from lib import assets
+
 GRAD = math.pi / 180  # 2 * pi / 360   # math module needs Radiant instead of Grad
 
 def write(background, text, x=50, y=150, color=(0, 0, 0),
-          fontsize=None, center=False):
-    """write text on pygame surface. """
-    if fontsize is None:
-        fontsize = 24
-    font = pygame.font.SysFont('mono', fontsize, bold=True)
-    fw, fh = font.size(text)
-    surface = font.render(text, True, color)
-    if center:  # center text around x,y
-        background.blit(surface, (x - fw // 2, y - fh // 2))
-    else:  # topleft corner is x,y
-        background.blit(surface, (x, y))
-
-
-class Bar(pygame.sprite.Sprite):
+          fontsize=None, center=False, numeric=False):
+    """write text on pygame surface. Font and text surface are cached,
+       numeric=True paints text changing each frame from a glyph atlas.
+       returns the Rect of the text"""
+    return textcache.write(background, text, x, y, color, fontsize, center, numeric=numeric)
+
+
+class Bar(pygame.sprite.DirtySprite):
     def __init__(self, boss, color = (0,200,200)):
         """create healt-bar to show the hitpoints of boss sprite.
            bar is full if boss has 100 or more hitpoints"""
         self.boss = boss #
         self.color = color
         self._layer = self.boss._layer + 1  # self.layer = layer
-        pygame.sprite.Sprite.__init__(self, self.groups)  # call parent class. NEVER FORGET !
+        pygame.sprite.DirtySprite.__init__(self, self.groups)  # call parent class. NEVER FORGET !
+        self.dirty = 2  # moving sprite, repaint each frame (for dirty rects)
         self.image = pygame.Surface((self.boss.rect.width, 7))
         self.distance = self.boss.rect.height - 15 # adapt this
         self.rect = self.image.get_rect()
@@ -59,17 +61,20 @@ class Bar(pygame.sprite.Sprite):
         self.rect.center = (self.boss.x, self.boss.y - self.distance)
             
 
-class FlyingObject(pygame.sprite.Sprite):
-    """base class for sprites. this class inherits from pygames sprite class"""
+class FlyingObject(pygame.sprite.DirtySprite):
+    """base class for sprites. this class inherits from pygames DirtySprite class"""
     number = 0
     images = []
+    rotations = rotocache.RotationCache(360)  # rotated images, shared by all FlyingObjects
+    smoothrotations = rotocache.RotationCache(360, smooth=True)  # the same, made with rotozoom
 
     def __init__(self, radius=50, color=None, x=320, y=240,
                  dx=0, dy=0, layer=4, mass=0):
         """create a (black) surface and paint a blue ball on it"""
         self._layer = layer  # self.layer = layer
-        pygame.sprite.Sprite.__init__(self, self.groups)  # call parent class. NEVER FORGET !
+        pygame.sprite.DirtySprite.__init__(self, self.groups)  # call parent class. NEVER FORGET !
         # self groups is set in PygView.paint()
+        self.dirty = 2  # moving sprite, repaint each frame (for dirty rects)
         self.number = FlyingObject.number  # unique number for each sprite
         FlyingObject.number += 1
         self.radius = radius
@@ -128,14 +133,11 @@ class FlyingObject(pygame.sprite.Sprite):
     def turn2heading(self):
         """rotate into direction of movement (dx,dy)"""
         self.angle = math.atan2(-self.dx, -self.dy) / math.pi * 180.0
-        self.image = pygame.transform.rotozoom(self.image0, self.angle, 1.0)
+        self.image = FlyingObject.smoothrotations.get(self.image0, self.angle)[0]
 
     def rotate(self):
         """rotate because changes in self.angle"""
-        self.oldcenter = self.rect.center
-        self.image = pygame.transform.rotate(self.image0, self.angle)
-        self.rect = self.image.get_rect()
-        self.rect.center = self.oldcenter
+        FlyingObject.rotations.rotate_sprite(self)  # cached, see lib/rotocache.py
 
     def rotate_toward(self, target):
         """set turndirection to rotate towards target and returns angle"""
@@ -206,6 +208,13 @@ class MovingWall(FlyingObject):
         if random.randint(0, 1) == 0:
             self.dx *= -1
             self.dy *= -1
+        self.dirty = 0  # slow wall: repaint only if it has moved (for dirty rects)
+
+    def update(self, seconds):
+        oldcenter = self.rect.center
+        FlyingObject.update(self, seconds)
+        if self.rect.center != oldcenter:
+            self.dirty = 1  # moved at least one pixel: repaint once
 
 
 class Bullet(FlyingObject):
@@ -343,8 +352,12 @@ class PygView(object):
     grid = 0
     bulletlifetime = 0
 
-    def __init__(self, width=800, height=600, fps=30, grid=50, bulletlifetime=3.5, p_wall=0.5, picturepath='data'):
-        """Initialize pygame, window, background, font,..."""
+    def __init__(self, width=800, height=600, fps=30, grid=50, bulletlifetime=3.5, p_wall=0.5, picturepath='data',
+                 dirty=False, compare=0, stats=False):
+        """Initialize pygame, window, background, font,...
+           dirty=True repaints only the changed parts of the screen (dirty rects),
+           compare=5 switches between full flip and dirty rects every 5 seconds,
+           stats=True prints the hit rates of the text cache and the dirty rect counts at exit"""
         pygame.init()
         PygView.width = width  # make global readable
         PygView.height = height
@@ -353,7 +366,11 @@ class PygView(object):
         self.screen = pygame.display.set_mode((self.width, self.height), pygame.DOUBLEBUF)
         self.clock = pygame.time.Clock()
         self.fps = fps
+        if compare:
+            self.fps = 0  # no frame limit, to compare the fps of both modes
+        self.stats = stats
         self.playtime = 0
+        self.dirtyscreen = dirtyrects.DirtyScreen(self.screen, dirty, compare=compare)
         self.picturepath = picturepath # path to folder with jpg images
         self.grid = grid  # pixel for grid
         self.gridmaxx = self.width // self.grid
@@ -376,15 +393,15 @@ class PygView(object):
     def loadbackground(self):
         self.background = pygame.Surface(self.screen.get_size()).convert()
         self.background.fill((255, 255, 255))  # fill background white
-        self.prettybackground = pygame.image.load(
-            os.path.join(self.picturepath, self.backgroundfilenames[self.level % len(self.backgroundfilenames)]))
-        self.prettybackground = pygame.transform.scale(self.prettybackground, (PygView.width, PygView.height))
-        self.prettybackground.convert()
+        # scaled and converted only once for each picture, maybe already preloaded by menu.py
+        self.prettybackground = assets.manager(self.picturepath).image(
+            self.backgroundfilenames[self.level % len(self.backgroundfilenames)], size=(PygView.width, PygView.height))
 
     def levelup(self):
         self.level += 1
         self.loadbackground()
         self.paintgrid()
+        self.dirtyscreen.repaint_all()  # new background
         # make the game harder
         for c in self.cannongroup:
             c.turnspeed *= 1.1  # 10% increase
@@ -407,9 +424,10 @@ class PygView(object):
                                  (x - self.grid // 2, y - self.grid // 2, self.grid, self.grid), 1)
                 self.tiles[(x, y)] = True
         try:  # ----------- load sprite images -----------
-            Player.images = [pygame.image.load(os.path.join("data", "babytux.png"))]
-            Cannon.images = [pygame.image.load(os.path.join("data", "babytux_neg.png"))]
-            Heart.images = [pygame.image.load(os.path.join("data", "heart.png"))]
+            data = assets.manager("data")  # converted images, see lib/assets.py
+            Player.images = [data.image("babytux.png")]
+            Cannon.images = [data.image("babytux_neg.png")]
+            Heart.images = [data.image("heart.png")]
         except:
             print("pygame error:", pygame.get_error())
             print("please make sure there is a subfolder 'data'")
@@ -418,7 +436,7 @@ class PygView(object):
             pygame.quit()
             sys.exit()
         # -------  create (pygame) Sprites Groups and Sprites -------------
-        self.allgroup = pygame.sprite.LayeredUpdates()  # for drawing
+        self.allgroup = pygame.sprite.LayeredDirty()  # for drawing, full or dirty rects, see lib/dirtyrects.py
         # self.ballgroup = pygame.sprite.Group()          # for collision detection etc.
         self.bulletgroup = pygame.sprite.Group()
         self.cannongroup = pygame.sprite.Group()
@@ -505,7 +523,7 @@ class PygView(object):
             milliseconds = self.clock.tick(self.fps)
             seconds = milliseconds / 1000
             self.playtime += seconds
-            self.screen.blit(self.background, (0, 0))  # clear screen
+            self.dirtyscreen.clear(self.background)  # clear screen (only the rects painted in the last frame if dirty rects)
             # ---- paint under player1 ----
             # if tile is True, blit prettybackground and set tile to False
             if (self.player1.x, self.player1.y) in self.tiles and self.tiles[(self.player1.x, self.player1.y)]:
@@ -514,14 +532,16 @@ class PygView(object):
                                      area=(self.player1.x - self.grid // 2, self.player1.y - self.grid // 2, self.grid,
                                            self.grid))
                 self.tiles[(self.player1.x, self.player1.y)] = False
+                self.dirtyscreen.add((self.player1.x - self.grid // 2, self.player1.y - self.grid // 2,
+                                      self.grid, self.grid))  # clear with the new background next frame
                 self.player1.tilesrevealed += 1
             if hiddentiles == 0:     # -- new level ?
                 self.player1.hitpoints = max(self.player1.hitpoints, 2) # refill to 100 hitpoints
                 self.levelup()
             # write text below sprites
-            write(self.screen, "Press ESC to quit. FPS: {:6.3}  PLAYTIME: {:.1f} SECONDS".format(
-                self.clock.get_fps(), self.playtime), color=(200, 0, 0), x=10, y=self.grid // 2, fontsize=10)
-            write(self.screen, "Press w,a,s,d to steer", x=self.width // 2, y=self.height - self.grid // 2, center=True)
+            self.dirtyscreen.add(write(self.screen, "Press ESC to quit. FPS: {:6.3}  PLAYTIME: {:.1f} SECONDS".format(
+                self.clock.get_fps(), self.playtime), color=(200, 0, 0), x=10, y=self.grid // 2, fontsize=10, numeric=True))
+            self.dirtyscreen.add(write(self.screen, "Press w,a,s,d to steer", x=self.width // 2, y=self.height - self.grid // 2, center=True))
             # --------- collision detection bullet vs. moving wall
             for wall in self.wallgroup:
                 crashgroup = pygame.sprite.spritecollide(wall, self.bulletgroup, False, pygame.sprite.collide_rect)
@@ -540,8 +560,8 @@ class PygView(object):
                         if bullet.color != otherbullet.color:
                             #Star(bullet.x, bullet.y)
                             for line in range(5):
-                                pygame.draw.line(self.screen, (random.randint(0,255),random.randint(0,255), random.randint(0,255)),
-                                                (bullet.x, bullet.y), (bullet.x +random.randint(-20,20), bullet.y + random.randint(-20,20)),1)
+                                self.dirtyscreen.add(pygame.draw.line(self.screen, (random.randint(0,255),random.randint(0,255), random.randint(0,255)),
+                                                (bullet.x, bullet.y), (bullet.x +random.randint(-20,20), bullet.y + random.randint(-20,20)),1))
                             otherbullet.kill()
                             bullet.kill()                                
                             break
@@ -558,14 +578,25 @@ class PygView(object):
                 self.player1.hitpoints -= 1
             # ----------- clear, draw , update, flip -----------------  
             self.allgroup.update(seconds)  # would also work with ballgroup
-            self.allgroup.draw(self.screen)
-            pygame.display.flip()
+            self.dirtyscreen.draw(self.allgroup)
+            self.dirtyscreen.update()  # flip, or update only the dirty rects
+            self.dirtyscreen.tick(seconds)
         # seconds = self.playtime / 1000
         print("Game over Player One")
         print("You played {:.2f} seconds, reached level {} and revealed {} tiles.\nThat is {:.2f} tiles per second!".format(
               self.playtime, self.level, self.player1.tilesrevealed, self.player1.tilesrevealed / self.playtime))
+        if self.stats:
+            print(textcache.report())
+        if self.stats or self.dirtyscreen.compare:
+            print(self.dirtyscreen.report())
         pygame.quit()
         #sys.exit() # no sys.exit() because we want to go back to the calling game menu
 
 if __name__ == '__main__':
-    PygView(1000, 600, grid=50, bulletlifetime=10, p_wall= 0.7, fps=60).run()  # try out other values and your own picturefolder, like picturepath="/home/horst/.config/variety/Favorites/"
+    # python crossfiregrid.py --dirty   : repaint only the changed parts of the screen (dirty rects)
+    #                                     (slower here: hundreds of moving walls, so flip is the default)
+    # python crossfiregrid.py --compare : switch between flip and dirty rects every 5 seconds, print fps of both
+    # python crossfiregrid.py --stats   : print the hit rates of the text cache and the dirty rect counts at exit
+    PygView(1000, 600, grid=50, bulletlifetime=10, p_wall= 0.7, fps=60,
+            dirty="--dirty" in sys.argv, compare=5.0 if "--compare" in sys.argv else 0,
+            stats="--stats" in sys.argv).run()  # try out other values and your own picturefolder, like picturepath="/home/horst/.config/variety/Favorites/"
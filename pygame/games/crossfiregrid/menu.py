@@ -8,6 +8,7 @@ import random
 import sys
 import os.path
 import crossfiregrid
+from lib import assets  # crossfiregrid has added the lib folder to sys.path
 import os
 from libs import easygui
 
@@ -162,6 +163,9 @@ class PygView(object):
         #print(self.backgroundfilenames)
         #print(len(self.backgroundfilenames))
         self.pictures = len(self.backgroundfilenames)
+        # decode the pictures and sprites in a background thread while the menu is shown
+        assets.manager(self.picturepath).preload(self.backgroundfilenames)
+        assets.manager("data").preload(["babytux.png", "babytux_neg.png", "heart.png"])
         
         
     def run(self):
@@ -190,7 +194,7 @@ class PygView(object):
                             #print("activating external program")
                             crossfiregrid.PygView(self.width, self.height, 
                                           grid=self.grid, bulletlifetime = self.bulletlifetime, 
-                                          p_wall = self.p_wall, fps = self.fps, picturepath=self.picturefolder ).run()
+                                          p_wall = self.p_wall, fps = self.fps, picturepath=self.picturepath ).run()
                             PygView(width=self.width, height=self.height, fps=self.fps, grid=self.grid, 
                  bulletlifetime = self.bulletlifetime, p_wall = self.p_wall).run()
                         elif text=="quit":
@@ -5,10 +5,43 @@ https://github.com/petercollingridge/
 no license information found
 
 adapted by Horst JENS http://github.com/horstjens
+
+Barnes-Hut gravity: instead of attracting each particle by every other
+particle ('attract', n*n pairs), 'attract_bh' sorts all particles once
+per step into a quadtree. A far away group of particles attracts like
+one big particle in its centre of mass. Environment.theta decides what
+is "far away": a quadtree square of side s at distance d is used as one
+particle if s/d < theta. theta = 0 is exact (and slow), 0.5 is good, 1 is fast.
+
+If no pair function needs all pairs (only 'collide' and 'combine',
+no 'attract'), Environment.update sorts the particles into a grid and
+only tests particles in neighbouring grid cells. The functions are called
+in the same order as with all pairs (the functions of particle i, then its
+pairs (i, j) with j > i), so both ways give the same result.
+
+Particle storage (backend): with numpy installed, Environment keeps all
+particles in a ParticleArray: one numpy array for each property (x, y,
+vx, vy, mass, size, drag ...) instead of one object for each particle.
+'move', 'drag', 'bounce', 'accelerate' and 'attract' then work on all
+particles at once. Iterating over a ParticleArray gives ParticleView
+objects that look like Particle objects, so findParticle and the game
+work as before. Environment((width, height), backend='list') uses
+Particle objects in a list (the classic way).
+
+run this file directly to compare 'attract' with 'attract_bh'
+(step time and energy drift) and both backends
 """
 
 
 import math, random
+import collections
+
+try:
+    import numpy
+except ImportError:
+    numpy = None # no ParticleArray, Environment uses a list of Particle objects
+
+GRAVITY = 0.2 # gravitational constant of this universe
 
 def addVectors(xxx_todo_changeme4, xxx_todo_changeme5):
     """ Returns the sum of two vectors """
@@ -73,7 +106,7 @@ class Particle:
         self.mass = mass
         self.drag = 1
         self.elasticity = 0.9
-        self.history = []
+        self.history = collections.deque(maxlen=255) # the last positions (x, y)
 
     def move(self):
         """ Update position based on speed, angle """
@@ -81,8 +114,6 @@ class Particle:
         self.x += math.sin(self.angle) * self.speed
         self.y -= math.cos(self.angle) * self.speed
         self.history.append((self.x, self.y))
-        if len(self.history) > 255:
-            del self.history[0]
 
     def experienceDrag(self):
         self.speed *= self.drag
@@ -115,27 +146,373 @@ class Particle:
             return True
 
         theta = math.atan2(dy, dx)
-        force = 0.2 * self.mass * other.mass / dist**2
+        force = GRAVITY * self.mass * other.mass / dist**2
         self.accelerate((theta- 0.5 * math.pi, force/self.mass))
         other.accelerate((theta+ 0.5 * math.pi, force/other.mass))
 
+class ParticleArray:
+    """ Structure of arrays: all particles in numpy arrays.
+        Particle number i has the position (x[i], y[i]) and the velocity
+        (vx[i], vy[i]) in screen coordinates (y points down).
+        Only the first len(self) entries of each array are used """
+    fields = ('x', 'y', 'vx', 'vy', 'heading', 'mass', 'size', 'drag', 'elasticity')
+    historylength = 255 # positions stored for the trail of each particle
+
+    def __init__(self, capacity=64):
+        self.n = 0
+        self.capacity = capacity
+        for name in ParticleArray.fields:
+            setattr(self, name, numpy.zeros(capacity))
+        # ring buffer of the last positions, trail[i, historypos-1] is the newest
+        self.trail = numpy.zeros((capacity, ParticleArray.historylength, 2), dtype=numpy.float32)
+        self.historycount = numpy.zeros(capacity, dtype=numpy.int32)
+        self.historypos = 0
+        self.views = [] # one ParticleView for each particle
+
+    def __len__(self):
+        return self.n
+
+    def __iter__(self):
+        return iter(list(self.views)) # copy: particles may be removed while iterating
+
+    def __getitem__(self, i):
+        return self.views[i]
+
+    def __contains__(self, view):
+        return isinstance(view, ParticleView) and view.array is self
+
+    def index(self, view):
+        return view.index
+
+    def grow(self):
+        """ Double the capacity of all arrays """
+        self.capacity *= 2
+        for name in ParticleArray.fields:
+            old = getattr(self, name)
+            new = numpy.zeros(self.capacity)
+            new[:self.n] = old[:self.n]
+            setattr(self, name, new)
+        newtrail = numpy.zeros((self.capacity, ParticleArray.historylength, 2), dtype=numpy.float32)
+        newtrail[:self.n] = self.trail[:self.n]
+        self.trail = newtrail
+        historycount = numpy.zeros(self.capacity, dtype=numpy.int32)
+        historycount[:self.n] = self.historycount[:self.n]
+        self.historycount = historycount
+
+    def add(self, x, y, size, mass=1):
+        """ Add a new particle without speed, returns its ParticleView """
+        if self.n == self.capacity:
+            self.grow()
+        i = self.n
+        for name in ParticleArray.fields:
+            getattr(self, name)[i] = 0.0
+        self.x[i] = x
+        self.y[i] = y
+        self.size[i] = size
+        self.mass[i] = mass
+        self.drag[i] = 1
+        self.elasticity[i] = 0.9
+        self.historycount[i] = 0
+        self.n += 1
+        view = ParticleView(self, i)
+        self.views.append(view)
+        return view
+
+    def remove(self, view):
+        """ Remove a particle, all particles behind it move one place forward.
+            The removed view keeps its values in a ParticleArray of its own """
+        if view.array is not self:
+            raise ValueError("particle is not in this ParticleArray")
+        i = view.index
+        n = self.n
+        single = ParticleArray(1)
+        for name in ParticleArray.fields:
+            getattr(single, name)[0] = getattr(self, name)[i]
+        single.trail[0] = self.trail[i]
+        single.historycount[0] = self.historycount[i]
+        single.historypos = self.historypos
+        single.n = 1
+        single.views = [view]
+        for name in ParticleArray.fields:
+            array = getattr(self, name)
+            array[i:n-1] = array[i+1:n]
+        self.trail[i:n-1] = self.trail[i+1:n]
+        self.historycount[i:n-1] = self.historycount[i+1:n]
+        self.n -= 1
+        del self.views[i]
+        for other in self.views[i:]:
+            other.index -= 1
+        view.array = single
+        view.index = 0
+
+    def history(self, i):
+        """ Returns the last positions of particle number i as numpy array
+            of shape (count, 2), oldest position first """
+        count = int(self.historycount[i])
+        start = (self.historypos - count) % ParticleArray.historylength
+        if start + count <= ParticleArray.historylength:
+            return self.trail[i, start:start + count] # a view, nothing is copied
+        return numpy.concatenate((self.trail[i, start:], self.trail[i, :self.historypos]))
+
+    def move(self):
+        n = self.n
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.trail[:n, self.historypos, 0] = self.x[:n]
+        self.trail[:n, self.historypos, 1] = self.y[:n]
+        self.historypos = (self.historypos + 1) % ParticleArray.historylength
+        numpy.minimum(self.historycount[:n] + 1, ParticleArray.historylength, out=self.historycount[:n])
+
+    def experienceDrag(self):
+        n = self.n
+        self.vx[:n] *= self.drag[:n]
+        self.vy[:n] *= self.drag[:n]
+
+    def accelerate(self, vector):
+        """ Add the same vector (angle, length) to all particles """
+        (angle, length) = vector
+        n = self.n
+        self.vx[:n] += math.sin(angle) * length
+        self.vy[:n] -= math.cos(angle) * length
+
+    def bounce(self, width, height, elasticity):
+        """ Bounce all particles from the borders, see Environment.bounce """
+        n = self.n
+        x = self.x[:n]
+        y = self.y[:n]
+        vx = self.vx[:n]
+        vy = self.vy[:n]
+        size = self.size[:n]
+        right = x > width - size
+        left = ~right & (x < size)
+        x[right] = 2 * (width - size[right]) - x[right]
+        x[left] = 2 * size[left] - x[left]
+        sideways = right | left
+        vx[sideways] = -vx[sideways]
+        bottom = y > height - size
+        top = ~bottom & (y < size)
+        y[bottom] = 2 * (height - size[bottom]) - y[bottom]
+        y[top] = 2 * size[top] - y[top]
+        updown = bottom | top
+        vy[updown] = -vy[updown]
+        factor = numpy.where(sideways, elasticity, 1.0) * numpy.where(updown, elasticity, 1.0)
+        vx *= factor
+        vy *= factor
+
+    def attract(self, chunk=512):
+        """ Exact gravity between all pairs, like Particle.attract.
+            The pairs are calculated in blocks of chunk rows to save memory """
+        n = self.n
+        x = self.x[:n]
+        y = self.y[:n]
+        mass = self.mass[:n]
+        size = self.size[:n]
+        ax = numpy.zeros(n)
+        ay = numpy.zeros(n)
+        for start in range(0, n, chunk):
+            end = min(n, start + chunk)
+            dx = x[numpy.newaxis, :] - x[start:end, numpy.newaxis]
+            dy = y[numpy.newaxis, :] - y[start:end, numpy.newaxis]
+            dist = numpy.hypot(dx, dy)
+            # Particle.attract ignores pairs nearer than 2 * size of the first particle
+            rows = numpy.arange(start, end)[:, numpy.newaxis]
+            first = numpy.where(numpy.arange(n)[numpy.newaxis, :] > rows,
+                                size[start:end, numpy.newaxis], size[numpy.newaxis, :])
+            far = (dist >= first + first) & (dist > 0)
+            with numpy.errstate(divide='ignore', invalid='ignore'):
+                f = numpy.where(far, GRAVITY * mass[numpy.newaxis, :] / dist**3, 0.0)
+            ax[start:end] = (dx * f).sum(axis=1)
+            ay[start:end] = (dy * f).sum(axis=1)
+        self.vx[:n] += ax
+        self.vy[:n] += ay
+
+    def attractBarnesHut(self, theta=0.5):
+        """ Gravity using a quadtree, see QuadTree """
+        n = self.n
+        if n < 2:
+            return
+        tree = QuadTree(self.x[:n].tolist(), self.y[:n].tolist(), self.mass[:n].tolist())
+        mindist = (2 * self.size[:n]).tolist()
+        accelerations = numpy.array([tree.acceleration(i, mindist[i], theta) for i in range(n)])
+        self.vx[:n] += accelerations[:, 0]
+        self.vy[:n] += accelerations[:, 1]
+
+    def findParticle(self, x, y):
+        """ Returns the first ParticleView at position x, y or None """
+        n = self.n
+        inside = numpy.nonzero(numpy.hypot(self.x[:n] - x, self.y[:n] - y) <= self.size[:n])[0]
+        if len(inside) == 0:
+            return None
+        return self.views[inside[0]]
+
+
+def arrayProperty(name):
+    """ A property reading and writing one field of the ParticleArray """
+    def get(view):
+        return float(getattr(view.array, name)[view.index])
+    def set(view, value):
+        getattr(view.array, name)[view.index] = value
+    return property(get, set)
+
+class ParticleView(Particle):
+    """ One particle of a ParticleArray, with the same attributes and
+        methods as Particle (x, y, speed, angle, mass, size, history ...).
+        colour, thickness and other new attributes are stored in the view """
+
+    def __init__(self, array, index):
+        self.array = array
+        self.index = index
+        self.colour = (0, 0, 255)
+        self.thickness = 0
+
+    x = arrayProperty('x')
+    y = arrayProperty('y')
+    mass = arrayProperty('mass')
+    size = arrayProperty('size')
+    drag = arrayProperty('drag')
+    elasticity = arrayProperty('elasticity')
+
+    def getSpeed(self):
+        return math.hypot(self.array.vx[self.index], self.array.vy[self.index])
+
+    def setSpeed(self, speed):
+        angle = self.angle
+        self.array.vx[self.index] = math.sin(angle) * speed
+        self.array.vy[self.index] = -math.cos(angle) * speed
+
+    def getAngle(self):
+        vx = self.array.vx[self.index]
+        vy = self.array.vy[self.index]
+        if vx == 0 and vy == 0:
+            return float(self.array.heading[self.index]) # no movement: last known angle
+        return math.atan2(vx, -vy)
+
+    def setAngle(self, angle):
+        speed = self.speed
+        self.array.heading[self.index] = angle
+        self.array.vx[self.index] = math.sin(angle) * speed
+        self.array.vy[self.index] = -math.cos(angle) * speed
+
+    speed = property(getSpeed, setSpeed)
+    angle = property(getAngle, setAngle)
+
+    history = property(lambda self: self.array.history(self.index))
+
+    def move(self):
+        """ Move only this particle. The trail is written by ParticleArray.move """
+        self.x += self.array.vx[self.index]
+        self.y += self.array.vy[self.index]
+
+class QuadTree:
+    """ Barnes-Hut quadtree of particles, build once per step from lists
+        of x, y and mass values. Each node is a tuple
+        (mass, centre x, centre y, left, top, size, children, indices).
+        Inner nodes have a list of children, leaves have a list of particle indices """
+    leafsize = 1  # a leaf holds up to leafsize particles
+    maxdepth = 24 # particles at (nearly) the same position share a leaf
+
+    def __init__(self, xs, ys, masses):
+        self.xs = xs
+        self.ys = ys
+        self.masses = masses
+        left = min(xs)
+        top = min(ys)
+        size = max(max(xs) - left, max(ys) - top) + 1
+        self.root = self.build(list(range(len(xs))), left, top, size, 0)
+
+    def build(self, indices, left, top, size, depth):
+        xs = self.xs
+        ys = self.ys
+        masses = self.masses
+        mass = 0.0
+        mx = 0.0
+        my = 0.0
+        for i in indices:
+            mass += masses[i]
+            mx += xs[i] * masses[i]
+            my += ys[i] * masses[i]
+        if len(indices) <= QuadTree.leafsize or depth >= QuadTree.maxdepth:
+            return (mass, mx / mass, my / mass, left, top, size, None, indices)
+        half = size / 2.0
+        quarters = ([], [], [], [])
+        for i in indices:
+            quarters[(xs[i] >= left + half) + 2 * (ys[i] >= top + half)].append(i)
+        children = []
+        for q, quarter in enumerate(quarters):
+            if quarter:
+                children.append(self.build(quarter, left + half * (q % 2), top + half * (q // 2),
+                                           half, depth + 1))
+        return (mass, mx / mass, my / mass, left, top, size, children, None)
+
+    def acceleration(self, i, mindist=0.0, theta=0.5):
+        """ Returns the gravitational acceleration (ax, ay) of particle number i.
+            Single particles nearer than mindist are ignored (see Particle.attract) """
+        xs = self.xs
+        ys = self.ys
+        masses = self.masses
+        ax = 0.0
+        ay = 0.0
+        x = xs[i]
+        y = ys[i]
+        theta2 = theta * theta
+        stack = [self.root]
+        while stack:
+            (mass, mx, my, left, top, size, children, leaf) = stack.pop()
+            if children is None:
+                for j in leaf:
+                    if j == i:
+                        continue
+                    dx = xs[j] - x
+                    dy = ys[j] - y
+                    dist = math.hypot(dx, dy)
+                    if dist < mindist:
+                        continue
+                    f = GRAVITY * masses[j] / dist**3
+                    ax += dx * f
+                    ay += dy * f
+                continue
+            dx = mx - x
+            dy = my - y
+            dist2 = dx * dx + dy * dy
+            inside = left <= x < left + size and top <= y < top + size
+            if not inside and size * size < theta2 * dist2:
+                # far away: the whole node attracts like one particle
+                f = GRAVITY * mass / (dist2 * math.sqrt(dist2))
+                ax += dx * f
+                ay += dy * f
+            else:
+                stack.extend(children)
+        return (ax, ay)
+
 class Environment:
     """ Defines the boundary of a simulation and its properties """
     
     #def __init__(self, (width, height)):
-    def __init__(self, xxx_todo_changeme2):
+    def __init__(self, xxx_todo_changeme2, backend=None):
+        """ backend is 'array' (ParticleArray, needs numpy) or 'list'
+            (list of Particle objects). None means 'array' if numpy is installed """
         (width, height) = xxx_todo_changeme2
 
         self.width = width
         self.height = height
-        self.particles = []
-        self.history = []
+        if backend is None:
+            backend = 'list' if numpy is None else 'array'
+        self.backend = backend
+        if backend == 'array':
+            self.particles = ParticleArray()
+        else:
+            self.particles = []
+        self.history = [] # (colour, Trail) of destroyed particles, filled by the game (planetgame.py)
         
         self.colour = (255,255,255)
         self.mass_of_air = 0.2
         self.elasticity = 0.75
         self.acceleration = (0,0)
+        self.theta = 0.5 # accuracy of 'attract_bh', 0 is exact
+        self.use_grid = True # test only nearby pairs if no pair function needs all pairs
+        self.all_pairs = False # True if a pair function needs all pairs (like 'attract')
         
+        self.particle_functions0 = [] # called once per step with the list of all particles
         self.particle_functions1 = []
         self.particle_functions2 = []
         self.function_dict = {
@@ -145,12 +522,26 @@ class Environment:
         'accelerate': (1, lambda p: p.accelerate(self.acceleration)),
         'collide': (2, lambda p1, p2: collide(p1, p2)),
         'combine': (2, lambda p1, p2: combine(p1, p2)),
-        'attract': (2, lambda p1, p2: p1.attract(p2))}
+        'attract': (2, lambda p1, p2: p1.attract(p2)),
+        'attract_bh': (0, lambda particles: self.attractBarnesHut(particles))}
+        if backend == 'array':
+            # one call for all particles
+            self.function_dict.update({
+            'move': (0, lambda particles: particles.move()),
+            'drag': (0, lambda particles: particles.experienceDrag()),
+            'bounce': (0, lambda particles: particles.bounce(self.width, self.height, self.elasticity)),
+            'accelerate': (0, lambda particles: particles.accelerate(self.acceleration)),
+            'attract': (0, lambda particles: particles.attract()),
+            'attract_bh': (0, lambda particles: particles.attractBarnesHut(self.theta))})
         
     def addFunctions(self, function_list):
         for func in function_list:
             (n, f) = self.function_dict.get(func, (-1, None))
-            if n == 1:
+            if func == 'attract' and n == 2:
+                self.all_pairs = True # attract works at any distance
+            if n == 0:
+                self.particle_functions0.append(f)
+            elif n == 1:
                 self.particle_functions1.append(f)
             elif n == 2:
                 self.particle_functions2.append(f)
@@ -166,17 +557,37 @@ class Environment:
             x = kargs.get('x', random.uniform(size, self.width-size))
             y = kargs.get('y', random.uniform(size, self.width-size))
             #print("automatic xy: ", x, y)
-            particle = Particle((x, y), size, mass)
+            if self.backend == 'array':
+                particle = self.particles.add(x, y, size, mass)
+            else:
+                particle = Particle((x, y), size, mass)
             particle.speed = kargs.get('speed', random.random())
             particle.angle = kargs.get('angle', random.uniform(0, math.pi*2))
             particle.colour = kargs.get('colour', (0, 0, 255))
             particle.drag = (particle.mass/(particle.mass + self.mass_of_air)) ** particle.size
 
-            self.particles.append(particle)
+            if self.backend != 'array':
+                self.particles.append(particle)
 
     def update(self):
         """  Moves particles and tests for collisions with the walls and each other """
         
+        for f in self.particle_functions0:
+            f(self.particles)
+        if self.use_grid and not self.all_pairs:
+            # the same order as the loop over all pairs below. The pairs are
+            # found before the particles move, so the grid cells are bigger by
+            # the way two particles can move toward each other in this step
+            pairs = self.nearbyPairs(self.moveMargin()) if self.particle_functions2 else []
+            k = 0
+            for particle in self.particles:
+                for f in self.particle_functions1:
+                    f(particle)
+                while k < len(pairs) and pairs[k][0] is particle:
+                    for f in self.particle_functions2:
+                        f(*pairs[k])
+                    k += 1
+            return
         for i, particle in enumerate(self.particles):
             for f in self.particle_functions1:
                 f(particle)
@@ -184,6 +595,70 @@ class Environment:
                 for f in self.particle_functions2:
                     f(particle, particle2)
 
+    def attractBarnesHut(self, particles):
+        """ Accelerate all particles toward each other, using a quadtree """
+        if len(particles) < 2:
+            return
+        tree = QuadTree([p.x for p in particles], [p.y for p in particles],
+                        [p.mass for p in particles])
+        accelerations = [tree.acceleration(i, p.size + p.size, self.theta)
+                         for i, p in enumerate(particles)]
+        for p, (ax, ay) in zip(particles, accelerations):
+            if ax or ay:
+                # screen y points down, angle 0 points up (see Particle.move)
+                p.accelerate((math.atan2(ax, -ay), math.hypot(ax, ay)))
+
+    def moveMargin(self):
+        """ The longest way two particles can move toward each other in one
+            update: collide or combine can push a particle by its size, and
+            a collision can double its speed before it moves """
+        if not self.particles:
+            return 0
+        if self.backend == 'array':
+            size = float(self.particles.size[:len(self.particles)].max())
+        else:
+            size = max(p.size for p in self.particles)
+        if not self.particle_functions1:
+            return 2 * size # (array backend) all particles have moved already
+        speed = max(p.speed for p in self.particles) + self.acceleration[1]
+        return 2 * (size + 2 * speed)
+
+    def nearbyPairs(self, margin=0):
+        """ Returns all pairs (p1, p2) of particles in neighbouring grid cells,
+            in the same order as the loop over all pairs would use.
+            The cell size is the diameter of the biggest particle (plus
+            margin), so each pair of touching particles is found """
+        particles = self.particles
+        if len(particles) < 2:
+            return []
+        if self.backend == 'array':
+            n = len(particles)
+            xs = particles.x[:n].tolist()
+            ys = particles.y[:n].tolist()
+            sizes = particles.size[:n].tolist()
+        else:
+            xs = [p.x for p in particles]
+            ys = [p.y for p in particles]
+            sizes = [p.size for p in particles]
+        cellsize = 2 * max(sizes) + 1 + margin
+        grid = {}
+        for i in range(len(xs)):
+            grid.setdefault((int(xs[i] // cellsize), int(ys[i] // cellsize)), []).append(i)
+        pairs = []
+        for (cx, cy), cell in grid.items():
+            for dx, dy in ((0, 0), (1, 0), (-1, 1), (0, 1), (1, 1)):
+                other = cell if (dx, dy) == (0, 0) else grid.get((cx + dx, cy + dy))
+                if other is None:
+                    continue
+                for i in cell:
+                    for j in other:
+                        if i < j:
+                            pairs.append((i, j))
+                        elif j < i and other is not cell:
+                            pairs.append((j, i))
+        pairs.sort()
+        return [(particles[i], particles[j]) for (i, j) in pairs]
+
     def bounce(self, particle):
         """ Tests whether a particle has hit the boundary of the environment """
         
@@ -212,7 +687,80 @@ class Environment:
 
         """ Returns any particle that occupies position x, y """
         (x, y) = xxx_todo_changeme3
+        if self.backend == 'array':
+            return self.particles.findParticle(x, y)
         for particle in self.particles:
             if math.hypot(particle.x - x, particle.y - y) <= particle.size:
                 return particle
         return None
+
+
+def energy(particles):
+    """ Returns kinetic + potential energy of all particles (exact, n*n) """
+    kinetic = sum(0.5 * p.mass * p.speed**2 for p in particles)
+    potential = 0.0
+    for i, p1 in enumerate(particles):
+        for p2 in particles[i+1:]:
+            dist = math.hypot(p1.x - p2.x, p1.y - p2.y)
+            if dist > 0:
+                potential -= GRAVITY * p1.mass * p2.mass / dist
+    return kinetic + potential
+
+def benchmark(steps=50):
+    """ Compare exact 'attract' with Barnes-Hut 'attract_bh', and both backends """
+    import time
+    backends = ('list',) if numpy is None else ('list', 'array')
+    for backend in backends:
+        for (n, methods) in ((500, ('attract', 'attract_bh')), (5000, ('attract', 'attract_bh'))):
+            for method in methods:
+                todo = steps
+                if n > 1000 and method == 'attract' and backend == 'list':
+                    todo = 1 # far too slow for more steps
+                random.seed(1)
+                universe = Environment((3000, 3000), backend)
+                universe.addFunctions(['move', method])
+                universe.addParticles(n, mass=10, size=1, speed=0)
+                start_energy = energy(universe.particles) if n <= 1000 else None
+                start = time.time()
+                for step in range(todo):
+                    universe.update()
+                duration = (time.time() - start) / todo
+                if start_energy is None:
+                    drift = "not measured (n*n)"
+                else:
+                    drift = "%.4f%%" % ((energy(universe.particles) - start_energy) / abs(start_energy) * 100)
+                print("%-5s %5i particles %-10s: %8.1f ms per step, energy drift after %i steps: %s" %
+                      (backend, n, method, duration * 1000, todo, drift))
+    # ---- grid against all pairs: the same order, the same result ----
+    for backend in backends:
+        results = []
+        for use_grid in (True, False):
+            random.seed(2)
+            universe = Environment((600, 600), backend)
+            universe.addFunctions(['move', 'drag', 'bounce', 'combine', 'collide', 'accelerate'])
+            universe.acceleration = (math.pi, 0.2)
+            universe.use_grid = use_grid
+            universe.addParticles(300)
+            for p in universe.particles:
+                p.speed = random.uniform(0, 9)
+            start = time.time()
+            for step in range(steps):
+                universe.update()
+            results.append([(p.x, p.y, p.speed) for p in universe.particles])
+            print("%-5s collide and combine, 300 particles, %-9s: %.1f ms per step" %
+                  (backend, "grid" if use_grid else "all pairs", (time.time() - start) / steps * 1000))
+        print("%-5s grid and all pairs give the same particles: %s" % (backend, results[0] == results[1]))
+    # ---- the functions of planetgame.py ----
+    for backend in backends:
+        random.seed(1)
+        universe = Environment((600, 600), backend)
+        universe.addFunctions(['move', 'attract', 'combine', 'bounce'])
+        universe.addParticles(200, mass=1, size=0.5, speed=0)
+        start = time.time()
+        for step in range(steps):
+            universe.update()
+        print("%-5s planetgame functions, 200 particles: %.1f ms per step" %
+              (backend, (time.time() - start) / steps * 1000))
+
+if __name__ == "__main__":
+    benchmark()
@@ -11,8 +11,13 @@ import random
 import pygame
 import particles 
 import os
+import sys
 import math
 
+# shared helper modules are in the lib folder of the pygame folder
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from lib import trail
+
 #todo: universe zoom funktion: height und width anpassen auf universe-screen. aber nur bei rauszoomen
 #todo: lambdas wegtun bei controller
 #todo: trail farben
@@ -64,6 +69,7 @@ universe = particles.Environment((width, height))
 universe.colour = (0,0,0)
 universe.addFunctions(['move', 'attract', 'combine', 'bounce'])
 #universe.addFunctions(['move', 'attract', 'collide', 'combine', 'bounce'])
+#universe.addFunctions(['move', 'attract_bh', 'combine', 'bounce']) # Barnes-Hut gravity, for many particles
 universe_screen = UniverseScreen(width, height)
 
 
@@ -87,6 +93,8 @@ key_to_function = {
     pygame.K_PLUS:   (lambda x: x.zoom(2)),
     pygame.K_r:      (lambda x: x.reset())}
 
+startrails = {} # particle: Trail of its last positions, appended after each universe.update()
+
 clock = pygame.time.Clock()
 paused = False
 running = True
@@ -187,19 +195,22 @@ while running:
 
     if not paused:
         universe.update()
+        for p in universe.particles:
+            if p not in startrails:
+                startrails[p] = trail.Trail(particles.ParticleArray.historylength)
+            startrails[p].append(p.x, p.y)
         
     screen.fill(universe.colour)
     # ---- paint trail of destroyed stars ----
-    for minilist in universe.history:
-            color = len(minilist)
-            for pos in minilist:
-                hx = pos[0]
-                hy = pos[1]
-                hx = int(universe_screen.mx + (universe_screen.dx + hx) * universe_screen.magnification)
-                hy = int(universe_screen.my + (universe_screen.dy + hy) * universe_screen.magnification)
-                pygame.draw.rect(screen, (255-min(color, p.colour[0]), 255-min(color, p.colour[1]), 255-min(color, p.colour[2])), (hx, hy, 2,2))
-            del minilist[0]
-    universe.history = [li for li in universe.history if len(li)>0] # cleanup lost trail history
+    # trail positions are moved by offset and multiplied by magnification
+    offset = (universe_screen.mx + universe_screen.dx * universe_screen.magnification,
+              universe_screen.my + universe_screen.dy * universe_screen.magnification)
+    for colour, startrail in universe.history:
+            color = len(startrail)
+            startrail.draw(screen, (255-min(color, colour[0]), 255-min(color, colour[1]), 255-min(color, colour[2])),
+                           2, offset=offset, scale=universe_screen.magnification)
+            startrail.popleft()
+    universe.history = [h for h in universe.history if len(h[1])>0] # cleanup lost trail history
     
     particles_to_remove = []
     for p in universe.particles:
@@ -208,15 +219,13 @@ while running:
             p.size = calculateRadius(p.mass)
             del p.__dict__['collide_with']
         # --- paint star trail ----
-        color = 255
-        for pos in p.history:
-            hx = pos[0]
-            hy = pos[1]
-            hx = int(universe_screen.mx + (universe_screen.dx + hx) * universe_screen.magnification)
-            hy = int(universe_screen.my + (universe_screen.dy + hy) * universe_screen.magnification)
-            #print(color, p.colour, hx, hy)
-            pygame.draw.rect(screen, (255-min(color, p.colour[0]), 255-min(color, p.colour[1]), 255-min(color, p.colour[2])), (hx, hy, 2,2))
-            color-= 1
+        # from inverted star colour (oldest position) to nearly white (newest), in 8 color bands
+        startrail = startrails.get(p, [])
+        color = 256 - len(startrail)
+        if startrail:
+            startrail.draw(screen, (255-p.colour[0], 255-p.colour[1], 255-p.colour[2]), 2,
+                           (255-min(color, p.colour[0]), 255-min(color, p.colour[1]), 255-min(color, p.colour[2])), 8,
+                           offset, universe_screen.magnification)
         
         # paint star itself
         x = int(universe_screen.mx + (universe_screen.dx + p.x) * universe_screen.magnification)
@@ -241,7 +250,8 @@ while running:
                                           colour=(255,0,0),x=p.x,y=p.y)
 
         if p in universe.particles:
-            universe.history.append(p.history)
+            if p in startrails:
+                universe.history.append((p.colour, startrails.pop(p)))
             universe.particles.remove(p)
             #fail.play()
 
@@ -13,6 +13,12 @@ import pygame
 import math
 import random
 import os
+import sys
+
+# shared helper modules are in the lib folder of the pygame folder
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from lib import textcache
+from lib import rotocache
 
 GRAD = math.pi / 180  # 2 * pi / 360   # math module needs Radiant instead of Grad
 
@@ -70,6 +76,8 @@ class FlyingObject(pygame.sprite.Sprite):
     """has a unique number"""
     number = 0
     numbers = {}
+    rotations = rotocache.RotationCache(360)  # rotated images, shared by all FlyingObjects
+    smoothrotations = rotocache.RotationCache(360, smooth=True)  # the same, made with rotozoom
     
     def __init__(self, layer=5):
         self._layer = layer   #self.layer = layer
@@ -81,7 +89,7 @@ class FlyingObject(pygame.sprite.Sprite):
     def turn2heading(self):
         """rotate into direction of movement (dx,dy)"""
         self.angle = math.atan2(-self.dx, -self.dy)/math.pi*180.0 
-        self.image = pygame.transform.rotozoom(self.image0,self.angle,1.0)
+        self.image = FlyingObject.smoothrotations.get(self.image0, self.angle)[0]
     
     def rotate_toward(self, target):
         """set turndirection to rotate towards target and returns angle"""
@@ -102,10 +110,7 @@ class FlyingObject(pygame.sprite.Sprite):
 
     def rotate(self):
         """rotate because changes in self.angle"""
-        self.oldcenter = self.rect.center
-        self.image = pygame.transform.rotate(self.image0, self.angle)
-        self.rect = self.image.get_rect()
-        self.rect.center = self.oldcenter
+        FlyingObject.rotations.rotate_sprite(self)  # cached, see lib/rotocache.py
     
     
     def kill(self):
@@ -372,17 +377,10 @@ def draw_examples(background):
     #return background # not necessary to return the surface, it's already in the memory
 
 def write(background, text, x=50, y=150, color=(0,0,0),
-          fontsize=None, center=False):
-        """write text on pygame surface. """
-        if fontsize is None:
-            fontsize = 24
-        font = pygame.font.SysFont('mono', fontsize, bold=True)
-        fw, fh = font.size(text)
-        surface = font.render(text, True, color)
-        if center: # center text around x,y
-            background.blit(surface, (x-fw//2, y-fh//2))
-        else:      # topleft corner is x,y
-            background.blit(surface, (x,y))
+          fontsize=None, center=False, numeric=False):
+        """write text on pygame surface. Font and text surface are cached,
+           numeric=True paints text changing each frame from a glyph atlas"""
+        textcache.write(background, text, x, y, color, fontsize, center, numeric=numeric)
 
 
 class PygView(object):
@@ -390,9 +388,10 @@ class PygView(object):
     height = 0
     images = []
   
-    def __init__(self, width=640, height=400, fps=30):
+    def __init__(self, width=640, height=400, fps=30, stats=False):
         """Initialize pygame, window, background, font,...
-           default arguments """
+           default arguments
+           stats=True prints the hit rates of the text cache at exit"""
         pygame.init()
         PygView.width = width    # make global readable
         PygView.height = height
@@ -401,6 +400,7 @@ class PygView(object):
         self.background.fill((255,255,255)) # fill background white
         self.clock = pygame.time.Clock()
         self.fps = fps
+        self.stats = stats
         self.playtime = 0.0
         #self.font = pygame.font.SysFont('mono', 24, bold=True)
         self.load_resources() 
@@ -491,7 +491,7 @@ class PygView(object):
             self.screen.blit(self.background, (0, 0)) 
             # write text below sprites
             write(self.screen, "FPS: {:6.3}  PLAYTIME: {:6.3} SECONDS".format(
-                           self.clock.get_fps(), self.playtime))
+                           self.clock.get_fps(), self.playtime), numeric=True)
             
             # ----------- clear, draw , update, flip -----------------  
             #self.allgroup.clear(screen, background)
@@ -561,7 +561,10 @@ class PygView(object):
             
             pygame.display.flip()
             
+        if self.stats:
+            print(textcache.report())
         pygame.quit()
 
 if __name__ == '__main__':
-    PygView().run() # try PygView(800,600).run()
+    # python platformgame.py --stats : print the hit rates of the text cache at exit
+    PygView(stats="--stats" in sys.argv).run() # try PygView(800,600).run()
@@ -22,6 +22,14 @@ import random
 import os
 import sys
 
+# shared helper modules are in the lib folder of the pygame folder
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from lib import trail
+from lib import textcache
+from lib import rotocache
+from lib import dirtyrects
+from lib import assets
+
 GRAD = math.pi / 180  # 2 * pi / 360   # math module needs Radiant instead of Grad
 
 
@@ -41,17 +49,11 @@ def distance(spriteA, spriteB):
 
 
 def write(background, text, x=50, y=150, color=(0, 0, 0),
-          fontsize=None, center=False):
-    """write text on pygame surface. """
-    if fontsize is None:
-        fontsize = 24
-    font = pygame.font.SysFont('mono', fontsize, bold=True)
-    fw, fh = font.size(text)
-    surface = font.render(text, True, color)
-    if center:  # center text around x,y
-        background.blit(surface, (x - fw // 2, y - fh // 2))
-    else:  # topleft corner is x,y
-        background.blit(surface, (x, y))
+          fontsize=None, center=False, numeric=False):
+    """write text on pygame surface. Font and text surface are cached,
+       numeric=True paints text changing each frame from a glyph atlas.
+       returns the Rect of the text"""
+    return textcache.write(background, text, x, y, color, fontsize, center, numeric=numeric)
 
 
 def elastic_collision(sprite1, sprite2):
@@ -103,10 +105,12 @@ def fill_surface_with_tiles(tile, width, height, leave_border_empty=False):
 
 # --- game Classes --------
 
-class FlyingObject(pygame.sprite.Sprite):
-    """base class for sprites. this class inherits from pygames sprite class"""
+class FlyingObject(pygame.sprite.DirtySprite):
+    """base class for sprites. this class inherits from pygames DirtySprite class"""
     number = 0  # current number of Flying Object. 0 means no FlyingObjects yet
     numbers = {}  # {number: Sprite}
+    rotations = rotocache.RotationCache(360)  # rotated images, shared by all FlyingObjects
+    smoothrotations = rotocache.RotationCache(360, smooth=True)  # the same, made with rotozoom
 
     def __init__(self, **kwargs):
         """create a (black) surface and paint a blue ball on it"""
@@ -167,8 +171,9 @@ class FlyingObject(pygame.sprite.Sprite):
             self.__setattr__(k, kwargs[k])  # overwriting defaults
         # -------- create Sprite ------------
         self._layer = self.layer  # self.layer = layer
-        pygame.sprite.Sprite.__init__(self, self.groups)  # call parent class. NEVER FORGET !
+        pygame.sprite.DirtySprite.__init__(self, self.groups)  # call parent class. NEVER FORGET !
         # self groups is set in PygView.paint()
+        self.dirty = 2  # moving sprite, repaint each frame (for dirty rects)
         FlyingObject.number += 1
         self.number = FlyingObject.number  # unique number for each sprite
         FlyingObject.numbers[self.number] = self  # dictionary, key is the number, value is the sprite
@@ -188,7 +193,7 @@ class FlyingObject(pygame.sprite.Sprite):
 
         # ---- make trail ------
         if self.trail:
-            self.oldposlist = []
+            self.oldposlist = trail.Trail(self.trail_max_length + 1)  # ring buffer
     
     def create_image(self):
         if self.imagenr is None:
@@ -235,14 +240,11 @@ class FlyingObject(pygame.sprite.Sprite):
     def turn_to_heading(self):
         """rotate into direction of movement (dx,dy)"""
         self.angle = math.atan2(-self.dx, -self.dy) / math.pi * 180.0
-        self.image = pygame.transform.rotozoom(self.image0, self.angle, 1.0)
+        self.image = FlyingObject.smoothrotations.get(self.image0, self.angle)[0]
     
     def rotate(self):
         """rotate because changes in self.angle"""
-        self.oldcenter = self.rect.center
-        self.image = pygame.transform.rotate(self.image0, self.angle)
-        self.rect = self.image.get_rect()
-        self.rect.center = self.oldcenter
+        FlyingObject.rotations.rotate_sprite(self)  # cached, see lib/rotocache.py
 
     def rotate_toward(self, target):
         """set dx dy and angle toward a target. need self.speed"""
@@ -356,9 +358,7 @@ class FlyingObject(pygame.sprite.Sprite):
         self.rect.centery = round(self.y, 0)
         # ---- paint trail ----
         if self.trail:
-            if len(self.oldposlist) > self.trail_max_length:
-                self.oldposlist.pop(0)  # remove first item
-            self.oldposlist.append((self.x, self.y))
+            self.oldposlist.append(self.x, self.y)  # overwrites the oldest position
 
 
 class Basebar(pygame.sprite.Sprite):
@@ -545,8 +545,12 @@ class Room(object):
 class PygView(object):
     images = []
     
-    def __init__(self, width=640, height=400, worldwidth=2000, worldheight=2000, mx=0, my=0, zoom=1.0, fps=30, grid=50):
-        """Initialize pygame, window, background, font,..."""
+    def __init__(self, width=640, height=400, worldwidth=2000, worldheight=2000, mx=0, my=0, zoom=1.0, fps=30, grid=50,
+                 dirty=False, compare=0, stats=False):
+        """Initialize pygame, window, background, font,...
+           dirty=True repaints only the changed parts of the screen (dirty rects),
+           compare=5 switches between full flip and dirty rects every 5 seconds,
+           stats=True prints the hit rates of the text cache and the dirty rect counts at exit"""
         pygame.init()
         pygame.display.set_caption("Press ESC to quit")
         PygView.width = width  # make global readable
@@ -562,7 +566,11 @@ class PygView(object):
         self.background.fill((255, 255, 255))  # fill background white
         self.clock = pygame.time.Clock()
         self.fps = fps
+        if compare:
+            self.fps = 0  # no frame limit, to compare the fps of both modes
+        self.stats = stats
         self.playtime = 0.0
+        self.dirtyscreen = dirtyrects.DirtyScreen(self.screen, dirty, compare=compare)
         # self.font = pygame.font.SysFont('mono', 24, bold=True)
         self.loadresources()  # loadresources calls paintgrid
         # joystick
@@ -610,10 +618,11 @@ class PygView(object):
         # make an interesting background 
         #draw_examples(self.background)  # background artwork
         try:  # ----------- load sprite images -----------
-            tile = pygame.image.load(os.path.join("data", "startile-300px.png"))
-            # tile = pygame.transform.scale(tile, (100,100)) # scale tile to (pixel): x=100, y=100
-            PygView.images.append(pygame.image.load(os.path.join("data", "babytux.png")))  # index 0
-            PygView.images.append(pygame.image.load(os.path.join("data", "babytux_neg.png")))  # index 1
+            data = assets.manager("data")  # converted images, see lib/assets.py
+            tile = data.image("startile-300px.png")
+            # tile = data.image("startile-300px.png", size=(100,100)) # scale tile to (pixel): x=100, y=100
+            PygView.images.append(data.image("babytux.png"))  # index 0
+            PygView.images.append(data.image("babytux_neg.png"))  # index 1
             # PygView.images.append(pygame.image.load(os.path.join("data", "babytux_neg.png")))   # index 2
             
             # load other resources here
@@ -634,7 +643,7 @@ class PygView(object):
 
         self.paintgrid()
         # -------  create (pygame) Sprites Groups and Sprites -------------
-        self.allgroup = pygame.sprite.LayeredUpdates()  # for drawing
+        self.allgroup = pygame.sprite.LayeredDirty()  # for drawing, full or dirty rects, see lib/dirtyrects.py
         self.ballgroup = pygame.sprite.Group()  # for collision detection etc.
         self.hitpointbargroup = pygame.sprite.Group()
         self.bulletgroup = pygame.sprite.Group()
@@ -781,10 +790,11 @@ class PygView(object):
             #self.mx += distx
             #self.my += disty
             #self.
-            self.screen.blit(self.worldbackground, (-self.mx, -self.my))  
+            # restore the background (only the rects painted in the last frame if dirty rects)
+            self.dirtyscreen.clear(self.worldbackground, (self.mx, self.my))
             # write text below sprites
-            write(self.screen, "FPS: {:6.3}  PLAYTIME: {:6.3} SECONDS".format(
-                self.clock.get_fps(), self.playtime))
+            self.dirtyscreen.add(write(self.screen, "FPS: {:6.3}  PLAYTIME: {:6.3} SECONDS".format(
+                self.clock.get_fps(), self.playtime), numeric=True))
             # write in window title
             pygame.display.set_caption(
                 "tux1: x {:.2f} y {:.2f} dx {:.2f} dy {:.2f} ddx {:.2f} ddy {:.2f} ".format(self.tux1.x, self.tux1.y,
@@ -855,27 +865,34 @@ class PygView(object):
                         # ----------- paint trails ----------
             for thing in self.allgroup:
                 if thing.trail:
-                    e = enumerate(thing.oldposlist)  # ( number, (pos))
-                    for epos in e:
-                        if epos[0] > 0:
-                            pygame.draw.line(self.screen,
-                                             (thing.color[0], thing.color[1],
-                                              int(epos[0] * 255 / thing.trail_max_length)),
-                                             oldpos, epos[1],
-                                             epos[0] // 100 + 4)  # TODO trailwidth dependent from trail_start_width
-                        oldpos = epos[1]
+                    # blue part of color fades in from oldest to newest position, in 5 color bands
+                    self.dirtyscreen.add(thing.oldposlist.draw(self.screen,
+                                          (thing.color[0], thing.color[1], 0), 4,
+                                          (thing.color[0], thing.color[1], 255), 5))  # TODO trailwidth dependent from trail_start_width
             # ----------- clear, draw , update, flip -----------------  
             # self.allgroup.clear(screen, background)
             self.allgroup.update(seconds)  # would also work with ballgroup
             self.hitpointbargroup.update(seconds)  # to avoid "bouncing" hitpointbars
-            self.allgroup.draw(self.screen)
+            self.dirtyscreen.draw(self.allgroup)
             self.hitpointbargroup.draw(self.screen)
+            for bar in self.hitpointbargroup:
+                self.dirtyscreen.add(bar.rect)
             
             # --------- next frame ---------------
-            pygame.display.flip()
+            self.dirtyscreen.update()  # flip, or update only the dirty rects
+            self.dirtyscreen.tick(seconds)
+        if self.stats:
+            print(textcache.report())
+        if self.stats or self.dirtyscreen.compare:
+            print(self.dirtyscreen.report())
         pygame.quit()
 
 
 if __name__ == '__main__':
     # try PygView(800,600).run()
-    PygView().run()
+    # python slurp.py --dirty   : repaint only the changed parts of the screen (dirty rects)
+    #                             (each scrolled frame is a full repaint anyway, so flip is the default)
+    # python slurp.py --compare : switch between flip and dirty rects every 5 seconds, print fps of both
+    # python slurp.py --stats   : print the hit rates of the text cache and the dirty rect counts at exit
+    PygView(dirty="--dirty" in sys.argv, compare=5.0 if "--compare" in sys.argv else 0,
+            stats="--stats" in sys.argv).run()
@@ -0,0 +1,287 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+assetbundle.py
+all images, collision masks and sounds of a data folder, already decoded, in one file
+author: horst.jens@spielend-programmieren.at
+licence: gpl, see http://www.gnu.org/licenses/gpl.html
+
+Decoding .jpg, .png, .gif and .ogg files costs time at each start of a game
+(800px-La_naissance_de_Venus.jpg alone: about 4 ms). build() does this work
+once and writes the results into one bundle file (data/assets.bundle):
+
+ * images: 32 bit pixels in the memory order B, G, R, A. This is the pixel
+           format of convert_alpha() (and, without the alpha byte, of
+           convert()) on a usual 32 bit display. The colorkey of .gif
+           images is kept.
+ * masks:  the bits of pygame.mask.from_surface() for each image
+           (for pixel perfect collision detection)
+ * sounds: the decoded PCM samples of pygame.mixer.Sound (without very
+           long music files, see maxpcm)
+
+The file is opened with mmap (copy on write, so painting on an image does
+not change the file). Images with alpha are made with pygame.image.frombuffer()
+and use the memory of the file directly, images without alpha are copied
+once into a display format surface (frombuffer knows no "BGRX" format).
+Sounds are made with pygame.mixer.Sound(buffer=...), which copies the samples.
+
+The header has a sha1 hash of the content of all source files. load()
+first compares the size and modification time of each file; only if they
+differ, the hash is calculated again: a bundle of changed files is not used.
+lib/assets.py uses the bundle of a folder automatically if it is current.
+
+usage:
+    python lib/assetbundle.py            # build data/assets.bundle, then a benchmark
+    python lib/assetbundle.py games/slurp/data
+    from lib import assetbundle
+    bundle = assetbundle.load("data")     # None if missing or outdated
+    image = bundle.image("babytux.png")
+    mask = bundle.mask("babytux.png")
+    sound = bundle.sound("claws.ogg")     # None if the mixer has another format
+
+run this file directly to build the bundle and for a benchmark
+(starting with the bundle against decoding each file)
+
+works with python3.4
+"""
+
+#the next line is only needed for python2.x and not necessary for python3.x
+from __future__ import print_function, division
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+import pygame
+
+DATAFOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+BUNDLENAME = "assets.bundle"
+IMAGES = (".png", ".jpg", ".jpeg", ".gif", ".bmp")
+SOUNDS = (".wav", ".ogg")
+MAGIC = b"PGAB"
+VERSION = 1
+HEADER = struct.Struct("<4sB20sI")  # magic, version, sha1 of the source files, length of the index
+MASKS = (0xFF0000, 0xFF00, 0xFF)    # red, green, blue masks of "BGRA" pixels (little endian)
+ALIGN = 16                          # each image, mask and sound starts at a multiple of ALIGN
+
+
+def sourcefiles(folder):
+    """names of all image and sound files in folder"""
+    return sorted(name for name in os.listdir(folder) if name.lower().endswith(IMAGES + SOUNDS))
+
+
+def stamp(folder, names):
+    """size and modification time of each file: cheap check if the files have changed"""
+    result = []
+    for name in names:
+        info = os.stat(os.path.join(folder, name))
+        result.append([name, info.st_size, int(info.st_mtime)])
+    return result
+
+
+def contenthash(folder, names):
+    """sha1 of the names and the content of all files"""
+    sha1 = hashlib.sha1()
+    for name in names:
+        sha1.update(name.encode("utf-8") + b"\0")
+        with open(os.path.join(folder, name), "rb") as f:
+            sha1.update(f.read())
+    return sha1.digest()
+
+
+def build(folder=DATAFOLDER, filename=None, maxpcm=4 * 1024 * 1024):
+    """decode all images and sounds of folder and write them into one bundle file
+       (default: folder/assets.bundle). Sounds with more than maxpcm bytes of samples
+       (music) are left out. returns the filename"""
+    filename = filename or os.path.join(folder, BUNDLENAME)
+    if not pygame.mixer.get_init():
+        pygame.mixer.init(44100, -16, 2, 2048)
+    names = sourcefiles(folder)
+    index = {"files": {}, "stamp": stamp(folder, names), "mixer": list(pygame.mixer.get_init()),
+             "maskbytes": memoryview(pygame.mask.Mask((64, 1))).itemsize}
+    chunks = []
+    offset = [0]  # offsets are counted from the start of the data (behind the index)
+
+    def add(data):
+        start = offset[0]
+        chunks.append(data)
+        offset[0] += len(data)
+        padding = -offset[0] % ALIGN
+        chunks.append(b"\0" * padding)
+        offset[0] += padding
+        return start
+
+    for name in names:
+        path = os.path.join(folder, name)
+        try:
+            if name.lower().endswith(SOUNDS):
+                pcm = pygame.mixer.Sound(path).get_raw()
+                if len(pcm) > maxpcm:
+                    continue  # music: better played with pygame.mixer.music
+                index["files"][name] = {"sound": add(pcm), "length": len(pcm)}
+                continue
+            surface = pygame.image.load(path)
+        except pygame.error as error:
+            print("assetbundle: can not decode %s: %s" % (name, error))
+            continue
+        width, height = surface.get_size()
+        alpha = bool(surface.get_flags() & pygame.SRCALPHA)
+        pixels = bytearray(pygame.image.tobytes(surface, "BGRA"))
+        if not alpha:
+            pixels[3::4] = bytes(width * height)  # like convert(): else the colorkey does not match
+        entry = {"image": add(bytes(pixels)), "size": [width, height], "alpha": alpha, "colorkey": None}
+        if surface.get_colorkey() is not None:
+            entry["colorkey"] = list(surface.get_colorkey())[:3]
+        mask = memoryview(pygame.mask.from_surface(surface))
+        entry["mask"] = add(mask.tobytes())
+        entry["masklength"] = mask.nbytes
+        index["files"][name] = entry
+    indexbytes = json.dumps(index, sort_keys=True).encode("utf-8")
+    # the data starts at a multiple of ALIGN, too
+    indexbytes += b" " * (-(HEADER.size + len(indexbytes)) % ALIGN)
+    with open(filename + ".tmp", "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, contenthash(folder, names), len(indexbytes)))
+        f.write(indexbytes)
+        for data in chunks:
+            f.write(data)
+    os.replace(filename + ".tmp", filename)
+    return filename
+
+
+class Bundle(object):
+    """a bundle file made by build(), opened with mmap"""
+    def __init__(self, filename):
+        self.filename = filename
+        with open(filename, "rb") as f:
+            # ACCESS_COPY: pages are shared with the file until someone paints on an image
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, version, self.hash, length = HEADER.unpack_from(self.map)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("%s is not an asset bundle of version %i" % (filename, VERSION))
+        index = json.loads(self.map[HEADER.size:HEADER.size + length].decode("utf-8"))
+        self.files = index["files"]
+        self.stamp = index["stamp"]
+        self.mixer = tuple(index["mixer"])
+        self.maskbytes = index["maskbytes"]
+        self.data = memoryview(self.map)[HEADER.size + length:]
+
+    def __contains__(self, name):
+        return name in self.files
+
+    def is_current(self, folder):
+        """True if the files of folder are the files of the bundle"""
+        names = sourcefiles(folder)
+        if names != [name for name, size, mtime in self.stamp]:
+            return False  # a new or removed file
+        if stamp(folder, names) == self.stamp:
+            return True
+        return contenthash(folder, names) == self.hash  # touched (git checkout), but same content?
+
+    def image(self, name):
+        """returns a surface in display format (if there is a display)"""
+        entry = self.files[name]
+        width, height = entry["size"]
+        pixels = self.data[entry["image"]:entry["image"] + width * height * 4]
+        display = pygame.display.get_surface()
+        if entry["alpha"]:
+            surface = pygame.image.frombuffer(pixels, (width, height), "BGRA")  # no copy
+            if display is not None and pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha().get_masks()[:3] != MASKS:
+                surface = surface.convert_alpha()  # display with another pixel format
+            return surface
+        surface = pygame.Surface((width, height), 0, 32, MASKS + (0,))
+        surface.get_buffer().write(pixels.tobytes())
+        if entry["colorkey"] is not None:
+            surface.set_colorkey(entry["colorkey"])
+        if display is not None and display.get_masks()[:3] != MASKS:
+            surface = surface.convert()
+        return surface
+
+    def mask(self, name):
+        """returns the collision mask (pygame.mask.from_surface) of image name"""
+        entry = self.files[name]
+        mask = pygame.mask.Mask(entry["size"])
+        bits = memoryview(mask).cast("B")
+        if self.maskbytes != memoryview(mask).itemsize or bits.nbytes != entry["masklength"]:
+            return pygame.mask.from_surface(self.image(name))  # bundle made on another platform
+        bits[:] = self.data[entry["mask"]:entry["mask"] + entry["masklength"]]
+        return mask
+
+    def sound(self, name):
+        """returns a pygame.mixer.Sound, or None if the mixer has not the format of the bundle"""
+        if pygame.mixer.get_init() != self.mixer:
+            return None
+        entry = self.files[name]
+        return pygame.mixer.Sound(buffer=self.data[entry["sound"]:entry["sound"] + entry["length"]])
+
+
+def load(folder=DATAFOLDER, filename=None):
+    """returns the Bundle of folder, or None if there is no current bundle"""
+    filename = filename or os.path.join(folder, BUNDLENAME)
+    if not os.path.exists(filename):
+        return None
+    try:
+        bundle = Bundle(filename)
+    except (ValueError, struct.error):
+        return None
+    if not bundle.is_current(folder):
+        return None
+    return bundle
+
+
+def benchmark(folder=DATAFOLDER, repeats=5):
+    """prints the time to load all files of folder: decoding each file against the bundle"""
+    names = sourcefiles(folder)
+    bundle = load(folder)
+    images = [name for name in names if name in bundle.files and "image" in bundle.files[name]]
+    sounds = [name for name in names if name in bundle.files and "sound" in bundle.files[name]]
+    timings = {}
+    for way in ("files", "bundle"):
+        start = time.time()
+        for repeat in range(repeats):
+            if way == "files":
+                for name in images:
+                    surface = pygame.image.load(os.path.join(folder, name))
+                    surface = surface.convert_alpha() if surface.get_flags() & pygame.SRCALPHA else surface.convert()
+                    pygame.mask.from_surface(surface)
+                for name in sounds:
+                    pygame.mixer.Sound(os.path.join(folder, name))
+            else:
+                bundle = load(folder)  # with the check of the files
+                for name in images:
+                    bundle.image(name)
+                    bundle.mask(name)
+                for name in sounds:
+                    bundle.sound(name)
+        timings[way] = (time.time() - start) * 1000 / repeats
+    print("%i images (with masks) and %i sounds of %s:" % (len(images), len(sounds), folder))
+    print("decoding each file + convert + mask : %8.2f ms" % timings["files"])
+    print("assets.bundle (%8i bytes)       : %8.2f ms (%.1f times faster)" % (
+        os.path.getsize(bundle.filename), timings["bundle"], timings["files"] / timings["bundle"]))
+    start = time.time()
+    contenthash(folder, names)
+    print("content hash of all files (only if a file was touched): %.2f ms" % ((time.time() - start) * 1000))
+    for name in ("800px-La_naissance_de_Venus.jpg", "babytux.png"):
+        if name in images:
+            start = time.time()
+            pygame.image.load(os.path.join(folder, name)).convert()
+            middle = time.time()
+            bundle.image(name)
+            print("%-32s: %6.3f ms decoding, %6.3f ms from the bundle" % (
+                name, (middle - start) * 1000, (time.time() - middle) * 1000))
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # no window necessary
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.mixer.pre_init(44100, -16, 2, 2048)
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    datafolder = sys.argv[1] if len(sys.argv) > 1 else DATAFOLDER
+    start = time.time()
+    build(datafolder)
+    print("built %s in %.2f ms" % (os.path.join(datafolder, BUNDLENAME), (time.time() - start) * 1000))
+    benchmark(datafolder)
+    pygame.quit()
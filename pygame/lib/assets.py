@@ -0,0 +1,390 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+assets.py
+load each image and sound file only once, converted for fast blitting
+author: horst.jens@spielend-programmieren.at
+licence: gpl, see http://www.gnu.org/licenses/gpl.html
+
+Most games load their files with pygame.image.load(os.path.join("data", ...)),
+some forget convert() or convert_alpha(), and blitting an unconverted
+surface is several times slower. Games started one after another
+(from a menu) load the same files (babytux.png, ...) again and again.
+
+An AssetManager (one for each data folder, see manager()) keeps:
+
+ * images: each file is decoded once and converted to the display format
+           (convert_alpha() for images with transparent pixels, else
+           convert(), keeping a colorkey) the first time image() is called.
+           Scaled versions (size=...) are cached, too.
+ * atlases: pack() pastes many small images onto one big surface (shelf
+           packing). image() then returns a subsurface of the atlas, like
+           008_animation.py cuts the lions out of char9.bmp (see sheet()).
+ * sounds: pygame.mixer.Sound objects
+ * preload(): decodes files in a background thread (for example while a
+           menu is shown). Only the decoding happens in the thread, the
+           conversion needs the display and happens at the first image().
+ * masks: collision masks (pygame.mask.from_surface) of the images
+ * bundle: if the folder has a current assets.bundle (made by
+           lib/assetbundle.py), images, masks and sounds come from there
+           without decoding and converting.
+
+Images and sounds are shared: never paint on a returned surface, paint on
+a copy() instead.
+
+usage:
+    from lib import assets
+    image = assets.image("babytux.png")               # from pygame/data
+    data = assets.manager("data")                     # data folder of a game
+    data.preload(["babytux.png", "heart.png", "boom.wav"])  # background thread
+    data.pack(["babytux.png", "babytux_neg.png", "heart.png"])
+    image = data.image("heart.png")                   # subsurface of an atlas
+    mask = data.mask("xmonster.png")                  # for pixel perfect collision
+    lions = data.sheet("char9.bmp", [(0, 64, 127, 127), (127, 64, 127, 127)], (0, 0, 0))
+    print(data.report())                              # load times and bytes
+
+run this file directly for a benchmark
+
+works with python3.4 and python2.7
+"""
+
+#the next line is only needed for python2.x and not necessary for python3.x
+from __future__ import print_function, division
+
+import collections
+import os
+import threading
+import time
+import pygame
+
+try:
+    from lib import assetbundle
+except ImportError:
+    import assetbundle  # this file was started directly
+
+DATAFOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+SOUNDS = (".wav", ".ogg")
+
+
+class Atlas(object):
+    """one big surface with many small images, side by side in rows (shelves)"""
+    def __init__(self, size=(1024, 1024), padding=1):
+        self.image = pygame.Surface(size, pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            self.image = self.image.convert_alpha()
+        self.image.fill((0, 0, 0, 0))
+        self.padding = padding
+        self.x = 0                     # next free place in the current shelf
+        self.y = 0                     # top of the current shelf
+        self.shelf = 0                 # height of the current shelf
+        self.used = 0                  # pixels used by images
+
+    def add(self, surface):
+        """paste surface into the atlas, returns the subsurface or None if the atlas is full"""
+        width, height = surface.get_size()
+        if self.x + width > self.image.get_width():
+            self.y += self.shelf + self.padding  # start a new shelf
+            self.x = 0
+            self.shelf = 0
+        if self.x + width > self.image.get_width() or self.y + height > self.image.get_height():
+            return None
+        rect = pygame.Rect(self.x, self.y, width, height)
+        # BLEND_RGBA_MAX on the empty (0,0,0,0) atlas copies the pixels and their alpha
+        self.image.blit(surface.convert_alpha() if pygame.display.get_surface() else surface,
+                        rect, special_flags=pygame.BLEND_RGBA_MAX)
+        self.x += width + self.padding
+        self.shelf = max(self.shelf, height)
+        self.used += width * height
+        return self.image.subsurface(rect)
+
+
+class AssetManager(object):
+    """loads the images and sounds of one folder, each only once"""
+    def __init__(self, folder=DATAFOLDER, atlassize=(1024, 1024), bundle=True):
+        self.folder = folder
+        self.bundle = assetbundle.load(folder) if bundle else None  # None: no current assets.bundle
+        self.atlassize = atlassize
+        self.raw = {}                  # filename: decoded surface, not yet converted
+        self.images = {}               # (filename, colorkey, size): converted surface
+        self.sounds = {}               # filename: pygame.mixer.Sound
+        self.masks = {}                # filename: pygame.mask.Mask
+        self.packed = {}               # filename: subsurface of an atlas
+        self.atlases = []
+        self.stats = {}                # filename: [decode seconds, convert seconds, bytes, uses, "thread" or "bundle"]
+        self.condition = threading.Condition()
+        self.decoding = None           # filename decoded by the preload thread right now
+        self.queue = collections.deque()  # filenames waiting for the preload thread
+        self.thread = None
+
+    def path(self, name):
+        return os.path.join(self.folder, name)
+
+    def stat(self, name):
+        if name not in self.stats:
+            self.stats[name] = [0.0, 0.0, 0, 0, ""]
+        return self.stats[name]
+
+    def decode(self, name, thread=False):
+        """load the file without any conversion, returns a Surface or Sound.
+           Files of the bundle need no decoding (and images no conversion)"""
+        start = time.time()
+        sound = name.lower().endswith(SOUNDS)
+        result = None
+        if self.bundle is not None and name in self.bundle:
+            result = self.bundle.sound(name) if sound else self.bundle.image(name)
+        where = "bundle" if result is not None else ("thread" if thread else "")
+        if result is None and sound:
+            result = pygame.mixer.Sound(self.path(name))  # bundle.sound() is None if the mixer has another format
+        elif result is None:
+            result = pygame.image.load(self.path(name))
+        if sound:
+            frequency, bits, channels = pygame.mixer.get_init()
+            size = int(result.get_length() * frequency) * channels * abs(bits) // 8
+        else:
+            size = result.get_pitch() * result.get_height()
+        with self.condition:
+            stat = self.stat(name)
+            stat[0] += time.time() - start
+            stat[2] = size
+            stat[4] = where
+        return result
+
+    def raw_image(self, name):
+        """the decoded (not converted) surface, maybe decoded by the preload thread"""
+        with self.condition:
+            while self.decoding == name:
+                self.condition.wait()  # the preload thread is decoding this file right now
+            surface = self.raw.get(name)
+        if surface is None:
+            surface = self.decode(name)
+            self.raw[name] = surface
+        return surface
+
+    def image(self, name, colorkey=None, size=None):
+        """returns the converted image of file name (maybe a subsurface of an atlas).
+           colorkey: color to make transparent (for images without alpha)
+           size: (width, height) to scale the image to"""
+        if colorkey is None and size is None and name in self.packed:
+            self.stat(name)[3] += 1
+            return self.packed[name]
+        key = (name, colorkey, size)
+        surface = self.images.get(key)
+        if surface is None:
+            surface = self.raw_image(name)
+            if size is not None:
+                surface = pygame.transform.scale(surface, size)
+            if colorkey is not None:
+                surface = surface.copy()
+                surface.set_colorkey(colorkey)
+            if pygame.display.get_surface() is None:
+                return surface  # convert needs pygame.display.set_mode(), do not keep it
+            start = time.time()
+            if surface is self.raw.get(name) and self.stat(name)[4] == "bundle":
+                pass  # the pixels of the bundle are already in display format
+            elif surface.get_flags() & pygame.SRCALPHA:
+                surface = surface.convert_alpha()
+            else:
+                surface = surface.convert()  # keeps the colorkey
+            stat = self.stat(name)
+            stat[1] += time.time() - start
+            if size is not None:
+                stat[2] += surface.get_pitch() * surface.get_height()
+            self.images[key] = surface
+        self.stat(name)[3] += 1
+        return surface
+
+    def sheet(self, name, rects, colorkey=None):
+        """cut a sprite sheet into a list of subsurfaces (one for each rect)"""
+        surface = self.image(name, colorkey)
+        return [surface.subsurface(rect) for rect in rects]
+
+    def mask(self, name):
+        """returns the (cached) collision mask of image name, see pygame.mask.from_surface"""
+        mask = self.masks.get(name)
+        if mask is None:
+            if self.bundle is not None and name in self.bundle:
+                mask = self.bundle.mask(name)  # made by lib/assetbundle.py
+            else:
+                mask = pygame.mask.from_surface(self.image(name))
+            self.masks[name] = mask
+        return mask
+
+    def pack(self, names, maxsize=128):
+        """paste the images (not bigger than maxsize) of names into atlases,
+           image(name) returns then a subsurface of an atlas"""
+        for name in names:
+            if name in self.packed:
+                continue
+            surface = self.image(name)
+            if max(surface.get_size()) > maxsize:
+                continue
+            subsurface = self.atlases[-1].add(surface) if self.atlases else None
+            if subsurface is None:
+                self.atlases.append(Atlas(self.atlassize))
+                subsurface = self.atlases[-1].add(surface)
+            self.packed[name] = subsurface
+
+    def sound(self, name):
+        """returns the (cached) pygame.mixer.Sound of file name"""
+        sound = self.sounds.get(name)
+        if sound is None:
+            with self.condition:
+                while self.decoding == name:
+                    self.condition.wait()
+                sound = self.sounds.get(name)
+            if sound is None:
+                sound = self.decode(name)
+                self.sounds[name] = sound
+        self.stat(name)[3] += 1
+        return sound
+
+    def preload(self, names=None, background=True):
+        """decode the files (default: all images and sounds of the folder),
+           in a background thread if background is True.
+           Calling preload() again while the thread is running adds the files to its queue"""
+        if names is None:
+            names = sorted(name for name in os.listdir(self.folder)
+                           if name.lower().endswith(SOUNDS + (".png", ".jpg", ".jpeg", ".gif", ".bmp")))
+        with self.condition:
+            self.queue.extend(names)
+            if not background:
+                self.thread = threading.current_thread()  # like a thread that is already running
+            elif self.thread is None:
+                self.thread = threading.Thread(target=self._preload, args=(True,))
+                self.thread.daemon = True  # do not keep a closed game alive
+                self.thread.start()
+                return
+            else:
+                return
+        self._preload(False)
+
+    def _preload(self, thread):
+        while True:
+            with self.condition:
+                if not self.queue:
+                    self.thread = None
+                    self.condition.notify_all()
+                    return
+                name = self.queue.popleft()
+                sound = name.lower().endswith(SOUNDS)
+                if name in self.raw or name in self.sounds or (sound and not pygame.mixer.get_init()):
+                    continue
+                if self.bundle is not None and name in self.bundle:
+                    continue  # nothing to decode
+                self.decoding = name
+            try:
+                result = self.decode(name, thread)
+            except (pygame.error, IOError):
+                result = None  # image() or sound() will raise the error
+            with self.condition:
+                if result is not None:
+                    (self.sounds if sound else self.raw)[name] = result
+                self.decoding = None
+                self.condition.notify_all()
+
+    def wait(self):
+        """wait until the preload thread has finished"""
+        with self.condition:
+            while self.thread is not None:
+                self.condition.wait()
+
+    def report(self):
+        """returns a text with decode and convert time, bytes and uses of each file"""
+        lines = ["assets %s:" % self.folder]
+        total = 0
+        for name in sorted(self.stats, key=lambda name: -self.stats[name][2]):
+            decode, convert, size, uses, where = self.stats[name]
+            total += size
+            lines.append("assets %-32s decode %7.2f ms %-8s convert %6.2f ms %9i bytes %5i uses%s" %
+                         (name, decode * 1000, "(%s)" % where if where else "", convert * 1000,
+                          size, uses, " (atlas)" if name in self.packed else ""))
+        for number, atlas in enumerate(self.atlases):
+            width, height = atlas.image.get_size()
+            lines.append("assets atlas %i: %ix%i pixel, %.1f%% used" %
+                         (number, width, height, atlas.used * 100.0 / (width * height)))
+        lines.append("assets total: %i files, %i bytes" % (len(self.stats), total))
+        return "\n".join(lines)
+
+
+managers = {}  # absolute folder name: AssetManager
+
+
+def manager(folder=DATAFOLDER):
+    """returns the AssetManager of folder (one for each folder, shared by all games)"""
+    folder = os.path.abspath(folder)
+    if folder not in managers:
+        managers[folder] = AssetManager(folder)
+    return managers[folder]
+
+
+def image(name, colorkey=None, size=None, folder=DATAFOLDER):
+    """returns the converted image of file name in folder (default: pygame/data)"""
+    return manager(folder).image(name, colorkey, size)
+
+
+def sound(name, folder=DATAFOLDER):
+    """returns the pygame.mixer.Sound of file name in folder (default: pygame/data)"""
+    return manager(folder).sound(name)
+
+
+def mask(name, folder=DATAFOLDER):
+    """returns the collision mask of image file name in folder (default: pygame/data)"""
+    return manager(folder).mask(name)
+
+
+def report():
+    """returns the report of all AssetManagers"""
+    return "\n".join(assetmanager.report() for assetmanager in managers.values())
+
+
+if __name__ == "__main__":
+    # ------ benchmark: loading, blitting and preloading the files of pygame/data ------
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # no window necessary
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.mixer.pre_init(44100, -16, 2, 2048)
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    sprites = ["babytux.png", "babytux_neg.png", "heart.png", "crossmonster.png", "xmonster.png",
+               "player_red2.png", "player_blue2.png", "alien1.gif", "bomb.gif", "shot.gif"]
+    games = 5  # five games (started from a menu) loading the same sprites
+    start = time.time()
+    for game in range(games):
+        for name in sprites:
+            pygame.image.load(os.path.join(DATAFOLDER, name))
+    print("pygame.image.load, %i games    : %8.2f ms" % (games, (time.time() - start) * 1000))
+    data = AssetManager(DATAFOLDER, bundle=False)  # see lib/assetbundle.py for the bundle
+    start = time.time()
+    for game in range(games):
+        for name in sprites:
+            data.image(name)
+    print("assets.image, %i games         : %8.2f ms" % (games, (time.time() - start) * 1000))
+    blits = 20000
+    for text, surface in (("unconverted", pygame.image.load(os.path.join(DATAFOLDER, "babytux.png"))),
+                          ("converted", data.image("babytux.png"))):
+        start = time.time()
+        for i in range(blits):
+            screen.blit(surface, (i % 700, i % 500))
+        print("blit %-11s babytux.png     : %8.3f ms per 1000 blits" % (text, (time.time() - start) * 1000000 / blits))
+    data.pack(sprites)
+    start = time.time()
+    for i in range(blits):
+        screen.blit(data.image("babytux.png"), (i % 700, i % 500))
+    print("blit atlas subsurface babytux.png : %8.3f ms per 1000 blits" % ((time.time() - start) * 1000000 / blits))
+    # preload everything else in a background thread while the main thread keeps painting (like a menu)
+    background = AssetManager(DATAFOLDER, bundle=False)
+    start = time.time()
+    background.preload()
+    frames = 0
+    while background.thread is not None:
+        screen.fill((255, 255, 255))
+        pygame.display.flip()
+        frames += 1
+    background.wait()
+    print("preload thread: all files in %.2f ms, %i menu frames painted meanwhile" %
+          ((time.time() - start) * 1000, frames))
+    start = time.time()
+    for name in background.raw:
+        background.image(name)
+    print("convert all preloaded images   : %8.2f ms" % ((time.time() - start) * 1000))
+    print(background.report())
+    pygame.quit()
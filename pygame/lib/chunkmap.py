@@ -0,0 +1,247 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+chunkmap.py
+a big scrolling world map made of small chunks, painted only when needed
+author: horst.jens@spielend-programmieren.at
+licence: gpl, see http://www.gnu.org/licenses/gpl.html
+
+A scrolling game can paint the whole world onto one big surface
+(bigmap) and show a part of it. But the memory of bigmap grows with
+width * height: a world of 20000 x 20000 pixel needs 1.6 GB.
+
+A ChunkMap cuts the world into square chunks (like 256 x 256 pixel).
+A chunk is painted by a painter function only when it is visible (or
+nearly visible) and is remembered in an LRU cache with a memory budget
+(in bytes). If the chunks need more memory, the least recently used
+chunks are thrown away (and painted again if they are needed later).
+
+The painter function gets a chunk surface and the rect of this chunk
+inside the world. It must paint the world part inside this rect, for
+example by moving all drawing coordinates by -rect.x and -rect.y:
+
+    def painter(surface, rect):
+        surface.fill((128,128,128))
+        pygame.draw.line(surface, (0,0,0), (500-rect.x, 0-rect.y), (500-rect.x, 9999-rect.y))
+
+usage:
+    world = ChunkMap(20000, 20000, painter)
+    world.draw(background, cornerpoint)      # paint the visible part of the world
+    world.prefetch(cornerpoint, (640, 480))  # each frame: prepare chunks near the screen
+    print(world.report())
+
+run this file directly for a benchmark (bigmap against ChunkMap)
+python chunkmap.py check : compare ChunkMap with one big surface at many viewports
+
+A painter must give the same pixels, no matter how the world is cut into
+chunks. Shapes that pygame clips at the surface border (like a rect with
+a thick border, pygame.draw.rect(..., 25)) can be painted a few pixels
+different in a small chunk: paint them as filled rects. check() finds
+such differences.
+
+works with python3.4 and python2.7
+"""
+
+#the next line is only needed for python2.x and not necessary for python3.x
+from __future__ import print_function, division
+
+import collections
+import pygame
+
+
+class ChunkMap(object):
+    """world of width x height pixel, cut into chunks of chunksize x chunksize pixel"""
+    def __init__(self, width, height, painter, chunksize=256, budget=16 * 1024 * 1024,
+                 margin=1, prefetchlimit=2):
+        self.width = width
+        self.height = height
+        self.painter = painter        # function(surface, rect) painting the world inside rect
+        self.chunksize = chunksize
+        self.budget = budget          # maximum memory for all chunks in bytes
+        self.margin = margin          # prefetch chunks up to margin chunks outside the screen
+        self.prefetchlimit = prefetchlimit  # maximum number of chunks painted by one prefetch()
+        self.columns = (width + chunksize - 1) // chunksize
+        self.rows = (height + chunksize - 1) // chunksize
+        self.chunks = collections.OrderedDict()  # (column, row): surface, oldest first
+        self.size = 0                 # memory used by all chunks, in bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.prefetched = 0
+
+    def chunkrect(self, column, row):
+        """returns the Rect of this chunk inside the world (chunks at the edge are smaller)"""
+        x = column * self.chunksize
+        y = row * self.chunksize
+        return pygame.Rect(x, y, min(self.chunksize, self.width - x), min(self.chunksize, self.height - y))
+
+    def make(self, column, row):
+        """paint a new chunk surface"""
+        rect = self.chunkrect(column, row)
+        surface = pygame.Surface(rect.size)
+        self.painter(surface, rect)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
+
+    def chunk(self, column, row):
+        """returns the (cached) surface of this chunk"""
+        key = (column, row)
+        surface = self.chunks.pop(key, None)
+        if surface is None:
+            self.misses += 1
+            surface = self.add(key)
+        else:
+            self.hits += 1
+        self.chunks[key] = surface  # (again) at the end: most recently used
+        return surface
+
+    def add(self, key):
+        """paint the chunk key and make room for it in the budget"""
+        surface = self.make(*key)
+        self.size += self.bytes(surface)
+        while self.size > self.budget and self.chunks:
+            oldsurface = self.chunks.popitem(last=False)[1]  # least recently used
+            self.size -= self.bytes(oldsurface)
+            self.evictions += 1
+        return surface
+
+    def bytes(self, surface):
+        width, height = surface.get_size()
+        return width * height * surface.get_bytesize()
+
+    def visible(self, cornerpoint, size, margin=0):
+        """returns (first column, last column, first row, last row) of the chunks
+           inside the area at cornerpoint with size (plus margin chunks around it)"""
+        first_column = max(0, int(cornerpoint[0]) // self.chunksize - margin)
+        last_column = min(self.columns - 1, (int(cornerpoint[0]) + size[0] - 1) // self.chunksize + margin)
+        first_row = max(0, int(cornerpoint[1]) // self.chunksize - margin)
+        last_row = min(self.rows - 1, (int(cornerpoint[1]) + size[1] - 1) // self.chunksize + margin)
+        return first_column, last_column, first_row, last_row
+
+    def draw(self, target, cornerpoint, pos=(0, 0)):
+        """blit the visible chunks onto target. cornerpoint is the world position
+           of the topleft corner of target (like Config.cornerpoint)"""
+        size = target.get_size()
+        first_column, last_column, first_row, last_row = self.visible(cornerpoint, size)
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                target.blit(self.chunk(column, row),
+                            (pos[0] + column * self.chunksize - int(cornerpoint[0]),
+                             pos[1] + row * self.chunksize - int(cornerpoint[1])))
+
+    def prefetch(self, cornerpoint, size):
+        """paint up to prefetchlimit missing chunks near the visible area,
+           nearest first, so that scrolling does not need to paint many chunks at once"""
+        first_column, last_column, first_row, last_row = self.visible(cornerpoint, size, self.margin)
+        centercolumn = (cornerpoint[0] + size[0] / 2) / self.chunksize - 0.5
+        centerrow = (cornerpoint[1] + size[1] / 2) / self.chunksize - 0.5
+        missing = [(column, row) for row in range(first_row, last_row + 1)
+                   for column in range(first_column, last_column + 1)
+                   if (column, row) not in self.chunks]
+        missing.sort(key=lambda key: (key[0] - centercolumn) ** 2 + (key[1] - centerrow) ** 2)
+        for key in missing[:self.prefetchlimit]:
+            self.chunks[key] = self.add(key)
+            self.prefetched += 1
+
+    def clear(self):
+        self.chunks.clear()
+        self.size = 0
+
+    def hitrate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+    def report(self):
+        """returns a text with memory and hit rate of the chunk cache"""
+        return ("chunkmap: %i of %i chunks, %.2f of %.2f MB, %i hits, %i misses, hit rate %.1f%%, %i prefetched, %i evictions" %
+                (len(self.chunks), self.columns * self.rows, self.size / 1048576.0, self.budget / 1048576.0,
+                 self.hits, self.misses, self.hitrate() * 100, self.prefetched, self.evictions))
+
+
+def check(width, height, painter, chunksize=256, size=(640, 480), steps=17):
+    """paint the world once on one big surface and compare it with the
+       ChunkMap at steps x steps viewports (all corners and edges included).
+       returns a list of the viewports (cornerpoints) with different pixels"""
+    tobytes = getattr(pygame.image, "tobytes", None) or pygame.image.tostring
+    bigmap = pygame.Surface((width, height))
+    painter(bigmap, bigmap.get_rect())
+    world = ChunkMap(width, height, painter, chunksize)
+    view = pygame.Surface(size)
+    wrong = []
+    for row in range(steps):
+        for column in range(steps):
+            corner = ((width - size[0]) * column // (steps - 1), (height - size[1]) * row // (steps - 1))
+            world.draw(view, corner)
+            if tobytes(view, "RGB") != tobytes(bigmap.subsurface(pygame.Rect(corner, size)), "RGB"):
+                wrong.append(corner)
+    return wrong
+
+
+if __name__ == "__main__":
+    # ------ benchmark: scrolling diagonal over worlds of different size ------
+    import os
+    import sys
+    import time
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # no window necessary
+    pygame.init()
+    screen = pygame.display.set_mode((640, 480))
+    frames = 300
+    maxbigmap = 512 * 1024 * 1024 # do not try to make a bigger bigmap
+
+    def painter(surface, rect, worldsize=(0, 0)):
+        """grey world with a grid of dark lines and a red edge, like 022_minimap.py"""
+        width, height = worldsize
+        surface.fill((128, 128, 128))
+        for x in range(0, width, width // 15):
+            pygame.draw.line(surface, (64, 64, 64), (x - rect.x, 0 - rect.y), (x - rect.x, height - rect.y))
+        for y in range(0, height, height // 15):
+            pygame.draw.line(surface, (64, 64, 64), (0 - rect.x, y - rect.y), (width - rect.x, y - rect.y))
+        for edge in ((0, 0, width, 25), (0, height - 25, width, 25), (0, 0, 25, height), (width - 25, 0, 25, height)):
+            surface.fill((255, 0, 0), pygame.Rect(edge).move(-rect.x, -rect.y)) # red edge, 25 pixel
+
+    if sys.argv[1:] == ["check"]:
+        ok = True
+        # world sizes with and without small chunks at the right and bottom border
+        for width, height in ((1024, 800), (1024, 1024), (1500, 1100), (3000, 2100)):
+            wrong = check(width, height, lambda surface, rect: painter(surface, rect, (width, height)))
+            print("%5i x %5i: chunks and bigmap differ at %i of 17 x 17 viewports %s" % (width, height, len(wrong), wrong[:3]))
+            ok = ok and not wrong
+        pygame.quit()
+        sys.exit(0 if ok else 1)
+
+    for width, height in ((1024, 800), (5000, 5000), (20000, 20000)):
+        # the viewport moves diagonal over the whole world
+        corners = [(int((width - 640) * frame / frames), int((height - 480) * frame / frames))
+                   for frame in range(frames)]
+        for mode in ("bigmap", "ChunkMap"):
+            background = pygame.Surface((640, 480)).convert()
+            start = time.time()
+            if mode == "bigmap":
+                if width * height * 4 > maxbigmap:
+                    print("%5i x %5i %-8s: would need %.0f MB, not tested" %
+                          (width, height, mode, width * height * 4 / 1048576.0))
+                    continue
+                bigmap = pygame.Surface((width, height))
+                painter(bigmap, bigmap.get_rect(), (width, height))
+                bigmap = bigmap.convert()
+                memory = width * height * bigmap.get_bytesize()
+                setup = time.time() - start
+                start = time.time()
+                for corner in corners:
+                    screen.blit(bigmap.subsurface((corner[0], corner[1], 640, 480)), (0, 0))
+                del bigmap
+            else:
+                world = ChunkMap(width, height, lambda surface, rect: painter(surface, rect, (width, height)))
+                setup = time.time() - start
+                start = time.time()
+                for corner in corners:
+                    world.draw(background, corner)
+                    screen.blit(background, (0, 0))
+                    world.prefetch(corner, (640, 480))
+                memory = world.size
+            duration = time.time() - start
+            print("%5i x %5i %-8s: setup %7.1f ms, %6.3f ms per frame, memory %7.2f MB" %
+                  (width, height, mode, setup * 1000, duration * 1000 / frames, memory / 1048576.0))
+        print("   " + world.report())
+    pygame.quit()
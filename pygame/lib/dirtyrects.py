@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+dirtyrects.py
+dirty rectangle rendering: repaint and update only the changed parts of the screen
+author: horst.jens@spielend-programmieren.at
+licence: gpl, see http://www.gnu.org/licenses/gpl.html
+
+Most games blit the whole background each frame and call
+pygame.display.flip(), even if only a few small sprites move.
+A DirtyScreen remembers each rect painted in a frame (sprites, text,
+trails). In the next frame only those rects are restored from the
+background, and pygame.display.update(rects) shows only the old and the
+new rects instead of the whole screen.
+
+The sprites must be in a pygame.sprite.LayeredDirty group (and be
+DirtySprites, dirty = 2 for moving sprites). LayeredDirty finds the
+old and new rect of each sprite and joins overlapping rects.
+
+If the dirty rects cover more than maxfraction of the screen, a full
+flip is faster: DirtyScreen then flips automatically. (The areas of
+the rects are simply added, parts covered by an old and a new rect
+count twice.)
+With dirty=False (the default), DirtyScreen works like the usual full
+repaint and flip. Dirty rects are only faster if a few small areas change:
+measure with compare before turning them on. Many moving sprites or a
+scrolling background make them slower than a flip.
+
+usage:
+    allgroup = pygame.sprite.LayeredDirty()
+    dirtyscreen = DirtyScreen(screen, dirty=True)
+    # each frame:
+    dirtyscreen.clear(background)            # restore background painted over in the last frame
+    dirtyscreen.add(write(screen, "FPS..."))  # remember rects painted directly on screen
+    allgroup.update(seconds)
+    dirtyscreen.draw(allgroup)               # paint sprites, remember their rects
+    dirtyscreen.update()                     # instead of pygame.display.flip()
+    # at the end (for statistics):
+    print(dirtyscreen.report())
+
+compare=5.0 switches between dirty and flip mode every 5 seconds, report()
+then shows the frames per second of both modes.
+
+works with python3.4 and python2.7
+"""
+
+#the next line is only needed for python2.x and not necessary for python3.x
+from __future__ import print_function, division
+
+import pygame
+
+
+class DirtyScreen(object):
+    """remembers the painted rects of each frame, clears and updates only those"""
+    def __init__(self, screen, dirty=False, maxfraction=0.5, compare=0):
+        self.screen = screen
+        self.screenrect = screen.get_rect()
+        self.dirty = dirty             # False: full repaint and flip each frame
+        self.maxfraction = maxfraction # flip if the dirty rects cover more of the screen
+        self.compare = compare         # switch mode every compare seconds (0: never)
+        self.rects = []                # rects painted in this frame
+        self.oldrects = []             # rects painted in the last frame
+        self.full = True               # repaint and flip the whole screen next frame
+        self.offset = None             # position of the screen inside the background
+        self.updates = 0               # frames shown with display.update(rects)
+        self.flips = 0                 # frames shown with display.flip()
+        self.fallbacks = 0             # flips because of too big dirty area
+        self.area = 0                  # sum of all updated areas in pixel
+        self.frames = {False: 0, True: 0}     # frames of each mode (dirty False / True)
+        self.seconds = {False: 0.0, True: 0.0}
+        self.switchtime = 0.0          # seconds since last mode switch
+
+    def set_dirty(self, dirty):
+        """switch between dirty rect mode (True) and full flip mode (False)"""
+        self.dirty = dirty
+        self.full = True
+
+    def repaint_all(self):
+        """the whole background has changed: repaint and flip the whole screen next frame"""
+        self.full = True
+
+    def add(self, rect):
+        """remember a rect (or a list of rects) painted directly on the screen (text, trail, ...)"""
+        if rect is None:
+            return
+        if isinstance(rect, list):
+            self.rects.extend(pygame.Rect(r) for r in rect)
+        else:
+            self.rects.append(pygame.Rect(rect))
+
+    def clear(self, background, offset=(0, 0)):
+        """restore the rects of the last frame from background.
+           offset: position of the screen's topleft corner inside background
+           (for a scrolling background bigger than the screen)"""
+        offset = tuple(offset)
+        if offset != self.offset:
+            self.full = True # scrolling: everything has moved
+            self.offset = offset
+        if not self.dirty or self.full:
+            self.screen.blit(background, (0, 0), self.screenrect.move(offset))
+            return
+        for rect in self.oldrects:
+            self.screen.blit(background, rect, rect.move(offset))
+
+    def draw(self, group):
+        """paint the sprites of group, remember their (old and new) rects"""
+        if self.dirty:
+            for sprite in group:
+                # not moving sprites (dirty = 0) inside a cleared rect must be painted again
+                if sprite.dirty == 0 and (self.full or sprite.rect.collidelist(self.oldrects) != -1):
+                    sprite.dirty = 1
+            rects = group.draw(self.screen)
+            if self.full or self.screenrect in rects:
+                # after a full repaint (or if LayeredDirty switched to full screen mode itself)
+                # draw returns the whole screen, but only the sprites must be cleared next frame
+                rects = [sprite.rect.copy() for sprite in group]
+            self.rects.extend(rects)
+        else:
+            # all sprites, without looking for dirty areas
+            pygame.sprite.LayeredUpdates.draw(group, self.screen)
+
+    def update(self):
+        """show the changed rects (or flip the whole screen) and prepare the next frame"""
+        flip = True
+        if self.dirty and not self.full:
+            rects = self.oldrects + [rect.clip(self.screenrect) for rect in self.rects]
+            area = sum(rect.width * rect.height for rect in rects)
+            if area <= self.maxfraction * self.screenrect.width * self.screenrect.height:
+                pygame.display.update(rects)
+                self.updates += 1
+                self.area += area
+                flip = False
+            else:
+                self.fallbacks += 1
+        if flip:
+            pygame.display.flip()
+            self.flips += 1
+            self.area += self.screenrect.width * self.screenrect.height
+        self.oldrects = [rect.clip(self.screenrect) for rect in self.rects]
+        self.rects = []
+        self.full = False
+
+    def tick(self, seconds):
+        """count frames and seconds of the current mode, switch mode if compare is set"""
+        self.frames[self.dirty] += 1
+        self.seconds[self.dirty] += seconds
+        self.switchtime += seconds
+        if self.compare > 0 and self.switchtime >= self.compare:
+            self.switchtime = 0.0
+            self.set_dirty(not self.dirty)
+
+    def fps(self, dirty):
+        """returns frames per second in dirty mode (True) or flip mode (False)"""
+        if self.seconds[dirty] == 0:
+            return 0.0
+        return self.frames[dirty] / self.seconds[dirty]
+
+    def report(self):
+        """returns a text with the number of updates and flips (and fps of both modes)"""
+        frames = max(1, self.updates + self.flips)
+        lines = ["dirtyrects: %i frames with dirty rects, %i flips (%i because of too big dirty area), "
+                 "average %.1f%% of the screen updated" %
+                 (self.updates, self.flips, self.fallbacks,
+                  self.area * 100.0 / frames / (self.screenrect.width * self.screenrect.height))]
+        for dirty, name in ((False, "flip"), (True, "dirty rects")):
+            if self.frames[dirty] > 0:
+                lines.append("dirtyrects: %-11s: %6i frames in %6.1f seconds, %6.1f fps" %
+                             (name, self.frames[dirty], self.seconds[dirty], self.fps(dirty)))
+        return "\n".join(lines)
@@ -0,0 +1,663 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+lifeengine.py
+engines for Conway's Game of Life, see ../gameOfLife.py
+see http://en.wikipedia.org/wiki/Conway's_Game_of_Life
+author: horst.jens@spielend-programmieren.at
+licence: gpl, see http://www.gnu.org/licenses/gpl.html
+
+All engines understand the same commands, so gameOfLife.py can switch
+between them while the game is running:
+    step(n)          calculate n generations, returns number of alive cells
+    get_cells()      set of (x, y) tuples of all alive cells
+    set_cells(cells) replace all cells with the given (x, y) tuples
+    set_cell(x, y, value), get_cell(x, y), count(), clear(), randomize(density)
+    render(surface, topleft, cellsize)
+
+DictLife:   the classic playfield: a dict with a value for every (x, y)
+            cell. Each generation asks all 8 neighbors of every cell.
+NumpyLife:  the board is a numpy array with shape (width, height), a cell
+            is board[x, y]. Instead of asking all 8 neighbors of each cell,
+            the whole board is shifted with numpy.roll (wrap-around borders,
+            like a torus) and added up. All cells are calculated at once,
+            without a python loop. The board is painted by writing the array
+            into a small 8-bit surface (one pixel per cell, pygame.surfarray)
+            and scaling this surface once.
+SparseLife: only stores the alive cells. The board is cut into square
+            tiles. Only tiles where a cell (or a neighbor cell) changed in
+            the last generation are calculated, still tiles are skipped.
+            width=None and height=None makes an unbounded board.
+HashLife:   unbounded board stored as memoised quadtree (Bill Gosper's
+            hashlife). Repeating patterns are calculated only once, so
+            jump(k) can calculate 2**k generations in one go.
+
+DictLife, NumpyLife and SparseLife have wrap-around borders (wraps = True).
+HashLife has no borders at all, width and height are only used for
+randomize() and render(). switch() moves the cells to another engine
+and warns if the borders change: a glider that wrapped around flies away
+(or the other way round).
+
+usage without pygame window (headless):
+    life = NumpyLife(1000, 1000)
+    life.step(100)            # calculate 100 generations
+    print(life.count())       # number of alive cells
+
+run this file directly for a 1000x1000 demo,
+run it with the argument benchmark to see generations per second
+
+NumpyLife needs numpy: pip install numpy
+works with python3.4 and python2.7
+"""
+
+#the next line is only needed for python2.x and not necessary for python3.x
+from __future__ import print_function, division
+
+import random
+import pygame
+
+try:
+    import numpy
+except ImportError:
+    numpy = None # NumpyLife can not work without numpy
+
+NEIGHBORS = ((-1, -1), (0, -1), (1, -1),
+             (-1,  0),          (1,  0),
+             (-1,  1), (0,  1), (1,  1))
+
+
+class Life(object):
+    """base class for all engines. Subclasses need at least
+       set_cell, get_cell, get_cells, clear and step"""
+    wraps = True # wrap-around borders (a torus), False for unbounded boards
+    def __init__(self, width=150, height=100):
+        self.width = width
+        self.height = height
+        self.generation = 0
+
+    def randomize(self, density=1/9.0):
+        """fill the board with random cells. density is the chance for an alive cell"""
+        self.clear()
+        for x in range(self.width):
+            for y in range(self.height):
+                if random.random() < density:
+                    self.set_cell(x, y, 1)
+
+    def set_cells(self, cells):
+        """replace all cells with the (x, y) tuples of cells"""
+        self.clear()
+        for (x, y) in cells:
+            self.set_cell(x, y, 1)
+
+    def count(self):
+        """returns the number of alive cells"""
+        return len(self.get_cells())
+
+    def render(self, surface, topleft=(0, 0), cellsize=4, colors=((0, 0, 0), (255, 0, 0))):
+        """paint the board on surface. colors are for dead and alive cells.
+           Only alive cells are painted on a dead background"""
+        left, top = topleft
+        surface.fill(colors[0], (left, top, self.width * cellsize, self.height * cellsize))
+        for (x, y) in self.get_cells():
+            if 0 <= x < self.width and 0 <= y < self.height:
+                surface.fill(colors[1], (left + x * cellsize, top + y * cellsize, cellsize, cellsize))
+
+
+class DictLife(Life):
+    """the classic playfield of gameOfLife.py: a dict with a value
+       (1 alive, 0 dead) for every (x, y) cell, wrap-around borders"""
+    def __init__(self, width=150, height=100, density=1/9.0):
+        Life.__init__(self, width, height)
+        self.cells = {}
+        self.clear()
+        if density > 0:
+            self.randomize(density)
+
+    def clear(self):
+        for x in range(self.width):
+            for y in range(self.height):
+                self.cells[x, y] = 0
+
+    def set_cell(self, x, y, value=1):
+        self.cells[x % self.width, y % self.height] = value
+
+    def get_cell(self, x, y):
+        return self.cells[x % self.width, y % self.height]
+
+    def get_cells(self):
+        return set(cell for cell, value in self.cells.items() if value == 1)
+
+    def newvalue(self, x, y):
+        """count the neighbors of a cell (8 directions). If too few or
+        too many neighbors, the cell dies., else it become or stay alife.
+        rules:
+        0 or 1 neigbors: cell dies because of underpopulation
+        2 or 3 neigbors: cell stay alive
+        4 or more cells: cell dies because of overpopulation
+        3 neignors and cell dead: cell becomes alive.
+        Returns 0 for a dead cell, 1 for an alive cell"""
+        neighbors = 0
+        for dx, dy in NEIGHBORS:
+            neighbors += self.cells[(x + dx) % self.width, (y + dy) % self.height]
+        if neighbors == 3 or (neighbors == 2 and self.cells[x, y] == 1):
+            return 1
+        return 0
+
+    def step(self, n=1):
+        """calculate n generations. Returns the number of alive cells"""
+        for _ in range(n):
+            newcells = {}
+            for x in range(self.width):
+                for y in range(self.height):
+                    newcells[x, y] = self.newvalue(x, y)
+            self.cells = newcells
+            self.generation += 1
+        return self.count()
+
+
+class NumpyLife(Life):
+    """Game of Life on a wrap-around (toroidal) board stored as numpy array.
+       1 means alive, 0 means dead"""
+    def __init__(self, width=150, height=100, density=1/9.0):
+        if numpy is None:
+            raise UserWarning("NumpyLife needs numpy, please install it: pip install numpy")
+        Life.__init__(self, width, height)
+        self.board = numpy.zeros((width, height), dtype=numpy.uint8)
+        self.small = None # 8-bit surface with one pixel per cell, see render()
+        if density > 0:
+            self.randomize(density)
+
+    def randomize(self, density=1/9.0):
+        """fill the board with random cells. density is the chance for an alive cell"""
+        self.board = (numpy.random.random((self.width, self.height)) < density).astype(numpy.uint8)
+
+    def clear(self):
+        self.board[:] = 0
+
+    def set_cell(self, x, y, value=1):
+        self.board[x % self.width, y % self.height] = value
+
+    def get_cell(self, x, y):
+        return int(self.board[x % self.width, y % self.height])
+
+    def get_cells(self):
+        """returns a set of (x, y) tuples of all alive cells"""
+        xs, ys = numpy.nonzero(self.board)
+        return set(zip(xs.tolist(), ys.tolist()))
+
+    def count(self):
+        """returns the number of alive cells"""
+        return int(numpy.count_nonzero(self.board))
+
+    def step(self, n=1):
+        """calculate n generations. Returns the number of alive cells"""
+        roll = numpy.roll
+        for _ in range(n):
+            board = self.board
+            # sum of each cell and its upper and lower neighbor (max. 3)
+            column = board + roll(board, 1, 1) + roll(board, -1, 1)
+            # add the left and right column: all 9 cells of the 3x3 block (max. 9)
+            block = column + roll(column, 1, 0) + roll(column, -1, 0)
+            # the 3x3 block includes the cell itself:
+            # block == 3: dead cell with 3 neighbors or alive cell with 2 neighbors
+            # block == 4 and alive: alive cell with 3 neighbors
+            self.board = ((block == 3) | ((block == 4) & (board == 1))).astype(numpy.uint8)
+            self.generation += 1
+        return self.count()
+
+    def render(self, surface, topleft=(0, 0), cellsize=4, colors=((0, 0, 0), (255, 0, 0))):
+        """paint the board on surface. colors are for dead and alive cells.
+           Each cell becomes a cellsize x cellsize square"""
+        if self.small is None or self.small.get_size() != (self.width, self.height):
+            self.small = pygame.Surface((self.width, self.height), 0, 8)
+            self.small.set_palette([colors[0], colors[1]] + [(0, 0, 0)] * 254)
+        pygame.surfarray.blit_array(self.small, self.board)
+        if cellsize == 1:
+            surface.blit(self.small, topleft)
+        else:
+            big = pygame.transform.scale(self.small, (self.width * cellsize, self.height * cellsize))
+            surface.blit(big, topleft)
+
+
+class SparseLife(Life):
+    """stores only the alive cells, in a set and sorted by tiles.
+       Only active tiles (where a cell or neighbor cell changed in
+       the last generation) are calculated. width=None and height=None
+       makes an unbounded board, else the borders wrap around"""
+    def __init__(self, width=150, height=100, density=1/9.0, tilesize=16):
+        Life.__init__(self, width, height)
+        self.wraps = width is not None
+        self.tilesize = tilesize
+        if width is not None:
+            self.tilesx = -(-width // tilesize) # number of tiles, rounded up
+            self.tilesy = -(-height // tilesize)
+        self.clear()
+        if density > 0 and width is not None:
+            self.randomize(density)
+
+    def clear(self):
+        self.alive = set()   # (x, y) of all alive cells
+        self.tiles = {}      # (tilex, tiley) : set of alive cells inside this tile
+        self.active = set()  # tiles to calculate in the next generation
+
+    def wrap(self, x, y):
+        if self.width is None:
+            return x, y
+        return x % self.width, y % self.height
+
+    def wraptile(self, tx, ty):
+        if self.width is None:
+            return tx, ty
+        return tx % self.tilesx, ty % self.tilesy
+
+    def tile(self, x, y):
+        return x // self.tilesize, y // self.tilesize
+
+    def activate(self, x, y):
+        """a cell has changed: the tiles of this cell and its neighbors must be calculated"""
+        self.active.add(self.tile(x, y))
+        for dx, dy in NEIGHBORS:
+            self.active.add(self.tile(*self.wrap(x + dx, y + dy)))
+
+    def set_cell(self, x, y, value=1):
+        x, y = self.wrap(x, y)
+        if value and (x, y) not in self.alive:
+            self.alive.add((x, y))
+            self.tiles.setdefault(self.tile(x, y), set()).add((x, y))
+            self.activate(x, y)
+        elif not value and (x, y) in self.alive:
+            self.alive.remove((x, y))
+            tile = self.tile(x, y)
+            self.tiles[tile].remove((x, y))
+            if not self.tiles[tile]:
+                del self.tiles[tile]
+            self.activate(x, y)
+
+    def get_cell(self, x, y):
+        return 1 if self.wrap(x, y) in self.alive else 0
+
+    def get_cells(self):
+        return set(self.alive)
+
+    def count(self):
+        return len(self.alive)
+
+    def step(self, n=1):
+        """calculate n generations. Returns the number of alive cells"""
+        for _ in range(n):
+            active = self.active
+            self.active = set()
+            self.generation += 1
+            if not active:
+                continue # nothing changed: still life
+            # alive cells in active tiles and their neighbor tiles count as neighbors
+            sources = set()
+            for (tx, ty) in active:
+                sources.add((tx, ty))
+                for dx, dy in NEIGHBORS:
+                    sources.add(self.wraptile(tx + dx, ty + dy))
+            counts = {} # (x, y) : number of alive neighbors, only for cells inside active tiles
+            for tile in sources:
+                for (x, y) in self.tiles.get(tile, ()):
+                    for dx, dy in NEIGHBORS:
+                        cell = self.wrap(x + dx, y + dy)
+                        if self.tile(*cell) in active:
+                            counts[cell] = counts.get(cell, 0) + 1
+            born = [cell for cell, neighbors in counts.items()
+                    if neighbors == 3 and cell not in self.alive]
+            died = [cell for tile in active for cell in self.tiles.get(tile, ())
+                    if counts.get(cell, 0) not in (2, 3)]
+            for (x, y) in born:
+                self.set_cell(x, y, 1)
+            for (x, y) in died:
+                self.set_cell(x, y, 0)
+        return self.count()
+
+
+# ------------------- hashlife -----------------------------
+# a node is a square of 2**k x 2**k cells, made of 4 nodes of level k-1:
+# a (top left), b (top right), c (bottom left), d (bottom right).
+# Nodes of level 0 are single cells. Equal squares are the same node
+# object (see join), so results can be memoised per node.
+
+class Node(object):
+    """quadtree node. n is the number of alive cells"""
+    __slots__ = ("k", "a", "b", "c", "d", "n", "hash")
+    def __init__(self, k, a, b, c, d, n, nodehash):
+        self.k = k
+        self.a = a
+        self.b = b
+        self.c = c
+        self.d = d
+        self.n = n
+        self.hash = nodehash
+
+    def __hash__(self):
+        return self.hash
+
+ON = Node(0, None, None, None, None, 1, 1)
+OFF = Node(0, None, None, None, None, 0, 0)
+
+joincache = {}      # (a, b, c, d) : node
+zerocache = {}      # k : empty node of level k
+successorcache = {} # (node, j) : node
+
+
+def join(a, b, c, d):
+    """returns the (unique) node made of 4 nodes"""
+    key = (a, b, c, d)
+    if key not in joincache:
+        nodehash = hash((a.k + 1, a.hash, b.hash, c.hash, d.hash))
+        joincache[key] = Node(a.k + 1, a, b, c, d, a.n + b.n + c.n + d.n, nodehash)
+    return joincache[key]
+
+
+def zero(k):
+    """returns an empty node of level k"""
+    if k not in zerocache:
+        zerocache[k] = OFF if k == 0 else join(zero(k - 1), zero(k - 1), zero(k - 1), zero(k - 1))
+    return zerocache[k]
+
+
+def centre(m):
+    """returns a node of level k+1 with m in the middle"""
+    z = zero(m.k - 1)
+    return join(join(z, z, z, m.a), join(z, z, m.b, z),
+                join(z, m.c, z, z), join(m.d, z, z, z))
+
+
+def inner(m):
+    """returns the middle of m, a node of level k-1"""
+    return join(m.a.d, m.b.c, m.c.b, m.d.a)
+
+
+def life_4x4(m):
+    """returns the middle 2x2 cells of a 4x4 node, one generation later"""
+    grid = ((m.a.a, m.a.b, m.b.a, m.b.b),
+            (m.a.c, m.a.d, m.b.c, m.b.d),
+            (m.c.a, m.c.b, m.d.a, m.d.b),
+            (m.c.c, m.c.d, m.d.c, m.d.d))
+    result = []
+    for y, x in ((1, 1), (1, 2), (2, 1), (2, 2)):
+        neighbors = sum(grid[y + dy][x + dx].n for dx, dy in NEIGHBORS)
+        if neighbors == 3 or (neighbors == 2 and grid[y][x].n == 1):
+            result.append(ON)
+        else:
+            result.append(OFF)
+    return join(*result)
+
+
+def successor(m, j):
+    """returns the middle of m (a node of level k-1), 2**j generations later.
+       j must be smaller than k-1"""
+    j = min(j, m.k - 2)
+    key = (m, j)
+    if key in successorcache:
+        return successorcache[key]
+    if m.n == 0:
+        s = m.a
+    elif m.k == 2:
+        s = life_4x4(m)
+    else:
+        # 9 overlapping nodes of level k-1, each moved forward
+        c1 = successor(m.a, j)
+        c2 = successor(join(m.a.b, m.b.a, m.a.d, m.b.c), j)
+        c3 = successor(m.b, j)
+        c4 = successor(join(m.a.c, m.a.d, m.c.a, m.c.b), j)
+        c5 = successor(join(m.a.d, m.b.c, m.c.b, m.d.a), j)
+        c6 = successor(join(m.b.c, m.b.d, m.d.a, m.d.b), j)
+        c7 = successor(m.c, j)
+        c8 = successor(join(m.c.b, m.d.a, m.c.d, m.d.c), j)
+        c9 = successor(m.d, j)
+        if j < m.k - 2:
+            # already 2**j generations later: just take the middle parts
+            s = join(join(c1.d, c2.c, c4.b, c5.a), join(c2.d, c3.c, c5.b, c6.a),
+                     join(c4.d, c5.c, c7.b, c8.a), join(c5.d, c6.c, c8.b, c9.a))
+        else:
+            # half way: move forward a second time
+            s = join(successor(join(c1, c2, c4, c5), j), successor(join(c2, c3, c5, c6), j),
+                     successor(join(c4, c5, c7, c8), j), successor(join(c5, c6, c8, c9), j))
+    successorcache[key] = s
+    return s
+
+
+def setleaf(m, x, y, leaf):
+    """returns m with the cell x, y (inside m) replaced by leaf (ON or OFF).
+       Only the nodes on the way from m to the cell are new"""
+    if m.k == 0:
+        return leaf
+    half = 2 ** (m.k - 1)
+    a, b, c, d = m.a, m.b, m.c, m.d
+    if y < half:
+        if x < half:
+            a = setleaf(a, x, y, leaf)
+        else:
+            b = setleaf(b, x - half, y, leaf)
+    else:
+        if x < half:
+            c = setleaf(c, x, y - half, leaf)
+        else:
+            d = setleaf(d, x - half, y - half, leaf)
+    return join(a, b, c, d)
+
+
+def getleaf(m, x, y):
+    """returns 1 if the cell x, y (inside m) is alive"""
+    while m.k > 0 and m.n > 0:
+        half = 2 ** (m.k - 1)
+        if y < half:
+            m = m.a if x < half else m.b
+        else:
+            m = m.c if x < half else m.d
+        x %= half
+        y %= half
+    return m.n
+
+
+class HashLife(Life):
+    """unbounded board, stored as memoised quadtree (hashlife).
+       width and height are only used for randomize() and render().
+       The memo caches are shared by all HashLife boards, they are
+       cleared if they contain more than maxcache nodes"""
+    maxcache = 2000000
+    wraps = False
+    def __init__(self, width=150, height=100, density=1/9.0):
+        Life.__init__(self, width, height)
+        self.clear()
+        if density > 0:
+            self.randomize(density)
+
+    def clear(self):
+        self.root = zero(3)
+        self.origin = (0, 0) # (x, y) of the top left cell of root
+
+    def set_cells(self, cells):
+        """build the quadtree bottom up from (x, y) tuples"""
+        cells = set(cells)
+        if not cells:
+            self.clear()
+            return
+        minx = min(x for x, y in cells)
+        miny = min(y for x, y in cells)
+        pattern = dict(((x - minx, y - miny), ON) for x, y in cells)
+        k = 0
+        while len(pattern) > 1 or k < 3:
+            z = zero(k)
+            upper = {}
+            while pattern:
+                x, y = next(iter(pattern))
+                x -= x & 1
+                y -= y & 1
+                upper[x // 2, y // 2] = join(pattern.pop((x, y), z), pattern.pop((x + 1, y), z),
+                                             pattern.pop((x, y + 1), z), pattern.pop((x + 1, y + 1), z))
+            pattern = upper
+            k += 1
+        self.root = pattern[0, 0]
+        self.origin = (minx, miny)
+
+    def inside(self, x, y):
+        """True if the cell x, y is inside root"""
+        size = 2 ** self.root.k
+        return 0 <= x - self.origin[0] < size and 0 <= y - self.origin[1] < size
+
+    def set_cell(self, x, y, value=1):
+        """changes only the nodes on the way from root to the cell"""
+        if not self.inside(x, y):
+            if not value:
+                return # outside root all cells are dead
+            while not self.inside(x, y):
+                self.grow()
+        self.root = setleaf(self.root, x - self.origin[0], y - self.origin[1], ON if value else OFF)
+
+    def get_cell(self, x, y):
+        if not self.inside(x, y):
+            return 0
+        return getleaf(self.root, x - self.origin[0], y - self.origin[1])
+
+    def get_cells(self):
+        cells = set()
+        todo = [(self.root, self.origin[0], self.origin[1])]
+        while todo:
+            node, x, y = todo.pop()
+            if node.n == 0:
+                continue
+            if node.k == 0:
+                cells.add((x, y))
+            else:
+                half = 2 ** (node.k - 1)
+                todo.append((node.a, x, y))
+                todo.append((node.b, x + half, y))
+                todo.append((node.c, x, y + half))
+                todo.append((node.d, x + half, y + half))
+        return cells
+
+    def count(self):
+        return self.root.n
+
+    def grow(self):
+        """add an empty border around root"""
+        half = 2 ** (self.root.k - 1)
+        self.root = centre(self.root)
+        self.origin = (self.origin[0] - half, self.origin[1] - half)
+
+    def shrink(self):
+        """remove empty borders around root"""
+        while self.root.k > 3 and inner(self.root).n == self.root.n:
+            quarter = 2 ** (self.root.k - 2)
+            self.root = inner(self.root)
+            self.origin = (self.origin[0] + quarter, self.origin[1] + quarter)
+
+    def jump(self, k):
+        """calculate 2**k generations in one go"""
+        if len(joincache) + len(successorcache) > HashLife.maxcache:
+            joincache.clear()
+            successorcache.clear()
+            zerocache.clear()
+            self.set_cells(self.get_cells()) # rebuild with fresh nodes
+        # the pattern can grow 2**k cells in each direction: enough empty border
+        while self.root.k < k + 1:
+            self.grow()
+        self.grow()
+        self.grow()
+        quarter = 2 ** (self.root.k - 2)
+        self.root = successor(self.root, k)
+        self.origin = (self.origin[0] + quarter, self.origin[1] + quarter)
+        self.shrink()
+        self.generation += 2 ** k
+
+    def step(self, n=1):
+        """calculate n generations, with one jump for each bit of n.
+           Returns the number of alive cells"""
+        k = 0
+        while n > 0:
+            if n & 1:
+                self.jump(k)
+            n >>= 1
+            k += 1
+        return self.count()
+
+
+ENGINES = (DictLife, NumpyLife, SparseLife, HashLife)
+
+
+def switch(life, engine):
+    """returns a new board of engine (a class of ENGINES) with the cells
+       of life. Cells outside a wrap-around board are wrapped into it.
+       Prints a warning if one engine has wrap-around borders and the other not"""
+    new = engine(life.width, life.height, 0)
+    cells = life.get_cells()
+    if new.wraps != life.wraps:
+        print("lifeengine warning: %s %s, %s %s: the game will change" % (
+            life.__class__.__name__, "wraps around" if life.wraps else "has no borders",
+            engine.__name__, "wraps around" if new.wraps else "has no borders"))
+    if new.wraps:
+        cells = set((x % new.width, y % new.height) for x, y in cells)
+    new.set_cells(cells)
+    return new
+
+
+def benchmark(width=1000, height=1000, generations=100):
+    """print generations per second for a headless board and with rendering"""
+    import time
+    life = NumpyLife(width, height)
+    start = time.time()
+    life.step(generations)
+    duration = time.time() - start
+    print("%ix%i board: %i generations in %.2f seconds: %.1f generations per second (headless)" %
+          (width, height, generations, duration, generations / duration))
+    surface = pygame.Surface((width, height))
+    start = time.time()
+    for _ in range(generations):
+        life.step()
+        life.render(surface, (0, 0), 1)
+    duration = time.time() - start
+    print("%ix%i board: %i generations in %.2f seconds: %.1f generations per second (with rendering)" %
+          (width, height, generations, duration, generations / duration))
+    # ---- all engines on the small board of gameOfLife.py ----
+    random.seed(1)
+    cells = DictLife(150, 100).get_cells()
+    for engine in ENGINES:
+        life = engine(150, 100, 0)
+        life.set_cells(cells)
+        start = time.time()
+        life.step(50)
+        duration = time.time() - start
+        print("%-10s 150x100 board: %.1f generations per second, %i cells alive" %
+              (engine.__name__, 50 / duration, life.count()))
+    # ---- hashlife: r-pentomino, 2**20 generations ----
+    life = HashLife(density=0)
+    life.set_cells([(1, 0), (2, 0), (0, 1), (1, 1), (1, 2)])
+    start = time.time()
+    life.jump(20)
+    print("HashLife   r-pentomino: %i generations in %.2f seconds, %i cells alive" %
+          (life.generation, time.time() - start, life.count()))
+
+
+def demo(width=1000, height=1000, cellsize=1):
+    """pygame window showing a big board. ESC quits"""
+    pygame.init()
+    screen = pygame.display.set_mode((width * cellsize, height * cellsize))
+    clock = pygame.time.Clock()
+    life = NumpyLife(width, height)
+    mainloop = True
+    while mainloop:
+        clock.tick(60)
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                mainloop = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                mainloop = False
+        cells = life.step()
+        life.render(screen, (0, 0), cellsize)
+        pygame.display.set_caption("Game of Life (numpy) fps: %.2f generation: %i cells: %i" %
+                                   (clock.get_fps(), life.generation, cells))
+        pygame.display.flip()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    import sys
+    if "benchmark" in sys.argv:
+        benchmark()
+    else:
+        demo()
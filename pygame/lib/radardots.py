@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+radardots.py
+paint many small square dots (like bullets on a radar map) at once
+author: horst.jens@spielend-programmieren.at
+licence: gpl, see http://www.gnu.org/licenses/gpl.html
+
+A radar map painting each bullet with its own pygame.draw.rect call
+needs one python function call (and one surface lock) per bullet.
+paint_dots() scales all positions at once with numpy and writes the
+pixels of all dots in a few array operations on pygame.surfarray.pixels2d
+(one operation for each pixel of a dot, not for each dot).
+
+Without numpy (or on a 24 bit surface, which pixels2d can not handle,
+or for less than FEWDOTS dots) each dot is painted with surface.fill,
+which is still faster than pygame.draw.rect.
+
+usage:
+    xs = [bullet.pos[0] for bullet in bullets]
+    ys = [bullet.pos[1] for bullet in bullets]
+    colors = [bullet.color for bullet in bullets]
+    radardots.paint_dots(radarimage, xs, ys, colors, 4, 200.0 / 1024, 150.0 / 800)
+    # dots of different size: one size for each dot, painted in the order of the lists
+    sizes = [2 if bullet.tracer else 4 for bullet in bullets]
+    radardots.paint_dots(radarimage, xs, ys, colors, sizes, 200.0 / 1024, 150.0 / 800)
+
+run this file directly for a benchmark
+
+works with python3.4 and python2.7
+"""
+
+#the next line is only needed for python2.x and not necessary for python3.x
+from __future__ import print_function, division
+
+import pygame
+
+try:
+    import numpy
+except ImportError:
+    numpy = None # paint_dots paints each dot with surface.fill
+
+FEWDOTS = 64 # for less dots, surface.fill is faster than numpy
+
+
+def paint_dots(surface, xs, ys, colors, size=2, factorx=1.0, factory=1.0):
+    """paint a square dot with side size (in pixel) for each position.
+       The topleft corner of dot i is at (int(xs[i] * factorx), int(ys[i] * factory)),
+       its color is colors[i] (a (r,g,b) tuple). Dots outside surface are clipped.
+       size can also be a list with the side of each dot. Overlapping dots
+       are painted in the order of the lists: the last dot is on top"""
+    if len(xs) == 0:
+        return
+    sizes = size if isinstance(size, (list, tuple)) else [size] * len(xs)
+    mapped = {} # color tuple : pixel value of this color in surface
+    for color in colors:
+        if color not in mapped:
+            mapped[color] = surface.map_rgb(color)
+    if numpy is None or surface.get_bytesize() == 3 or len(xs) < FEWDOTS:
+        area = surface.get_rect()
+        for x, y, color, side in zip(xs, ys, colors, sizes):
+            # clip first: fill moves a dot at x < 0 (or y < 0) into the surface instead of cutting it
+            surface.fill(mapped[color], pygame.Rect(int(x * factorx), int(y * factory), side, side).clip(area))
+        return
+    width, height = surface.get_size()
+    x = (numpy.asarray(xs, dtype=numpy.float64) * factorx).astype(numpy.int32)
+    y = (numpy.asarray(ys, dtype=numpy.float64) * factory).astype(numpy.int32)
+    sides = numpy.asarray(sizes, dtype=numpy.int32)
+    values = numpy.array([mapped[color] for color in colors], dtype=numpy.int64)
+    # all pixels of all dots: one row for each dot, one column for each pixel of the biggest dot
+    biggest = int(sides.max())
+    ox, oy = numpy.divmod(numpy.arange(biggest * biggest, dtype=numpy.int32), biggest)
+    px = (x[:, None] + ox).ravel()
+    py = (y[:, None] + oy).ravel()
+    values = numpy.repeat(values, biggest * biggest)
+    inside = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+    if sides.min() < biggest: # smaller dots use only a part of their row
+        inside &= ((ox < sides[:, None]) & (oy < sides[:, None])).ravel()
+    pixels = pygame.surfarray.pixels2d(surface) # locks surface until pixels is deleted
+    pixels[px[inside], py[inside]] = values[inside].astype(pixels.dtype, casting="unsafe")
+    del pixels # unlock surface
+
+
+if __name__ == "__main__":
+    # ------ benchmark: bullets on a 200 x 150 radar map of a 1024 x 800 world ------
+    import os
+    import random
+    import time
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # no window necessary
+    pygame.init()
+    screen = pygame.display.set_mode((640, 480))
+    radar = pygame.Surface((200, 150)).convert()
+    factorx = 200.0 / 1024
+    factory = 150.0 / 800
+    frames = 100
+    for objects in (10, 1000, 10000):
+        random.seed(1)
+        xs = [random.uniform(0, 1024) for _ in range(objects)]
+        ys = [random.uniform(0, 800) for _ in range(objects)]
+        colors = [random.choice(((200, 200, 0), (100, 100, 255))) for _ in range(objects)]
+        for mode in ("draw.rect", "paint_dots"):
+            start = time.time()
+            for frame in range(frames):
+                radar.fill((0, 0, 0))
+                if mode == "draw.rect":
+                    for x, y, color in zip(xs, ys, colors):
+                        pygame.draw.rect(radar, color, (int(x * factorx), int(y * factory), 4, 4))
+                else:
+                    paint_dots(radar, xs, ys, colors, 4, factorx, factory)
+            duration = time.time() - start
+            print("%5i dots %-10s: %7.3f ms per frame" % (objects, mode, duration * 1000 / frames))
+    pygame.quit()
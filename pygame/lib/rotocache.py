@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+rotocache.py
+cache of pre-rotated sprite images (and their rects and masks)
+author: horst.jens@spielend-programmieren.at
+licence: gpl, see http://www.gnu.org/licenses/gpl.html
+
+pygame.transform.rotate (and rotozoom) create a new surface each time,
+and pygame.mask.from_surface has to look at each pixel of it.
+A homing rocket changes its angle every frame, so doing this for each
+rocket in each frame costs a lot of time.
+
+A RotationCache rounds the angle to one of steps angles (360 steps:
+one degree, 72 steps: 5 degrees) and remembers the rotated image, its
+rect and (if masks=True) its mask for each base image and each angle.
+Make one RotationCache as class attribute, then all sprites of this
+class share the rotated images.
+
+The cache has a memory budget (in bytes). If the rotated images need
+more memory, the least recently used ones are thrown away.
+
+Rotated images are shared, never paint on them.
+
+usage:
+    class Rocket(pygame.sprite.Sprite):
+        rotations = rotocache.RotationCache(72, masks=True)
+        ...
+        def update(self, seconds):
+            ...
+            Rocket.rotations.rotate_sprite(self) # sets image, rect, mask from self.image0 and self.angle
+
+run this file directly for a benchmark
+
+works with python3.4 and python2.7
+"""
+
+#the next line is only needed for python2.x and not necessary for python3.x
+from __future__ import print_function, division
+
+import collections
+import pygame
+
+
+class RotationCache(object):
+    """rotated images of base images, at steps different angles"""
+    def __init__(self, steps=360, budget=16 * 1024 * 1024, masks=False, smooth=False, zoomsteps=100):
+        self.steps = steps        # number of different angles, 360 means 1 degree
+        self.budget = budget      # maximum memory for rotated images (and masks) in bytes
+        self.masks = masks        # calculate a pygame.mask for each rotated image
+        self.smooth = smooth      # use rotozoom (smooth, but slower) instead of rotate
+        self.zoomsteps = zoomsteps  # zoom is rounded to 1 / zoomsteps
+        self.entries = collections.OrderedDict()  # (key, angleindex, zoomindex): (image, rect, mask, bytes)
+        self.size = 0             # memory used by all entries, in bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def angle_index(self, angle):
+        """returns the number (0 ... steps-1) of the nearest cached angle"""
+        return int(round(angle % 360 * self.steps / 360.0)) % self.steps
+
+    def get(self, base, angle, key=None, zoom=1.0):
+        """returns (image, rect, mask) of base rotated by angle (in degrees).
+           rect is a new Rect (at 0,0) that can be moved, mask is None if masks=False.
+           key: name for base (default: base itself). Sprites creating their own
+           base image with the same pixels (like bullets of one color) should use
+           the same key, like ("bullet", color), to share their rotated images"""
+        if key is None:
+            key = base
+        index = self.angle_index(angle)
+        zoomindex = int(round(zoom * self.zoomsteps))
+        entrykey = (key, index, zoomindex)
+        entry = self.entries.pop(entrykey, None)
+        if entry is None:
+            self.misses += 1
+            entry = self.make(base, index * 360.0 / self.steps, zoomindex / self.zoomsteps)
+            self.size += entry[3]
+            while self.size > self.budget and self.entries:
+                oldentry = self.entries.popitem(last=False)[1] # least recently used
+                self.size -= oldentry[3]
+                self.evictions += 1
+        else:
+            self.hits += 1
+        self.entries[entrykey] = entry # (again) at the end: most recently used
+        image, rect, mask, bytes = entry
+        return image, rect.copy(), mask
+
+    def make(self, base, angle, zoom):
+        """rotate (and zoom) base, returns (image, rect, mask, bytes)"""
+        if self.smooth or zoom != 1.0:
+            image = pygame.transform.rotozoom(base, angle, zoom)
+        else:
+            image = pygame.transform.rotate(base, angle)
+        rect = image.get_rect()
+        bytes = rect.width * rect.height * image.get_bytesize()
+        mask = None
+        if self.masks:
+            mask = pygame.mask.from_surface(image)
+            bytes += rect.width * rect.height // 8
+        return image, rect, mask, bytes
+
+    def warmup(self, base, key=None, zoom=1.0):
+        """calculate the rotated images for all steps angles of base now"""
+        for index in range(self.steps):
+            self.get(base, index * 360.0 / self.steps, key, zoom)
+
+    def rotate_sprite(self, sprite, angle=None, key=None):
+        """set image, rect (same center as before) and mask (if masks=True)
+           of sprite to its base image sprite.image0 rotated by angle.
+           angle and key default to sprite.angle and sprite.rotationkey (if it exists)"""
+        if angle is None:
+            angle = sprite.angle
+        if key is None:
+            key = getattr(sprite, "rotationkey", None)
+        oldcenter = sprite.rect.center
+        sprite.image, sprite.rect, mask = self.get(sprite.image0, angle, key)
+        sprite.rect.center = oldcenter
+        if mask is not None:
+            sprite.mask = mask
+
+    def clear(self):
+        self.entries.clear()
+        self.size = 0
+
+    def hitrate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+    def report(self):
+        """returns a text with size and hit rate of the cache"""
+        return ("rotocache: %i images, %.2f of %.2f MB, %i hits, %i misses, hit rate %.1f%%, %i evictions" %
+                (len(self.entries), self.size / 1048576.0, self.budget / 1048576.0,
+                 self.hits, self.misses, self.hitrate() * 100, self.evictions))
+
+
+if __name__ == "__main__":
+    # ------ benchmark: 100 homing rockets turning every frame ------
+    import os
+    import random
+    import time
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # no window necessary
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    rocketimage = pygame.Surface((6, 20))
+    rocketimage.set_colorkey((0, 0, 0))
+    pygame.draw.rect(rocketimage, (200, 0, 0), (0, 0, 6, 20))
+    pygame.draw.rect(rocketimage, (10, 0, 0), (0, 0, 6, 4))
+    rocketimage = rocketimage.convert_alpha()
+    rockets = 100
+    frames = 300
+    for mode in ("rotozoom+mask", "RotationCache 360", "RotationCache 72"):
+        random.seed(1)
+        angles = [random.uniform(0, 360) for _ in range(rockets)]
+        cache = RotationCache(72 if mode.endswith("72") else 360, masks=True, smooth=True)
+        start = time.time()
+        for frame in range(frames):
+            for i in range(rockets):
+                angles[i] += random.uniform(-3, 3) # homing rockets turn a little each frame
+                if mode == "rotozoom+mask":
+                    image = pygame.transform.rotozoom(rocketimage, angles[i], 1.0)
+                    mask = pygame.mask.from_surface(image)
+                else:
+                    image, rect, mask = cache.get(rocketimage, angles[i])
+        duration = time.time() - start
+        print("%-17s: %i rockets, %.3f ms per frame" % (mode, rockets, duration * 1000 / frames))
+        if mode != "rotozoom+mask":
+            print("   " + cache.report())
+    pygame.quit()
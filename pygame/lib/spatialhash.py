@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+spatialhash.py
+uniform grid (spatial hash) broadphase for pygame sprite collision detection
+url: http://thepythongamebook.com/en:part2:pygame:step019
+author: horst.jens@spielend-programmieren.at
+licence: gpl, see http://www.gnu.org/licenses/gpl.html
+
+pygame.sprite.spritecollide tests one sprite against every sprite of
+a group. Doing this for every sprite of a group costs n*n tests each frame.
+A SpatialHash sorts all sprites once per frame into the cells of a
+uniform grid. A collision test must only look at the sprites sharing a
+cell with the tested sprite (candidates). The (expensive) collided
+function, like pygame.sprite.collide_mask, runs only for those candidates.
+
+usage:
+    hash = SpatialHash()
+    hash.rebuild(projectilegroup)   # once per frame, before collision tests
+    crashgroup = hash.spritecollide(player, bulletgroup, pygame.sprite.collide_mask)
+
+the result is the same list (same order) as
+    pygame.sprite.spritecollide(player, bulletgroup, False, pygame.sprite.collide_mask)
+as long as all tested sprites were in the group given to rebuild()
+
+run this file directly to see a benchmark (2000 projectiles, broadphase on and off)
+
+works with python3.4 and python2.7
+"""
+
+#the next line is only needed for python2.x and not necessary for python3.x
+from __future__ import print_function, division
+
+import pygame
+
+
+class SpatialHash(object):
+    """uniform grid of square cells. Each cell is a list of sprites
+       whose rect touches the cell. A sprite can sit in several cells."""
+    def __init__(self, cellsize=64):
+        self.cellsize = cellsize
+        self.cells = {}  # (column, row) : [sprite, sprite, ...]
+        self.order = {}  # sprite : insertion number, to keep the order of the group
+
+    @staticmethod
+    def cellsize_for(sprites, minimum=8):
+        """calculate a good cell size from the largest sprite radius.
+           sprites without .radius attribute use half of their rect diagonal"""
+        biggest = 0
+        for sprite in sprites:
+            if hasattr(sprite, "radius"):
+                radius = sprite.radius
+            else:
+                radius = (sprite.rect.width ** 2 + sprite.rect.height ** 2) ** 0.5 / 2.0
+            if radius > biggest:
+                biggest = radius
+        return max(minimum, int(biggest * 2) + 1)
+
+    def clear(self):
+        self.cells = {}
+        self.order = {}
+
+    def rebuild(self, sprites, cellsize=None):
+        """forget all sprites and insert all given sprites (a group or a list).
+           if cellsize is None, the cell size is calculated from the largest sprite"""
+        self.clear()
+        if cellsize is None:
+            cellsize = SpatialHash.cellsize_for(sprites)
+        self.cellsize = cellsize
+        for sprite in sprites:
+            self.insert(sprite)
+
+    def cellrange(self, rect):
+        """returns the first and last column and row touched by a rect"""
+        c = self.cellsize
+        return (rect.left // c, (rect.right - 1) // c,
+                rect.top // c, (rect.bottom - 1) // c)
+
+    def insert(self, sprite):
+        if sprite in self.order:
+            return # already inside
+        self.order[sprite] = len(self.order)
+        left, right, top, bottom = self.cellrange(sprite.rect)
+        for column in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                self.cells.setdefault((column, row), []).append(sprite)
+
+    def candidates(self, rect):
+        """returns all sprites sharing at least one cell with rect,
+           in the order they were inserted"""
+        left, right, top, bottom = self.cellrange(rect)
+        found = set()
+        cells = self.cells
+        for column in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                if (column, row) in cells:
+                    found.update(cells[(column, row)])
+        return sorted(found, key=self.order.__getitem__)
+
+    def spritecollide(self, sprite, group=None, collided=None):
+        """works like pygame.sprite.spritecollide(sprite, group, False, collided).
+           if group is not None, only sprites of this group are returned.
+           Killed sprites are ignored. collided (like collide_mask) is only
+           called for candidates whose rect overlaps the rect of sprite"""
+        crashgroup = []
+        rect = sprite.rect
+        for other in self.candidates(rect):
+            if group is None:
+                if not other.alive():
+                    continue # killed since the last rebuild
+            elif other not in group:
+                continue
+            if not rect.colliderect(other.rect):
+                continue
+            if collided is None or collided(sprite, other):
+                crashgroup.append(other)
+        return crashgroup
+
+
+if __name__ == "__main__":
+    # ------ benchmark: 2000 projectiles, broadphase on and off ------
+    import os
+    import random
+    import time
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # no window necessary
+    pygame.init()
+    screen = pygame.display.set_mode((1800, 1000))
+    screenrect = screen.get_rect()
+
+    class Thing(pygame.sprite.Sprite):
+        """a simple projectile or player flying over the screen"""
+        number = 0
+        def __init__(self, size, groups):
+            pygame.sprite.Sprite.__init__(self, groups)
+            self.image = pygame.Surface(size)
+            self.image.set_colorkey((0, 0, 0))
+            pygame.draw.ellipse(self.image, (200, 0, 200), self.image.get_rect())
+            self.image = self.image.convert_alpha()
+            self.rect = self.image.get_rect()
+            self.rect.center = (random.randint(0, screenrect.width), random.randint(0, screenrect.height))
+            self.radius = max(size) / 2.0
+            self.dx = random.randint(-200, 200)
+            self.dy = random.randint(-200, 200)
+            self.number = Thing.number
+            self.team = random.randint(0, 1)
+            Thing.number += 1
+
+        def update(self, seconds):
+            self.rect.move_ip(self.dx * seconds, self.dy * seconds)
+            if not screenrect.contains(self.rect):
+                self.dx, self.dy = -self.dx, -self.dy
+                self.rect.clamp_ip(screenrect)
+
+    def frame(broadphase, hash, players, bullets, rockets, projectiles):
+        """the collision passes of 019_homing_missiles.py, counting hits"""
+        hits = 0
+        if broadphase:
+            hash.rebuild(projectiles)
+        for player in players:
+            if broadphase:
+                crashgroup = hash.spritecollide(player, bullets, pygame.sprite.collide_mask)
+            else:
+                crashgroup = pygame.sprite.spritecollide(player, bullets, False, pygame.sprite.collide_mask)
+            hits += len(crashgroup)
+            if broadphase:
+                crashgroup = hash.spritecollide(player, rockets, pygame.sprite.collide_mask)
+            else:
+                crashgroup = pygame.sprite.spritecollide(player, rockets, False, pygame.sprite.collide_mask)
+            hits += len(crashgroup)
+        for projectile in projectiles:
+            if broadphase:
+                crashgroup = hash.spritecollide(projectile, projectiles)
+            else:
+                crashgroup = pygame.sprite.spritecollide(projectile, projectiles, False)
+            for crashthing in crashgroup:
+                if projectile.number > crashthing.number and projectile.team != crashthing.team:
+                    hits += 1
+        return hits
+
+    for broadphase in (False, True):
+        random.seed(1) # same projectiles for both runs
+        Thing.number = 0
+        players = pygame.sprite.Group()
+        bullets = pygame.sprite.Group()
+        rockets = pygame.sprite.Group()
+        projectiles = pygame.sprite.Group()
+        for _ in range(3):
+            Thing((50, 50), players)
+        for _ in range(1500):
+            Thing((4, 20), (bullets, projectiles))
+        for _ in range(500):
+            Thing((6, 20), (rockets, projectiles))
+        hash = SpatialHash()
+        frames = 30
+        hits = 0
+        start = time.time()
+        for _ in range(frames):
+            hits += frame(broadphase, hash, players, bullets, rockets, projectiles)
+            projectiles.update(1 / 60.0)
+        duration = time.time() - start
+        print("broadphase %-5s: %i projectiles, %.2f ms per frame, %i hits" %
+              (broadphase, len(projectiles), duration * 1000.0 / frames, hits))
+    pygame.quit()
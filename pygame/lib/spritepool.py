@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+spritepool.py
+reuse short-lived sprites (fragments, smoke, bullets) instead of creating new ones
+author: horst.jens@spielend-programmieren.at
+licence: gpl, see http://www.gnu.org/licenses/gpl.html
+
+An explosion creating hundreds of fragment sprites at once makes
+hundreds of new pygame.Surfaces and sprite objects in one frame,
+and the game stutters. A SpritePool keeps killed sprites of one class
+in a list of free sprites and gives them back (with new values) the
+next time such a sprite is needed.
+
+A pooled sprite class needs:
+    __init__(self)        without arguments: make the sprite (and its image)
+                          once, but do not join any group
+    reset(self, ...)      give the sprite its new values and join the groups
+                          (this replaces the arguments of __init__)
+    kill(self)            leave the groups and go back into the pool:
+                          pygame.sprite.Sprite.kill(self)
+                          self.pool.release(self)
+
+Killing a sprite twice is fine, the pool takes it only once.
+With enabled=False the pool makes a new sprite for each acquire()
+(to compare the game with and without pool).
+
+usage:
+    class Smoke(pygame.sprite.Sprite):
+        def __init__(self): ...
+        def reset(self, pos, dx, dy): ...
+        def kill(self):
+            pygame.sprite.Sprite.kill(self)
+            Smoke.pool.release(self)
+    Smoke.pool = SpritePool(Smoke, 200)  # 200 Smoke sprites made in advance
+    Smoke.pool.acquire(pos, dx, dy)      # instead of Smoke(pos, dx, dy)
+    print(Smoke.pool.report())
+
+run this file directly for a benchmark
+
+works with python3.4 and python2.7
+"""
+
+#the next line is only needed for python2.x and not necessary for python3.x
+from __future__ import print_function, division
+
+import pygame
+
+
+class SpritePool(object):
+    """free (killed) sprites of one class, ready to be used again"""
+    def __init__(self, factory, size=0, maxfree=None, enabled=True, name=None):
+        self.factory = factory        # class (or function) making a new sprite without arguments
+        self.maxfree = maxfree        # keep at most maxfree free sprites (None: no limit)
+        self.enabled = enabled        # False: make a new sprite for each acquire()
+        self.name = name or getattr(factory, "__name__", "sprites")
+        self.free = []                # killed sprites, ready for acquire()
+        self.inuse = 0                # sprites acquired and not yet released
+        self.peak = 0                 # highest inuse so far
+        self.created = 0
+        self.reused = 0
+        if enabled:
+            self.preallocate(size)
+
+    def make(self):
+        sprite = self.factory()
+        sprite.inpool = True
+        self.created += 1
+        return sprite
+
+    def preallocate(self, number):
+        """make number sprites in advance (before the game starts)"""
+        for _ in range(number):
+            self.free.append(self.make())
+
+    def acquire(self, *args, **kwargs):
+        """returns a free (or new) sprite, reset with args and kwargs"""
+        if self.enabled and self.free:
+            sprite = self.free.pop()
+            self.reused += 1
+        else:
+            sprite = self.make()
+        sprite.inpool = False
+        sprite.reset(*args, **kwargs)
+        self.inuse += 1
+        self.peak = max(self.peak, self.inuse)
+        return sprite
+
+    def release(self, sprite):
+        """take back a killed sprite (the sprite must already have left its groups)"""
+        if sprite.inpool:
+            return # killed twice
+        sprite.inpool = True
+        self.inuse -= 1
+        if self.enabled and (self.maxfree is None or len(self.free) < self.maxfree):
+            self.free.append(sprite)
+
+    def set_enabled(self, enabled):
+        """switch the pool on or off, a disabled pool forgets its free sprites"""
+        self.enabled = enabled
+        if not enabled:
+            del self.free[:]
+
+    def report(self):
+        """returns a text with usage of the pool"""
+        return ("spritepool %s: %i in use, peak %i, %i free, %i created, %i reused%s" %
+                (self.name, self.inuse, self.peak, len(self.free), self.created, self.reused,
+                 "" if self.enabled else " (disabled)"))
+
+
+if __name__ == "__main__":
+    # ------ benchmark: explosions of 2000 fragments, with and without pool ------
+    import os
+    import random
+    import time
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # no window necessary
+    pygame.init()
+    screen = pygame.display.set_mode((640, 480))
+    allgroup = pygame.sprite.LayeredUpdates()
+    fragmentgroup = pygame.sprite.Group()
+
+    class Fragment(pygame.sprite.Sprite):
+        """like RedFragment of 019_homing_missiles.py"""
+        def __init__(self):
+            self._layer = 9
+            pygame.sprite.Sprite.__init__(self)
+            self.image = pygame.Surface((10, 10), pygame.SRCALPHA).convert_alpha()
+            self.rect = self.image.get_rect()
+
+        def reset(self, pos):
+            self.image.fill((0, 0, 0, 0))
+            pygame.draw.circle(self.image, (random.randint(25, 255), 0, 0), (5, 5), random.randint(2, 5))
+            self.rect.center = pos
+            self.add(allgroup, fragmentgroup)
+
+        def kill(self):
+            pygame.sprite.Sprite.kill(self)
+            Fragment.pool.release(self)
+
+    explosions = 20
+    for enabled in (False, True):
+        Fragment.pool = SpritePool(Fragment, 2000 if enabled else 0, enabled=enabled)
+        random.seed(1)
+        longest = 0.0
+        start = time.time()
+        for explosion in range(explosions):
+            begin = time.time()
+            for _ in range(2000):
+                Fragment.pool.acquire((random.randint(0, 639), random.randint(0, 479)))
+            allgroup.draw(screen)
+            longest = max(longest, time.time() - begin)
+            for fragment in fragmentgroup.sprites():
+                fragment.kill()
+        duration = time.time() - start
+        print("pool %-8s: %7.3f ms per explosion, longest %7.3f ms" %
+              ("enabled" if enabled else "disabled", duration * 1000 / explosions, longest * 1000))
+        print("   " + Fragment.pool.report())
+    pygame.quit()
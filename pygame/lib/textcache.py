@@ -0,0 +1,234 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+textcache.py
+cached fonts and cached text surfaces for pygame games
+author: horst.jens@spielend-programmieren.at
+licence: gpl, see http://www.gnu.org/licenses/gpl.html
+
+Creating a font with pygame.font.SysFont is slow (it searches the
+system fonts) and font.render is not free either. The write() functions
+of many games do both for every text, every frame. This module keeps:
+
+ * fonts: an LRU cache of Font objects, key: (name, size, bold)
+ * texts: an LRU cache of rendered text surfaces,
+          key: (text, color, antialias) and the font key
+ * atlases: for text changing every frame (like "FPS: 29.87"), a
+          GlyphAtlas renders each character only once onto one surface.
+          A text is painted by blitting the characters from the atlas.
+
+LRU means "least recently used": if a cache is full, the entry not
+used for the longest time is thrown away.
+
+Surfaces returned by render() are shared (cached), so never paint on them.
+
+usage:
+    from lib import textcache
+    textcache.write(screen, "Hello", 50, 150, (0,0,0), 24)              # cached text
+    textcache.write(screen, "FPS: {:6.3}".format(fps), 10, 10, numeric=True) # glyph atlas
+    surface = textcache.render("Game Over", (255,0,0), size=50)
+    print(textcache.report())  # hit rates of all caches
+
+run this file directly for a benchmark
+
+works with python3.4 and python2.7
+"""
+
+#the next line is only needed for python2.x and not necessary for python3.x
+from __future__ import print_function, division
+
+import collections
+import os
+import pygame
+
+DIGITS = "0123456789.,:;-+%/() "  # glyphs inside every new GlyphAtlas
+
+
+class LRUCache(object):
+    """dictionary with a maximum size, forgetting the least recently used entry.
+       counts hits and misses of get()"""
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.data = collections.OrderedDict()  # oldest entry first
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.data)
+
+    def __contains__(self, key):
+        return key in self.data
+
+    def get(self, key, default=None):
+        if key not in self.data:
+            self.misses += 1
+            return default
+        self.hits += 1
+        value = self.data.pop(key)  # move to the end: most recently used
+        self.data[key] = value
+        return value
+
+    def put(self, key, value):
+        if key in self.data:
+            del self.data[key]
+        elif len(self.data) >= self.maxsize:
+            self.data.popitem(last=False)  # forget the least recently used
+        self.data[key] = value
+
+    def clear(self):
+        self.data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def hitrate(self):
+        """returns hits / (hits + misses), or 0.0 if get() was never called"""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+
+class GlyphAtlas(object):
+    """all characters of a font in one color on one surface.
+       Missing characters are added when first used (the atlas is rebuilt)"""
+    def __init__(self, font, color=(0, 0, 0), antialias=True, chars=DIGITS):
+        self.font = font
+        self.color = color
+        self.antialias = antialias
+        self.rebuilds = 0
+        self.build(chars)
+
+    def build(self, chars):
+        """render each character once and paste them side by side on one surface"""
+        self.chars = "".join(sorted(set(chars)))
+        glyphs = [self.font.render(char, self.antialias, self.color) for char in self.chars]
+        width = max(1, sum(glyph.get_width() for glyph in glyphs))
+        self.height = max([glyph.get_height() for glyph in glyphs] + [self.font.get_height()])
+        self.image = pygame.Surface((width, self.height), pygame.SRCALPHA)
+        self.areas = {}  # char : Rect of this char inside self.image
+        x = 0
+        for char, glyph in zip(self.chars, glyphs):
+            self.image.blit(glyph, (x, 0))
+            self.areas[char] = pygame.Rect(x, 0, glyph.get_width(), glyph.get_height())
+            x += glyph.get_width()
+        if pygame.display.get_surface() is not None:
+            self.image = self.image.convert_alpha()
+        self.rebuilds += 1
+
+    def size(self, text):
+        """returns (width, height) of text, like font.size(text)"""
+        missing = set(text) - set(self.areas)
+        if missing:
+            self.build(self.chars + "".join(missing))
+        return sum(self.areas[char].width for char in text), self.height
+
+    def blit(self, surface, text, pos):
+        """paint text with topleft corner at pos"""
+        width, height = self.size(text) # also adds missing chars
+        x, y = pos
+        image = self.image
+        areas = self.areas
+        for char in text:
+            area = areas[char]
+            surface.blit(image, (x, y), area)
+            x += area.width
+        return pygame.Rect(pos[0], y, width, height)
+
+
+fonts = LRUCache(32)
+texts = LRUCache(512)
+atlases = LRUCache(16)
+
+
+def font(name="mono", size=24, bold=False):
+    """returns a (cached) Font. name can be a system font name or a font file"""
+    key = (name, size, bold)
+    result = fonts.get(key)
+    if result is None:
+        if name is not None and os.path.isfile(name):
+            result = pygame.font.Font(name, size)
+            result.set_bold(bold)
+        else:
+            result = pygame.font.SysFont(name, size, bold=bold)
+        fonts.put(key, result)
+    return result
+
+
+def render(text, color=(0, 0, 0), name="mono", size=24, bold=False, antialias=True):
+    """returns a (cached) surface with text, like font.render. Do not paint on it!"""
+    key = (text, tuple(color), antialias, name, size, bold)
+    surface = texts.get(key)
+    if surface is None:
+        surface = font(name, size, bold).render(text, antialias, color)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        texts.put(key, surface)
+    return surface
+
+
+def atlas(color=(0, 0, 0), name="mono", size=24, bold=False, antialias=True):
+    """returns a (cached) GlyphAtlas for this font and color"""
+    key = (tuple(color), antialias, name, size, bold)
+    result = atlases.get(key)
+    if result is None:
+        result = GlyphAtlas(font(name, size, bold), color, antialias)
+        atlases.put(key, result)
+    return result
+
+
+def write(background, text, x=50, y=150, color=(0, 0, 0),
+          fontsize=None, center=False, name="mono", bold=True, numeric=False):
+    """write text on pygame surface (like the write functions of the games).
+       numeric=True uses a GlyphAtlas: best for text changing every frame.
+       returns the Rect of the text"""
+    if fontsize is None:
+        fontsize = 24
+    if numeric:
+        glyphs = atlas(color, name, fontsize, bold)
+        fw, fh = glyphs.size(text)
+        if center:  # center text around x,y
+            return glyphs.blit(background, text, (x - fw // 2, y - fh // 2))
+        else:  # topleft corner is x,y
+            return glyphs.blit(background, text, (x, y))
+    surface = render(text, color, name, fontsize, bold)
+    fw, fh = surface.get_size()
+    if center:  # center text around x,y
+        return background.blit(surface, (x - fw // 2, y - fh // 2))
+    else:  # topleft corner is x,y
+        return background.blit(surface, (x, y))
+
+
+def report():
+    """returns a text with size and hit rate of each cache"""
+    lines = []
+    for cachename, cache in (("fonts", fonts), ("texts", texts), ("atlases", atlases)):
+        lines.append("textcache %-7s: %4i of %4i entries, %6i hits, %6i misses, hit rate %5.1f%%" %
+                     (cachename, len(cache), cache.maxsize, cache.hits, cache.misses, cache.hitrate() * 100))
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    # ------ benchmark: FPS/PLAYTIME line of slurp.py, written each frame ------
+    import time
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # no window necessary
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    frames = 500
+    lines = ["FPS: {:6.3}  PLAYTIME: {:6.3} SECONDS".format(29.0 + frame % 100 / 37.0, frame / 30.0)
+             for frame in range(frames)]
+
+    def oldwrite(background, text, x=50, y=150, color=(0, 0, 0), fontsize=24):
+        """the write function of slurp.py: new font for each text"""
+        myfont = pygame.font.SysFont('mono', fontsize, bold=True)
+        background.blit(myfont.render(text, True, color), (x, y))
+
+    for mode in ("new font", "cached font+text", "glyph atlas"):
+        start = time.time()
+        for line in lines:
+            screen.fill((255, 255, 255))
+            if mode == "new font":
+                oldwrite(screen, line, 10, 10)
+            else:
+                write(screen, line, 10, 10, numeric=(mode == "glyph atlas"))
+        duration = time.time() - start
+        print("%-16s: %.3f ms per frame" % (mode, duration * 1000 / frames))
+    print(report())
+    pygame.quit()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+trail.py
+fixed-size trail (the last positions of a moving sprite) for pygame games
+author: horst.jens@spielend-programmieren.at
+licence: gpl, see http://www.gnu.org/licenses/gpl.html
+
+A python list used as trail grows with append() and shrinks with pop(0).
+pop(0) must move all other list items one place forward and each new
+position is a new tuple. A Trail stores the positions in a ring buffer:
+an array of floats (array module) with a head index pointing at the
+oldest position. A new position simply overwrites the oldest one.
+
+A Trail is painted with pygame.draw.lines: one call for the whole trail
+(or a few calls, one for each color band if the color should fade).
+
+usage:
+    mytrail = Trail(50)                 # remember the last 50 positions
+    mytrail.append(x, y)                # each frame
+    mytrail.draw(screen, (255,0,0), 2)  # paint it
+
+run this file directly to compare 200 balls with list trails and with Trail objects
+
+works with python3.4 and python2.7
+"""
+
+#the next line is only needed for python2.x and not necessary for python3.x
+from __future__ import print_function, division
+
+import array
+import pygame
+
+
+class Trail(object):
+    """ring buffer with the last capacity positions (x, y)"""
+    def __init__(self, capacity=50):
+        self.capacity = capacity
+        self.buffer = array.array("f", [0.0] * (2 * capacity)) # x0, y0, x1, y1, ...
+        self.head = 0   # index of the oldest position (if the trail is full)
+        self.length = 0 # number of stored positions
+
+    @classmethod
+    def frompoints(cls, points, capacity=None):
+        """create a Trail from a list of (x, y) positions, oldest first"""
+        if capacity is None:
+            capacity = max(1, len(points))
+        points = points[len(points) - capacity:] if len(points) > capacity else points
+        flat = [coordinate for point in points for coordinate in point]
+        trail = cls(capacity)
+        trail.buffer[:len(flat)] = array.array("f", flat)
+        trail.length = len(points)
+        return trail
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        return iter(self.points())
+
+    def append(self, x, y):
+        """add a new position. If the trail is full, the oldest position is lost"""
+        if self.length < self.capacity:
+            i = (self.head + self.length) % self.capacity
+            self.length += 1
+        else:
+            i = self.head
+            self.head = (self.head + 1) % self.capacity
+        self.buffer[2 * i] = x
+        self.buffer[2 * i + 1] = y
+
+    def popleft(self):
+        """remove and return the oldest position"""
+        if self.length == 0:
+            raise IndexError("pop from empty Trail")
+        i = self.head
+        self.head = (self.head + 1) % self.capacity
+        self.length -= 1
+        return (self.buffer[2 * i], self.buffer[2 * i + 1])
+
+    def clear(self):
+        self.head = 0
+        self.length = 0
+
+    def flat(self):
+        """returns all positions as flat list [x0, y0, x1, y1, ...], oldest first"""
+        start = 2 * self.head
+        end = start + 2 * self.length
+        if end <= 2 * self.capacity:
+            return self.buffer[start:end].tolist()
+        return self.buffer[start:].tolist() + self.buffer[:end - 2 * self.capacity].tolist()
+
+    def points(self, offset=(0, 0), scale=1.0):
+        """returns a list of (x, y) positions, oldest first.
+           Each position is multiplied with scale and moved by offset"""
+        flat = self.flat()
+        if scale == 1.0 and offset == (0, 0):
+            return list(zip(flat[0::2], flat[1::2]))
+        ox, oy = offset
+        return [(ox + x * scale, oy + y * scale) for x, y in zip(flat[0::2], flat[1::2])]
+
+    def draw(self, surface, color, width=1, endcolor=None, bands=1, offset=(0, 0), scale=1.0):
+        """paint the trail with pygame.draw.lines.
+           if endcolor is given, the color fades from color (oldest position)
+           to endcolor (newest position) in the given number of color bands,
+           using one pygame.draw.lines call per band.
+           returns a list with the Rect of each painted band (for dirty rects)"""
+        points = self.points(offset, scale)
+        if len(points) < 2:
+            return []
+        segments = len(points) - 1
+        bands = min(bands, segments)
+        if endcolor is None or bands < 2:
+            return [pygame.draw.lines(surface, color, False, points, width)]
+        rects = []
+        for band in range(bands):
+            start = band * segments // bands
+            end = (band + 1) * segments // bands
+            t = band / (bands - 1)
+            bandcolor = [int(c1 + (c2 - c1) * t) for c1, c2 in zip(color, endcolor)]
+            rects.append(pygame.draw.lines(surface, bandcolor, False, points[start:end + 1], width))
+        return rects
+
+
+if __name__ == "__main__":
+    # ------ benchmark: 200 balls with trails of 50 positions ------
+    import os
+    import random
+    import time
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # no window necessary
+    pygame.init()
+    screen = pygame.display.set_mode((1000, 600))
+    balls = 200
+    length = 50
+    frames = 300
+    for mode in ("list", "Trail"):
+        random.seed(1)
+        positions = [[random.randint(0, 1000), random.randint(0, 600),
+                      random.randint(-5, 5), random.randint(-5, 5)] for _ in range(balls)]
+        if mode == "list":
+            trails = [[] for _ in range(balls)]
+        else:
+            trails = [Trail(length) for _ in range(balls)]
+        start = time.time()
+        for frame in range(frames):
+            screen.fill((255, 255, 255))
+            for ball, trail in zip(positions, trails):
+                ball[0] = (ball[0] + ball[2]) % 1000
+                ball[1] = (ball[1] + ball[3]) % 600
+                if mode == "list":
+                    # the old way, like slurp.py: pop(0) and one draw.line per segment
+                    if len(trail) > length:
+                        trail.pop(0)
+                    trail.append((ball[0], ball[1]))
+                    for number, pos in enumerate(trail):
+                        if number > 0:
+                            pygame.draw.line(screen, (255, 0, int(number * 255 / length)), oldpos, pos, 4)
+                        oldpos = pos
+                else:
+                    trail.append(ball[0], ball[1])
+                    trail.draw(screen, (255, 0, 0), 4, (255, 0, 255), 5)
+        duration = time.time() - start
+        print("%-5s trails: %i balls, %.2f ms per frame" % (mode, balls, duration * 1000 / frames))
+    pygame.quit()
@@ -21,6 +21,9 @@ import math
 import random
 import os
 import sys
+from lib import trail
+from lib import textcache
+from lib import rotocache
 
 GRAD = math.pi / 180  # 2 * pi / 360   # math module needs Radiant instead of Grad
 
@@ -41,17 +44,10 @@ def draw_examples(background):
 
 
 def write(background, text, x=50, y=150, color=(0, 0, 0),
-          fontsize=None, center=False):
-    """write text on pygame surface. """
-    if fontsize is None:
-        fontsize = 24
-    font = pygame.font.SysFont('mono', fontsize, bold=True)
-    fw, fh = font.size(text)
-    surface = font.render(text, True, color)
-    if center:  # center text around x,y
-        background.blit(surface, (x - fw // 2, y - fh // 2))
-    else:  # topleft corner is x,y
-        background.blit(surface, (x, y))
+          fontsize=None, center=False, numeric=False):
+    """write text on pygame surface. Font and text surface are cached,
+       numeric=True paints text changing each frame from a glyph atlas"""
+    textcache.write(background, text, x, y, color, fontsize, center, numeric=numeric)
 
 
 def elastic_collision(sprite1, sprite2):
@@ -107,6 +103,8 @@ class FlyingObject(pygame.sprite.Sprite):
     """base class for sprites. this class inherits from pygames sprite class"""
     number = 0  # current number of Flying Object. 0 means no FlyingObjects yet
     numbers = {}  # {number: Sprite}
+    rotations = rotocache.RotationCache(360)  # rotated images, shared by all FlyingObjects
+    smoothrotations = rotocache.RotationCache(360, smooth=True)  # the same, made with rotozoom
 
     def __init__(self, **kwargs):
         """create a (black) surface and paint a blue ball on it"""
@@ -188,7 +186,7 @@ class FlyingObject(pygame.sprite.Sprite):
 
         # ---- make trail ------
         if self.trail:
-            self.oldposlist = []
+            self.oldposlist = trail.Trail(self.trail_max_length + 1)  # ring buffer
     
     def create_image(self):
         if self.imagenr is None:
@@ -235,14 +233,11 @@ class FlyingObject(pygame.sprite.Sprite):
     def turn_to_heading(self):
         """rotate into direction of movement (dx,dy)"""
         self.angle = math.atan2(-self.dx, -self.dy) / math.pi * 180.0
-        self.image = pygame.transform.rotozoom(self.image0, self.angle, 1.0)
+        self.image = FlyingObject.smoothrotations.get(self.image0, self.angle)[0]
     
     def rotate(self):
         """rotate because changes in self.angle"""
-        self.oldcenter = self.rect.center
-        self.image = pygame.transform.rotate(self.image0, self.angle)
-        self.rect = self.image.get_rect()
-        self.rect.center = self.oldcenter
+        FlyingObject.rotations.rotate_sprite(self)  # cached, see lib/rotocache.py
 
     def rotate_toward(self, target):
         """set dx dy and angle toward a target. need self.speed"""
@@ -356,9 +351,7 @@ class FlyingObject(pygame.sprite.Sprite):
         self.rect.centery = round(self.y, 0)
         # ---- paint trail ----
         if self.trail:
-            if len(self.oldposlist) > self.trail_max_length:
-                self.oldposlist.pop(0)  # remove first item
-            self.oldposlist.append((self.x, self.y))
+            self.oldposlist.append(self.x, self.y)  # overwrites the oldest position
 
 
 class Basebar(pygame.sprite.Sprite):
@@ -545,8 +538,9 @@ class Room(object):
 class PygView(object):
     images = []
     
-    def __init__(self, width=640, height=400, fps=30, grid=50):
-        """Initialize pygame, window, background, font,..."""
+    def __init__(self, width=640, height=400, fps=30, grid=50, stats=False):
+        """Initialize pygame, window, background, font,...
+           stats=True prints the hit rates of the text cache at exit"""
         pygame.init()
         pygame.display.set_caption("Press ESC to quit")
         PygView.width = width  # make global readable
@@ -557,6 +551,7 @@ class PygView(object):
         self.background.fill((255, 255, 255))  # fill background white
         self.clock = pygame.time.Clock()
         self.fps = fps
+        self.stats = stats
         self.playtime = 0.0
         # self.font = pygame.font.SysFont('mono', 24, bold=True)
         self.loadresources()  # loadresources calls paintgrid
@@ -754,7 +749,7 @@ class PygView(object):
             self.screen.blit(self.background, (0, 0))  # clear screen
             # write text below sprites
             write(self.screen, "FPS: {:6.3}  PLAYTIME: {:6.3} SECONDS".format(
-                self.clock.get_fps(), self.playtime))
+                self.clock.get_fps(), self.playtime), numeric=True)
             # write in window title
             pygame.display.set_caption(
                 "tux1: x {:.2f} y {:.2f} dx {:.2f} dy {:.2f} ddx {:.2f} ddy {:.2f} ".format(self.tux1.x, self.tux1.y,
@@ -825,15 +820,10 @@ class PygView(object):
                         # ----------- paint trails ----------
             for thing in self.allgroup:
                 if thing.trail:
-                    e = enumerate(thing.oldposlist)  # ( number, (pos))
-                    for epos in e:
-                        if epos[0] > 0:
-                            pygame.draw.line(self.screen,
-                                             (thing.color[0], thing.color[1],
-                                              int(epos[0] * 255 / thing.trail_max_length)),
-                                             oldpos, epos[1],
-                                             epos[0] // 100 + 4)  # TODO trailwidth dependent from trail_start_width
-                        oldpos = epos[1]
+                    # blue part of color fades in from oldest to newest position, in 5 color bands
+                    thing.oldposlist.draw(self.screen,
+                                          (thing.color[0], thing.color[1], 0), 4,
+                                          (thing.color[0], thing.color[1], 255), 5)  # TODO trailwidth dependent from trail_start_width
             # ----------- clear, draw , update, flip -----------------  
             # self.allgroup.clear(screen, background)
             self.allgroup.update(seconds)  # would also work with ballgroup
@@ -843,9 +833,12 @@ class PygView(object):
             
             # --------- next frame ---------------
             pygame.display.flip()
+        if self.stats:
+            print(textcache.report())
         pygame.quit()
 
 
 if __name__ == '__main__':
     # try PygView(800,600).run()
-    PygView().run()
+    # python template006_grid_and_trail.py --stats : print the hit rates of the text cache at exit
+    PygView(stats="--stats" in sys.argv).run()
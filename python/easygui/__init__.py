@@ -0,0 +1,83 @@
+"""
+@version: 0.96(2010-08-29)
+
+EasyGui: simple boxes (msgbox, enterbox, choicebox, textbox, ...) that
+are invoked by simple function calls that return results.
+Written by Stephen Raymond Ferg, modified BSD license (see boxes.py).
+
+This is the one EasyGui of ThePythonGameBook, shared by all games.
+The other places of easygui.py (pygame/lib, pygame/data, goblindice, ...)
+only keep their import path and load this package.
+
+"import easygui" is cheap: the parts of EasyGui are imported only when
+they are used for the first time (module __getattr__, python 3.7 and newer):
+
+    easygui.EgStore                  store.py (without tkinter)
+    easygui.msgbox, ...              boxes.py (tkinter; the file dialogs of
+                                     tkinter and PIL only with the first
+                                     file box or image)
+    easygui.egdemo, abouteasygui     demo.py
+
+So a game that shows only one msgbox at exit does not load tkinter at start.
+Older pythons import all parts at once, like the old easygui.py.
+
+Settings like the fonts belong to easygui.boxes:
+    easygui.boxes.PROPORTIONAL_FONT_SIZE = 14
+
+run the demo:                    python -m easygui
+benchmark of the boxes:          python -m easygui benchmark
+benchmark of the import time:    python -m easygui importtime
+check of the session mode:       python -m easygui check
+"""
+
+import importlib
+import sys
+
+egversion = __doc__.split()[1]
+eg_version = egversion  # the name used by newer EasyGui versions
+
+__all__ = [
+    'ynbox', 'ccbox', 'boolbox', 'indexbox', 'msgbox', 'buttonbox',
+    'integerbox', 'multenterbox', 'enterbox', 'exceptionbox', 'choicebox',
+    'codebox', 'textbox', 'diropenbox', 'fileopenbox', 'filesavebox',
+    'passwordbox', 'multpasswordbox', 'multchoicebox', 'abouteasygui',
+    'egversion', 'egdemo', 'EgStore', 'session'
+]
+
+# the module of each name, all other names are in boxes
+MODULES = {
+    "EgStore": "store",
+    "egdemo": "demo",
+    "abouteasygui": "demo",
+}
+
+
+def __getattr__(name):
+    """
+    Import the module of name when it is used for the first time.
+    Functions and classes are remembered, other names (like boxRoot)
+    are always taken from boxes.
+    """
+    if name.startswith("__"):
+        raise AttributeError(name)
+    if name in ("boxes", "store", "demo"):
+        return importlib.import_module("." + name, __name__)
+    module = importlib.import_module("." + MODULES.get(name, "boxes"), __name__)
+    try:
+        value = getattr(module, name)
+    except AttributeError:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    if name in __all__:
+        globals()[name] = value  # the next time without __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if sys.version_info < (3, 7):
+    # no module __getattr__: import everything now
+    from .boxes import *
+    from .store import EgStore
+    from .demo import egdemo, abouteasygui
@@ -0,0 +1,53 @@
+"""
+python -m easygui               run the EasyGui demo
+python -m easygui benchmark     time to open and close each kind of box
+python -m easygui importtime    time to import easygui, and each part of it
+python -m easygui check         check the boxes used again in the session mode
+"""
+from __future__ import print_function
+
+import os
+import subprocess
+import sys
+
+import easygui
+
+# each statement runs in a new python: nothing is imported before
+IMPORTS = [
+    ("import easygui", "import easygui"),
+    ("+ easygui.EgStore", "import easygui; easygui.EgStore"),
+    ("+ easygui.msgbox (tkinter)", "import easygui; easygui.msgbox"),
+    ("+ file dialogs and PIL", "import easygui; easygui.msgbox; "
+     "easygui.boxes.__fileDialog(); easygui.boxes.__importPIL()"),
+    ("everything (old easygui.py)", "import easygui.boxes, easygui.store, easygui.demo; "
+     "easygui.boxes.__fileDialog(); easygui.boxes.__importPIL()"),
+]
+
+
+def importtime(repeats=10):
+    """
+    Print the time needed to import easygui (and to use a part of it),
+    each time in a new python, the best of repeats runs.
+    """
+    folder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = "import time; start = time.time(); %s; print(time.time() - start)"
+    timings = []
+    for name, statement in IMPORTS:
+        best = min(
+            float(subprocess.check_output([sys.executable, "-c", code % statement], cwd=folder))
+            for i in range(repeats)
+        )
+        timings.append(best)
+        print("%-30s %8.2f ms" % (name, best * 1000))
+    print("a game that does not show a box saves %.2f ms (%.0f times faster)" % (
+        (timings[-1] - timings[0]) * 1000, timings[-1] / timings[0]))
+
+
+if sys.argv[1:] == ["benchmark"]:
+    easygui.benchmark()
+elif sys.argv[1:] == ["importtime"]:
+    importtime()
+elif sys.argv[1:] == ["check"]:
+    sys.exit(0 if easygui.boxes.check() else 1)
+else:
+    easygui.egdemo()
@@ -73,18 +73,22 @@ http://en.wikipedia.org/wiki/BSD_licenses#3-clause_license_.28.22New_BSD_License
 """
 egversion = __doc__.split()[1]
 
+# EgStore is in store.py, egdemo and abouteasygui are in demo.py
 __all__ = [
     'ynbox', 'ccbox', 'boolbox', 'indexbox', 'msgbox', 'buttonbox',
     'integerbox', 'multenterbox', 'enterbox', 'exceptionbox', 'choicebox',
     'codebox', 'textbox', 'diropenbox', 'fileopenbox', 'filesavebox',
-    'passwordbox', 'multpasswordbox', 'multchoicebox', 'abouteasygui',
-    'egversion', 'egdemo', 'EgStore'
+    'passwordbox', 'multpasswordbox', 'multchoicebox',
+    'egversion', 'session'
 ]
 
 import sys, os
 import string
-import pickle
 import traceback
+import bisect
+import heapq
+import itertools
+import time
 
 #--------------------------------------------------
 # check python version and take appropriate action
@@ -115,21 +119,40 @@ if sys.hexversion >= 0x030000F0:
 else:
     runningPython3 = False
 
-try:
-    from PIL import Image as PILImage
-    from PIL import ImageTk as PILImageTk
-    PILisLoaded = True
-except:
-    PILisLoaded = False
-
 if runningPython3:
     from tkinter import *
-    import tkinter.filedialog as tk_FileDialog
-    from io import StringIO
 else:
     from Tkinter import *
-    import tkFileDialog as tk_FileDialog
-    from StringIO import StringIO
+
+# PIL and the file dialogs of tkinter are imported only when they are used
+PILImage = None
+PILImageTk = None
+
+
+def __importPIL():
+    """
+    Import the Python Imaging Library for the first image that is not a gif.
+    Return True if PIL is installed.
+    """
+    global PILImage, PILImageTk
+    if PILImageTk is None:
+        try:
+            from PIL import Image as PILImage
+            from PIL import ImageTk as PILImageTk
+        except:
+            return False
+    return True
+
+
+def __fileDialog():
+    """
+    Return the file dialog module of tkinter, imported by the first file box.
+    """
+    if runningPython3:
+        import tkinter.filedialog as tk_FileDialog
+    else:
+        import tkFileDialog as tk_FileDialog
+    return tk_FileDialog
 
 
 def write(*args):
@@ -170,6 +193,13 @@ PROPORTIONAL_FONT_SIZE = 10
 MONOSPACE_FONT_SIZE = 9  #a little smaller, because it it more legible at a smaller size
 TEXT_ENTRY_FONT_SIZE = 12  # a little larger makes it easier to see
 
+# longer lists of choices and longer texts are shown virtually:
+# only the visible lines are put into the Listbox or Text widget
+VIRTUAL_CHOICES = 1000  # choices
+VIRTUAL_TEXT = 1000000  # characters
+TEXT_CHUNK = 1000000  # characters read at once from a file or generator shown by textbox
+SORT_CHUNK = 20000  # choices sorted (or merged) at once, between two events of the box
+
 #STANDARD_SELECTION_EVENTS = ["Return", "Button-1"]
 STANDARD_SELECTION_EVENTS = ["Return", "Button-1", "space"]
 
@@ -184,12 +214,89 @@ __enterboxDefaultText = ""
 __multenterboxText = ""
 choiceboxChoices = None
 choiceboxWidget = None
+choiceboxVirtual = None  # the VirtualList of a long choicebox
 entryWidget = None
 boxRoot = None
 ImageErrorMsg = (
     "\n\n---------------------------------------------\n"
     "Error: %s\n%s"
 )
+sessionRoot = None  # the hidden Tk root of the session mode, see session()
+sessionDialogs = {}  # kind of box: dict with the widgets of a hidden box, ready for reuse
+
+
+#-------------------------------------------------------------------
+# session
+#-------------------------------------------------------------------
+def session(active=True):
+    """
+    Switch the session mode on (or off, with active=False).
+
+    Without the session mode, each box creates its own Tk() root and
+    destroys it when the box is closed. This costs 100-300 ms for each box.
+
+    In the session mode, one hidden Tk root is kept. buttonbox (and the
+    boxes built on top of it, like msgbox), enterbox, integerbox,
+    passwordbox, choicebox, multchoicebox, textbox and codebox hide their
+    window when they are closed and use it again for the next box of the
+    same kind: only the title, the msg, the buttons, the entry, the
+    choices or the text are changed. All boxes keep their arguments and
+    return values.
+
+    Useful for programs that show many boxes, like a menu in a loop::
+        session()
+        while True:
+            reply = buttonbox("What now?", choices=["fight", "quit"])
+            if reply == "quit": break
+        session(False)
+
+    Run "python -m easygui benchmark" to compare the time needed
+    to open and close a box with and without the session mode,
+    "python -m easygui check" to check the boxes that are used again.
+    """
+    global sessionRoot
+    if active and sessionRoot is None:
+        sessionRoot = Tk()
+        sessionRoot.withdraw()
+    elif not active and sessionRoot is not None:
+        sessionDialogs.clear()
+        sessionRoot.destroy()  # destroys the hidden boxes, too
+        sessionRoot = None
+
+
+def __getBox(kind, root=None):
+    """
+    Returns (window, dialog) for a box of this kind.
+    dialog is the dict with the widgets of a hidden box of the session mode,
+    or None if the widgets must be built in the (withdrawn) window.
+    """
+    if root:
+        root.withdraw()
+        window = Toplevel(master=root)
+    elif sessionRoot is not None:
+        # pop: a box opened while this box is open gets its own window
+        dialog = sessionDialogs.pop(kind, None)
+        if dialog is not None:
+            return dialog["window"], dialog
+        window = Toplevel(master=sessionRoot)
+    else:
+        window = Tk()
+    window.withdraw()
+    return window, None
+
+
+def __closeBox(kind, dialog, root=None):
+    """
+    Hide the window of the box for the next box of this kind (session mode)
+    or destroy it.
+    """
+    if root is None and sessionRoot is not None and kind not in sessionDialogs:
+        dialog["window"].withdraw()
+        sessionDialogs[kind] = dialog
+    else:
+        dialog["window"].destroy()
+    if root:
+        root.deiconify()
 
 #-------------------------------------------------------------------
 # various boxes built on top of the basic buttonbox
@@ -366,13 +473,7 @@ def buttonbox(
     # This is what will be used if the window is closed by the close button.
     __replyButtonText = choices[0]
 
-    if root:
-        root.withdraw()
-        boxRoot = Toplevel(master=root)
-        boxRoot.withdraw()
-    else:
-        boxRoot = Tk()
-        boxRoot.withdraw()
+    boxRoot, dialog = __getBox("buttonbox", root)
 
     boxRoot.protocol('WM_DELETE_WINDOW', denyWindowManagerClose)
     boxRoot.title(title)
@@ -380,10 +481,6 @@ def buttonbox(
     boxRoot.geometry(rootWindowPosition)
     boxRoot.minsize(400, 100)
 
-    # ------------- define the messageFrame ---------------------------------
-    messageFrame = Frame(master=boxRoot)
-    messageFrame.pack(side=TOP, fill=BOTH)
-
     # ------------- define the imageFrame ---------------------------------
     tk_Image = None
     if image:
@@ -394,7 +491,7 @@ def buttonbox(
             if ext.lower() in [".gif", ".pgm", ".ppm"]:
                 tk_Image = PhotoImage(master=boxRoot, file=imageFilename)
             else:
-                if PILisLoaded:
+                if __importPIL():
                     try:
                         pil_Image = PILImage.open(imageFilename)
                         tk_Image = PILImageTk.PhotoImage(
@@ -420,24 +517,38 @@ def buttonbox(
         else:
             msg += ImageErrorMsg % (imageFilename, "\nImage file not found.")
 
-    if tk_Image:
+    if dialog is None:
+        # ------------- define the messageFrame ---------------------------------
+        messageFrame = Frame(master=boxRoot)
+        messageFrame.pack(side=TOP, fill=BOTH)
+
+        # the imageFrame is packed only if there is an image
         imageFrame = Frame(master=boxRoot)
-        imageFrame.pack(side=TOP, fill=BOTH)
-        label = Label(imageFrame, image=tk_Image)
-        label.image = tk_Image  # keep a reference!
+        label = Label(imageFrame)
         label.pack(side=TOP, expand=YES, fill=X, padx='1m', pady='1m')
 
-    # ------------- define the buttonsFrame ---------------------------------
-    buttonsFrame = Frame(master=boxRoot)
-    buttonsFrame.pack(side=TOP, fill=BOTH)
+        # ------------- define the buttonsFrame ---------------------------------
+        buttonsFrame = Frame(master=boxRoot)
+        buttonsFrame.pack(side=TOP, fill=BOTH)
 
-    # -------------------- place the widgets in the frames -----------------------
-    messageWidget = Message(messageFrame, text=msg, width=400)
-    messageWidget.configure(
-        font=(PROPORTIONAL_FONT_FAMILY, PROPORTIONAL_FONT_SIZE)
-    )
-    messageWidget.pack(side=TOP, expand=YES, fill=X, padx='3m', pady='3m')
+        # -------------------- place the widgets in the frames -----------------------
+        messageWidget = Message(messageFrame, width=400)
+        messageWidget.configure(
+            font=(PROPORTIONAL_FONT_FAMILY, PROPORTIONAL_FONT_SIZE)
+        )
+        messageWidget.pack(side=TOP, expand=YES, fill=X, padx='3m', pady='3m')
+        dialog = {"window": boxRoot, "messageFrame": messageFrame, "messageWidget": messageWidget,
+                  "imageFrame": imageFrame, "label": label, "buttonsFrame": buttonsFrame}
+
+    dialog["messageWidget"].configure(text=msg)
+    if tk_Image:
+        dialog["label"].configure(image=tk_Image)
+        dialog["label"].image = tk_Image  # keep a reference!
+        dialog["imageFrame"].pack(side=TOP, fill=BOTH, after=dialog["messageFrame"])
+    else:
+        dialog["imageFrame"].pack_forget()
 
+    buttonsFrame = dialog["buttonsFrame"]
     __put_buttons_in_buttonframe(choices)
 
     # -------------- the action begins -----------
@@ -446,9 +557,7 @@ def buttonbox(
 
     boxRoot.deiconify()
     boxRoot.mainloop()
-    boxRoot.destroy()
-    if root:
-        root.deiconify()
+    __closeBox("buttonbox", dialog, root)
     return __replyButtonText
 
 
@@ -886,13 +995,7 @@ def __fillablebox(msg, title="", default="", mask=None, image=None, root=None):
     __enterboxDefaultText = default
     __enterboxText = __enterboxDefaultText
 
-    if root:
-        root.withdraw()
-        boxRoot = Toplevel(master=root)
-        boxRoot.withdraw()
-    else:
-        boxRoot = Tk()
-        boxRoot.withdraw()
+    boxRoot, dialog = __getBox("fillablebox", root)
 
     boxRoot.protocol('WM_DELETE_WINDOW', denyWindowManagerClose)
     boxRoot.title(title)
@@ -900,10 +1003,6 @@ def __fillablebox(msg, title="", default="", mask=None, image=None, root=None):
     boxRoot.geometry(rootWindowPosition)
     boxRoot.bind("<Escape>", __enterboxCancel)
 
-    # ------------- define the messageFrame ---------------------------------
-    messageFrame = Frame(master=boxRoot)
-    messageFrame.pack(side=TOP, fill=BOTH)
-
     # ------------- define the imageFrame ---------------------------------
     tk_Image = None
     if image:
@@ -914,7 +1013,7 @@ def __fillablebox(msg, title="", default="", mask=None, image=None, root=None):
             if ext.lower() in [".gif", ".pgm", ".ppm"]:
                 tk_Image = PhotoImage(master=boxRoot, file=imageFilename)
             else:
-                if PILisLoaded:
+                if __importPIL():
                     try:
                         pil_Image = PILImage.open(imageFilename)
                         tk_Image = PILImageTk.PhotoImage(
@@ -940,79 +1039,96 @@ def __fillablebox(msg, title="", default="", mask=None, image=None, root=None):
         else:
             msg += ImageErrorMsg % (imageFilename, "\nImage file not found.")
 
-    if tk_Image:
+    if dialog is None:
+        # ------------- define the messageFrame ---------------------------------
+        messageFrame = Frame(master=boxRoot)
+        messageFrame.pack(side=TOP, fill=BOTH)
+
+        # the imageFrame is packed only if there is an image
         imageFrame = Frame(master=boxRoot)
-        imageFrame.pack(side=TOP, fill=BOTH)
-        label = Label(imageFrame, image=tk_Image)
-        label.image = tk_Image  # keep a reference!
+        label = Label(imageFrame)
         label.pack(side=TOP, expand=YES, fill=X, padx='1m', pady='1m')
 
-    # ------------- define the buttonsFrame ---------------------------------
-    buttonsFrame = Frame(master=boxRoot)
-    buttonsFrame.pack(side=TOP, fill=BOTH)
+        # ------------- define the buttonsFrame ---------------------------------
+        buttonsFrame = Frame(master=boxRoot)
+        buttonsFrame.pack(side=TOP, fill=BOTH)
 
-    # ------------- define the entryFrame ---------------------------------
-    entryFrame = Frame(master=boxRoot)
-    entryFrame.pack(side=TOP, fill=BOTH)
+        # ------------- define the entryFrame ---------------------------------
+        entryFrame = Frame(master=boxRoot)
+        entryFrame.pack(side=TOP, fill=BOTH)
 
-    # ------------- define the buttonsFrame ---------------------------------
-    buttonsFrame = Frame(master=boxRoot)
-    buttonsFrame.pack(side=TOP, fill=BOTH)
+        # ------------- define the buttonsFrame ---------------------------------
+        buttonsFrame = Frame(master=boxRoot)
+        buttonsFrame.pack(side=TOP, fill=BOTH)
 
-    #-------------------- the msg widget ----------------------------
-    messageWidget = Message(messageFrame, width="4.5i", text=msg)
-    messageWidget.configure(
-        font=(PROPORTIONAL_FONT_FAMILY, PROPORTIONAL_FONT_SIZE)
-    )
-    messageWidget.pack(side=RIGHT, expand=1, fill=BOTH, padx='3m', pady='3m')
+        #-------------------- the msg widget ----------------------------
+        messageWidget = Message(messageFrame, width="4.5i")
+        messageWidget.configure(
+            font=(PROPORTIONAL_FONT_FAMILY, PROPORTIONAL_FONT_SIZE)
+        )
+        messageWidget.pack(side=RIGHT, expand=1, fill=BOTH, padx='3m', pady='3m')
 
-    # --------- entryWidget ----------------------------------------------
-    entryWidget = Entry(entryFrame, width=40)
-    bindArrows(entryWidget)
-    entryWidget.configure(font=(PROPORTIONAL_FONT_FAMILY, TEXT_ENTRY_FONT_SIZE))
-    if mask:
-        entryWidget.configure(show=mask)
-    entryWidget.pack(side=LEFT, padx="3m")
-    entryWidget.bind("<Return>", __enterboxGetText)
-    entryWidget.bind("<Escape>", __enterboxCancel)
-    # put text into the entryWidget
-    entryWidget.insert(0, __enterboxDefaultText)
+        # --------- entryWidget ----------------------------------------------
+        entryWidget = Entry(entryFrame, width=40)
+        bindArrows(entryWidget)
+        entryWidget.configure(font=(PROPORTIONAL_FONT_FAMILY, TEXT_ENTRY_FONT_SIZE))
+        entryWidget.pack(side=LEFT, padx="3m")
+        entryWidget.bind("<Return>", __enterboxGetText)
+        entryWidget.bind("<Escape>", __enterboxCancel)
 
-    # ------------------ ok button -------------------------------
-    okButton = Button(buttonsFrame, takefocus=1, text="OK")
-    bindArrows(okButton)
-    okButton.pack(
-        expand=1,
-        side=LEFT,
-        padx='3m',
-        pady='3m',
-        ipadx='2m',
-        ipady='1m'
-    )
+        # ------------------ ok button -------------------------------
+        okButton = Button(buttonsFrame, takefocus=1, text="OK")
+        bindArrows(okButton)
+        okButton.pack(
+            expand=1,
+            side=LEFT,
+            padx='3m',
+            pady='3m',
+            ipadx='2m',
+            ipady='1m'
+        )
 
-    # for the commandButton, bind activation events to the activation event handler
-    commandButton = okButton
-    handler = __enterboxGetText
-    for selectionEvent in STANDARD_SELECTION_EVENTS:
-        commandButton.bind("<%s>" % selectionEvent, handler)
+        # for the commandButton, bind activation events to the activation event handler
+        commandButton = okButton
+        handler = __enterboxGetText
+        for selectionEvent in STANDARD_SELECTION_EVENTS:
+            commandButton.bind("<%s>" % selectionEvent, handler)
 
-    # ------------------ cancel button -------------------------------
-    cancelButton = Button(buttonsFrame, takefocus=1, text="Cancel")
-    bindArrows(cancelButton)
-    cancelButton.pack(
-        expand=1,
-        side=RIGHT,
-        padx='3m',
-        pady='3m',
-        ipadx='2m',
-        ipady='1m'
-    )
+        # ------------------ cancel button -------------------------------
+        cancelButton = Button(buttonsFrame, takefocus=1, text="Cancel")
+        bindArrows(cancelButton)
+        cancelButton.pack(
+            expand=1,
+            side=RIGHT,
+            padx='3m',
+            pady='3m',
+            ipadx='2m',
+            ipady='1m'
+        )
 
-    # for the commandButton, bind activation events to the activation event handler
-    commandButton = cancelButton
-    handler = __enterboxCancel
-    for selectionEvent in STANDARD_SELECTION_EVENTS:
-        commandButton.bind("<%s>" % selectionEvent, handler)
+        # for the commandButton, bind activation events to the activation event handler
+        commandButton = cancelButton
+        handler = __enterboxCancel
+        for selectionEvent in STANDARD_SELECTION_EVENTS:
+            commandButton.bind("<%s>" % selectionEvent, handler)
+        dialog = {"window": boxRoot, "messageFrame": messageFrame, "messageWidget": messageWidget,
+                  "imageFrame": imageFrame, "label": label, "entryWidget": entryWidget,
+                  "okButton": okButton, "cancelButton": cancelButton}
+
+    entryWidget = dialog["entryWidget"]
+    okButton = dialog["okButton"]
+    cancelButton = dialog["cancelButton"]
+    dialog["messageWidget"].configure(text=msg)
+    if tk_Image:
+        dialog["label"].configure(image=tk_Image)
+        dialog["label"].image = tk_Image  # keep a reference!
+        dialog["imageFrame"].pack(side=TOP, fill=BOTH, after=dialog["messageFrame"])
+    else:
+        dialog["imageFrame"].pack_forget()
+    entryWidget.configure(show=mask or "")
+    # put text into the entryWidget
+    entryWidget.delete(0, END)
+    entryWidget.insert(0, __enterboxDefaultText)
 
     # ------------------- time for action! -----------------
     entryWidget.focus_force()  # put the focus on the entryWidget
@@ -1020,9 +1136,7 @@ def __fillablebox(msg, title="", default="", mask=None, image=None, root=None):
     boxRoot.mainloop()  # run it!
 
     # -------- after the run has completed ----------------------------------
-    if root:
-        root.deiconify()
-    boxRoot.destroy()  # button_click didn't destroy boxRoot, so we do it now
+    __closeBox("fillablebox", dialog, root)  # button_click didn't destroy boxRoot, so we do it now
     return __enterboxText
 
 
@@ -1050,6 +1164,9 @@ def __enterboxCancel(event):
 def denyWindowManagerClose():
     """ don't allow WindowManager close
     """
+    if sessionRoot is not None:
+        sessionRoot.bell()
+        return
     x = Tk()
     x.withdraw()
     x.bell()
@@ -1074,7 +1191,7 @@ def multchoicebox(msg="Pick as many items as you like."
     @arg title: the window title
     @arg choices: a list or tuple of the choices to be displayed
     """
-    if len(choices) == 0:
+    if hasattr(choices, "__len__") and len(choices) == 0:
         choices = ["Program logic error - no choices were specified."]
 
     global __choiceboxMultipleSelect
@@ -1093,9 +1210,13 @@ def choicebox(msg="Pick something.", title=" ", choices=()):
 
     @arg msg: the msg to be displayed.
     @arg title: the window title
-    @arg choices: a list or tuple of the choices to be displayed
+    @arg choices: a list or tuple of the choices to be displayed.
+        choices can also be a generator (or another iterator): then the choices
+        are not sorted and taken from it only when they are scrolled into view.
+        More than VIRTUAL_CHOICES choices are shown at once, unsorted, and
+        sorted while the box is open (a million choices: about a second).
     """
-    if len(choices) == 0:
+    if hasattr(choices, "__len__") and len(choices) == 0:
         choices = ["Program logic error - no choices were specified."]
 
     global __choiceboxMultipleSelect
@@ -1111,23 +1232,26 @@ def __choicebox(msg, title, choices):
     internal routine to support choicebox() and multchoicebox()
     """
     global boxRoot, __choiceboxResults, choiceboxWidget, defaultText
-    global choiceboxWidget, choiceboxChoices
+    global choiceboxWidget, choiceboxChoices, choiceboxVirtual
     #-------------------------------------------------------------------
     # If choices is a tuple, we make it a list so we can sort it.
     # If choices is already a list, we make a new list, so that when
     # we sort the choices, we don't affect the list object that we
     # were given.
+    # A generator (or another iterator) is not sorted: its choices are
+    # taken from it only when they are scrolled into view.
+    # A long list is shown unsorted first and sorted by VirtualList while
+    # the box is open: sorting a million choices takes about a second.
     #-------------------------------------------------------------------
-    choices = list(choices[:])
-    if len(choices) == 0:
-        choices = ["Program logic error - no choices were specified."]
+    lazy = not hasattr(choices, "__getitem__")
+    if lazy:
+        choices = iter(choices)
+    else:
+        choices = list(choices[:])
+        if len(choices) == 0:
+            choices = ["Program logic error - no choices were specified."]
     defaultButtons = ["OK", "Cancel"]
 
-    # make sure all choices are strings
-    for index in range(len(choices)):
-        choices[index] = str(choices[index])
-
-    lines_to_show = min(len(choices), 20)
     lines_to_show = 20
 
     if title == None:
@@ -1137,7 +1261,7 @@ def __choicebox(msg, title, choices):
     # This is the value that will be returned if the user clicks the close icon
     __choiceboxResults = None
 
-    boxRoot = Tk()
+    boxRoot, dialog = __getBox("choicebox")
     boxRoot.protocol('WM_DELETE_WINDOW', denyWindowManagerClose)
     screen_width = boxRoot.winfo_screenwidth()
     screen_height = boxRoot.winfo_screenheight()
@@ -1155,6 +1279,76 @@ def __choicebox(msg, title, choices):
     rootWindowPosition = "+" + str(root_xpos) + "+" + str(root_ypos)
     boxRoot.geometry(rootWindowPosition)
 
+    if dialog is None:
+        dialog = __buildChoicebox(boxRoot, root_width, lines_to_show)
+    choiceboxWidget = dialog["choiceboxWidget"]
+    dialog["messageWidget"].configure(text=msg)
+
+    if __choiceboxMultipleSelect:
+        choiceboxWidget.configure(selectmode=MULTIPLE)
+    else:
+        choiceboxWidget.configure(selectmode=BROWSE)
+
+    #---------------------------------------------------
+    # make sure all choices are strings
+    # sort the choices
+    # eliminate duplicates
+    # put the choices into the choiceboxWidget
+    #---------------------------------------------------
+    # heapq.merge(key=...) of VirtualList.sortSteps needs python 3.5
+    sortLater = not lazy and len(choices) > VIRTUAL_CHOICES and sys.version_info >= (3, 5)
+    if not lazy:
+        choices = [str(choice) for choice in choices]
+
+    if not lazy and not sortLater:
+        if runningPython3:
+            choices.sort(key=str.lower)
+        else:
+            choices.sort(lambda x, y: cmp(x.lower(), y.lower()))  # case-insensitive sort
+
+        choices = [choice for choice, duplicates in itertools.groupby(choices)]
+
+    choiceboxWidget.delete(0, END)  # the choices of an earlier box (session mode)
+    if lazy or len(choices) > VIRTUAL_CHOICES:
+        # only the visible choices are put into the choiceboxWidget
+        choiceboxVirtual = VirtualList(
+            choiceboxWidget, dialog["rightScrollbar"], choices, lines_to_show,
+            multiple=__choiceboxMultipleSelect, ordered=not lazy, sortLater=sortLater
+        )
+        choiceboxChoices = choiceboxVirtual.items
+    else:
+        choiceboxVirtual = None
+        VirtualList.release(choiceboxWidget, dialog["rightScrollbar"])
+        choiceboxChoices = choices
+        choiceboxWidget.insert(END, *choices)
+        choiceboxWidget.select_set(0)
+        choiceboxWidget.see(0)
+
+    # special buttons for multiple select features
+    if __choiceboxMultipleSelect:
+        dialog["selectionButtonsFrame"].pack(side=RIGHT, fill=Y, expand=NO)
+    else:
+        dialog["selectionButtonsFrame"].pack_forget()
+
+    # --------------------- the action begins -----------------------------------
+    # put the focus on the choiceboxWidget, and the select highlight on the first item
+    choiceboxWidget.focus_force()
+
+    # --- run it! -----
+    boxRoot.deiconify()
+    boxRoot.mainloop()
+
+    if choiceboxVirtual is not None:
+        choiceboxVirtual.stop()  # no more sorting steps after the box is closed
+    __closeBox("choicebox", dialog)
+    return __choiceboxResults
+
+
+def __buildChoicebox(boxRoot, root_width, lines_to_show):
+    """
+    internal routine of __choicebox: put the frames and widgets into boxRoot,
+    returns a dict with the widgets that change from box to box
+    """
     # ---------------- put the frames in the window -----------------------------------------
     message_and_buttonsFrame = Frame(master=boxRoot)
     message_and_buttonsFrame.pack(side=TOP, fill=X, expand=NO)
@@ -1176,7 +1370,6 @@ def __choicebox(msg, title, choices):
     messageWidget = Message(
         messageFrame,
         anchor=NW,
-        text=msg,
         width=int(root_width * 0.9)
     )
     messageWidget.configure(
@@ -1193,9 +1386,6 @@ def __choicebox(msg, title, choices):
         bg="white"
     )
 
-    if __choiceboxMultipleSelect:
-        choiceboxWidget.configure(selectmode=MULTIPLE)
-
     choiceboxWidget.configure(
         font=(PROPORTIONAL_FONT_FAMILY, PROPORTIONAL_FONT_SIZE)
     )
@@ -1225,63 +1415,35 @@ def __choicebox(msg, title, choices):
 
     choiceboxWidget.pack(side=LEFT, padx="1m", pady="1m", expand=YES, fill=BOTH)
 
-    #---------------------------------------------------
-    # sort the choices
-    # eliminate duplicates
-    # put the choices into the choiceboxWidget
-    #---------------------------------------------------
-    for index in range(len(choices)):
-        choices[index] = str(choices[index])
-
-    if runningPython3:
-        choices.sort(key=str.lower)
-    else:
-        choices.sort(lambda x, y: cmp(x.lower(), y.lower()))  # case-insensitive sort
-
-    lastInserted = None
-    choiceboxChoices = []
-    for choice in choices:
-        if choice == lastInserted:
-            pass
-        else:
-            choiceboxWidget.insert(END, choice)
-            choiceboxChoices.append(choice)
-            lastInserted = choice
-
     boxRoot.bind('<Any-Key>', KeyboardListener)
 
     # put the buttons in the buttonsFrame
-    if len(choices) > 0:
-        okButton = Button(
-            buttonsFrame,
-            takefocus=YES,
-            text="OK",
-            height=1,
-            width=6
-        )
-        bindArrows(okButton)
-        okButton.pack(
-            expand=NO,
-            side=TOP,
-            padx='2m',
-            pady='1m',
-            ipady="1m",
-            ipadx="2m"
-        )
+    okButton = Button(
+        buttonsFrame,
+        takefocus=YES,
+        text="OK",
+        height=1,
+        width=6
+    )
+    bindArrows(okButton)
+    okButton.pack(
+        expand=NO,
+        side=TOP,
+        padx='2m',
+        pady='1m',
+        ipady="1m",
+        ipadx="2m"
+    )
 
-        # for the commandButton, bind activation events to the activation event handler
-        commandButton = okButton
-        handler = __choiceboxGetChoice
-        for selectionEvent in STANDARD_SELECTION_EVENTS:
-            commandButton.bind("<%s>" % selectionEvent, handler)
+    # for the commandButton, bind activation events to the activation event handler
+    commandButton = okButton
+    handler = __choiceboxGetChoice
+    for selectionEvent in STANDARD_SELECTION_EVENTS:
+        commandButton.bind("<%s>" % selectionEvent, handler)
 
-        # now bind the keyboard events
-        choiceboxWidget.bind("<Return>", __choiceboxGetChoice)
-        choiceboxWidget.bind("<Double-Button-1>", __choiceboxGetChoice)
-    else:
-        # now bind the keyboard events
-        choiceboxWidget.bind("<Return>", __choiceboxCancel)
-        choiceboxWidget.bind("<Double-Button-1>", __choiceboxCancel)
+    # now bind the keyboard events
+    choiceboxWidget.bind("<Return>", __choiceboxGetChoice)
+    choiceboxWidget.bind("<Double-Button-1>", __choiceboxGetChoice)
 
     cancelButton = Button(
         buttonsFrame,
@@ -1306,65 +1468,57 @@ def __choicebox(msg, title, choices):
     for selectionEvent in STANDARD_SELECTION_EVENTS:
         commandButton.bind("<%s>" % selectionEvent, handler)
 
-    # add special buttons for multiple select features
-    if len(choices) > 0 and __choiceboxMultipleSelect:
-        selectionButtonsFrame = Frame(messageFrame)
-        selectionButtonsFrame.pack(side=RIGHT, fill=Y, expand=NO)
-
-        selectAllButton = Button(
-            selectionButtonsFrame,
-            text="Select All",
-            height=1,
-            width=6
-        )
-        bindArrows(selectAllButton)
-
-        selectAllButton.bind("<Button-1>", __choiceboxSelectAll)
-        selectAllButton.pack(
-            expand=NO,
-            side=TOP,
-            padx='2m',
-            pady='1m',
-            ipady="1m",
-            ipadx="2m"
-        )
-
-        clearAllButton = Button(
-            selectionButtonsFrame,
-            text="Clear All",
-            height=1,
-            width=6
-        )
-        bindArrows(clearAllButton)
-        clearAllButton.bind("<Button-1>", __choiceboxClearAll)
-        clearAllButton.pack(
-            expand=NO,
-            side=TOP,
-            padx='2m',
-            pady='1m',
-            ipady="1m",
-            ipadx="2m"
-        )
+    # special buttons for multiple select features, packed only by multchoicebox
+    selectionButtonsFrame = Frame(messageFrame)
 
-    # -------------------- bind some keyboard events ----------------------------
-    boxRoot.bind("<Escape>", __choiceboxCancel)
+    selectAllButton = Button(
+        selectionButtonsFrame,
+        text="Select All",
+        height=1,
+        width=6
+    )
+    bindArrows(selectAllButton)
 
-    # --------------------- the action begins -----------------------------------
-    # put the focus on the choiceboxWidget, and the select highlight on the first item
-    choiceboxWidget.select_set(0)
-    choiceboxWidget.focus_force()
+    selectAllButton.bind("<Button-1>", __choiceboxSelectAll)
+    selectAllButton.pack(
+        expand=NO,
+        side=TOP,
+        padx='2m',
+        pady='1m',
+        ipady="1m",
+        ipadx="2m"
+    )
 
-    # --- run it! -----
-    boxRoot.mainloop()
+    clearAllButton = Button(
+        selectionButtonsFrame,
+        text="Clear All",
+        height=1,
+        width=6
+    )
+    bindArrows(clearAllButton)
+    clearAllButton.bind("<Button-1>", __choiceboxClearAll)
+    clearAllButton.pack(
+        expand=NO,
+        side=TOP,
+        padx='2m',
+        pady='1m',
+        ipady="1m",
+        ipadx="2m"
+    )
 
-    boxRoot.destroy()
-    return __choiceboxResults
+    # -------------------- bind some keyboard events ----------------------------
+    boxRoot.bind("<Escape>", __choiceboxCancel)
+    return {"window": boxRoot, "messageWidget": messageWidget, "choiceboxWidget": choiceboxWidget,
+            "rightScrollbar": rightScrollbar, "selectionButtonsFrame": selectionButtonsFrame}
 
 
 def __choiceboxGetChoice(event):
     global boxRoot, __choiceboxResults, choiceboxWidget
 
-    if __choiceboxMultipleSelect:
+    if choiceboxVirtual is not None:
+        __choiceboxResults = choiceboxVirtual.getChoice()
+
+    elif __choiceboxMultipleSelect:
         __choiceboxResults = [
             choiceboxWidget.get(index)
             for index in choiceboxWidget.curselection()
@@ -1382,12 +1536,18 @@ def __choiceboxGetChoice(event):
 def __choiceboxSelectAll(event):
     global choiceboxWidget, choiceboxChoices
 
+    if choiceboxVirtual is not None:
+        choiceboxVirtual.selectAll(True)
+        return
     choiceboxWidget.selection_set(0, len(choiceboxChoices) - 1)
 
 
 def __choiceboxClearAll(event):
     global choiceboxWidget, choiceboxChoices
 
+    if choiceboxVirtual is not None:
+        choiceboxVirtual.selectAll(False)
+        return
     choiceboxWidget.selection_clear(0, len(choiceboxChoices) - 1)
 
 
@@ -1403,6 +1563,10 @@ def KeyboardListener(event):
     key = event.keysym
     if len(key) <= 1:
         if key in string.printable:
+            if choiceboxVirtual is not None:
+                choiceboxVirtual.typeAhead(key)  # bisect instead of looking at each choice
+                return
+
             # Find the key in the list.
             # before we clear the list, remember the selected member
             try:
@@ -1448,6 +1612,425 @@ def KeyboardListener(event):
                 return
 
 
+#-----------------------------------------------------------------------
+# VirtualList
+#-----------------------------------------------------------------------
+class VirtualList:
+    """
+    Shows a long list of choices in a Listbox, but puts only the visible
+    choices into the Listbox: the scrollbar, the keys and the mouse wheel
+    put other choices into it. The selection is kept as a set of indexes
+    into the whole list.
+
+    choices is a list, sorted like choicebox sorts it (ordered=True),
+    or an iterator: its choices are taken (and converted with str) only
+    when they are scrolled into view.
+    With sortLater=True the list of strings is shown unsorted and sorted
+    in steps of SORT_CHUNK choices by the event loop of the box (widget.after),
+    like choicebox sorts: case-insensitive, without duplicates.
+    """
+    SEQUENCES = ("<Up>", "<Down>", "<Prior>", "<Next>", "<Home>", "<End>",
+                 "<MouseWheel>", "<Button-4>", "<Button-5>", "<<ListboxSelect>>")
+
+    def __init__(self, widget, scrollbar, choices, height, multiple=False, ordered=True,
+                 sortLater=False):
+        self.widget = widget
+        self.scrollbar = scrollbar
+        self.height = height
+        self.multiple = multiple
+        self.ordered = ordered
+        if hasattr(choices, "__getitem__"):
+            self.items = choices
+            self.source = None
+        else:
+            self.items = []
+            self.source = choices
+        self.top = 0  # index of the first visible choice
+        self.cursor = 0  # index of the active choice
+        self.selected = set([0])
+        self.keys = None  # lowercase choices for the type-ahead, made at the first key
+        self.prefix = ""
+        self.lastKey = 0  # time of the last key of the type-ahead
+        self.sorting = None  # the generator of the sorting steps (sortLater)
+        self.job = None  # the next sorting step, waiting in widget.after
+
+        scrollbar.configure(command=self.yview)
+        widget.configure(yscrollcommand="")
+        widget.bind("<Up>", lambda event: self.moveCursor(-1))
+        widget.bind("<Down>", lambda event: self.moveCursor(1))
+        widget.bind("<Prior>", lambda event: self.moveCursor(-self.height))
+        widget.bind("<Next>", lambda event: self.moveCursor(self.height))
+        widget.bind("<Home>", lambda event: self.moveCursor(-self.cursor))
+        widget.bind("<End>", lambda event: self.moveCursor(sys.maxsize))
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            widget.bind(sequence, self.wheel)
+        widget.bind("<<ListboxSelect>>", self.syncSelection)
+
+        self.fetch(height)
+        if not self.items:
+            self.items.append("Program logic error - no choices were specified.")
+        if sortLater:
+            self.ordered = False
+            self.sorting = self.sortSteps()
+            self.job = widget.after(1, self.sortStep)
+        self.show()
+
+    def sortSteps(self):
+        """
+        Generator: sort the choices, one step of SORT_CHUNK choices each.
+        Chunks of the choices are sorted, then merged (heapq.merge is
+        stable, so the result is the same as one sort of all choices).
+        At the end the choices are replaced, the selected choices and
+        the active choice stay selected.
+        """
+        items = self.items
+        runs = []
+        for start in range(0, len(items), SORT_CHUNK):
+            runs.append(sorted(items[start:start + SORT_CHUNK], key=str.lower))
+            yield
+        merged = heapq.merge(*runs, key=str.lower)
+        result = []
+        while True:
+            chunk = list(itertools.islice(merged, SORT_CHUNK))
+            if not chunk:
+                break
+            for choice, duplicates in itertools.groupby(chunk):
+                if not result or choice != result[-1]:  # duplicates at the chunk border
+                    result.append(choice)
+            yield
+        if self.selected == set([0]) and self.cursor == 0:
+            self.selected = set([0])  # still the first choice, like a sorted list
+        else:
+            row = self.cursor - self.top
+            selected = set(items[index] for index in self.selected)
+            active = items[self.cursor]
+            self.selected = set(index for index, choice in enumerate(result) if choice in selected)
+            self.cursor = result.index(active)
+            self.top = max(0, self.cursor - row)
+        self.items = result
+        self.keys = None
+        self.ordered = True
+        self.show()
+
+    def sortStep(self):
+        """one sorting step, then wait for the events of the box"""
+        self.job = None
+        try:
+            next(self.sorting)
+        except StopIteration:
+            self.sorting = None
+            return
+        self.job = self.widget.after(1, self.sortStep)
+
+    def finishSort(self):
+        """do the missing sorting steps now"""
+        if self.sorting is not None:
+            self.stop()
+            for step in self.sorting:
+                pass
+            self.sorting = None
+
+    def stop(self):
+        """no more sorting steps by the event loop"""
+        if self.job is not None:
+            self.widget.after_cancel(self.job)
+            self.job = None
+
+    @staticmethod
+    def release(widget, scrollbar):
+        """connect widget and scrollbar again for a normal Listbox (session mode)"""
+        for sequence in VirtualList.SEQUENCES:
+            widget.unbind(sequence)
+        scrollbar.configure(command=widget.yview)
+        widget.configure(yscrollcommand=scrollbar.set)
+
+    def fetch(self, count):
+        """make sure that the first count choices are taken from the iterator"""
+        while self.source is not None and len(self.items) < count:
+            try:
+                self.items.append(str(next(self.source)))
+            except StopIteration:
+                self.source = None
+
+    def size(self):
+        """number of choices. For an iterator: the choices taken so far,
+        and one page more while the iterator has more choices"""
+        if self.source is None:
+            return len(self.items)
+        return len(self.items) + self.height
+
+    def show(self, top=None):
+        """put the visible choices, starting with choice top, into the Listbox"""
+        if top is not None:
+            self.top = top
+        self.fetch(self.top + self.height)
+        self.top = max(0, min(self.top, len(self.items) - self.height))
+        visible = self.items[self.top:self.top + self.height]
+        self.widget.delete(0, END)
+        self.widget.insert(END, *visible)
+        for line in range(len(visible)):
+            if self.top + line in self.selected:
+                self.widget.selection_set(line)
+        if 0 <= self.cursor - self.top < len(visible):
+            self.widget.activate(self.cursor - self.top)
+        size = float(self.size())
+        self.scrollbar.set(self.top / size, (self.top + len(visible)) / size)
+
+    def see(self, index):
+        """scroll (only if necessary) so that choice index is visible"""
+        if index < self.top:
+            self.show(index)
+        elif index >= self.top + self.height:
+            self.show(index - self.height + 1)
+        else:
+            self.show()
+
+    def yview(self, *args):
+        """command of the scrollbar"""
+        if args[0] == "moveto":
+            self.show(int(float(args[1]) * self.size()))
+        elif args[0] == "scroll":
+            step = self.height if args[2] == "pages" else 1
+            self.show(self.top + int(args[1]) * step)
+
+    def wheel(self, event):
+        if event.num == 5 or event.delta < 0:
+            self.show(self.top + 3)
+        else:
+            self.show(self.top - 3)
+        return "break"
+
+    def moveCursor(self, lines):
+        """Up, Down, Prior, Next, Home, End: move the active choice (and the selection)"""
+        self.fetch(self.cursor + lines + 1)
+        self.cursor = max(0, min(self.cursor + lines, len(self.items) - 1))
+        if not self.multiple:
+            self.selected = set([self.cursor])
+        self.see(self.cursor)
+        return "break"  # not the bindings of the Listbox, they know only the visible choices
+
+    def syncSelection(self, event=None):
+        """take the selection of the visible choices from the Listbox"""
+        visible = [int(line) for line in self.widget.curselection()]
+        if self.multiple:
+            for line in range(self.height):
+                self.selected.discard(self.top + line)
+            self.selected.update(self.top + line for line in visible)
+        elif visible:
+            self.selected = set([self.top + visible[0]])
+        if visible:
+            self.cursor = self.top + int(self.widget.index(ACTIVE))
+
+    def selectAll(self, select=True):
+        if select:
+            self.fetch(sys.maxsize)
+            self.selected = set(range(len(self.items)))
+        else:
+            self.selected = set()
+        self.show()
+
+    def getChoice(self):
+        """the selected choice, or the list of selected choices (multiple select)"""
+        self.syncSelection()
+        if self.multiple:
+            return [self.items[index] for index in sorted(self.selected)]
+        if not self.selected:
+            return None
+        return self.items[min(self.selected)]
+
+    def typeAhead(self, key):
+        """
+        Select the next choice starting with key (like KeyboardListener).
+        Different keys typed within a second are a prefix: "ab" selects the
+        first choice starting with "ab". The same key again selects the next
+        choice starting with it ("bb" cycles through the choices with "b").
+        Choices of an iterator are found only if they were already taken
+        from it. A list that is still sorted (sortLater) is sorted now.
+        """
+        self.finishSort()
+        key = key.lower()
+        now = time.time()
+        if now - self.lastKey < 1.0 and self.prefix != key:
+            self.prefix += key
+        else:
+            self.prefix = key
+        self.lastKey = now
+        if len(self.prefix) == 1:
+            index = self.find(self.prefix, self.cursor)
+        else:
+            index = self.find(self.prefix)
+        self.cursor = index
+        self.selected = set([index])
+        self.see(index)
+
+    def find(self, prefix, after=-1):
+        """
+        Index of the first choice after index after starting with prefix,
+        else of the first choice starting with prefix, else of the nearest
+        choice. Found with bisect in the sorted lowercase choices.
+        """
+        if self.keys is None or len(self.keys) != len(self.items):
+            if self.ordered:
+                self.keys = [item.lower() for item in self.items]  # sorted like the items
+            else:
+                self.keys = sorted((item.lower(), index) for index, item in enumerate(self.items))
+        keys = self.keys
+        # prefix is printable ascii (KeyboardListener): behind all strings starting with prefix
+        behind = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        if self.ordered:
+            low = bisect.bisect_left(keys, prefix)
+            high = bisect.bisect_left(keys, behind, low)
+            if low < high:
+                if low <= after + 1 < high:
+                    return after + 1
+                return low
+            # nothing matched -- the choice before the first greater one
+            return max(0, min(low, len(keys)) - 1)
+        low = bisect.bisect_left(keys, (prefix,))
+        high = bisect.bisect_left(keys, (behind,), low)
+        if low < high:
+            indexes = [index for key, index in keys[low:high]]
+            later = [index for index in indexes if index > after]
+            return min(later or indexes)
+        return keys[min(low, len(keys) - 1)][1]
+
+
+#-----------------------------------------------------------------------
+# VirtualText
+#-----------------------------------------------------------------------
+class VirtualText:
+    """
+    Shows a long text in a Text widget, but puts only the visible lines
+    into the widget. The scrollbar shows the position in the characters of
+    the text, so no index of all lines is needed.
+
+    text is a string, or an iterator of strings (an open file, a generator):
+    it is read in chunks of TEXT_CHUNK characters, only when the reader
+    scrolls to them.
+    """
+    SEQUENCES = ("<Up>", "<Down>", "<Prior>", "<Next>", "<Control-Home>", "<Control-End>",
+                 "<MouseWheel>", "<Button-4>", "<Button-5>")
+
+    def __init__(self, widget, scrollbar, text, height):
+        self.widget = widget
+        self.scrollbar = scrollbar
+        self.height = height
+        if type(text) == type("abc"):
+            self.text = text
+            self.source = None
+        else:
+            self.text = ""
+            self.source = iter(text)
+        self.top = 0  # index of the first visible character (the start of a line)
+
+        scrollbar.configure(command=self.yview)
+        widget.configure(yscrollcommand="")
+        widget.bind("<Up>", lambda event: self.scroll(-1))
+        widget.bind("<Down>", lambda event: self.scroll(1))
+        widget.bind("<Prior>", lambda event: self.scroll(-self.height))
+        widget.bind("<Next>", lambda event: self.scroll(self.height))
+        widget.bind("<Control-Home>", lambda event: self.show(0) or "break")
+        widget.bind("<Control-End>", lambda event: self.show(sys.maxsize) or "break")
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            widget.bind(sequence, self.wheel)
+        self.show(0)
+
+    @staticmethod
+    def release(widget, scrollbar):
+        """connect widget and scrollbar again for a normal Text (session mode)"""
+        for sequence in VirtualText.SEQUENCES:
+            widget.unbind(sequence)
+        widget.configure(state=NORMAL, yscrollcommand=scrollbar.set)
+        scrollbar.configure(command=widget.yview)
+
+    def fetch(self, count):
+        """make sure that the first count characters are read from the iterator"""
+        if self.source is None or len(self.text) >= count:
+            return
+        # at least the length of the text: each chunk is bigger, so self.text is copied only a few times
+        wanted = max(count - len(self.text), TEXT_CHUNK, len(self.text))
+        parts = []
+        length = 0
+        for part in self.source:
+            parts.append(part)
+            length += len(part)
+            if length >= wanted:
+                break
+        else:
+            self.source = None
+        self.text += "".join(parts)
+
+    def size(self):
+        """number of characters (for an iterator: and one chunk more while it has more)"""
+        if self.source is None:
+            return len(self.text)
+        return len(self.text) + TEXT_CHUNK
+
+    def forward(self, position, lines):
+        """start of the line lines lines after the line starting at position"""
+        for line in range(lines):
+            end = self.text.find("\n", position)
+            while end < 0 and self.source is not None:
+                self.fetch(len(self.text) + 1)
+                end = self.text.find("\n", position)
+            if end < 0:
+                return len(self.text)
+            position = end + 1
+        return position
+
+    def backward(self, position, lines):
+        """start of the line lines lines before the line starting at position"""
+        for line in range(lines):
+            if position == 0:
+                break
+            position = self.text.rfind("\n", 0, position - 1) + 1
+        return position
+
+    def show(self, top):
+        """put the lines starting with the line of character top into the widget"""
+        if top == sys.maxsize:
+            self.fetch(sys.maxsize)  # Control-End: all of the file
+        self.fetch(top + 1)
+        top = max(0, min(top, len(self.text)))
+        top = self.text.rfind("\n", 0, top) + 1  # the start of its line
+        end = self.forward(top, self.height)
+        if end >= len(self.text) and self.source is None:
+            top = min(top, self.backward(len(self.text), self.height))  # the last page is full
+            end = self.forward(top, self.height)
+        self.top = top
+        self.widget.configure(state=NORMAL)
+        self.widget.delete("1.0", END)
+        self.widget.insert(END, self.text[top:end], "normal")
+        self.widget.configure(state=DISABLED)  # changes of the visible lines would get lost
+        size = float(max(1, self.size()))
+        self.scrollbar.set(top / size, end / size)
+
+    def scroll(self, lines):
+        if lines > 0:
+            self.show(self.forward(self.top, lines))
+        else:
+            self.show(self.backward(self.top, -lines))
+        return "break"
+
+    def yview(self, *args):
+        """command of the scrollbar"""
+        if args[0] == "moveto":
+            self.show(int(float(args[1]) * self.size()))
+        elif args[0] == "scroll":
+            step = self.height if args[2] == "pages" else 1
+            self.scroll(int(args[1]) * step)
+
+    def wheel(self, event):
+        if event.num == 5 or event.delta < 0:
+            return self.scroll(3)
+        return self.scroll(-3)
+
+    def getText(self):
+        """all of the text (the rest of an iterator is read now)"""
+        self.fetch(sys.maxsize)
+        return self.text
+
+
 #-----------------------------------------------------------------------
 # exception_format
 #-----------------------------------------------------------------------
@@ -1511,6 +2094,9 @@ def textbox(msg="", title=" ", text="", codebox=0):
 
     The text parameter should be a string, or a list or tuple of lines to be
     displayed in the textbox.
+    text can also be an open file or a generator of lines: then the text is
+    read only when it is scrolled into view. Long texts (and files) are shown
+    read-only, with only the visible lines in the textbox.
     """
 
     if msg == None:
@@ -1523,7 +2109,8 @@ def textbox(msg="", title=" ", text="", codebox=0):
     choices = ["OK"]
     __replyButtonText = choices[0]
 
-    boxRoot = Tk()
+    kind = "codebox" if codebox else "textbox"
+    boxRoot, dialog = __getBox(kind)
 
     boxRoot.protocol('WM_DELETE_WINDOW', denyWindowManagerClose)
 
@@ -1543,126 +2130,136 @@ def textbox(msg="", title=" ", text="", codebox=0):
     rootWindowPosition = "+" + str(root_xpos) + "+" + str(root_ypos)
     boxRoot.geometry(rootWindowPosition)
 
-    mainframe = Frame(master=boxRoot)
-    mainframe.pack(side=TOP, fill=BOTH, expand=YES)
+    if dialog is None:
+        mainframe = Frame(master=boxRoot)
+        mainframe.pack(side=TOP, fill=BOTH, expand=YES)
 
-    # ----  put frames in the window -----------------------------------
-    # we pack the textboxFrame first, so it will expand first
-    textboxFrame = Frame(mainframe, borderwidth=3)
-    textboxFrame.pack(side=BOTTOM, fill=BOTH, expand=YES)
+        # ----  put frames in the window -----------------------------------
+        # we pack the textboxFrame first, so it will expand first
+        textboxFrame = Frame(mainframe, borderwidth=3)
+        textboxFrame.pack(side=BOTTOM, fill=BOTH, expand=YES)
 
-    message_and_buttonsFrame = Frame(mainframe)
-    message_and_buttonsFrame.pack(side=TOP, fill=X, expand=NO)
+        message_and_buttonsFrame = Frame(mainframe)
+        message_and_buttonsFrame.pack(side=TOP, fill=X, expand=NO)
 
-    messageFrame = Frame(message_and_buttonsFrame)
-    messageFrame.pack(side=LEFT, fill=X, expand=YES)
+        messageFrame = Frame(message_and_buttonsFrame)
+        messageFrame.pack(side=LEFT, fill=X, expand=YES)
 
-    buttonsFrame = Frame(message_and_buttonsFrame)
-    buttonsFrame.pack(side=RIGHT, expand=NO)
+        buttonsFrame = Frame(message_and_buttonsFrame)
+        buttonsFrame.pack(side=RIGHT, expand=NO)
+
+        # -------------------- put widgets in the frames --------------------
+
+        # put a textArea in the top frame
+        if codebox:
+            character_width = int((root_width * 0.6) / MONOSPACE_FONT_SIZE)
+            textArea = Text(
+                textboxFrame,
+                height=25,
+                width=character_width,
+                padx="2m",
+                pady="1m"
+            )
+            textArea.configure(wrap=NONE)
+            textArea.configure(font=(MONOSPACE_FONT_FAMILY, MONOSPACE_FONT_SIZE))
+
+        else:
+            character_width = int((root_width * 0.6) / MONOSPACE_FONT_SIZE)
+            textArea = Text(
+                textboxFrame,
+                height=25,
+                width=character_width,
+                padx="2m",
+                pady="1m"
+            )
+            textArea.configure(wrap=WORD)
+            textArea.configure(
+                font=(PROPORTIONAL_FONT_FAMILY, PROPORTIONAL_FONT_SIZE)
+            )
+
+        # some simple keybindings for scrolling
+        mainframe.bind("<Next>", textArea.yview_scroll(1, PAGES))
+        mainframe.bind("<Prior>", textArea.yview_scroll(-1, PAGES))
 
-    # -------------------- put widgets in the frames --------------------
+        mainframe.bind("<Right>", textArea.xview_scroll(1, PAGES))
+        mainframe.bind("<Left>", textArea.xview_scroll(-1, PAGES))
 
-    # put a textArea in the top frame
-    if codebox:
-        character_width = int((root_width * 0.6) / MONOSPACE_FONT_SIZE)
-        textArea = Text(
+        mainframe.bind("<Down>", textArea.yview_scroll(1, UNITS))
+        mainframe.bind("<Up>", textArea.yview_scroll(-1, UNITS))
+
+        # add a vertical scrollbar to the frame
+        rightScrollbar = Scrollbar(
             textboxFrame,
-            height=25,
-            width=character_width,
-            padx="2m",
-            pady="1m"
+            orient=VERTICAL,
+            command=textArea.yview
         )
-        textArea.configure(wrap=NONE)
-        textArea.configure(font=(MONOSPACE_FONT_FAMILY, MONOSPACE_FONT_SIZE))
+        textArea.configure(yscrollcommand=rightScrollbar.set)
 
-    else:
-        character_width = int((root_width * 0.6) / MONOSPACE_FONT_SIZE)
-        textArea = Text(
+        # add a horizontal scrollbar to the frame
+        bottomScrollbar = Scrollbar(
             textboxFrame,
-            height=25,
-            width=character_width,
-            padx="2m",
-            pady="1m"
+            orient=HORIZONTAL,
+            command=textArea.xview
+        )
+        textArea.configure(xscrollcommand=bottomScrollbar.set)
+
+        # pack the textArea and the scrollbars.  Note that although we must define
+        # the textArea first, we must pack it last, so that the bottomScrollbar will
+        # be located properly.
+
+        # Note that we need a bottom scrollbar only for code.
+        # Text will be displayed with wordwrap, so we don't need to have a horizontal
+        # scroll for it.
+        if codebox:
+            bottomScrollbar.pack(side=BOTTOM, fill=X)
+        rightScrollbar.pack(side=RIGHT, fill=Y)
+
+        textArea.pack(side=LEFT, fill=BOTH, expand=YES)
+
+        # ---------- put a msg widget in the msg frame-------------------
+        messageWidget = Message(
+            messageFrame,
+            anchor=NW,
+            width=int(root_width * 0.9)
         )
-        textArea.configure(wrap=WORD)
-        textArea.configure(
+        messageWidget.configure(
             font=(PROPORTIONAL_FONT_FAMILY, PROPORTIONAL_FONT_SIZE)
         )
+        messageWidget.pack(side=LEFT, expand=YES, fill=BOTH, padx='1m', pady='1m')
 
-    # some simple keybindings for scrolling
-    mainframe.bind("<Next>", textArea.yview_scroll(1, PAGES))
-    mainframe.bind("<Prior>", textArea.yview_scroll(-1, PAGES))
-
-    mainframe.bind("<Right>", textArea.xview_scroll(1, PAGES))
-    mainframe.bind("<Left>", textArea.xview_scroll(-1, PAGES))
-
-    mainframe.bind("<Down>", textArea.yview_scroll(1, UNITS))
-    mainframe.bind("<Up>", textArea.yview_scroll(-1, UNITS))
-
-    # add a vertical scrollbar to the frame
-    rightScrollbar = Scrollbar(
-        textboxFrame,
-        orient=VERTICAL,
-        command=textArea.yview
-    )
-    textArea.configure(yscrollcommand=rightScrollbar.set)
-
-    # add a horizontal scrollbar to the frame
-    bottomScrollbar = Scrollbar(
-        textboxFrame,
-        orient=HORIZONTAL,
-        command=textArea.xview
-    )
-    textArea.configure(xscrollcommand=bottomScrollbar.set)
-
-    # pack the textArea and the scrollbars.  Note that although we must define
-    # the textArea first, we must pack it last, so that the bottomScrollbar will
-    # be located properly.
-
-    # Note that we need a bottom scrollbar only for code.
-    # Text will be displayed with wordwrap, so we don't need to have a horizontal
-    # scroll for it.
-    if codebox:
-        bottomScrollbar.pack(side=BOTTOM, fill=X)
-    rightScrollbar.pack(side=RIGHT, fill=Y)
-
-    textArea.pack(side=LEFT, fill=BOTH, expand=YES)
-
-    # ---------- put a msg widget in the msg frame-------------------
-    messageWidget = Message(
-        messageFrame,
-        anchor=NW,
-        text=msg,
-        width=int(root_width * 0.9)
-    )
-    messageWidget.configure(
-        font=(PROPORTIONAL_FONT_FAMILY, PROPORTIONAL_FONT_SIZE)
-    )
-    messageWidget.pack(side=LEFT, expand=YES, fill=BOTH, padx='1m', pady='1m')
+        # put the buttons in the buttonsFrame
+        okButton = Button(buttonsFrame, takefocus=YES, text="OK", height=1, width=6)
+        okButton.pack(
+            expand=NO,
+            side=TOP,
+            padx='2m',
+            pady='1m',
+            ipady="1m",
+            ipadx="2m"
+        )
 
-    # put the buttons in the buttonsFrame
-    okButton = Button(buttonsFrame, takefocus=YES, text="OK", height=1, width=6)
-    okButton.pack(
-        expand=NO,
-        side=TOP,
-        padx='2m',
-        pady='1m',
-        ipady="1m",
-        ipadx="2m"
-    )
+        # for the commandButton, bind activation events to the activation event handler
+        commandButton = okButton
+        handler = __textboxOK
+        for selectionEvent in ["Return", "Button-1", "Escape"]:
+            commandButton.bind("<%s>" % selectionEvent, handler)
+        dialog = {"window": boxRoot, "messageWidget": messageWidget, "textArea": textArea,
+                  "rightScrollbar": rightScrollbar, "okButton": okButton}
 
-    # for the commandButton, bind activation events to the activation event handler
-    commandButton = okButton
-    handler = __textboxOK
-    for selectionEvent in ["Return", "Button-1", "Escape"]:
-        commandButton.bind("<%s>" % selectionEvent, handler)
+    textArea = dialog["textArea"]
+    okButton = dialog["okButton"]
+    dialog["messageWidget"].configure(text=msg)
+    # an earlier box may have been virtual (session mode)
+    VirtualText.release(textArea, dialog["rightScrollbar"])
+    textArea.delete("1.0", END)  # the text of an earlier box (session mode)
+    virtualText = None
 
     # ----------------- the action begins ----------------------------------------
     try:
         # load the text into the textArea
         if type(text) == type("abc"):
             pass
-        else:
+        elif isinstance(text, (list, tuple)):
             try:
                 text = "".join(text)  # convert a list or a tuple to a string
             except:
@@ -1671,7 +2268,12 @@ def textbox(msg="", title=" ", text="", codebox=0):
                         text)) + " to text in textArea"
                 )
                 sys.exit(16)
-        textArea.insert(END, text, "normal")
+        # else: a file or a generator, read by VirtualText
+        if type(text) == type("abc") and len(text) <= VIRTUAL_TEXT:
+            textArea.insert(END, text, "normal")
+        else:
+            # the textArea has a height of 25 lines
+            virtualText = VirtualText(textArea, dialog["rightScrollbar"], text, 25)
 
     except:
         msgbox("Exception when trying to load the textArea.")
@@ -1683,11 +2285,15 @@ def textbox(msg="", title=" ", text="", codebox=0):
         msgbox("Exception when trying to put focus on okButton.")
         sys.exit(16)
 
+    boxRoot.deiconify()
     boxRoot.mainloop()
 
     # this line MUST go before the line that destroys boxRoot
-    areaText = textArea.get(0.0, END)
-    boxRoot.destroy()
+    if virtualText is not None:
+        areaText = virtualText.getText() + "\n"  # like textArea.get(): with a newline at the end
+    else:
+        areaText = textArea.get(0.0, END)
+    __closeBox(kind, dialog)
     return areaText  # return __replyButtonText
 
 
@@ -1717,7 +2323,7 @@ def diropenbox(msg=None, title=None, default=None):
     localRoot.withdraw()
     if not default:
         default = None
-    f = tk_FileDialog.askdirectory(
+    f = __fileDialog().askdirectory(
         parent=localRoot,
         title=title,
         initialdir=default,
@@ -1892,7 +2498,7 @@ def fileopenbox(msg=None, title=None, default="*", filetypes=None):
     elif initialbase == "*":
         initialfile = None
 
-    f = tk_FileDialog.askopenfilename(
+    f = __fileDialog().askopenfilename(
         parent=localRoot,
         title=getFileDialogTitle(msg, title),
         initialdir=initialdir,
@@ -1930,7 +2536,7 @@ def filesavebox(msg=None, title=None, default="", filetypes=None):
         default, filetypes
     )
 
-    f = tk_FileDialog.asksaveasfilename(
+    f = __fileDialog().asksaveasfilename(
         parent=localRoot,
         title=getFileDialogTitle(msg, title),
         initialfile=initialfile,
@@ -2029,11 +2635,23 @@ def __put_buttons_in_buttonframe(choices):
     __firstWidget = None
     __widgetTexts = {}
 
-    i = 0
+    # the buttons of an earlier box (session mode) are used again
+    oldButtons = buttonsFrame.winfo_children()
+
+    for i, buttonText in enumerate(choices):
+        if i < len(oldButtons):
+            tempButton = oldButtons[i]
+            tempButton.configure(text=buttonText)
+        else:
+            tempButton = Button(buttonsFrame, takefocus=1, text=buttonText)
+            bindArrows(tempButton)
+
+            # for the commandButton, bind activation events to the activation event handler
+            commandButton = tempButton
+            handler = __buttonEvent
+            for selectionEvent in STANDARD_SELECTION_EVENTS:
+                commandButton.bind("<%s>" % selectionEvent, handler)
 
-    for buttonText in choices:
-        tempButton = Button(buttonsFrame, takefocus=1, text=buttonText)
-        bindArrows(tempButton)
         tempButton.pack(
             expand=YES,
             side=LEFT,
@@ -2049,681 +2667,137 @@ def __put_buttons_in_buttonframe(choices):
         # remember the first widget, so we can put the focus there
         if i == 0:
             __firstWidget = tempButton
-            i = 1
 
-        # for the commandButton, bind activation events to the activation event handler
-        commandButton = tempButton
-        handler = __buttonEvent
-        for selectionEvent in STANDARD_SELECTION_EVENTS:
-            commandButton.bind("<%s>" % selectionEvent, handler)
+    # buttons not needed for this box
+    for tempButton in oldButtons[len(choices):]:
+        tempButton.pack_forget()
 
 
-#-----------------------------------------------------------------------
-#
-#     class EgStore
-#
-#-----------------------------------------------------------------------
-class EgStore:
-    r"""
-A class to support persistent storage.
-
-You can use EgStore to support the storage and retrieval
-of user settings for an EasyGui application.
-
-
-# Example A
-#-----------------------------------------------------------------------
-# define a class named Settings as a subclass of EgStore
-#-----------------------------------------------------------------------
-class Settings(EgStore):
-::
-    def __init__(self, filename):  # filename is required
-        #-------------------------------------------------
-        # Specify default/initial values for variables that
-        # this particular application wants to remember.
-        #-------------------------------------------------
-        self.userId = ""
-        self.targetServer = ""
-
-        #-------------------------------------------------
-        # For subclasses of EgStore, these must be
-        # the last two statements in  __init__
-        #-------------------------------------------------
-        self.filename = filename  # this is required
-        self.restore()            # restore values from the storage file if possible
-
-
-
-# Example B
-#-----------------------------------------------------------------------
-# create settings, a persistent Settings object
-#-----------------------------------------------------------------------
-settingsFile = "myApp_settings.txt"
-settings = Settings(settingsFile)
-
-user    = "obama_barak"
-server  = "whitehouse1"
-settings.userId = user
-settings.targetServer = server
-settings.store()    # persist the settings
-
-# run code that gets a new value for userId, and persist the settings
-user    = "biden_joe"
-settings.userId = user
-settings.store()
-
-
-# Example C
-#-----------------------------------------------------------------------
-# recover the Settings instance, change an attribute, and store it again.
-#-----------------------------------------------------------------------
-settings = Settings(settingsFile)
-settings.userId = "vanrossum_g"
-settings.store()
-
-"""
-
-    def __init__(self, filename):  # obtaining filename is required
-        self.filename = None
-        raise NotImplementedError()
-
-    def restore(self):
-        """
-        Set the values of whatever attributes are recoverable
-        from the pickle file.
-
-        Populate the attributes (the __dict__) of the EgStore object
-        from     the attributes (the __dict__) of the pickled object.
-
-        If the pickled object has attributes that have been initialized
-        in the EgStore object, then those attributes of the EgStore object
-        will be replaced by the values of the corresponding attributes
-        in the pickled object.
-
-        If the pickled object is missing some attributes that have
-        been initialized in the EgStore object, then those attributes
-        of the EgStore object will retain the values that they were
-        initialized with.
-
-        If the pickled object has some attributes that were not
-        initialized in the EgStore object, then those attributes
-        will be ignored.
-
-        IN SUMMARY:
-
-        After the recover() operation, the EgStore object will have all,
-        and only, the attributes that it had when it was initialized.
-
-        Where possible, those attributes will have values recovered
-        from the pickled object.
-        """
-        if not os.path.exists(self.filename):
-            return self
-        if not os.path.isfile(self.filename):
-            return self
-
-        try:
-            f = open(self.filename, "rb")
-            unpickledObject = pickle.load(f)
-            f.close()
-
-            for key in list(self.__dict__.keys()):
-                default = self.__dict__[key]
-                self.__dict__[key] = unpickledObject.__dict__.get(key, default)
-        except:
-            pass
-
-        return self
-
-    def store(self):
-        """
-        Save the attributes of the EgStore object to a pickle file.
-        Note that if the directory for the pickle file does not already exist,
-        the store operation will fail.
-        """
-        f = open(self.filename, "wb")
-        pickle.dump(self, f)
-        f.close()
-
-    def kill(self):
-        """
-        Delete my persistent file (i.e. pickle file), if it exists.
-        """
-        if os.path.isfile(self.filename):
-            os.remove(self.filename)
-        return
-
-    def __str__(self):
-        """
-        return my contents as a string in an easy-to-read format.
-        """
-        # find the length of the longest attribute name
-        longest_key_length = 0
-        keys = []
-        for key in self.__dict__.keys():
-            keys.append(key)
-            longest_key_length = max(longest_key_length, len(key))
-
-        keys.sort()  # sort the attribute names
-        lines = []
-        for key in keys:
-            value = self.__dict__[key]
-            key = key.ljust(longest_key_length)
-            lines.append("%s : %s\n" % (key, repr(value)))
-        return "".join(lines)  # return a string showing the attributes
-
-
-#-----------------------------------------------------------------------
-#
-# test/demo easygui
-#
-#-----------------------------------------------------------------------
-def egdemo():
+#-------------------------------------------------------------------
+# benchmark
+#-------------------------------------------------------------------
+def benchmark(repeats=20):
     """
-    Run the EasyGui demo.
+    Print the time needed to open and close each kind of box, without and
+    with the session mode (see session()). Instead of waiting for a click,
+    each box is closed as soon as it is drawn.
+    The last boxes are virtual (see VirtualList and VirtualText).
+    The million choices are not sorted: the choicebox sorts them while it
+    is open, "until sorted" waits for the sorting before closing the box.
+
+    run: python -m easygui benchmark
     """
-    # clear the console
-    writeln("\n" * 100)
-
-    intro_message = (
-        "Pick the kind of box that you wish to demo.\n" + "\n * Python version "
-        + sys.version + "\n * EasyGui version " + egversion + "\n * Tk version "
-        + str(TkVersion)
-    )
-
-    #========================================== END DEMONSTRATION DATA
-
-    while 1:  # do forever
-        choices = [
-            "msgbox", "buttonbox",
-            "buttonbox(image) -- a buttonbox that displays an image",
-            "choicebox", "multchoicebox", "textbox", "ynbox", "ccbox",
-            "enterbox", "enterbox(image) -- an enterbox that displays an image",
-            "exceptionbox", "codebox", "integerbox", "boolbox", "indexbox",
-            "filesavebox", "fileopenbox", "passwordbox", "multenterbox",
-            "multpasswordbox", "diropenbox", "About EasyGui", " Help"
-        ]
-        choice = choicebox(
-            msg=intro_message,
-            title="EasyGui " + egversion,
-            choices=choices
-        )
-
-        if not choice:
-            return
-
-        reply = choice.split()
-
-        if reply[0] == "msgbox":
-            reply = msgbox("short msg", "This is a long title")
-            writeln("Reply was: %s" % repr(reply))
-
-        elif reply[0] == "About":
-            reply = abouteasygui()
-
-        elif reply[0] == "Help":
-            _demo_help()
-
-        elif reply[0] == "buttonbox":
-            reply = buttonbox()
-            writeln("Reply was: %s" % repr(reply))
-
-            title = "Demo of Buttonbox with many, many buttons!"
-            msg = "This buttonbox shows what happens when you specify too many buttons."
-            reply = buttonbox(msg=msg, title=title, choices=choices)
-            writeln("Reply was: %s" % repr(reply))
-
-        elif reply[0] == "buttonbox(image)":
-            _demo_buttonbox_with_image()
-
-        elif reply[0] == "boolbox":
-            reply = boolbox()
-            writeln("Reply was: %s" % repr(reply))
-
-        elif reply[0] == "enterbox":
-            image = "python_and_check_logo.gif"
-            message = "Enter the name of your best friend."\
-                      "\n(Result will be stripped.)"
-            reply = enterbox(message, "Love!", "     Suzy Smith     ")
-            writeln("Reply was: %s" % repr(reply))
-
-            message = "Enter the name of your best friend."\
-                      "\n(Result will NOT be stripped.)"
-            reply = enterbox(
-                message,
-                "Love!",
-                "     Suzy Smith     ",
-                strip=False
-            )
-            writeln("Reply was: %s" % repr(reply))
-
-            reply = enterbox("Enter the name of your worst enemy:", "Hate!")
-            writeln("Reply was: %s" % repr(reply))
-
-        elif reply[0] == "enterbox(image)":
-            image = "python_and_check_logo.gif"
-            message = "What kind of snake is this?"
-            reply = enterbox(message, "Quiz", image=image)
-            writeln("Reply was: %s" % repr(reply))
-
-        elif reply[0] == "exceptionbox":
-            try:
-                thisWillCauseADivideByZeroException = 1 / 0
-            except:
-                exceptionbox()
-
-        elif reply[0] == "integerbox":
-            reply = integerbox(
-                "Enter a number between 3 and 333",
-                "Demo: integerbox WITH a default value", 222, 3, 333
-            )
-            writeln("Reply was: %s" % repr(reply))
-
-            reply = integerbox(
-                "Enter a number between 0 and 99",
-                "Demo: integerbox WITHOUT a default value"
-            )
-            writeln("Reply was: %s" % repr(reply))
-
-        elif reply[0] == "diropenbox":
-            _demo_diropenbox()
-        elif reply[0] == "fileopenbox":
-            _demo_fileopenbox()
-        elif reply[0] == "filesavebox":
-            _demo_filesavebox()
-
-        elif reply[0] == "indexbox":
-            title = reply[0]
-            msg = "Demo of " + reply[0]
-            choices = ["Choice1", "Choice2", "Choice3", "Choice4"]
-            reply = indexbox(msg, title, choices)
-            writeln("Reply was: %s" % repr(reply))
-
-        elif reply[0] == "passwordbox":
-            reply = passwordbox(
-                "Demo of password box WITHOUT default" +
-                "\n\nEnter your secret password", "Member Logon"
-            )
-            writeln("Reply was: %s" % str(reply))
-
-            reply = passwordbox(
-                "Demo of password box WITH default" +
-                "\n\nEnter your secret password", "Member Logon", "alfie"
-            )
-            writeln("Reply was: %s" % str(reply))
-
-        elif reply[0] == "multenterbox":
-            msg = "Enter your personal information"
-            title = "Credit Card Application"
-            fieldNames = ["Name", "Street Address", "City", "State", "ZipCode"]
-            fieldValues = []  # we start with blanks for the values
-            fieldValues = multenterbox(msg, title, fieldNames)
-
-            # make sure that none of the fields was left blank
-            while 1:
-                if fieldValues == None:
-                    break
-                errmsg = ""
-                for i in range(len(fieldNames)):
-                    if fieldValues[i].strip() == "":
-                        errmsg = errmsg + (
-                            '"%s" is a required field.\n\n' % fieldNames[i]
-                        )
-                if errmsg == "":
-                    break  # no problems found
-                fieldValues = multenterbox(
-                    errmsg, title, fieldNames, fieldValues
-                )
+    many = ["goblin %07i" % (i * 7919 % 1000000) for i in range(1000000)]  # each number once, unsorted
+    sortAll = []  # not empty: close a choicebox only after its choices are sorted
 
-            writeln("Reply was: %s" % str(fieldValues))
-
-        elif reply[0] == "multpasswordbox":
-            msg = "Enter logon information"
-            title = "Demo of multpasswordbox"
-            fieldNames = ["Server ID", "User ID", "Password"]
-            fieldValues = []  # we start with blanks for the values
-            fieldValues = multpasswordbox(msg, title, fieldNames)
-
-            # make sure that none of the fields was left blank
-            while 1:
-                if fieldValues == None:
-                    break
-                errmsg = ""
-                for i in range(len(fieldNames)):
-                    if fieldValues[i].strip() == "":
-                        errmsg = errmsg + (
-                            '"%s" is a required field.\n\n' % fieldNames[i]
-                        )
-                if errmsg == "":
-                    break  # no problems found
-                fieldValues = multpasswordbox(
-                    errmsg, title, fieldNames, fieldValues
-                )
-
-            writeln("Reply was: %s" % str(fieldValues))
-
-        elif reply[0] == "ynbox":
-            title = "Demo of ynbox"
-            msg = "Were you expecting the Spanish Inquisition?"
-            reply = ynbox(msg, title)
-            writeln("Reply was: %s" % repr(reply))
-            if reply:
-                msgbox("NOBODY expects the Spanish Inquisition!", "Wrong!")
-
-        elif reply[0] == "ccbox":
-            title = "Demo of ccbox"
-            reply = ccbox(msg, title)
-            writeln("Reply was: %s" % repr(reply))
-
-        elif reply[0] == "choicebox":
-            title = "Demo of choicebox"
-            longchoice = "This is an example of a very long option which you may or may not wish to choose." * 2
-            listChoices = [
-                "nnn", "ddd", "eee", "fff", "aaa", longchoice, "aaa", "bbb",
-                "ccc", "ggg", "hhh", "iii", "jjj", "kkk", "LLL", "mmm", "nnn",
-                "ooo", "ppp", "qqq", "rrr", "sss", "ttt", "uuu", "vvv"
-            ]
-
-            msg = "Pick something. " + (
-                "A wrapable sentence of text ?! " * 30
-            ) + "\nA separate line of text." * 6
-            reply = choicebox(msg=msg, choices=listChoices)
-            writeln("Reply was: %s" % repr(reply))
-
-            msg = "Pick something. "
-            reply = choicebox(msg=msg, title=title, choices=listChoices)
-            writeln("Reply was: %s" % repr(reply))
-
-            msg = "Pick something. "
-            reply = choicebox(msg="The list of choices is empty!", choices=[])
-            writeln("Reply was: %s" % repr(reply))
-
-        elif reply[0] == "multchoicebox":
-            listChoices = [
-                "aaa", "bbb", "ccc", "ggg", "hhh", "iii", "jjj", "kkk", "LLL",
-                "mmm", "nnn", "ooo", "ppp", "qqq", "rrr", "sss", "ttt", "uuu",
-                "vvv"
-            ]
-
-            msg = "Pick as many choices as you wish."
-            reply = multchoicebox(msg, "Demo of multchoicebox", listChoices)
-            writeln("Reply was: %s" % repr(reply))
-
-        elif reply[0] == "textbox":
-            _demo_textbox(reply[0])
-        elif reply[0] == "codebox":
-            _demo_codebox(reply[0])
-
-        else:
-            msgbox(
-                "Choice\n\n" + choice + "\n\nis not recognized",
-                "Program Logic Error"
-            )
-            return
-
-
-def _demo_textbox(reply):
-    text_snippet = ((\
-"""It was the best of times, and it was the worst of times.  The rich ate cake, and the poor had cake recommended to them, but wished only for enough cash to buy bread.  The time was ripe for revolution! """ \
-*5)+"\n\n")*10
-    title = "Demo of textbox"
-    msg = "Here is some sample text. " * 16
-    reply = textbox(msg, title, text_snippet)
-    writeln("Reply was: %s" % str(reply))
-
-
-def _demo_codebox(reply):
-    code_snippet = ("dafsdfa dasflkj pp[oadsij asdfp;ij asdfpjkop asdfpok asdfpok asdfpok"*3) +"\n"+\
-"""# here is some dummy Python code
-for someItem in myListOfStuff:
-    do something(someItem)
-    do something()
-    do something()
-    if somethingElse(someItem):
-        doSomethingEvenMoreInteresting()
-
-"""*16
-    msg = "Here is some sample code. " * 16
-    reply = codebox(msg, "Code Sample", code_snippet)
-    writeln("Reply was: %s" % repr(reply))
-
-
-def _demo_buttonbox_with_image():
-
-    msg = "Do you like this picture?\nIt is "
-    choices = ["Yes", "No", "No opinion"]
-
-    for image in [
-        "python_and_check_logo.gif", "python_and_check_logo.jpg",
-        "python_and_check_logo.png", "zzzzz.gif"
-    ]:
-
-        reply = buttonbox(msg + image, image=image, choices=choices)
-        writeln("Reply was: %s" % repr(reply))
-
-
-def _demo_help():
-    savedStdout = sys.stdout  # save the sys.stdout file object
-    sys.stdout = capturedOutput = StringIO()
-    help("easygui")
-    sys.stdout = savedStdout  # restore the sys.stdout file object
-    codebox("EasyGui Help", text=capturedOutput.getvalue())
-
-
-def _demo_filesavebox():
-    filename = "myNewFile.txt"
-    title = "File SaveAs"
-    msg = "Save file as:"
-
-    f = filesavebox(msg, title, default=filename)
-    writeln("You chose to save file: %s" % f)
-
-
-def _demo_diropenbox():
-    title = "Demo of diropenbox"
-    msg = "Pick the directory that you wish to open."
-    d = diropenbox(msg, title)
-    writeln("You chose directory...: %s" % d)
-
-    d = diropenbox(msg, title, default="./")
-    writeln("You chose directory...: %s" % d)
-
-    d = diropenbox(msg, title, default="c:/")
-    writeln("You chose directory...: %s" % d)
-
-
-def _demo_fileopenbox():
-    msg = "Python files"
-    title = "Open files"
-    default = "*.py"
-    f = fileopenbox(msg, title, default=default)
-    writeln("You chose to open file: %s" % f)
-
-    default = "./*.gif"
-    filetypes = [
-        "*.jpg", ["*.zip", "*.tgs", "*.gz", "Archive files"
-                 ], ["*.htm", "*.html", "HTML files"]
+    def sortedChoicebox():
+        sortAll.append(True)
+        try:
+            choicebox("benchmark", choices=many)
+        finally:
+            sortAll.pop()
+
+    log = "".join("%07i the goblin hits the wolf for %i damage\n" % (i, i % 7) for i in range(1000000))
+    boxes = [
+        ("msgbox", lambda: msgbox("benchmark")),
+        ("buttonbox", lambda: buttonbox("benchmark", choices=["fight", "flee", "look", "quit"])),
+        ("enterbox", lambda: enterbox("benchmark", default="goblin")),
+        ("choicebox, 100 choices", lambda: choicebox("benchmark", choices=["goblin %i" % i for i in range(100)])),
+        ("textbox, 1000 lines", lambda: textbox("benchmark", text="the goblin hits the wolf\n" * 1000)),
+        ("codebox, 1000 lines", lambda: codebox("benchmark", text="the goblin hits the wolf\n" * 1000)),
+        ("choicebox, 1M choices", lambda: choicebox("benchmark", choices=many)),
+        ("  until sorted", sortedChoicebox),
+        ("choicebox, generator", lambda: choicebox("benchmark", choices=("goblin %i" % i for i in range(10 ** 9)))),
+        ("textbox, %i MB log" % (len(log) // 1000000), lambda: textbox("benchmark", text=log)),
     ]
-    f = fileopenbox(msg, title, default=default, filetypes=filetypes)
-    writeln("You chose to open file: %s" % f)
-    """#deadcode -- testing ----------------------------------------
-    f = fileopenbox(None,None,default=default)
-    writeln("You chose to open file: %s" % f)
-
-    f = fileopenbox(None,title,default=default)
-    writeln("You chose to open file: %s" % f)
-
-    f = fileopenbox(msg,None,default=default)
-    writeln("You chose to open file: %s" % f)
-
-    f = fileopenbox(default=default)
-    writeln("You chose to open file: %s" % f)
-
-    f = fileopenbox(default=None)
-    writeln("You chose to open file: %s" % f)
-    #----------------------------------------------------deadcode """
-
-
-def _dummy():
-    pass
-
-
-EASYGUI_ABOUT_INFORMATION = '''
-========================================================================
-0.96(2010-08-29)
-========================================================================
-This version fixes some problems with version independence.
-
-BUG FIXES
-------------------------------------------------------
- * A statement with Python 2.x-style exception-handling syntax raised
-   a syntax error when running under Python 3.x.
-   Thanks to David Williams for reporting this problem.
-
- * Under some circumstances, PIL was unable to display non-gif images
-   that it should have been able to display.
-   The cause appears to be non-version-independent import syntax.
-   PIL modules are now imported with a version-independent syntax.
-   Thanks to Horst Jens for reporting this problem.
-
-LICENSE CHANGE
-------------------------------------------------------
-Starting with this version, EasyGui is licensed under what is generally known as
-the "modified BSD license" (aka "revised BSD", "new BSD", "3-clause BSD").
-This license is GPL-compatible but less restrictive than GPL.
-Earlier versions were licensed under the Creative Commons Attribution License 2.0.
-
-
-========================================================================
-0.95(2010-06-12)
-========================================================================
-
-ENHANCEMENTS
-------------------------------------------------------
- * Previous versions of EasyGui could display only .gif image files using the
-   msgbox "image" argument. This version can now display all image-file formats
-   supported by PIL the Python Imaging Library) if PIL is installed.
-   If msgbox is asked to open a non-gif image file, it attempts to import
-   PIL and to use PIL to convert the image file to a displayable format.
-   If PIL cannot be imported (probably because PIL is not installed)
-   EasyGui displays an error message saying that PIL must be installed in order
-   to display the image file.
 
-   Note that
-   http://www.pythonware.com/products/pil/
-   says that PIL doesn't yet support Python 3.x.
+    def drawAndClose(self, n=0):
+        self.update()  # draw the box, then leave it like a click on OK would do
+        if sortAll and choiceboxVirtual is not None:
+            choiceboxVirtual.finishSort()
 
-
-========================================================================
-0.94(2010-06-06)
-========================================================================
-
-ENHANCEMENTS
-------------------------------------------------------
- * The codebox and textbox functions now return the contents of the box, rather
-   than simply the name of the button ("Yes").  This makes it possible to use
-   codebox and textbox as data-entry widgets.  A big "thank you!" to Dominic
-   Comtois for requesting this feature, patiently explaining his requirement,
-   and helping to discover the tkinter techniques to implement it.
-
-   NOTE THAT in theory this change breaks backward compatibility.  But because
-   (in previous versions of EasyGui) the value returned by codebox and textbox
-   was meaningless, no application should have been checking it.  So in actual
-   practice, this change should not break backward compatibility.
-
- * Added support for SPACEBAR to command buttons.  Now, when keyboard
-   focus is on a command button, a press of the SPACEBAR will act like
-   a press of the ENTER key; it will activate the command button.
-
- * Added support for keyboard navigation with the arrow keys (up,down,left,right)
-   to the fields and buttons in enterbox, multenterbox and multpasswordbox,
-   and to the buttons in choicebox and all buttonboxes.
-
- * added highlightthickness=2 to entry fields in multenterbox and
-   multpasswordbox.  Now it is easier to tell which entry field has
-   keyboard focus.
-
-
-BUG FIXES
-------------------------------------------------------
- * In EgStore, the pickle file is now opened with "rb" and "wb" rather than
-   with "r" and "w".  This change is necessary for compatibility with Python 3+.
-   Thanks to Marshall Mattingly for reporting this problem and providing the fix.
-
- * In integerbox, the actual argument names did not match the names described
-   in the docstring. Thanks to Daniel Zingaro of at University of Toronto for
-   reporting this problem.
-
- * In integerbox, the "argLowerBound" and "argUpperBound" arguments have been
-   renamed to "lowerbound" and "upperbound" and the docstring has been corrected.
-
-   NOTE THAT THIS CHANGE TO THE ARGUMENT-NAMES BREAKS BACKWARD COMPATIBILITY.
-   If argLowerBound or argUpperBound are used, an AssertionError with an
-   explanatory error message is raised.
-
- * In choicebox, the signature to choicebox incorrectly showed choicebox as
-   accepting a "buttons" argument.  The signature has been fixed.
-
-
-========================================================================
-0.93(2009-07-07)
-========================================================================
-
-ENHANCEMENTS
-------------------------------------------------------
-
- * Added exceptionbox to display stack trace of exceptions
-
- * modified names of some font-related constants to make it
-   easier to customize them
-
-
-========================================================================
-0.92(2009-06-22)
-========================================================================
-
-ENHANCEMENTS
-------------------------------------------------------
-
- * Added EgStore class to to provide basic easy-to-use persistence.
-
-BUG FIXES
-------------------------------------------------------
-
- * Fixed a bug that was preventing Linux users from copying text out of
-   a textbox and a codebox.  This was not a problem for Windows users.
-
-'''
+    originalMainloop = Misc.mainloop
+    Misc.mainloop = drawAndClose
+    try:
+        writeln("%-24s %12s %16s" % ("box", "new Tk()", "session mode"))
+        for name, box in boxes:
+            timings = []
+            for active in (False, True):
+                session(active)
+                start = time.time()
+                for i in range(repeats):
+                    box()
+                timings.append((time.time() - start) * 1000 / repeats)
+                session(False)
+            writeln("%-24s %9.2f ms %13.2f ms  (%.1f times faster)" % (
+                name, timings[0], timings[1], timings[0] / timings[1]))
+    finally:
+        Misc.mainloop = originalMainloop
 
 
-def abouteasygui():
+#-------------------------------------------------------------------
+# check
+#-------------------------------------------------------------------
+def check():
     """
-    shows the easygui revision history
+    Check the boxes that are used again in the session mode (see session()):
+    an enterbox with an image, then one without, then a passwordbox and
+    an enterbox again, all in the same hidden window. Each box returns its
+    default text at once, like a click on OK.
+    Returns True if the image frame is packed (below the msg) only for the
+    box with the image, the mask only for the passwordbox, and each box
+    returns its own default text.
+
+    run: python -m easygui check
     """
-    codebox("About EasyGui\n" + egversion, "EasyGui", EASYGUI_ABOUT_INFORMATION)
-    return None
-
-
-if __name__ == '__main__':
-    if True:
-        egdemo()
-    else:
-        # test the new root feature
-        root = Tk()
-        msg = """This is a test of a main Tk() window in which we will place an easygui msgbox.
-                It will be an interesting experiment.\n\n"""
-
-        messageWidget = Message(root, text=msg, width=1000)
-        messageWidget.pack(side=TOP, expand=YES, fill=X, padx='3m', pady='3m')
-        messageWidget = Message(root, text=msg, width=1000)
-        messageWidget.pack(side=TOP, expand=YES, fill=X, padx='3m', pady='3m')
-
-        msgbox("this is a test of passing in boxRoot", root=root)
-        msgbox("this is a second test of passing in boxRoot", root=root)
-
-        reply = enterbox("Enter something", root=root)
-        writeln("You wrote:", reply)
-
-        reply = enterbox("Enter something else", root=root)
-        writeln("You wrote:", reply)
-        root.destroy()
+    import base64
+    import tempfile
+
+    gif = base64.b64decode("R0lGODlhAQABAIAAAP///wAAACH5BAEAAAAALAAAAAABAAEAAAICRAEAOw==")
+    handle, imageFilename = tempfile.mkstemp(suffix=".gif")
+    os.write(handle, gif)
+    os.close(handle)
+
+    def clickOk(self, n=0):
+        __enterboxGetText(None)
+
+    boxes = [
+        # name, box, reply, image packed, mask
+        ("enterbox with image", lambda: enterbox("check", default="goblin", image=imageFilename), "goblin", True, ""),
+        ("enterbox", lambda: enterbox("check", default="wolf"), "wolf", False, ""),
+        ("passwordbox", lambda: passwordbox("check", default="secret"), "secret", False, "*"),
+        ("enterbox", lambda: enterbox("check"), "", False, ""),
+        ("passwordbox with image", lambda: passwordbox("check", image=imageFilename), "", True, "*"),
+        ("integerbox", lambda: integerbox("check", default=7), 7, False, ""),
+    ]
+    ok = True
+    window = None
+    originalMainloop = Misc.mainloop
+    Misc.mainloop = clickOk
+    session()
+    try:
+        for name, box, expected, imagePacked, mask in boxes:
+            reply = box()
+            dialog = sessionDialogs["fillablebox"]
+            if window is None:
+                window = dialog["window"]
+            slaves = dialog["window"].pack_slaves()
+            packed = dialog["imageFrame"] in slaves
+            below = not packed or slaves.index(dialog["imageFrame"]) == slaves.index(dialog["messageFrame"]) + 1
+            show = dialog["entryWidget"].cget("show")
+            errors = []
+            if dialog["window"] is not window:
+                errors.append("new window")
+            if packed != imagePacked or not below:
+                errors.append("image frame %s" % (packed and "packed" or "not packed"))
+            if show != mask:
+                errors.append("mask %r" % show)
+            if reply != expected:
+                errors.append("reply %r" % (reply,))
+            writeln("%-24s %s" % (name, ", ".join(errors) or "ok"))
+            ok = ok and not errors
+    finally:
+        session(False)
+        Misc.mainloop = originalMainloop
+        os.remove(imageFilename)
+    return ok
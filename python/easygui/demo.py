@@ -0,0 +1,507 @@
+"""
+The EasyGui demo (egdemo) and the revision history (abouteasygui).
+
+Part of EasyGui (see boxes.py for the license), imported only when
+easygui.egdemo or easygui.abouteasygui is used.
+"""
+
+import sys
+
+from .boxes import *
+from .boxes import writeln, egversion, TkVersion, runningPython3
+
+if runningPython3:
+    from io import StringIO
+else:
+    from StringIO import StringIO
+
+
+#-----------------------------------------------------------------------
+#
+# test/demo easygui
+#
+#-----------------------------------------------------------------------
+def egdemo():
+    """
+    Run the EasyGui demo.
+    """
+    # clear the console
+    writeln("\n" * 100)
+
+    intro_message = (
+        "Pick the kind of box that you wish to demo.\n" + "\n * Python version "
+        + sys.version + "\n * EasyGui version " + egversion + "\n * Tk version "
+        + str(TkVersion)
+    )
+
+    #========================================== END DEMONSTRATION DATA
+
+    while 1:  # do forever
+        choices = [
+            "msgbox", "buttonbox",
+            "buttonbox(image) -- a buttonbox that displays an image",
+            "choicebox", "multchoicebox", "textbox", "ynbox", "ccbox",
+            "enterbox", "enterbox(image) -- an enterbox that displays an image",
+            "exceptionbox", "codebox", "integerbox", "boolbox", "indexbox",
+            "filesavebox", "fileopenbox", "passwordbox", "multenterbox",
+            "multpasswordbox", "diropenbox", "About EasyGui", " Help"
+        ]
+        choice = choicebox(
+            msg=intro_message,
+            title="EasyGui " + egversion,
+            choices=choices
+        )
+
+        if not choice:
+            return
+
+        reply = choice.split()
+
+        if reply[0] == "msgbox":
+            reply = msgbox("short msg", "This is a long title")
+            writeln("Reply was: %s" % repr(reply))
+
+        elif reply[0] == "About":
+            reply = abouteasygui()
+
+        elif reply[0] == "Help":
+            _demo_help()
+
+        elif reply[0] == "buttonbox":
+            reply = buttonbox()
+            writeln("Reply was: %s" % repr(reply))
+
+            title = "Demo of Buttonbox with many, many buttons!"
+            msg = "This buttonbox shows what happens when you specify too many buttons."
+            reply = buttonbox(msg=msg, title=title, choices=choices)
+            writeln("Reply was: %s" % repr(reply))
+
+        elif reply[0] == "buttonbox(image)":
+            _demo_buttonbox_with_image()
+
+        elif reply[0] == "boolbox":
+            reply = boolbox()
+            writeln("Reply was: %s" % repr(reply))
+
+        elif reply[0] == "enterbox":
+            image = "python_and_check_logo.gif"
+            message = "Enter the name of your best friend."\
+                      "\n(Result will be stripped.)"
+            reply = enterbox(message, "Love!", "     Suzy Smith     ")
+            writeln("Reply was: %s" % repr(reply))
+
+            message = "Enter the name of your best friend."\
+                      "\n(Result will NOT be stripped.)"
+            reply = enterbox(
+                message,
+                "Love!",
+                "     Suzy Smith     ",
+                strip=False
+            )
+            writeln("Reply was: %s" % repr(reply))
+
+            reply = enterbox("Enter the name of your worst enemy:", "Hate!")
+            writeln("Reply was: %s" % repr(reply))
+
+        elif reply[0] == "enterbox(image)":
+            image = "python_and_check_logo.gif"
+            message = "What kind of snake is this?"
+            reply = enterbox(message, "Quiz", image=image)
+            writeln("Reply was: %s" % repr(reply))
+
+        elif reply[0] == "exceptionbox":
+            try:
+                thisWillCauseADivideByZeroException = 1 / 0
+            except:
+                exceptionbox()
+
+        elif reply[0] == "integerbox":
+            reply = integerbox(
+                "Enter a number between 3 and 333",
+                "Demo: integerbox WITH a default value", 222, 3, 333
+            )
+            writeln("Reply was: %s" % repr(reply))
+
+            reply = integerbox(
+                "Enter a number between 0 and 99",
+                "Demo: integerbox WITHOUT a default value"
+            )
+            writeln("Reply was: %s" % repr(reply))
+
+        elif reply[0] == "diropenbox":
+            _demo_diropenbox()
+        elif reply[0] == "fileopenbox":
+            _demo_fileopenbox()
+        elif reply[0] == "filesavebox":
+            _demo_filesavebox()
+
+        elif reply[0] == "indexbox":
+            title = reply[0]
+            msg = "Demo of " + reply[0]
+            choices = ["Choice1", "Choice2", "Choice3", "Choice4"]
+            reply = indexbox(msg, title, choices)
+            writeln("Reply was: %s" % repr(reply))
+
+        elif reply[0] == "passwordbox":
+            reply = passwordbox(
+                "Demo of password box WITHOUT default" +
+                "\n\nEnter your secret password", "Member Logon"
+            )
+            writeln("Reply was: %s" % str(reply))
+
+            reply = passwordbox(
+                "Demo of password box WITH default" +
+                "\n\nEnter your secret password", "Member Logon", "alfie"
+            )
+            writeln("Reply was: %s" % str(reply))
+
+        elif reply[0] == "multenterbox":
+            msg = "Enter your personal information"
+            title = "Credit Card Application"
+            fieldNames = ["Name", "Street Address", "City", "State", "ZipCode"]
+            fieldValues = []  # we start with blanks for the values
+            fieldValues = multenterbox(msg, title, fieldNames)
+
+            # make sure that none of the fields was left blank
+            while 1:
+                if fieldValues == None:
+                    break
+                errmsg = ""
+                for i in range(len(fieldNames)):
+                    if fieldValues[i].strip() == "":
+                        errmsg = errmsg + (
+                            '"%s" is a required field.\n\n' % fieldNames[i]
+                        )
+                if errmsg == "":
+                    break  # no problems found
+                fieldValues = multenterbox(
+                    errmsg, title, fieldNames, fieldValues
+                )
+
+            writeln("Reply was: %s" % str(fieldValues))
+
+        elif reply[0] == "multpasswordbox":
+            msg = "Enter logon information"
+            title = "Demo of multpasswordbox"
+            fieldNames = ["Server ID", "User ID", "Password"]
+            fieldValues = []  # we start with blanks for the values
+            fieldValues = multpasswordbox(msg, title, fieldNames)
+
+            # make sure that none of the fields was left blank
+            while 1:
+                if fieldValues == None:
+                    break
+                errmsg = ""
+                for i in range(len(fieldNames)):
+                    if fieldValues[i].strip() == "":
+                        errmsg = errmsg + (
+                            '"%s" is a required field.\n\n' % fieldNames[i]
+                        )
+                if errmsg == "":
+                    break  # no problems found
+                fieldValues = multpasswordbox(
+                    errmsg, title, fieldNames, fieldValues
+                )
+
+            writeln("Reply was: %s" % str(fieldValues))
+
+        elif reply[0] == "ynbox":
+            title = "Demo of ynbox"
+            msg = "Were you expecting the Spanish Inquisition?"
+            reply = ynbox(msg, title)
+            writeln("Reply was: %s" % repr(reply))
+            if reply:
+                msgbox("NOBODY expects the Spanish Inquisition!", "Wrong!")
+
+        elif reply[0] == "ccbox":
+            title = "Demo of ccbox"
+            reply = ccbox(msg, title)
+            writeln("Reply was: %s" % repr(reply))
+
+        elif reply[0] == "choicebox":
+            title = "Demo of choicebox"
+            longchoice = "This is an example of a very long option which you may or may not wish to choose." * 2
+            listChoices = [
+                "nnn", "ddd", "eee", "fff", "aaa", longchoice, "aaa", "bbb",
+                "ccc", "ggg", "hhh", "iii", "jjj", "kkk", "LLL", "mmm", "nnn",
+                "ooo", "ppp", "qqq", "rrr", "sss", "ttt", "uuu", "vvv"
+            ]
+
+            msg = "Pick something. " + (
+                "A wrapable sentence of text ?! " * 30
+            ) + "\nA separate line of text." * 6
+            reply = choicebox(msg=msg, choices=listChoices)
+            writeln("Reply was: %s" % repr(reply))
+
+            msg = "Pick something. "
+            reply = choicebox(msg=msg, title=title, choices=listChoices)
+            writeln("Reply was: %s" % repr(reply))
+
+            msg = "Pick something. "
+            reply = choicebox(msg="The list of choices is empty!", choices=[])
+            writeln("Reply was: %s" % repr(reply))
+
+        elif reply[0] == "multchoicebox":
+            listChoices = [
+                "aaa", "bbb", "ccc", "ggg", "hhh", "iii", "jjj", "kkk", "LLL",
+                "mmm", "nnn", "ooo", "ppp", "qqq", "rrr", "sss", "ttt", "uuu",
+                "vvv"
+            ]
+
+            msg = "Pick as many choices as you wish."
+            reply = multchoicebox(msg, "Demo of multchoicebox", listChoices)
+            writeln("Reply was: %s" % repr(reply))
+
+        elif reply[0] == "textbox":
+            _demo_textbox(reply[0])
+        elif reply[0] == "codebox":
+            _demo_codebox(reply[0])
+
+        else:
+            msgbox(
+                "Choice\n\n" + choice + "\n\nis not recognized",
+                "Program Logic Error"
+            )
+            return
+
+
+def _demo_textbox(reply):
+    text_snippet = ((\
+"""It was the best of times, and it was the worst of times.  The rich ate cake, and the poor had cake recommended to them, but wished only for enough cash to buy bread.  The time was ripe for revolution! """ \
+*5)+"\n\n")*10
+    title = "Demo of textbox"
+    msg = "Here is some sample text. " * 16
+    reply = textbox(msg, title, text_snippet)
+    writeln("Reply was: %s" % str(reply))
+
+
+def _demo_codebox(reply):
+    code_snippet = ("dafsdfa dasflkj pp[oadsij asdfp;ij asdfpjkop asdfpok asdfpok asdfpok"*3) +"\n"+\
+"""# here is some dummy Python code
+for someItem in myListOfStuff:
+    do something(someItem)
+    do something()
+    do something()
+    if somethingElse(someItem):
+        doSomethingEvenMoreInteresting()
+
+"""*16
+    msg = "Here is some sample code. " * 16
+    reply = codebox(msg, "Code Sample", code_snippet)
+    writeln("Reply was: %s" % repr(reply))
+
+
+def _demo_buttonbox_with_image():
+
+    msg = "Do you like this picture?\nIt is "
+    choices = ["Yes", "No", "No opinion"]
+
+    for image in [
+        "python_and_check_logo.gif", "python_and_check_logo.jpg",
+        "python_and_check_logo.png", "zzzzz.gif"
+    ]:
+
+        reply = buttonbox(msg + image, image=image, choices=choices)
+        writeln("Reply was: %s" % repr(reply))
+
+
+def _demo_help():
+    savedStdout = sys.stdout  # save the sys.stdout file object
+    sys.stdout = capturedOutput = StringIO()
+    help("easygui")
+    sys.stdout = savedStdout  # restore the sys.stdout file object
+    codebox("EasyGui Help", text=capturedOutput.getvalue())
+
+
+def _demo_filesavebox():
+    filename = "myNewFile.txt"
+    title = "File SaveAs"
+    msg = "Save file as:"
+
+    f = filesavebox(msg, title, default=filename)
+    writeln("You chose to save file: %s" % f)
+
+
+def _demo_diropenbox():
+    title = "Demo of diropenbox"
+    msg = "Pick the directory that you wish to open."
+    d = diropenbox(msg, title)
+    writeln("You chose directory...: %s" % d)
+
+    d = diropenbox(msg, title, default="./")
+    writeln("You chose directory...: %s" % d)
+
+    d = diropenbox(msg, title, default="c:/")
+    writeln("You chose directory...: %s" % d)
+
+
+def _demo_fileopenbox():
+    msg = "Python files"
+    title = "Open files"
+    default = "*.py"
+    f = fileopenbox(msg, title, default=default)
+    writeln("You chose to open file: %s" % f)
+
+    default = "./*.gif"
+    filetypes = [
+        "*.jpg", ["*.zip", "*.tgs", "*.gz", "Archive files"
+                 ], ["*.htm", "*.html", "HTML files"]
+    ]
+    f = fileopenbox(msg, title, default=default, filetypes=filetypes)
+    writeln("You chose to open file: %s" % f)
+    """#deadcode -- testing ----------------------------------------
+    f = fileopenbox(None,None,default=default)
+    writeln("You chose to open file: %s" % f)
+
+    f = fileopenbox(None,title,default=default)
+    writeln("You chose to open file: %s" % f)
+
+    f = fileopenbox(msg,None,default=default)
+    writeln("You chose to open file: %s" % f)
+
+    f = fileopenbox(default=default)
+    writeln("You chose to open file: %s" % f)
+
+    f = fileopenbox(default=None)
+    writeln("You chose to open file: %s" % f)
+    #----------------------------------------------------deadcode """
+
+
+def _dummy():
+    pass
+
+
+EASYGUI_ABOUT_INFORMATION = '''
+========================================================================
+0.96(2010-08-29)
+========================================================================
+This version fixes some problems with version independence.
+
+BUG FIXES
+------------------------------------------------------
+ * A statement with Python 2.x-style exception-handling syntax raised
+   a syntax error when running under Python 3.x.
+   Thanks to David Williams for reporting this problem.
+
+ * Under some circumstances, PIL was unable to display non-gif images
+   that it should have been able to display.
+   The cause appears to be non-version-independent import syntax.
+   PIL modules are now imported with a version-independent syntax.
+   Thanks to Horst Jens for reporting this problem.
+
+LICENSE CHANGE
+------------------------------------------------------
+Starting with this version, EasyGui is licensed under what is generally known as
+the "modified BSD license" (aka "revised BSD", "new BSD", "3-clause BSD").
+This license is GPL-compatible but less restrictive than GPL.
+Earlier versions were licensed under the Creative Commons Attribution License 2.0.
+
+
+========================================================================
+0.95(2010-06-12)
+========================================================================
+
+ENHANCEMENTS
+------------------------------------------------------
+ * Previous versions of EasyGui could display only .gif image files using the
+   msgbox "image" argument. This version can now display all image-file formats
+   supported by PIL the Python Imaging Library) if PIL is installed.
+   If msgbox is asked to open a non-gif image file, it attempts to import
+   PIL and to use PIL to convert the image file to a displayable format.
+   If PIL cannot be imported (probably because PIL is not installed)
+   EasyGui displays an error message saying that PIL must be installed in order
+   to display the image file.
+
+   Note that
+   http://www.pythonware.com/products/pil/
+   says that PIL doesn't yet support Python 3.x.
+
+
+========================================================================
+0.94(2010-06-06)
+========================================================================
+
+ENHANCEMENTS
+------------------------------------------------------
+ * The codebox and textbox functions now return the contents of the box, rather
+   than simply the name of the button ("Yes").  This makes it possible to use
+   codebox and textbox as data-entry widgets.  A big "thank you!" to Dominic
+   Comtois for requesting this feature, patiently explaining his requirement,
+   and helping to discover the tkinter techniques to implement it.
+
+   NOTE THAT in theory this change breaks backward compatibility.  But because
+   (in previous versions of EasyGui) the value returned by codebox and textbox
+   was meaningless, no application should have been checking it.  So in actual
+   practice, this change should not break backward compatibility.
+
+ * Added support for SPACEBAR to command buttons.  Now, when keyboard
+   focus is on a command button, a press of the SPACEBAR will act like
+   a press of the ENTER key; it will activate the command button.
+
+ * Added support for keyboard navigation with the arrow keys (up,down,left,right)
+   to the fields and buttons in enterbox, multenterbox and multpasswordbox,
+   and to the buttons in choicebox and all buttonboxes.
+
+ * added highlightthickness=2 to entry fields in multenterbox and
+   multpasswordbox.  Now it is easier to tell which entry field has
+   keyboard focus.
+
+
+BUG FIXES
+------------------------------------------------------
+ * In EgStore, the pickle file is now opened with "rb" and "wb" rather than
+   with "r" and "w".  This change is necessary for compatibility with Python 3+.
+   Thanks to Marshall Mattingly for reporting this problem and providing the fix.
+
+ * In integerbox, the actual argument names did not match the names described
+   in the docstring. Thanks to Daniel Zingaro of at University of Toronto for
+   reporting this problem.
+
+ * In integerbox, the "argLowerBound" and "argUpperBound" arguments have been
+   renamed to "lowerbound" and "upperbound" and the docstring has been corrected.
+
+   NOTE THAT THIS CHANGE TO THE ARGUMENT-NAMES BREAKS BACKWARD COMPATIBILITY.
+   If argLowerBound or argUpperBound are used, an AssertionError with an
+   explanatory error message is raised.
+
+ * In choicebox, the signature to choicebox incorrectly showed choicebox as
+   accepting a "buttons" argument.  The signature has been fixed.
+
+
+========================================================================
+0.93(2009-07-07)
+========================================================================
+
+ENHANCEMENTS
+------------------------------------------------------
+
+ * Added exceptionbox to display stack trace of exceptions
+
+ * modified names of some font-related constants to make it
+   easier to customize them
+
+
+========================================================================
+0.92(2009-06-22)
+========================================================================
+
+ENHANCEMENTS
+------------------------------------------------------
+
+ * Added EgStore class to to provide basic easy-to-use persistence.
+
+BUG FIXES
+------------------------------------------------------
+
+ * Fixed a bug that was preventing Linux users from copying text out of
+   a textbox and a codebox.  This was not a problem for Windows users.
+
+'''
+
+
+def abouteasygui():
+    """
+    shows the easygui revision history
+    """
+    codebox("About EasyGui\n" + egversion, "EasyGui", EASYGUI_ABOUT_INFORMATION)
+    return None
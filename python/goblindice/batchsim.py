@@ -0,0 +1,286 @@
+"""
+batch combat sim: millions of goblindice combats at once, using numpy
+
+Name:             batchsim.py
+purpose           run the combat of goblindice004.combat_sim for many
+                  fights at the same time. Instead of one fight after
+                  the other, each combat round is calculated for all
+                  still running fights together, using numpy arrays.
+                  No combat log is written, only the results are counted:
+                  victories, hitpoints of the winner and combat rounds.
+idea:             attack and defense are gauss distributed, so the chance
+                  to hit can be calculated exactly (see hit_chance)
+                  and one random number per strike decides if it hits
+                  and what the first die shows
+edit this code:   https://github.com/horstjens/ThePythonGameBook/
+                  blob/master/python/goblindice/batchsim.py
+main project:     http://ThePythonGameBook.com
+Author:           Horst JENS, horst.jens@spielend-programmieren.at
+Licence:          gpl, see http://www.gnu.org/licenses/gpl.html
+
+run this file directly to simulate 10 million fights (or
+"python batchsim.py 1000000" for 1 million). Before the time is measured,
+a short check compares 2000 fights of batch_combat_sim with combat_sim.
+run "python batchsim.py check" for the full check with 20000 fights
+"""
+import math
+import random
+
+import goblindice004 as goblin
+
+try:
+    import numpy
+except ImportError:
+    numpy = None  # batch_combat_sim works without numpy, but slow
+
+
+class BatchResult(object):
+    """counted results of many fights between two monsters.
+    hp_hist[0][x] is the number of victories of monster1 with x hitpoints
+    left, hp_hist[1] the same for monster2. rounds_hist[x] is the number
+    of fights lasting x combat rounds"""
+
+    def __init__(self, monster1, monster2):
+        self.names = (monster1.name, monster2.name)
+        self.fights = 0
+        self.wins = [0, 0]
+        self.hp_hist = [[], []]
+        self.rounds_hist = []
+
+    def add(self, monster_index, hp, rounds):
+        """count one fight: monster_index (0 or 1) wins with hp left"""
+        self.fights += 1
+        self.wins[monster_index] += 1
+        count(self.hp_hist[monster_index], hp)
+        count(self.rounds_hist, rounds)
+
+    def add_counts(self, wins, hp_hist, rounds_hist):
+        """count many fights at once (from batch_combat_sim)"""
+        self.fights += sum(wins)
+        for i in (0, 1):
+            self.wins[i] += wins[i]
+            self.hp_hist[i] = add_hist(self.hp_hist[i], hp_hist[i])
+        self.rounds_hist = add_hist(self.rounds_hist, rounds_hist)
+
+    def win_rate(self, monster_index):
+        return self.wins[monster_index] / self.fights if self.fights else 0.0
+
+    def mean_hp(self, monster_index):
+        """average hitpoints left of monster monster_index when it wins"""
+        return mean_of_hist(self.hp_hist[monster_index])
+
+    def mean_rounds(self):
+        return mean_of_hist(self.rounds_hist)
+
+    def hp_values(self, monster_index):
+        """list of all hitpoints left of monster_index victories (like m1_hp
+        in combatsimviewer). Can be very long!"""
+        values = []
+        for hp, count in enumerate(self.hp_hist[monster_index]):
+            values.extend([hp] * int(count))
+        return values
+
+    def rounds_values(self):
+        """list of the number of combat rounds of all fights"""
+        values = []
+        for rounds, count in enumerate(self.rounds_hist):
+            values.extend([rounds] * int(count))
+        return values
+
+    def __repr__(self):
+        text = "{} fights".format(self.fights)
+        for i in (0, 1):
+            text += "\nVictorys for {}: {} ({:.2f}%) ~hp: {:.1f}".format(
+                self.names[i], self.wins[i], self.win_rate(i) * 100,
+                self.mean_hp(i)
+            )
+        text += "\n~duration: {:.1f} rounds".format(self.mean_rounds())
+        return text
+
+
+def count(hist, x):
+    """add 1 to hist[x], make the list hist longer if necessary"""
+    while len(hist) <= x:
+        hist.append(0)
+    hist[x] += 1
+
+
+def add_hist(hist1, hist2):
+    """returns the sum of two histograms (lists or arrays of counts)
+    of maybe different length"""
+    if len(hist1) < len(hist2):
+        hist1, hist2 = hist2, hist1
+    result = [int(count) for count in hist1]
+    for x, count in enumerate(hist2):
+        result[x] += int(count)
+    return result
+
+
+def mean_of_hist(hist):
+    total = sum(hist)
+    if total == 0:
+        return 0.0
+    return sum(x * c for x, c in enumerate(hist)) / total
+
+
+def variance_of_hist(hist):
+    total = sum(hist)
+    if total == 0:
+        return 0.0
+    return sum(x * x * c for x, c in enumerate(hist)) / total - mean_of_hist(hist) ** 2
+
+
+def hit_chance(attacker, defender):
+    """returns the chance that attacker hits defender (see goblindice004.strike).
+    attacker hits if attacker.attack + gauss(0.5, 0.2) > defender.defense +
+    gauss(0.5, 0.1), that is if gauss(0, (0.2**2 + 0.1**2)**0.5) is bigger than
+    defender.defense - attacker.attack"""
+    sigma = (0.2 ** 2 + 0.1 ** 2) ** 0.5
+    return 0.5 * math.erfc((defender.defense - attacker.attack) / (sigma * 2 ** 0.5))
+
+
+def strike_many(rng, hit, size, faces=6):
+    """damage of size strikes with the chance hit to hit, each doing
+    re_roll() damage. One random number u decides hit and first die:
+    u < 1 - hit is no hit, the rest (1 - hit ... 1) is split into faces
+    parts of the same size for the die faces. Only the dice showing the
+    highest face are thrown again (open ended)"""
+    if hit <= 0:
+        return numpy.zeros(size, dtype=numpy.int32)
+    u = rng.random(size)
+    damage = numpy.floor((u - (1.0 - hit)) * (faces / hit)).astype(numpy.int32) + 1
+    numpy.maximum(damage, 0, out=damage)  # no hit: 0 damage
+    again = numpy.flatnonzero(damage == faces)
+    while again.size > 0:
+        roll = rng.integers(1, faces + 1, again.size, dtype=numpy.int32)
+        damage[again] += roll - 1
+        again = again[roll == faces]
+    return damage
+
+
+def fight_chunk(rng, m1, m2, size):
+    """simulate size fights between m1 and m2 at the same time.
+    returns histograms: hitpoints left of m1 victories,
+    hitpoints left of m2 victories, combat rounds"""
+    hit12 = hit_chance(m1, m2)  # chance of m1 hitting m2
+    hit21 = hit_chance(m2, m1)
+    h1 = numpy.full(size, m1.hitpoints, dtype=numpy.int32)  # only running fights
+    h2 = numpy.full(size, m2.hitpoints, dtype=numpy.int32)
+    m1_hp, m2_hp, rounds_hist = [], [], [0]
+    while h1.size > 0:
+        n = h1.size
+        new2 = h2 - strike_many(rng, hit12, n)  # m1 strikes m2
+        new1 = h1 - strike_many(rng, hit21, n)  # m2 strikes m1
+        m1first = rng.random(n) < 0.5  # random.shuffle of 2 monsters
+        # the second striker only strikes back if still alive
+        h2 = numpy.where(m1first | (new1 >= 1), new2, h2)
+        h1 = numpy.where(~m1first | (new2 >= 1), new1, h1)
+        # ---- count the ended fights, keep the running fights ----
+        running = (h1 > 0) & (h2 > 0)
+        ended = n - int(numpy.count_nonzero(running))
+        rounds_hist.append(ended)  # fights ending in this combat round
+        if ended:
+            m1_hp.append(h1[~running & (h1 > 0)])
+            m2_hp.append(h2[~running & (h2 > 0)])
+            h1 = h1[running]
+            h2 = h2[running]
+    return (numpy.bincount(numpy.concatenate(m1_hp)) if m1_hp else [],
+            numpy.bincount(numpy.concatenate(m2_hp)) if m2_hp else [],
+            rounds_hist)
+
+
+def batch_combat_sim(monster1, monster2, fights, seed=None, chunksize=2 ** 17):
+    """simulate many fights between monster1 and monster2
+    (like calling goblindice004.combat_sim fights times, restoring
+    the hitpoints after each fight) and return a BatchResult.
+    Fights are calculated in chunks of chunksize fights: small enough
+    to keep the arrays inside the processor cache.
+    Without numpy, combat_sim is called for each fight (slow)."""
+    if numpy is None:
+        return scalar_results(monster1, monster2, fights, seed)
+    result = BatchResult(monster1, monster2)
+    rng = numpy.random.default_rng(seed)
+    todo = fights
+    while todo > 0:
+        size = min(todo, chunksize)
+        todo -= size
+        m1_hist, m2_hist, rounds_hist = fight_chunk(rng, monster1, monster2, size)
+        result.add_counts((int(sum(m1_hist)), int(sum(m2_hist))),
+                          (m1_hist, m2_hist), rounds_hist)
+    return result
+
+
+def scalar_results(monster1, monster2, fights, seed=None):
+    """the same as batch_combat_sim, but calling goblindice004.combat_sim
+    for each fight"""
+    random.seed(seed)
+    result = BatchResult(monster1, monster2)
+    for _ in range(fights):
+        # fresh copies, because combat_sim changes the hitpoints
+        m1 = goblin.Monster(monster1.name, monster1.attack, monster1.defense, monster1.hitpoints)
+        m2 = goblin.Monster(monster2.name, monster2.attack, monster2.defense, monster2.hitpoints)
+        winner, hp, rounds, log = goblin.combat_sim(m1, m2)
+        result.add(0 if m1.hitpoints > 0 else 1, hp, rounds)
+    return result
+
+
+def compare(monster1, monster2, fights=20000):
+    """run combat_sim and batch_combat_sim fights times each and compare
+    the win rate, the average hitpoints and the distribution of combat
+    rounds. Returns True if all differences are small enough to be chance"""
+    scalar = scalar_results(monster1, monster2, fights, seed=1)
+    batch = batch_combat_sim(monster1, monster2, fights, seed=2)
+    ok = True
+    # --- win rate: difference of two binomial ratios ---
+    p = (scalar.wins[0] + batch.wins[0]) / (2 * fights)
+    sigma = (2 * p * (1 - p) / fights) ** 0.5
+    diff = batch.win_rate(0) - scalar.win_rate(0)
+    print("win rate {}: combat_sim {:.4f} batch {:.4f} ({:+.1f} sigma)".format(
+        monster1.name, scalar.win_rate(0), batch.win_rate(0), diff / sigma if sigma else 0.0))
+    ok = ok and abs(diff) <= 4 * sigma
+    # --- mean of rounds and hitpoints left ---
+    for name, s_hist, b_hist in (("rounds", scalar.rounds_hist, batch.rounds_hist),
+                                 ("hp " + monster1.name, scalar.hp_hist[0], batch.hp_hist[0]),
+                                 ("hp " + monster2.name, scalar.hp_hist[1], batch.hp_hist[1])):
+        s_mean, b_mean = mean_of_hist(s_hist), mean_of_hist(b_hist)
+        sigma = (variance_of_hist(s_hist) / max(1, sum(s_hist)) +
+                 variance_of_hist(b_hist) / max(1, sum(b_hist))) ** 0.5
+        print("mean {}: combat_sim {:.3f} batch {:.3f} ({:+.1f} sigma)".format(
+            name, s_mean, b_mean, (b_mean - s_mean) / sigma if sigma else 0.0))
+        ok = ok and abs(b_mean - s_mean) <= 4 * sigma
+    # --- is the rounds histogram the same? ---
+    chi2, bins = 0.0, 0  # two sample chi square test
+    hist_s = add_hist(scalar.rounds_hist, [0] * len(batch.rounds_hist))
+    hist_b = add_hist(batch.rounds_hist, [0] * len(scalar.rounds_hist))
+    pool_s = pool_b = 0
+    for s, b in zip(hist_s, hist_b):
+        pool_s += s
+        pool_b += b
+        if pool_s + pool_b >= 50:  # join rare round numbers into one bin
+            chi2 += (pool_s - pool_b) ** 2 / (pool_s + pool_b)
+            bins += 1
+            pool_s = pool_b = 0
+    # chi2 with bins-1 degrees of freedom, mean bins-1, sigma sqrt(2*(bins-1))
+    limit = (bins - 1) + 4 * (2 * (bins - 1)) ** 0.5
+    print("rounds histogram: chi2 {:.1f} with {} degrees of freedom (limit {:.1f})".format(
+        chi2, bins - 1, limit))
+    ok = ok and chi2 <= limit
+    print("distributions are the same" if ok else "DISTRIBUTIONS DIFFER")
+    return ok
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+    m1 = goblin.Monster("Grunty", 0.4, 0.7, 95)  # name, attack, defense, hp
+    m2 = goblin.Monster("Stinky", 0.8, 0.3, 109)
+    if len(sys.argv) > 1 and sys.argv[1] == "check":
+        sys.exit(0 if compare(m1, m2) else 1)
+    fights = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 7
+    # a fast engine is worth nothing if it gives other results
+    if not compare(m1, m2, 2000):
+        sys.exit(1)
+    start = time.time()
+    result = batch_combat_sim(m1, m2, fights, seed=1)
+    print(result)
+    print("{} fights in {:.1f} seconds".format(fights, time.time() - start))
@@ -18,6 +18,7 @@ import os.path
 
 try:
     import goblindice004 as goblin
+    import batchsim  # many fights at once, without combat log
     import easygui
 except:
     print(
@@ -125,7 +126,17 @@ def fight(
     m2_wins, m2_hp, picdict
 ):
     potency = calc_buttons.index(action)  # rank of button
-    for x in range(10**potency):  # fight 1,10,100 times
+    fights = 10**potency
+    if fights > 100:  # many fights: use batchsim, only the last one with log
+        result = batchsim.batch_combat_sim(m1, m2, fights - 1)
+        battles += result.fights
+        battlerounds.extend(result.rounds_values())
+        m1_wins += result.wins[0]
+        m1_hp.extend(result.hp_values(0))
+        m2_wins += result.wins[1]
+        m2_hp.extend(result.hp_values(1))
+        fights = 1
+    for x in range(fights):  # fight 1,10,100 times
         winner, hp, rounds, log = goblin.combat_sim(m1, m2)
         battles += 1
         battlerounds.append(rounds)
@@ -167,11 +178,15 @@ def playtester_gui():
         vtext, log = clean() # set valuues to zero / empty
     oldtext = ""
 
-    calc_buttons = ["+1 battle", "+10 battles", "+100 battles", "1000", "10000"]
+    calc_buttons = ["+1 battle", "+10 battles", "+100 battles", "1000", "10000",
+                    "100000", "1000000"]
     buttonlist = ["log", "clear", "edit", "save"]
     buttonlist.extend(calc_buttons)  # append each calcbutton to the list
     buttonlist.append("quit")  # append one single elemet
 
+    # session mode: the boxes of the menu loop reuse one hidden Tk window
+    # instead of building and destroying a new one for each box
+    easygui.session()
     while True:
         text = make_txt(
             m1, m2, m1_wins, m2_wins, m1_hp, m2_hp, battles, battlerounds
@@ -183,6 +198,7 @@ def playtester_gui():
             image=victorimage
         )
         if action == "quit":  # --------menu handler-----------
+            easygui.session(False)  # destroy the hidden boxes
             break
         elif action == "log":
             show_log(battles, vtext, log)
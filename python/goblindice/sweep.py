@@ -0,0 +1,318 @@
+"""
+parameter sweep: test many attack / defense / hitpoints combinations
+
+Name:             sweep.py
+purpose           instead of editing the monster stats in combatsimviewer
+                  and clicking "+10000" for each pair of stats, let the
+                  computer try a whole grid of stats. Each configuration
+                  (attack, defense and hitpoints of both monsters) fights
+                  --fights times using batchsim. The configurations are
+                  split into chunks, the chunks are calculated by
+                  several processes (ProcessPoolExecutor).
+                  Each finished chunk is appended to a csv file (and, if
+                  pyarrow is installed, written as parquet file), so the
+                  results never need to fit into memory. A checkpoint
+                  file remembers the parameters of the sweep and the
+                  finished chunks: --resume continues an interrupted
+                  sweep (with the same parameters).
+edit this code:   https://github.com/horstjens/ThePythonGameBook/
+                  blob/master/python/goblindice/sweep.py
+main project:     http://ThePythonGameBook.com
+Author:           Horst JENS, horst.jens@spielend-programmieren.at
+Licence:          gpl, see http://www.gnu.org/licenses/gpl.html
+
+example:
+python sweep.py --attack1 0.2:1.0:0.1 --defense1 0.7 --hp1 95 \\
+                --attack2 0.8 --defense2 0.1:0.9:0.1 --hp2 80:120:10 \\
+                --fights 10000 --out sweep.csv
+(interrupt with Ctrl-C, continue with the same command and --resume)
+
+a range is start:stop:step (stop included) or a single value
+
+python sweep.py check     interrupts and resumes a small sweep and compares
+                          it with an uninterrupted one (csv and parquet)
+"""
+import argparse
+import concurrent.futures
+import csv
+import itertools
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+import goblindice004 as goblin
+import batchsim
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None  # no parquet output, only csv
+
+FIELDS = ("config", "attack1", "defense1", "hp1", "attack2", "defense2",
+          "hp2", "fights", "wins1", "wins2", "winrate1", "mean_hp1",
+          "mean_hp2", "mean_rounds")
+
+
+def parse_range(text, kind=float):
+    """'0.2:1.0:0.1' -> [0.2, 0.3, ... 1.0], '95' -> [95]"""
+    parts = text.split(":")
+    if len(parts) == 1:
+        return [kind(parts[0])]
+    if len(parts) != 3:
+        raise argparse.ArgumentTypeError("range must be start:stop:step, not " + text)
+    start, stop, step = (kind(part) for part in parts)
+    if step <= 0:
+        raise argparse.ArgumentTypeError("step must be positive: " + text)
+    values = []
+    number = 0
+    while True:
+        value = start + number * step  # no adding up of rounding errors
+        if value > stop + step * 1e-9:
+            break
+        values.append(round(value, 10) if kind is float else value)
+        number += 1
+    return values
+
+
+def configuration(grid, number):
+    """returns the configuration with this number as tuple
+    (attack1, defense1, hp1, attack2, defense2, hp2), without building
+    the whole grid (grid: list of 6 lists of values)"""
+    values = []
+    for axis in reversed(grid):  # the last axis changes fastest, like itertools.product
+        number, position = divmod(number, len(axis))
+        values.append(axis[position])
+    return tuple(reversed(values))
+
+
+def run_chunk(grid, chunk, chunksize, configs, fights, seed):
+    """worker process: simulate all configurations of one chunk.
+    Each configuration has its own random seed (made from seed and the
+    config number), so the results do not depend on the number of
+    processes or on resuming"""
+    rows = []
+    for number in range(chunk * chunksize, min(configs, (chunk + 1) * chunksize)):
+        attack1, defense1, hp1, attack2, defense2, hp2 = configuration(grid, number)
+        m1 = goblin.Monster("monster1", attack1, defense1, hp1)
+        m2 = goblin.Monster("monster2", attack2, defense2, hp2)
+        result = batchsim.batch_combat_sim(m1, m2, fights, seed=seed * configs + number)
+        rows.append((number, attack1, defense1, hp1, attack2, defense2, hp2,
+                     result.fights, result.wins[0], result.wins[1],
+                     round(result.win_rate(0), 6), round(result.mean_hp(0), 4),
+                     round(result.mean_hp(1), 4), round(result.mean_rounds(), 4)))
+    return chunk, rows
+
+
+class Output(object):
+    """csv file (plus parquet files) of the results and the checkpoint file.
+    The first line of the checkpoint file holds the parameters of the
+    sweep (grid, fights, seed, chunksize) as json, then it has one line
+    for each finished chunk: chunk number and the size of the csv file
+    after writing this chunk"""
+
+    def __init__(self, filename, parameters, resume=False, parquet=True):
+        self.filename = filename
+        self.checkpointname = filename + ".checkpoint"
+        self.parquetdir = None
+        if parquet and pyarrow is not None:
+            self.parquetdir = os.path.splitext(filename)[0] + ".parquet"
+        self.done = set()
+        header = json.dumps(parameters, sort_keys=True)
+        if resume and os.path.isfile(self.checkpointname):
+            csvsize = 0
+            with open(self.checkpointname) as checkpoint:
+                if checkpoint.readline().rstrip("\n") != header:
+                    raise SystemExit("{} was written by a sweep with other parameters "
+                                     "(grid, fights, seed or chunk). Use the same "
+                                     "parameters to resume".format(self.checkpointname))
+                for line in checkpoint:
+                    chunk, size = line.split()
+                    self.done.add(int(chunk))
+                    csvsize = int(size)
+            if self.done and not os.path.isfile(self.filename):
+                raise SystemExit("{} is missing: can not resume. Delete {} to start "
+                                 "again".format(filename, self.checkpointname))
+            if os.path.isfile(self.filename):
+                # forget rows of an unfinished chunk (written after the last checkpoint)
+                with open(self.filename, "r+") as csvfile:
+                    csvfile.truncate(csvsize)
+            self.checkpoint = open(self.checkpointname, "a")
+        else:
+            # a new sweep: no old results may be mixed into it
+            if os.path.isfile(self.filename):
+                if resume:
+                    raise SystemExit("{} exists, but not {}: can not resume. Delete {} to "
+                                     "start again".format(filename, self.checkpointname, filename))
+                raise SystemExit("{} exists. Use --resume to continue or delete it".format(filename))
+            if self.parquetdir is not None and os.path.isdir(self.parquetdir) and os.listdir(self.parquetdir):
+                raise SystemExit("{} is not empty. Delete it to start a new sweep".format(self.parquetdir))
+            self.checkpoint = open(self.checkpointname, "w")
+            self.checkpoint.write(header + "\n")
+        self.csvfile = open(self.filename, "a", newline="")
+        self.writer = csv.writer(self.csvfile)
+        if self.csvfile.tell() == 0:
+            self.writer.writerow(FIELDS)
+        if self.parquetdir is not None and not os.path.isdir(self.parquetdir):
+            os.makedirs(self.parquetdir)
+
+    def write(self, chunk, rows):
+        """append rows of one chunk to csv (and parquet), then write the checkpoint"""
+        self.writer.writerows(rows)
+        self.csvfile.flush()
+        os.fsync(self.csvfile.fileno())
+        if self.parquetdir is not None:
+            columns = list(zip(*rows))
+            table = pyarrow.table({name: list(column) for name, column in zip(FIELDS, columns)})
+            name = os.path.join(self.parquetdir, "chunk{:06d}.parquet".format(chunk))
+            pyarrow.parquet.write_table(table, name + ".tmp")
+            os.replace(name + ".tmp", name)  # no half written parquet files
+        self.checkpoint.write("{} {}\n".format(chunk, self.csvfile.tell()))
+        self.checkpoint.flush()
+        os.fsync(self.checkpoint.fileno())
+        self.done.add(chunk)
+
+    def close(self):
+        self.csvfile.close()
+        self.checkpoint.close()
+
+
+def sweep(grid, fights=1000, chunksize=100, workers=None, seed=0,
+          filename="sweep.csv", resume=False, parquet=True):
+    """simulate all configurations of grid and write the results to filename"""
+    configs = 1
+    for axis in grid:
+        configs *= len(axis)
+    chunks = (configs + chunksize - 1) // chunksize
+    parameters = {"grid": grid, "fights": fights, "seed": seed, "chunksize": chunksize}
+    output = Output(filename, parameters, resume, parquet)
+    todo = [chunk for chunk in range(chunks) if chunk not in output.done]
+    print("{} configurations in {} chunks, {} chunks done, {} to do".format(
+        configs, chunks, chunks - len(todo), len(todo)))
+    if output.parquetdir is None and parquet:
+        print("pyarrow not installed: writing only csv")
+    workers = workers or os.cpu_count() or 1
+    try:
+        with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+            running = set()
+            todo = iter(todo)
+            while True:
+                # only a few chunks at once, so the results do not pile up in memory
+                for chunk in itertools.islice(todo, 2 * workers - len(running)):
+                    running.add(pool.submit(run_chunk, grid, chunk, chunksize,
+                                            configs, fights, seed))
+                if not running:
+                    break
+                finished, running = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in finished:
+                    chunk, rows = future.result()
+                    output.write(chunk, rows)
+                    print("\rchunk {} ready, {} of {} chunks done".format(
+                        chunk, len(output.done), chunks), end="")
+                    sys.stdout.flush()
+        print()
+    finally:
+        output.close()
+
+
+def read_rows(filename, parquetdir=None):
+    """rows of the csv file (or of the parquet files) as lists of strings,
+    sorted by config number"""
+    if parquetdir is None:
+        with open(filename, newline="") as csvfile:
+            rows = list(csv.reader(csvfile))[1:]
+    else:
+        rows = []
+        for name in os.listdir(parquetdir):
+            columns = pyarrow.parquet.read_table(os.path.join(parquetdir, name)).to_pydict()
+            rows.extend(zip(*(columns[field] for field in FIELDS)))
+        rows = [[str(value) for value in row] for row in rows]
+    return sorted(rows, key=lambda row: int(row[0]))
+
+
+def check():
+    """run a small sweep without and with interruption and compare the
+    results. Resuming with other parameters, or without checkpoint file,
+    must stop without changing the csv file. Returns True if all is ok"""
+    grid = [[0.3, 0.5], [0.7], [20, 30], [0.8], [0.2, 0.4], [25]]
+    folder = tempfile.mkdtemp()
+    ok = True
+    try:
+        reference = os.path.join(folder, "reference.csv")
+        sweep(grid, fights=200, chunksize=3, workers=2, filename=reference)
+        expected = read_rows(reference)
+        # --- interrupted after the first 2 chunks, with half a chunk written ---
+        filename = os.path.join(folder, "resumed.csv")
+        sweep(grid, fights=200, chunksize=3, workers=2, filename=filename)
+        with open(filename + ".checkpoint") as checkpoint:
+            lines = checkpoint.readlines()[:3]  # parameters and 2 chunks
+        with open(filename + ".checkpoint", "w") as checkpoint:
+            checkpoint.writelines(lines)
+        with open(filename, "r+") as csvfile:
+            csvfile.truncate(int(lines[-1].split()[1]))
+            csvfile.seek(0, os.SEEK_END)
+            csvfile.write("99,0.5,0.7,20")  # unfinished chunk
+        sweep(grid, fights=200, chunksize=3, workers=2, filename=filename, resume=True)
+        same = read_rows(filename) == expected
+        print("interrupted and resumed sweep gives the same csv rows: {}".format(same))
+        ok = ok and same and len(expected) == 8
+        if pyarrow is None:
+            print("pyarrow not installed: parquet files not checked")
+        else:
+            for name in (reference, filename):
+                same = read_rows(name, os.path.splitext(name)[0] + ".parquet") == expected
+                print("parquet files of {} give the same rows: {}".format(os.path.basename(name), same))
+                ok = ok and same
+        # --- resuming must refuse, and leave the csv file alone ---
+        size = os.path.getsize(filename)
+        for text, kwargs in (("other fights", {"fights": 300}),
+                             ("other grid", {"grid": grid[:5] + [[26]]}),
+                             ("no checkpoint file", {})):
+            if not kwargs:
+                os.remove(filename + ".checkpoint")
+            arguments = dict(grid=grid, fights=200, chunksize=3, workers=2,
+                             filename=filename, resume=True)
+            arguments.update(kwargs)
+            try:
+                sweep(**arguments)
+                refused = False
+            except SystemExit:
+                refused = True
+            kept = os.path.getsize(filename) == size
+            print("resume with {}: refused {}, csv file kept {}".format(text, refused, kept))
+            ok = ok and refused and kept
+    finally:
+        shutil.rmtree(folder)
+    print("sweep is ok" if ok else "SWEEP FAILED")
+    return ok
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="goblindice parameter sweep")
+    parser.add_argument("--attack1", type=parse_range, default="0.4")
+    parser.add_argument("--defense1", type=parse_range, default="0.7")
+    parser.add_argument("--hp1", type=lambda text: parse_range(text, int), default="95")
+    parser.add_argument("--attack2", type=parse_range, default="0.8")
+    parser.add_argument("--defense2", type=parse_range, default="0.3")
+    parser.add_argument("--hp2", type=lambda text: parse_range(text, int), default="109")
+    parser.add_argument("--fights", type=int, default=1000, help="fights per configuration")
+    parser.add_argument("--chunk", type=int, default=100, help="configurations per chunk")
+    parser.add_argument("--workers", type=int, default=None, help="number of processes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="sweep.csv", help="csv file for the results")
+    parser.add_argument("--noparquet", action="store_true", help="do not write parquet files")
+    parser.add_argument("--resume", action="store_true", help="continue an interrupted sweep")
+    options = parser.parse_args(args)
+    grid = [options.attack1, options.defense1, options.hp1,
+            options.attack2, options.defense2, options.hp2]
+    sweep(grid, options.fights, options.chunk, options.workers, options.seed,
+          options.out, options.resume, not options.noparquet)
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["check"]:
+        sys.exit(0 if check() else 1)
+    main()
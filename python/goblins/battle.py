@@ -0,0 +1,246 @@
+"""part of http://ThePythonGameBook.com
+source code:
+
+https://github.com/horstjens/ThePythonGameBook/blob/master/
+python/goblins/battle.py
+
+battle engine for the team vs team fights of slowgoblins022.py
+
+The old combatround() walked over the numbers of all goblins ever
+created (also sold ones) and built a new list of possible victims
+for each attacker, so one round needed n * n steps.
+A Battle keeps, for each team, a list of the goblins that are awake
+and alive, and the position of each goblin in this list. Choosing a
+random victim is one index into this list. A knocked out goblin is
+removed by moving the last goblin of the list into its place.
+
+The combat log is optional. With log=True the battle only remembers
+the numbers of each strike (rolls, hitpoints, ...); the text lines
+are made by text() when somebody reads them.
+
+The rules (and the statistics damage_dealt, damage_received, victory,
+streak, lastround, lost and loot of each goblin) are the same as in
+strike() and combatround() of slowgoblins022.py.
+
+usage:
+    battle = Battle(team0.members, team1.members, ("Alpha", "Bravo"), log=True)
+    winner = battle.run()  # 0, 1 or None
+    for line in battle.text():
+        print(line)
+
+run this file directly for a benchmark (battle of 10000 goblins)
+"""
+__license__ = 'gpl3'  # see http://www.gnu.org/licenses/gpl.html'
+
+import random
+
+# kinds of log entries
+ROUND, ATTACK, STRIKE = range(3)
+
+
+class Battle(object):
+    """one battle between two teams ({goblin number: goblin, ...}).
+    Only goblins that do not sleep take part in the battle"""
+
+    def __init__(self, ateam, bteam, names=("team 0", "team 1"), loot=1,
+                 log=False, rng=random):
+        self.teams = (ateam, bteam)
+        self.names = names
+        self.lootfactor = loot  # gold per hitpoint of a knocked out enemy
+        self.log = log  # remember each strike for text()
+        self.rng = rng  # random or a random.Random instance
+        self.events = []  # log entries (tuples), see text()
+        self.rounds = 0
+        self.winner = None
+        self.alive = ([], [])  # goblins of each team that are awake and alive
+        self.position = {}  # goblin number: index in its alive list
+        for side, team in enumerate(self.teams):
+            for goblin in team.values():
+                if goblin.sleep:
+                    continue
+                goblin.prepare_for_fight()  # restore hitpoints to full etc
+                if goblin.hitpoints > 0:
+                    self.position[goblin.number] = len(self.alive[side])
+                    self.alive[side].append(goblin)
+
+    def knock_out(self, goblin, side):
+        """remove goblin from the alive list of its team"""
+        alive = self.alive[side]
+        index = self.position.pop(goblin.number)
+        last = alive.pop()
+        if last is not goblin:
+            alive[index] = last  # the last goblin fills the gap
+            self.position[last.number] = index
+
+    def roll(self):
+        """like reroll(1, 6) of slowgoblins022.py: a 6 may be rolled
+        again, each 6 counts only 5"""
+        random = self.rng.random
+        accu = 0
+        for _ in range(99):
+            eyes = int(random() * 6) + 1
+            if eyes < 6:
+                return accu + eyes
+            accu += 5
+        return accu + int(random() * 6) + 1
+
+    def strike(self, attacker, defender, side, counterstrike=False):
+        """attacker (of team side) strikes at defender.
+        Returns True if the defender goes down"""
+        random = self.rng.random
+        rollatt = int(random() * 6) + 1  # like self.roll(), but without a call if no 6 is rolled
+        if rollatt == 6:
+            rollatt = 5 + self.roll()
+        rolldef = int(random() * 6) + 1
+        if rolldef == 6:
+            rolldef = 5 + self.roll()
+        scorea = attacker.attack + rollatt
+        scored = defender.defense + rolldef - defender.defense_penalty
+        down = False
+        if scorea > scored:
+            damage = scorea - scored
+            defender.hitpoints -= damage
+            #statistics
+            attacker.damage_dealt += damage
+            defender.damage_received += damage
+            if defender.hitpoints <= 0:
+                attacker.victory += 1
+                attacker.streak += 1
+                defender.lost += 1
+                defender.lastround = self.rounds
+                attacker.loot = defender.fullhealth * self.lootfactor
+                self.knock_out(defender, 1 - side)
+                down = True
+        if counterstrike:
+            attacker.defense_penalty += 1  # each counterstrike lowers defense
+        if self.log:
+            self.events.append((STRIKE, attacker, defender, rollatt, rolldef,
+                                scorea, scored, counterstrike, down,
+                                attacker.victory, defender.victory))
+        return down
+
+    def combatround(self):
+        """each awake, alive goblin (in random order) strikes a random
+        enemy, the enemy (if he survives) strikes back"""
+        self.rounds += 1
+        if self.log:
+            self.events.append((ROUND, self.rounds, len(self.alive[0]), len(self.alive[1])))
+        order = [(goblin, 0) for goblin in self.alive[0]]
+        order.extend((goblin, 1) for goblin in self.alive[1])
+        for goblin, side in order:
+            goblin.defense_penalty = 0
+        self.rng.shuffle(order)
+        random = self.rng.random
+        for attacker, side in order:
+            if attacker.hitpoints <= 0:
+                continue  # knocked out earlier in this round
+            enemies = self.alive[1 - side]
+            if not enemies:
+                continue
+            defender = enemies[int(random() * len(enemies))]
+            if self.log:
+                self.events.append((ATTACK, attacker, defender, side,
+                                    attacker.hitpoints, defender.hitpoints,
+                                    attacker.defense_penalty, defender.defense_penalty))
+            if not self.strike(attacker, defender, side):
+                self.strike(defender, attacker, 1 - side, True)
+
+    def run(self):
+        """fight until one team has no goblins left.
+        Returns the number (0 or 1) of the winning team or None"""
+        while self.alive[0] and self.alive[1]:
+            self.combatround()
+        if self.alive[0]:
+            self.winner = 0
+        elif self.alive[1]:
+            self.winner = 1
+        return self.winner
+
+    def loot(self, side):
+        """gold plundered by the awake goblins of team side"""
+        return sum(goblin.loot for goblin in self.teams[side].values() if not goblin.sleep)
+
+    def goblintext(self, goblin, hitpoints, penalty):
+        """like str(goblin), but with the hitpoints at the time of the strike"""
+        return "{:>15} ({:>2}): {:6.2f} {:6.2f} {:6.2f} {:6.2f} {} {}".format(
+            goblin.name, goblin.number, goblin.attack, goblin.defense,
+            hitpoints, goblin.value, goblin.sleep, penalty)
+
+    def text(self):
+        """yields the lines of the combat log (battle must be run with log=True)
+        and the statistics of each goblin. Call it before the goblins fight again"""
+        yield "The big battle between team {} and team {} starts:".format(*self.names)
+        for event in self.events:
+            if event[0] == ROUND:
+                yield "======================="
+                yield "---Battle round {:>4} ---".format(event[1])
+                yield "alive: {} vs. {}".format(event[2], event[3])
+                yield "--------------------------"
+            elif event[0] == ATTACK:
+                attacker, defender, side, atthp, defhp, attpen, defpen = event[1:]
+                yield "--"
+                yield ("{} (nr {}) of team {} strikes".format(attacker.name, attacker.number, self.names[side]) +
+                       " {} (nr {})  of team {}".format(defender.name, defender.number, self.names[1 - side]))
+                yield "{:<20}:  att    def      hp".format("  Strike!") + "    $  sleep def-penalty"
+                yield self.goblintext(attacker, atthp, attpen)
+                yield self.goblintext(defender, defhp, defpen)
+            else:
+                (attacker, defender, rollatt, rolldef, scorea, scored,
+                 counterstrike, down, attvictory, defvictory) = event[1:]
+                t = "counterattack" if counterstrike else "attack"
+                if counterstrike:
+                    yield "  Counterstrike of {}!".format(attacker.name)
+                yield "{} rolls {}, {} rolls {}".format(attacker.name, rollatt, defender.name, rolldef)
+                if scorea > scored:
+                    yield "Sucessfull {0} !  ({1:.2f} > {2:.2f})".format(t, scorea, scored)
+                    yield "...doing {0:.2f} damage.".format(scorea - scored)
+                    if down:
+                        yield "Victory for {}! {} goes down".format(attacker.name, defender.name)
+                        yield ("This is victory {} for {}".format(attvictory, attacker.name) +
+                               " ( {} had {} ".format(defender.name, defvictory) +
+                               " before he got down)")
+                        yield "{} wins {:.2f} gold for his team".format(
+                            attacker.name, defender.fullhealth * self.lootfactor)
+                else:
+                    yield "The {0} failed... ({1:.2f} <= {2:.2f})".format(t, scorea, scored)
+        yield "========================"
+        if self.winner is None:
+            yield "no victorous team ?"
+        else:
+            yield "team {} is victorious".format(self.names[self.winner])
+            yield "========================"
+        yield "=====--------- battle statistics -----------====="
+        for side in (0, 1):
+            yield "------ team {} ----".format(self.names[side])
+            yield "{:>20}{:>7}{:>7}{:>7}{:>7}{:>7}".format("Name:", "dmg d", "dmg r", "lst r", "streak", "loot")
+            for goblin in self.teams[side].values():
+                if goblin.sleep:
+                    continue
+                yield "{:>20}{:7.2f}{:7.2f}{:7.2f}{:7.2f}{:7.2f}".format(
+                    goblin.name, goblin.damage_dealt, goblin.damage_received,
+                    goblin.lastround, goblin.streak, goblin.loot)
+            yield "==================================="
+            yield "team {} made a sum of {:.2f} gold in this battle".format(self.names[side], self.loot(side))
+
+
+if __name__ == "__main__":
+    # benchmark: 2 teams of 5000 goblins each, with and without log
+    import time
+    import slowgoblins022 as goblins
+    for log in (False, True):
+        random.seed(1)
+        teams = ({}, {})
+        for side in (0, 1):
+            for _ in range(5000):
+                goblin = goblins.Goblin()
+                teams[side][goblin.number] = goblin
+        start = time.time()
+        battle = Battle(teams[0], teams[1], ("Alpha", "Bravo"), log=log, rng=random.Random(2))
+        winner = battle.run()
+        duration = time.time() - start
+        print("10000 goblins, log={}: {:.3f} seconds, {} rounds, winner: team {}".format(
+            log, duration, battle.rounds, battle.names[winner]))
+        if log:
+            start = time.time()
+            lines = sum(1 for line in battle.text())
+            print("   {} lines of text made in {:.3f} seconds".format(lines, time.time() - start))
@@ -24,6 +24,8 @@ import sys
 import random
 import operator
 
+import battle  # battle engine for team vs team fights, see battle.py
+
 
 class Goblin(object):
     """demo class, goblins only have a name attribute
@@ -418,168 +420,29 @@ def reroll(min_eyes, max_eyes, accu=0, depth=99):
     return reroll(min_eyes, max_eyes, accu + result - 1, depth - 1)
 
 
-def strike(attacker, defender, combatround, counterstrike=False):
-    """attacker strikes at defender. The function changes the new
-    hitpoints of the defender and returns a text String with the
-    combat report.
-    counterstrike (boolean) indicates that this is a counterattack
-    or not.
-    Each counterstrike (=being attacked) increases the defense penalty
-    by one
-    """
-    striketext = []  # a list of textlines !
-    if counterstrike:
-        t = "counterattack"
-    else:
-        t = "attack"
-
-    rollAtt = reroll(1, 6)  # allowed to re-roll if a 6 is thrown
-    rollDef = reroll(1, 6)
-    scoreA = attacker.attack + rollAtt
-    scoreD = defender.defense + rollDef - defender.defense_penalty
-    striketext.append("{} rolls {}, {} rolls {}".format(attacker.name, rollAtt, defender.name, rollDef))
-    if scoreA > scoreD:
-        striketext.append("Sucessfull {0} !  ({1:.2f} > {2:.2f})".format(t, scoreA, scoreD))
-        damage = scoreA - scoreD
-        defender.hitpoints -= damage
-        #statistics
-        attacker.damage_dealt += damage
-        defender.damage_received += damage
-        striketext.append("...doing {0:.2f} damage.".format(damage))
-        if defender.hitpoints <= 0:
-            attacker.victory += 1
-            attacker.streak += 1
-            defender.lost += 1
-            defender.lastround = combatround
-            striketext.append("Victory for {}! {} goes down".format(attacker.name, defender.name))
-            striketext.append(
-                "This is victory {} for {}".format(attacker.victory, attacker.name) +
-                " ( {} had {} ".format(defender.name, defender.victory) +
-                " before he got down)"
-            )
-            striketext.append("{} wins {:.2f} gold for his team".format(attacker.name, defender.fullhealth * Config.loot))
-            attacker.loot = defender.fullhealth * Config.loot
-    else:
-        striketext.append("The {0} failed... ({1:.2f} <= {2:.2f})".format(t, scoreA, scoreD))
-    if counterstrike:
-        attacker.defense_penalty += 1  # each counterstrike lowers defense
-    return striketext
-
-
-def combatround(a, b, number):
-    """a round of combat between team a and team b.
-    Each non-sleeping, alive (hp>0) goblin can make one stike against
-    another goblin of the enemy team.
-    Each attacked goblin (if he survive the attack) makes an counterstrike
-    against his attacker, and get his defensepenalty increased by 1
-    The effect is that many attack against a single victim are more
-    likely to suceed, but remain dangerous for the attacker"""
-    # reset all defense_penaltys to 0
-    text = []  # a list of lines !
-    for team in [a, b]:
-        for goblin in Config.teams[team].values():
-            goblin.defense_penalty = 0
-    # randomize goblin.number to process combat order
-    # TODO: give each goblin speed and initiative attributes
-    order = list(range(Goblin.number))  # list of all goblin numbers
-    random.shuffle(order)  # random ordering of those numbers
-    for gnr in order:
-        if gnr in Config.teams[a]:
-            myteam = a
-            enemyteam = b
-        elif gnr in Config.teams[b]:
-            myteam = b
-            enemyteam = a
-        else:
-            continue  # non-existing goblin ( sold? )
-        attacker = Config.teams[myteam][gnr]
-        if attacker.sleep or attacker.hitpoints <= 0:
-            continue
-        # search random victim
-        victimlist = [
-            x
-            for x in Config.teams[enemyteam].values()
-            if ((x.sleep == False) and (x.hitpoints > 0))
-        ]
-        if len(victimlist) == 0:
-            continue
-        defender = random.choice(victimlist)
-        text.append("--")
-        text.append(
-            "{} (nr {}) of team {} strikes".format(attacker.name, attacker.number, Config.team_names[a]) +
-            " {} (nr {})  of team {}".format(defender.name, defender.number, Config.team_names[b])
-        )
-        text.append("{:<20}:  att    def      hp".format("  Strike!") + "    $  sleep def-penalty")
-        text.append(str(attacker) + " {}".format(attacker.defense_penalty))
-        text.append(str(defender) + " {}".format(defender.defense_penalty))
-        text.extend(strike(attacker, defender, number, False))
-        if defender.hitpoints > 0:
-            text.append("  Counterstrike of {}!".format(defender.name))
-            text.extend(strike(defender, attacker, number, True))
-    return text
-
-
-def fight(a=0, b=1):
-    """let fight all non-sleeping, alive goblins in 2 teams versus
-       each other until one team has no goblins left"""
-    text = ["The big battle between team {} and team {} starts:".format(Config.team_names[a], Config.team_names[b])]
-    for team in [a, b]:
-        for goblin in Config.teams[team].values():
-            if not goblin.sleep:
-                goblin.prepare_for_fight()  # restore hitpoints to full etc
-    battleround = 0
-    while True:
-        battleround += 1
-        ateam = [x for x in Config.teams[a].values() if ((x.sleep == False) and (x.hitpoints > 0))]
-        bteam = [x for x in Config.teams[b].values() if ((x.sleep == False) and (x.hitpoints > 0))]
-        if len(ateam) > 0 and len(bteam) > 0:
-            text.append("=======================")
-            text.append("---Battle round {:>4} ---".format(battleround))
-            text.append("alive: {} vs. {}".format(len(ateam), len(bteam)))
-            text.append("--------------------------")
-            text.extend(combatround(a, b, battleround))
-        elif len(ateam) > 0:
-            text.append("========================")
-            text.append("team {} is victorious".format(Config.team_names[a]))
-            text.append("========================")
-            break
-        elif len(bteam) > 0:
-            text.append("========================")
-            text.append("team {} is victorious".format(Config.team_names[b]))
-            text.append("========================")
-            break
-        else:
-            text.append("no victorous team ?")
-            break
+def fight(ateam, bteam, log=True, logfilename="combatlog.txt"):
+    """let fight all non-sleeping, alive goblins of 2 teams (Team instances)
+       versus each other until one team has no goblins left.
+       The battle is done by battle.Battle (see battle.py).
+       With log=False no combat log of each strike is made (much faster
+       for big teams), only the battle statistics are printed"""
+    fightbattle = battle.Battle(ateam.members, bteam.members, (ateam.name, bteam.name), Game.loot, log)
+    winner = fightbattle.run()
+    if winner is not None:
+        (ateam, bteam)[winner].won += 1
+        (ateam, bteam)[1 - winner].lost += 1
+    for t, team in enumerate((ateam, bteam)):
+        team.gold += fightbattle.loot(t)
     # ---- battle over, print textlines
-    text.append("=====--------- battle statistics -----------=====")
-    lootsum = [0.0, 0.0]
-    for t in [a, b]:
-        text.append("------ team {} ----".format(Config.team_names[t]))
-        tl = [x for x in Config.teams[t].values() if not x.sleep]
-        text.append("{:>20}{:>7}{:>7}{:>7}{:>7}{:>7}".format("Name:", "dmg d", "dmg r", "lst r", "streak", "loot"))
-        for goblin in tl:
-            #text.append(str(goblin))
-            text.append(
-                "{:>20}{:7.2f}{:7.2f}{:7.2f}{:7.2f}{:7.2f}".format(
-                    goblin.name, goblin.damage_dealt, goblin.damage_received,
-                    goblin.lastround, goblin.streak, goblin.loot
-                )
-            )
-            lootsum[t] += goblin.loot
-        text.append("===================================")
-        text.append("team {} made a sum of {:.2f} gold in this battle".format(Config.team_names[t], lootsum[t]))
-        Config.gold[t] += lootsum[t]
-
+    text = list(fightbattle.text())
     for line in text:
         print(line)
     try:
-        with open('combatlog.txt', 'a') as logfile:
-            for line in text:
-                logfile.write(line + "\n")
-        print("combat log appended into file 'combatlog.txt'")
+        with open(logfilename, 'a') as logfile:
+            logfile.write("\n".join(text) + "\n")
+        print("combat log appended into file '{}'".format(logfilename))
     except IOError:
-        print("problem writing into file combatlog.txt")
+        print("problem writing into file {}".format(logfilename))
 
 
         # funcitons for sorting
@@ -668,7 +531,7 @@ class Game(object):
                 ["create new team", "createteam"],
                 ["delete team", "deleteteam"],
                 ["compare teams", lambda: compare_teams(0, 1)],
-                ["fight team vs team", fight],
+                ["fight team vs team", self.fight_teams],
                 ["clear combatlog.txt", clear_logfile],
                 ["show info", info]
             ],
@@ -728,6 +591,14 @@ class Game(object):
             return -1, -1
         return first, second
 
+    def fight_teams(self):
+        """ask for two team numbers and let those teams fight"""
+        a, b = self.ask_team_numbers()
+        if a == -1 or b == -1:
+            print("no valid team numbers entered")
+            return
+        fight(self.teams[a], self.teams[b])
+
     def compare_teams(self):
         a, b = self.ask_team_numbers()
         if a == -1 or b == -1:
@@ -0,0 +1,192 @@
+"""part of http://ThePythonGameBook.com
+source code:
+
+https://github.com/horstjens/ThePythonGameBook/blob/master/
+python/goblins/tournament.py
+
+headless tournament (round robin league) between many generated teams
+
+To find out if the goblin prices (Goblin.calculate_value) are fair,
+each team gets the same gold and buys random goblins until the next
+goblin is too expensive. Then each team fights each other team
+--repeats times (without input() and without combat log), using the
+battle engine of battle.py.
+The matches are split into chunks, the chunks are calculated by
+several processes (ProcessPoolExecutor). Each match has its own random
+seed made from the master seed and the match number, so the results
+do not depend on the number of processes.
+
+Files written (--out tournament.csv):
+tournament.csv            one line for each match, written while the
+                          tournament is running
+tournament_standings.csv  wins, losses, elo rating, gold spent of each team
+tournament_matrix.csv     how often team (row) won against team (column)
+
+example:
+python tournament.py --teams 8 --repeats 1000 --gold 500 --seed 1 --out tournament.csv
+"""
+__license__ = 'gpl3'  # see http://www.gnu.org/licenses/gpl.html'
+
+import argparse
+import collections
+import concurrent.futures
+import csv
+import itertools
+import os
+import random
+
+import slowgoblins022 as goblins
+import battle
+
+FIELDS = ("match", "repeat", "team_a", "team_b", "winner", "rounds",
+          "alive_a", "alive_b", "loot_a", "loot_b")
+
+_teams = None  # the teams of the tournament, set in each worker process
+
+
+def make_teams(number, gold=500, maxgoblins=20, seed=0):
+    """returns a list of number teams. Each team buys random goblins
+    with its gold until the next goblin is too expensive"""
+    random.seed(seed)  # Goblin() uses the random module
+    teams = []
+    for t in range(number):
+        team = goblins.Team("team{}".format(t))
+        team.gold = gold
+        while len(team.members) < maxgoblins:
+            goblin = goblins.Goblin("goblin {}.{}".format(t, len(team.members)))
+            if goblin.value > team.gold:
+                break
+            team.members[goblin.number] = goblin
+            team.gold -= goblin.value
+        teams.append(team)
+    return teams
+
+
+def schedule(teams, repeats):
+    """returns the list of all matches as (repeat, team a, team b)"""
+    pairs = list(itertools.combinations(range(teams), 2))
+    return [(repeat, a, b) for repeat in range(repeats) for (a, b) in pairs]
+
+
+def init_worker(teams):
+    global _teams
+    _teams = teams
+
+
+def run_chunk(matches, first, seed):
+    """worker process: fight the matches (repeat, a, b) with the match
+    numbers first, first + 1, ... and returns one result row for each"""
+    rows = []
+    for number, (repeat, a, b) in enumerate(matches, first):
+        ateam = _teams[a]
+        bteam = _teams[b]
+        fightbattle = battle.Battle(ateam.members, bteam.members, (ateam.name, bteam.name),
+                                    goblins.Game.loot, log=False,
+                                    rng=random.Random(seed * 1000003 + number))
+        winner = fightbattle.run()
+        rows.append((number, repeat, a, b, "" if winner is None else (a, b)[winner],
+                     fightbattle.rounds, len(fightbattle.alive[0]), len(fightbattle.alive[1]),
+                     round(fightbattle.loot(0), 4), round(fightbattle.loot(1), 4)))
+    return rows
+
+
+class League(object):
+    """win matrix and elo ratings of all teams"""
+
+    def __init__(self, teams, k=16, start=1500):
+        self.k = k  # elo: maximum rating change for one match
+        self.wins = [[0] * teams for _ in range(teams)]  # wins[a][b]: a won against b
+        self.draws = collections.Counter()  # (a, b): matches without winner
+        self.elo = [float(start)] * teams
+
+    def add(self, a, b, winner):
+        """count the result of a match (winner: a, b or None)"""
+        expected = 1.0 / (1 + 10 ** ((self.elo[b] - self.elo[a]) / 400.0))
+        if winner == a:
+            score = 1.0
+            self.wins[a][b] += 1
+        elif winner == b:
+            score = 0.0
+            self.wins[b][a] += 1
+        else:
+            score = 0.5
+            self.draws[a, b] += 1
+        self.elo[a] += self.k * (score - expected)
+        self.elo[b] -= self.k * (score - expected)
+
+    def standings(self, teams):
+        """returns rows (team, name, goblins, gold spent, wins, losses, win rate, elo),
+        best elo first"""
+        rows = []
+        for t, team in enumerate(teams):
+            won = sum(self.wins[t])
+            lost = sum(row[t] for row in self.wins)
+            spent = sum(goblin.value for goblin in team.members.values())
+            rows.append((t, team.name, len(team.members), round(spent, 2), won, lost,
+                         round(won / max(1, won + lost), 4), round(self.elo[t], 1)))
+        rows.sort(key=lambda row: -row[-1])
+        return rows
+
+
+def tournament(teams=8, repeats=100, gold=500, maxgoblins=20, chunksize=500,
+               workers=None, seed=0, filename="tournament.csv"):
+    """play a round robin league and write the results"""
+    league_teams = make_teams(teams, gold, maxgoblins, seed)
+    matches = schedule(teams, repeats)
+    league = League(teams)
+    print("{} teams, {} matches in chunks of {}".format(teams, len(matches), chunksize))
+    workers = workers or os.cpu_count() or 1
+    chunks = iter(range(0, len(matches), chunksize))
+    with open(filename, "w", newline="") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(FIELDS)
+        with concurrent.futures.ProcessPoolExecutor(workers, initializer=init_worker,
+                                                    initargs=(league_teams,)) as pool:
+            running = collections.deque()
+            while True:
+                # only a few chunks at once, results are used in match order (for elo)
+                for first in itertools.islice(chunks, 2 * workers - len(running)):
+                    running.append(pool.submit(run_chunk, matches[first:first + chunksize], first, seed))
+                if not running:
+                    break
+                rows = running.popleft().result()
+                writer.writerows(rows)
+                for row in rows:
+                    league.add(row[2], row[3], None if row[4] == "" else row[4])
+                print("\r{} of {} matches done".format(rows[-1][0] + 1, len(matches)), end="")
+        print()
+    base = os.path.splitext(filename)[0]
+    standings = league.standings(league_teams)
+    with open(base + "_standings.csv", "w", newline="") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(("team", "name", "goblins", "gold_spent", "wins", "losses", "winrate", "elo"))
+        writer.writerows(standings)
+    with open(base + "_matrix.csv", "w", newline="") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["wins"] + [team.name for team in league_teams])
+        for team, row in zip(league_teams, league.wins):
+            writer.writerow([team.name] + row)
+    print("{:>12} {:>7} {:>10} {:>7} {:>7} {:>8} {:>7}".format(
+        "team", "goblins", "gold spent", "wins", "losses", "winrate", "elo"))
+    for row in standings:
+        print("{:>12} {:>7} {:>10.2f} {:>7} {:>7} {:>8.4f} {:>7.1f}".format(*row[1:]))
+    return league
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="slowgoblins round robin tournament")
+    parser.add_argument("--teams", type=int, default=8, help="number of generated teams")
+    parser.add_argument("--repeats", type=int, default=100, help="matches of each pair of teams")
+    parser.add_argument("--gold", type=float, default=500, help="gold of each team for buying goblins")
+    parser.add_argument("--maxgoblins", type=int, default=20, help="maximum goblins of a team")
+    parser.add_argument("--chunk", type=int, default=500, help="matches per chunk")
+    parser.add_argument("--workers", type=int, default=None, help="number of processes")
+    parser.add_argument("--seed", type=int, default=0, help="master seed")
+    parser.add_argument("--out", default="tournament.csv", help="csv file for the matches")
+    options = parser.parse_args(args)
+    tournament(options.teams, options.repeats, options.gold, options.maxgoblins,
+               options.chunk, options.workers, options.seed, options.out)
+
+
+if __name__ == "__main__":
+    main()
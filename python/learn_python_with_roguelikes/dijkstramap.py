@@ -0,0 +1,312 @@
+# dijkstramap
+# distance maps ("Dijkstra maps") for monsters chasing or fleeing the player
+# see http://www.roguebasin.com/index.php?title=The_Incredible_Power_of_Dijkstra_Maps
+# part of http://ThePythonGameBook.com
+
+# short description:
+# instead of letting each monster search its own way to the player
+# (A* for each monster in each turn), one map is calculated for the whole level:
+# each floor cell gets the number of steps to the nearest goal (the player).
+# every monster looking at this map simply steps to the neighbour cell with
+# the smallest value (step()), so 500 monsters cost one map per turn.
+#
+# the map is only calculated again where necessary:
+#   update() calculates the map only if the goals have moved. If the player
+#     moves one step, nearly every cell of the map changes its value by one,
+#     so a new breadth first search is faster than correcting the old map.
+#     With limit (like the sniffrange of a wolf) only cells up to limit steps
+#     away from the goal are calculated, the other cells stay INF.
+#   set_passable() (a wall was dug or built) corrects only the cells
+#     around this wall whose value changed
+# goals can have several cells (multi-source) and start values.
+# flee() makes a map for fleeing monsters: they do not simply run away
+# into the next dead end, but toward far away places.
+#
+# usage:
+#   pathmap = DijkstraMap(width, height, lambda x, y: lines[y][x] != "#", limit=20)
+#   pathmap.update([(player.x, player.y)])   # once per turn
+#   pathmap.set_passable(x, y, True)         # player has dug a wall
+#   dx, dy = pathmap.step(monster.x, monster.y)
+#   fleemap = pathmap.flee()
+#   dx, dy = fleemap.step(monster.x, monster.y)
+#
+# run this file directly for a benchmark (500 monsters on a 200x200 map)
+
+import collections
+import heapq
+import time
+
+INF = float("inf")  # value of cells without way to a goal (and of walls)
+
+
+class DijkstraMap(object):
+    """steps from each cell to the nearest goal. Moves go to the 4 (or with
+    diagonal=True to the 8) neighbouring cells, each step costs 1"""
+
+    def __init__(self, width, height, passable, diagonal=False, limit=INF):
+        self.width = width
+        self.height = height
+        self.diagonal = diagonal
+        self.limit = limit  # cells more than limit steps away from the goals stay INF
+        # cells are numbered row by row, with a border of walls around the map,
+        # so a neighbour is simply cell + offset
+        self.row = width + 2
+        self.offsets = [-1, 1, -self.row, self.row]
+        if diagonal:
+            self.offsets += [-self.row - 1, -self.row + 1, self.row - 1, self.row + 1]
+        self.open = bytearray(self.row * (height + 2))  # 1 for passable cells
+        for y in range(height):
+            for x in range(width):
+                if passable(x, y):
+                    self.open[self.cell(x, y)] = 1
+        self.dist = [INF] * len(self.open)
+        self.goals = {}  # cell: start value
+        self.timing = collections.Counter()  # seconds used by compute, update, ...
+        self.calls = collections.Counter()
+
+    def cell(self, x, y):
+        return (y + 1) * self.row + x + 1
+
+    def xy(self, cell):
+        y, x = divmod(cell, self.row)
+        return x - 1, y - 1
+
+    def value(self, x, y):
+        """steps from x, y to the nearest goal (INF if there is no way)"""
+        return self.dist[self.cell(x, y)]
+
+    def compute(self, goals):
+        """calculate the whole map. goals: list of (x, y) or
+        dict {(x, y): start value, ...}"""
+        start = time.time()
+        if not isinstance(goals, dict):
+            goals = dict.fromkeys(goals, 0)
+        self.goals = dict((self.cell(x, y), value) for (x, y), value in goals.items())
+        self.dist = dist = [INF] * len(self.open)
+        opened = self.open
+        offsets = self.offsets
+        for cell, value in self.goals.items():
+            dist[cell] = value
+        if len(set(self.goals.values())) <= 1:
+            # all goals have the same value: breadth first search
+            queue = collections.deque(self.goals)
+            popleft = queue.popleft
+            append = queue.append
+            limit = self.limit
+            while queue:
+                cell = popleft()
+                d = dist[cell] + 1
+                if d > limit:
+                    break  # all cells in queue are as far away
+                for offset in offsets:
+                    n = cell + offset
+                    if opened[n] and dist[n] > d:
+                        dist[n] = d
+                        append(n)
+        else:
+            heap = [(value, cell) for cell, value in self.goals.items()]
+            heapq.heapify(heap)
+            self._dijkstra(heap)
+        self.timing["compute"] += time.time() - start
+        self.calls["compute"] += 1
+
+    def _dijkstra(self, heap):
+        """spread the values of the (value, cell) tuples in heap"""
+        dist = self.dist
+        opened = self.open
+        offsets = self.offsets
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        limit = self.limit
+        while heap:
+            d, cell = heappop(heap)
+            if d > dist[cell]:
+                continue  # already reached with a smaller value
+            d += 1
+            if d > limit:
+                break
+            for offset in offsets:
+                n = cell + offset
+                if opened[n] and dist[n] > d:
+                    dist[n] = d
+                    heappush(heap, (d, n))
+
+    def _lower(self, cell):
+        """the value of cell may have become smaller (new goal, dug wall):
+        spread it to all cells that get a smaller value"""
+        dist = self.dist
+        opened = self.open
+        offsets = self.offsets
+        queue = collections.deque([cell])
+        popleft = queue.popleft
+        append = queue.append
+        limit = self.limit
+        while queue:
+            cell = popleft()
+            d = dist[cell] + 1
+            if d > limit:
+                break
+            for offset in offsets:
+                n = cell + offset
+                if opened[n] and dist[n] > d:
+                    dist[n] = d
+                    append(n)
+
+    def _raise(self, cells):
+        """the values of cells may have become bigger (goal removed, new wall):
+        find all cells whose shortest way is lost, then calculate only those again"""
+        dist = self.dist
+        opened = self.open
+        offsets = self.offsets
+        goals = self.goals
+        lost = set()
+        heap = [(dist[cell], cell) for cell in cells if dist[cell] < INF]
+        heapq.heapify(heap)
+        while heap:
+            d, cell = heapq.heappop(heap)
+            if cell in lost or goals.get(cell) == d:
+                continue
+            if opened[cell]:
+                for offset in offsets:
+                    n = cell + offset
+                    if dist[n] == d - 1 and opened[n] and n not in lost:
+                        break  # still a shortest way over neighbour n
+                else:
+                    n = None
+                if n is not None:
+                    continue
+            lost.add(cell)
+            for offset in offsets:
+                n = cell + offset
+                if dist[n] == d + 1 and opened[n] and n not in lost:
+                    heapq.heappush(heap, (d + 1, n))  # maybe n has lost its way, too
+        for cell in lost:
+            dist[cell] = INF
+        heap = []
+        for cell in lost:
+            if not opened[cell]:
+                continue
+            best = goals.get(cell, INF)
+            for offset in offsets:
+                n = cell + offset
+                if dist[n] + 1 < best:
+                    best = dist[n] + 1
+            if best <= self.limit:
+                dist[cell] = best
+                heap.append((best, cell))
+        heapq.heapify(heap)
+        self._dijkstra(heap)
+        return len(lost)
+
+    def update(self, goals):
+        """goals for this turn (list of (x, y)), the map is calculated
+        again only if the goals have changed"""
+        if set(self.cell(x, y) for x, y in goals) != set(self.goals):
+            self.compute(goals)
+
+    def set_passable(self, x, y, passable=True):
+        """a wall was dug (passable=True) or built (passable=False) at x, y"""
+        start = time.time()
+        cell = self.cell(x, y)
+        if bool(self.open[cell]) == passable:
+            return
+        if passable:
+            self.open[cell] = 1
+            best = self.goals.get(cell, INF)
+            for offset in self.offsets:
+                best = min(best, self.dist[cell + offset] + 1)
+            if best <= self.limit:
+                self.dist[cell] = best
+                self._lower(cell)
+        else:
+            self.open[cell] = 0
+            self._raise([cell])
+        self.timing["set_passable"] += time.time() - start
+        self.calls["set_passable"] += 1
+
+    def step(self, x, y, blocked=()):
+        """returns dx, dy toward the smallest neighbour value (0, 0 if no
+        neighbour is better than x, y). blocked: (x, y) cells not to step into"""
+        dist = self.dist
+        cell = self.cell(x, y)
+        best = dist[cell]
+        bestcell = cell
+        for offset in self.offsets:
+            n = cell + offset
+            if dist[n] < best and self.open[n] and (not blocked or self.xy(n) not in blocked):
+                best = dist[n]
+                bestcell = n
+        nx, ny = self.xy(bestcell)
+        return nx - x, ny - y
+
+    def flee(self, factor=-1.2):
+        """returns a new map for fleeing from the goals of this map: each reachable
+        cell is a goal with the start value factor * steps to the goals of this map,
+        so the deepest (farthest) places attract, but a way through the pursuer does not"""
+        fleemap = DijkstraMap.__new__(DijkstraMap)
+        fleemap.__dict__.update(self.__dict__)  # same walls (self.open is shared)
+        fleemap.timing = self.timing
+        fleemap.calls = self.calls
+        start = time.time()
+        fleemap.limit = INF
+        fleemap.goals = dict((cell, factor * d) for cell, d in enumerate(self.dist) if d < INF)
+        fleemap.dist = [INF] * len(self.open)
+        for cell, value in fleemap.goals.items():
+            fleemap.dist[cell] = value
+        heap = [(value, cell) for cell, value in fleemap.goals.items()]
+        heapq.heapify(heap)
+        fleemap._dijkstra(heap)
+        self.timing["flee"] += time.time() - start
+        self.calls["flee"] += 1
+        return fleemap
+
+    def report(self):
+        """returns a text with the number of calls and milliseconds of each method"""
+        return "\n".join("dijkstramap {:>12}: {:6} calls, {:9.3f} ms per call".format(
+            name, self.calls[name], self.timing[name] * 1000 / self.calls[name])
+            for name in sorted(self.calls))
+
+
+def benchmark(limit=INF, turns=100, size=200, monsters=500, seed=1):
+    """monsters hunting a player on a size x size cave map, prints timings"""
+    import random
+    random.seed(seed)
+    rock = set((random.randrange(size), random.randrange(size)) for _ in range(size * size // 4))
+    passable = lambda x, y: (x, y) not in rock and 0 < x < size - 1 and 0 < y < size - 1
+    floor = [(x, y) for y in range(size) for x in range(size) if passable(x, y)]
+    px, py = random.choice(floor)
+    places = random.sample(floor, monsters)
+    pathmap = DijkstraMap(size, size, passable, diagonal=True, limit=limit)
+    steps = 0.0
+    for turn in range(turns):
+        dx, dy = random.choice(((0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (-1, -1)))
+        if passable(px + dx, py + dy):
+            px, py = px + dx, py + dy
+        pathmap.update([(px, py)])
+        if turn % 10 == 0:
+            x, y = random.choice(floor)
+            pathmap.set_passable(x, y, False)  # build a wall
+            pathmap.set_passable(x, y, True)  # dig it again
+        start = time.time()
+        occupied = set(places)
+        for i, (mx, my) in enumerate(places):
+            dx, dy = pathmap.step(mx, my, occupied)
+            if (dx, dy) != (0, 0):
+                occupied.discard((mx, my))
+                places[i] = (mx + dx, my + dy)
+                occupied.add(places[i])
+        steps += time.time() - start
+    # the corrected map must be the same as a new map
+    check = DijkstraMap(size, size, lambda x, y: pathmap.open[pathmap.cell(x, y)], True, limit)
+    check.compute([(px, py)])
+    assert check.dist == pathmap.dist, "corrected map differs from a new map"
+    pathmap.flee()
+    print("{} turns, {}x{} map, {} monsters, limit {}:".format(turns, size, size, monsters, limit))
+    print(pathmap.report())
+    print("dijkstramap {:>12}: {:6} turns, {:9.3f} ms per turn".format(
+        "monster step", turns, steps * 1000 / turns))
+
+
+if __name__ == "__main__":
+    benchmark()
+    benchmark(limit=20)
@@ -0,0 +1,240 @@
+# fov
+# field of view: which cells of the dungeon can the player see?
+# see http://www.roguebasin.com/index.php?title=FOV_using_recursive_shadowcasting
+# part of http://ThePythonGameBook.com
+
+# short description:
+# two ways to find the visible cells around the player (x, y) inside radius:
+#   mode "shadow": recursive shadowcasting. Each of the 8 octants is scanned
+#     row by row, walls throw shadows (slopes) that are not scanned again.
+#   mode "rays": rays from the player to each cell at the border of the radius,
+#     made with get_line() of bresenham.py. A ray stops at the first wall.
+#     the rays (as dx, dy offsets) are made only once for each radius.
+# compute() remembers its results: standing at the same place with the same
+# map (same version, see set_transparent()) costs nothing.
+# each visible cell is also marked in the explored map, so a game can show
+# the visible cells, the cells seen before (explored) and nothing else.
+#
+# usage:
+#   fov = FieldOfView(width, height, lambda x, y: lines[y][x] != "#", radius=8)
+#   visible = fov.compute(player.x, player.y)   # frozenset of (x, y)
+#   if (x, y) in visible: ... elif fov.is_explored(x, y): ... else: " "
+#   fov.set_transparent(x, y, True)             # player has dug a wall
+#
+# run this file directly for a benchmark (radius 8, 16, 32 against get_line()
+# for each cell)
+
+import collections
+import time
+
+from bresenham import get_line
+
+# transform the octant (dx, dy) into the real direction: xx, xy, yx, yy
+OCTANTS = ((1, 0, 0, 1), (0, 1, 1, 0), (0, -1, 1, 0), (-1, 0, 0, 1),
+           (-1, 0, 0, -1), (0, -1, -1, 0), (0, 1, -1, 0), (1, 0, 0, -1))
+
+
+class FieldOfView(object):
+    """visible cells (inside radius) of a map and all cells ever seen"""
+
+    rays = {}  # radius: list of rays, each ray a list of (dx, dy), shared by all instances
+
+    def __init__(self, width, height, transparent, radius=8, mode="shadow", maxcache=1000):
+        self.width = width
+        self.height = height
+        self.radius = radius
+        self.mode = mode  # "shadow" or "rays"
+        self.opaque = bytearray(width * height)  # 1 for walls (cells you can not see through)
+        for y in range(height):
+            for x in range(width):
+                if not transparent(x, y):
+                    self.opaque[y * width + x] = 1
+        self.explored = bytearray(width * height)  # 1 for cells seen before
+        self.version = 0  # changes with each set_transparent()
+        self.maxcache = maxcache
+        self.cache = {}  # (x, y, radius, mode, version): frozenset of (x, y)
+        self.visible = frozenset()  # result of the last compute()
+        self.hits = 0
+        self.misses = 0
+        self.seconds = 0.0  # used by compute() without cache hits
+
+    def is_explored(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height and self.explored[y * self.width + x] == 1
+
+    def set_transparent(self, x, y, transparent=True):
+        """a wall was dug (transparent=True) or built: older results are useless"""
+        if self.opaque[y * self.width + x] == (not transparent):
+            return
+        self.opaque[y * self.width + x] = not transparent
+        self.version += 1
+        self.cache.clear()
+
+    def compute(self, x, y, radius=None, mode=None):
+        """returns the frozenset of (x, y) cells visible from x, y"""
+        radius = self.radius if radius is None else radius
+        mode = mode or self.mode
+        key = (x, y, radius, mode, self.version)
+        visible = self.cache.get(key)
+        if visible is not None:
+            self.hits += 1
+        else:
+            start = time.time()
+            if mode == "shadow":
+                visible = self.shadowcast(x, y, radius)
+            elif mode == "rays":
+                visible = self.raycast(x, y, radius)
+            else:
+                raise UserWarning("unknown fov mode: {}".format(mode))
+            if len(self.cache) >= self.maxcache:
+                self.cache.clear()
+            self.cache[key] = visible
+            for vx, vy in visible:
+                self.explored[vy * self.width + vx] = 1
+            self.seconds += time.time() - start
+            self.misses += 1
+        self.visible = visible
+        return visible
+
+    def shadowcast(self, x, y, radius):
+        """recursive shadowcasting in all 8 octants"""
+        visible = set([(x, y)])
+        for octant in OCTANTS:
+            self._castlight(visible, x, y, 1, 1.0, 0.0, radius, octant)
+        return frozenset(visible)
+
+    def _castlight(self, visible, cx, cy, row, start, end, radius, octant):
+        """scan the rows row..radius of one octant between the slopes start and end"""
+        if start < end:
+            return
+        xx, xy, yx, yy = octant
+        width = self.width
+        height = self.height
+        opaque = self.opaque
+        radius2 = radius * radius
+        newstart = start
+        for j in range(row, radius + 1):
+            dx = -j - 1
+            dy = -j
+            blocked = False
+            while dx <= 0:
+                dx += 1
+                leftslope = (dx - 0.5) / (dy + 0.5)
+                rightslope = (dx + 0.5) / (dy - 0.5)
+                if start < rightslope:
+                    continue
+                if end > leftslope:
+                    break
+                mx = cx + dx * xx + dy * xy
+                my = cy + dx * yx + dy * yy
+                inside = 0 <= mx < width and 0 <= my < height
+                wall = not inside or opaque[my * width + mx]
+                if inside and dx * dx + dy * dy <= radius2:
+                    visible.add((mx, my))
+                if blocked:
+                    if wall:
+                        newstart = rightslope  # still in the shadow of a wall
+                        continue
+                    blocked = False
+                    start = newstart
+                elif wall and j < radius:
+                    # a wall starts: scan the next rows beside its shadow, go on behind it
+                    blocked = True
+                    self._castlight(visible, cx, cy, j + 1, start, leftslope, radius, octant)
+                    newstart = rightslope
+            if blocked:
+                break
+
+    @classmethod
+    def get_rays(cls, radius):
+        """the rays (lists of dx, dy) from 0, 0 to each cell at the border of
+        radius, made with get_line() only once for each radius"""
+        if radius not in cls.rays:
+            radius2 = radius * radius
+            rays = []
+            for i in range(-radius, radius + 1):
+                for end in ((i, -radius), (i, radius), (-radius, i), (radius, i)):
+                    ray = []
+                    line = get_line((0, 0), end)
+                    for dx, dy in line[1:]:
+                        if dx * dx + dy * dy > radius2:
+                            break
+                        ray.append((dx, dy))
+                    rays.append(ray)
+            cls.rays[radius] = rays
+        return cls.rays[radius]
+
+    def raycast(self, x, y, radius):
+        """bresenham rays from x, y to the border of radius, each ray stops at a wall"""
+        width = self.width
+        height = self.height
+        opaque = self.opaque
+        visible = set([(x, y)])
+        for ray in self.get_rays(radius):
+            for dx, dy in ray:
+                mx = x + dx
+                my = y + dy
+                if not (0 <= mx < width and 0 <= my < height):
+                    break
+                visible.add((mx, my))
+                if opaque[my * width + mx]:
+                    break
+        return frozenset(visible)
+
+    def bruteforce(self, x, y, radius):
+        """for comparison: one get_line() for each cell inside radius.
+        A cell is visible if no wall is between it and x, y"""
+        width = self.width
+        opaque = self.opaque
+        visible = set()
+        for my in range(max(0, y - radius), min(self.height, y + radius + 1)):
+            for mx in range(max(0, x - radius), min(width, x + radius + 1)):
+                if (mx - x) ** 2 + (my - y) ** 2 > radius * radius:
+                    continue
+                for lx, ly in get_line((x, y), (mx, my))[1:-1]:
+                    if opaque[ly * width + lx]:
+                        break
+                else:
+                    visible.add((mx, my))
+        return frozenset(visible)
+
+    def report(self):
+        """returns a text with cache hits and the time used by compute()"""
+        return "fov: {} computed ({:.3f} ms each), {} from cache, {} of {} cells explored".format(
+            self.misses, self.seconds * 1000 / max(1, self.misses), self.hits,
+            sum(self.explored), self.width * self.height)
+
+
+def benchmark(size=200, repeats=200, seed=1):
+    """prints milliseconds per fov for radius 8, 16, 32 with each mode"""
+    import random
+    random.seed(seed)
+    rock = set((random.randrange(size), random.randrange(size)) for _ in range(size * size // 10))
+    places = [(random.randrange(size), random.randrange(size)) for _ in range(repeats)]
+    print("{}x{} map, 10% walls, {} places, milliseconds per fov:".format(size, size, repeats))
+    print("{:>6} {:>10} {:>10} {:>10} {:>10} {:>10}".format(
+        "radius", "get_line", "shadow", "rays", "cached", "same cells"))
+    for radius in (8, 16, 32):
+        fov = FieldOfView(size, size, lambda x, y: (x, y) not in rock, radius)
+        FieldOfView.get_rays(radius)  # not timed: made only once
+        timings = collections.OrderedDict()
+        results = {}
+        for name, function in (("get_line", fov.bruteforce), ("shadow", fov.shadowcast),
+                               ("rays", fov.raycast)):
+            start = time.time()
+            results[name] = [function(x, y, radius) for x, y in places]
+            timings[name] = (time.time() - start) * 1000 / repeats
+        for x, y in places:
+            fov.compute(x, y)
+        start = time.time()
+        for x, y in places:
+            fov.compute(x, y)  # same places again: from cache
+        timings["cached"] = (time.time() - start) * 1000 / repeats
+        same = sum(len(a & b) / float(len(a | b)) for a, b in zip(results["shadow"], results["get_line"]))
+        print("{:>6} {:>10.3f} {:>10.3f} {:>10.3f} {:>10.4f} {:>9.1f}%".format(
+            radius, timings["get_line"], timings["shadow"], timings["rays"], timings["cached"],
+            same * 100 / repeats))
+    print("(same cells: shadowcasting compared with get_line for each cell)")
+
+
+if __name__ == "__main__":
+    benchmark()
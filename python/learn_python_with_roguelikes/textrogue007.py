@@ -1,9 +1,14 @@
 # DungeonLevel class, LEGEND,  multi-level dungeons, Door and keys
-# not used yet: panic attribute, __repr__ to print monsters
+# not used yet: __repr__ to print monsters
+# wolves find the player (around walls) with one shared distance map, see dijkstramap.py
+# the player sees only the dungeon around him (and remembers what he saw), see fov.py
 
 
 import random
 
+from dijkstramap import DijkstraMap
+from fov import FieldOfView
+
 # legend: #=rock  .=floor  f=food  $=gold l=loot ?=mushroom T=Trader
 
 PROMPT = 'Type your command or ? and press Enter:'
@@ -42,7 +47,7 @@ DUNGEON2 = '''
 ##################################################
 '''  # add more lines to the dungeon!
 
-lines = DUNGEON.split()
+lines = DUNGEON1.split()
 DUNGEONWIDTH = len(lines[0])
 DUNGEONHEIGHT = len(lines)
 
@@ -52,6 +57,9 @@ class Game(object):
     players = []
     monsters = {}
     graveyard = []
+    pathmap = None  # DijkstraMap: steps to the player, shared by all monsters (see game())
+    fleemap = None  # DijkstraMap for fleeing monsters, made only if needed (see fleemap())
+    fov = None  # FieldOfView: the player sees only a part of the dungeon (see game())
 
 class DungeonLevel(object):
     """holds one complete floor of th edungeon, including all monsters"""
@@ -119,7 +127,7 @@ class Player(Monster):
 class Statue(Monster):
     """a stationary monster with tons of hitpoints but no defense"""
 
-    def __init__(self, x, y, z, char="S"):
+    def __init__(self, x, y, z=1, char="S"):
         Monster.__init__(self, x, y, z, char)  # ------- important ---------
         # --- overwriting default monster attributes ------
         self.hitpoints = int(random.gauss(20, 5))
@@ -130,26 +138,20 @@ class Statue(Monster):
 class Wolf(Monster):
     """a clever Monster tracking the player"""
 
-    def __init__(self, x, y, char="W"):
+    def __init__(self, x, y, z=1, char="W"):
         Monster.__init__(self, x, y, z, char)  # ------- important ---------
         # --- overwriting default monster attributes ------
         self.panic = random.random() * 0.2  # 20% panic at max
         self.sniffrange = random.randint(5, 10)
 
     def ai(self, player_x, player_y):
-        """returns dx, dy toward player if inside sniffrange"""
-        if distance(self.x, self.y, player_x, player_y) < self.sniffrange:
-            dx, dy = 0, 0
-            if player_x > self.x:
-                dx = 1
-            elif player_x < self.x:
-                dx = -1
-            if player_y > self.y:
-                dy = 1
-            elif player_y < self.y:
-                dy = -1
-        else:
-            dx, dy = random.randint(-1, 1), random.randint(-1, 1)
+        """returns dx, dy toward player (around walls) if the way to the player
+        is shorter than sniffrange, or away from the player in panic"""
+        if Game.pathmap.value(self.x, self.y) < self.sniffrange:
+            if random.random() < self.panic:
+                return fleemap().step(self.x, self.y)
+            return Game.pathmap.step(self.x, self.y)
+        dx, dy = random.randint(-1, 1), random.randint(-1, 1)
         if dx != 0 and dy != 0:
             # do not allow diagonal movement
             if random.random() < 0.5:
@@ -159,6 +161,13 @@ class Wolf(Monster):
         return dx, dy
 
 
+def fleemap():
+    """the flee map of this turn, calculated when the first monster needs it"""
+    if Game.fleemap is None:
+        Game.fleemap = Game.pathmap.flee()
+    return Game.fleemap
+
+
 def battle(m1, m2):
     """a battle round between two monsters/players. m1 attacks m2"""
     attackroll = random.randint(1, 6) + random.randint(1, 6)
@@ -224,7 +233,7 @@ def replace_tile(lines, x, y, newTile="."):
 
 def game(lines):
     message = 'welcome @, move with w,a,s,d'
-    player1 = Player(1, 1, "@")
+    player = Player(1, 1, 1, name="@")
 
     # ------- create monsters (once) ---------
     for y, line in enumerate(lines):
@@ -236,28 +245,37 @@ def game(lines):
             elif char == "W":
                 Wolf(x, y)
                 lines = replace_tile(lines, x, y, ".")
+    # ------- one distance map for all monsters (walls, trader and mushrooms block them) -------
+    Game.pathmap = DijkstraMap(len(lines[0]), len(lines), lambda x, y: lines[y][x] not in "#T?", limit=10)
+    # ------- walls and doors block the view -------
+    Game.fov = FieldOfView(len(lines[0]), len(lines), lambda x, y: lines[y][x] not in "#D", radius=8)
     # ------------the game begins ----------------------
-    while hunger < 100 and player1.hitpoints > 0:
+    while player.hunger < 100 and player.hitpoints > 0:
         # ------ Print dungeon -------
+        visible = Game.fov.compute(player.x, player.y)
         for y, line in enumerate(lines):
             # y is the line number starting with 0      
             newline = ""
             for x in range(len(line)):
+                if (x, y) not in visible:
+                    # seen before: the dungeon without monsters, else nothing
+                    newline += lines[y][x] if Game.fov.is_explored(x, y) else " "
+                    continue
                 char = "_"
                 char = lines[y][x]
-                for monsternumber in Monster.monsterdict:
-                    monster = Monster.monsterdict[monsternumber]
+                for monsternumber in Game.monsters:
+                    monster = Game.monsters[monsternumber]
                     if monster.x == x and monster.y == y:
                         char = monster.char
                 newline += char
             print(newline)
         # ------ Command processing ---------
 
-        command = input('{}\n{}\n{}'.format(message, player1.status(), PROMPT))
+        command = input('{}\n{}\n{}'.format(message, player.status(), PROMPT))
         message = ''
         delta_x, delta_y = 0, 0
-        hunger += 1  # getting more hungry, whatever you do
-        mana += 0.1  # very slow mana regeneration
+        player.hunger += 1  # getting more hungry, whatever you do
+        player.mana += 0.1  # very slow mana regeneration
         if random.random() < 0.01:
             player.hitpoints += 1  # 1% chance to regain a hitpoint
         if command in ['help', '?']:
@@ -265,12 +283,12 @@ def game(lines):
         elif command in ['exit', 'q', 'quit', 'leave']:
             break  # exit the game
         elif command in ['e', 'eat']:
-            if food > 0:
+            if player.food > 0:
                 message = 'you eat food'
-                food -= 1
-                hunger -= random.randint(5, 15)
-                if hunger < 0:
-                    hunger = 0
+                player.food -= 1
+                player.hunger -= random.randint(5, 15)
+                if player.hunger < 0:
+                    player.hunger = 0
                     message += ' but your belly is already full'
             else:
                 message = 'You have no food!'
@@ -285,11 +303,11 @@ def game(lines):
             delta_y = 1  # go down
         # ---- jumping costs mana and makes hungry
         elif "jump" in command:
-            if mana < 5:
-                message += not_enough(5, mana, "mana")
+            if player.mana < 5:
+                message += not_enough(5, player.mana, "mana")
             else:
-                hunger += 1
-                mana -= 5
+                player.hunger += 1
+                player.mana -= 5
                 if command == "jump a":
                     delta_x = -2  # jump left   
                     message += "you jump west\n"
@@ -304,10 +322,10 @@ def game(lines):
                     delta_y = 2  # jump down
         # --- jump spell ------
         elif "dig" in command:
-            if mana < 50:
-                message += not_enough(50, mana, "mana")
+            if player.mana < 50:
+                message += not_enough(50, player.mana, "mana")
             else:
-                mana -= 50
+                player.mana -= 50
                 if command == "dig w":
                     delta_y = -1
                     message += "you dig north"
@@ -322,43 +340,45 @@ def game(lines):
                     message += "you dig east"
                 # ---- replace target with floor tile ----
                 lines = replace_tile(lines, player.x + delta_x, player.y + delta_y, ".")
+                Game.pathmap.set_passable(player.x + delta_x, player.y + delta_y, True)
+                Game.fov.set_transparent(player.x + delta_x, player.y + delta_y, True)
         elif lines[player.y][player.x] == "T":
             # -----special command if player is on a Trader position ---
             if command == "mana":
-                if loot > 0:
-                    loot -= 1
-                    mana += 10
+                if player.loot > 0:
+                    player.loot -= 1
+                    player.mana += 10
                     message += "you trade loot for mana"
                 else:
-                    message += not_enough(1, loot, "loot")
+                    message += not_enough(1, player.loot, "loot")
             elif command == "food":
-                if loot > 1:
-                    loot -= 2
-                    food += 10
+                if player.loot > 1:
+                    player.loot -= 2
+                    player.food += 10
                     message += "you trade loot for food"
                 else:
-                    message += not_enough(2, loot, "loot")
+                    message += not_enough(2, player.loot, "loot")
             elif command == "health":
-                if loot > 2:
-                    loot -= 3
-                    player_hitpoints += 10
+                if player.loot > 2:
+                    player.loot -= 3
+                    player.hitpoints += 10
                     message += "you trade loot for health"
                 else:
-                    message += not_enough(3, loot, "loot")
+                    message += not_enough(3, player.loot, "loot")
             elif command == "loot":
-                if gold > 4:
-                    gold -= 5
-                    loot += 1
+                if player.gold > 4:
+                    player.gold -= 5
+                    player.loot += 1
                     message += "you buy one loot for 5 gold"
                 else:
-                    message += not_enough(5, gold, "gold")
+                    message += not_enough(5, player.gold, "gold")
         # ------ blink spell teleports to a random floor nearby -----
         elif command == "blink":
-            if mana < 10:
-                message += not_enough(10, mana, "mana")
+            if player.mana < 10:
+                message += not_enough(10, player.mana, "mana")
             else:
                 delta_x, delta_y = blink(player.x, player.y)
-                mana -= 10
+                player.mana -= 10
                 message += "you blink magically"
         # ----- check if movement is valid ------
         if not is_inside_dungeon(player.x + delta_x, player.y + delta_y):
@@ -367,10 +387,10 @@ def game(lines):
         target = lines[player.y + delta_y][player.x + delta_x]
         # ----- check if running into another monster ------
         cleanlist = []
-        for monsternumber in Monster.monsterdict:
+        for monsternumber in Game.monsters:
             if monsternumber == 1:
                 continue  # player is monster number 1
-            monster = Monster.monsterdict[monsternumber]
+            monster = Game.monsters[monsternumber]
             if monster.x == player.x + delta_x and monster.y == player.y + delta_y:
                 # ---- fight !!! ----
                 print("player fights monster!")
@@ -388,7 +408,7 @@ def game(lines):
                     # remove monster
                     cleanlist.append(monsternumber)
         for number in cleanlist:
-            del Monster.monsterdict[number]
+            del Game.monsters[number]
 
 
             # ----
@@ -408,22 +428,22 @@ def game(lines):
             # ----- things that can be collected or instantly used up ------
             if target == 'f':
                 message += 'you found food!'
-                food += 1
+                player.food += 1
             elif target == 'k':
                 message += 'you found a key!'
-                keys += 1
+                player.keys += 1
             elif target == 'l':
                 message += 'you found loot!'
-                loot += 1
+                player.loot += 1
             elif target == '$':
                 message += 'you found gold!'
-                gold += 1
+                player.gold += 1
             elif target == '?':
                 message += 'You trample on a magic mushroom! The fairies living inside are very upset'
                 fate = random.randint(1, 10)
                 if fate == 1:
                     message += "\nYou eat the mushroom. It tastes boring"
-                    hunger -= 2
+                    player.hunger -= 2
                 elif fate == 2:
                     message += "\nThe fairies attack you"
                     player.hitpoints -= 5
@@ -432,36 +452,39 @@ def game(lines):
                     player.hitpoints = 1
                 elif fate == 4:
                     message += "\nThe fairies steal all your food"
-                    food = 0
+                    player.food = 0
                 elif fate == 5:
                     message += "\nThe fairies steall all your gold"
-                    gold = 0
+                    player.gold = 0
                 elif fate == 6:
                     message += "\nYou find some fairy gold and take it"
-                    gold += 10
+                    player.gold += 10
                 elif fate == 7:
                     message += "\nYou find some useful fairy stuff"
-                    loot += 1
+                    player.loot += 1
                 elif fate == 8:
                     message += "\nYou eat some fairys. The taste is very strange"
-                    mana += 5
+                    player.mana += 5
                 elif fate == 9:
                     message += "\nThe fairy shaman steals all your mana"
-                    mana = 0
+                    player.mana = 0
                 elif fate == 10:
                     message += "\nThe fairies curse you but nothing happens"
             # ---- replace target with floor tile ----
             lines = replace_tile(lines, player.x + delta_x, player.y + delta_y, ".")
+            Game.pathmap.set_passable(player.x + delta_x, player.y + delta_y, True)
         # ---- update player position -----
         player.x += delta_x  # movement x
         player.y += delta_y  # movement y
+        Game.pathmap.update([(player.x, player.y)])  # only if the player has moved
+        Game.fleemap = None
         # ---- update moving monsters -----
         cleanlist = []
         monsterplaces = set()
-        for monsternumber in Monster.monsterdict:
+        for monsternumber in Game.monsters:
             if monsternumber == 1:
                 continue  # player is monster number 1
-            monster = Monster.monsterdict[monsternumber]
+            monster = Game.monsters[monsternumber]
             dx, dy = monster.ai(player.x, player.y)
             if monster.x + dx == player.x and monster.y + dy == player.y:
                 print("Monster moves into player!")
@@ -482,10 +505,10 @@ def game(lines):
                 # TODO several monsters can be in the same location
         # ------ clean dead monsters -----
         for number in cleanlist:
-            del Monster.monsterdict[number]
+            del Game.monsters[number]
 
     else:
-        print("hitpoints: {}, hunger: {}".format(player.hitpoints, hunger))
+        print("hitpoints: {}, hunger: {}".format(player.hitpoints, player.hunger))
     print('Game Over')
 
 
@@ -14,6 +14,7 @@
 # each level has 3 stairs down and 3 stairs up
 
 import random
+import collections
 
 #class Config(object):
 #    """all user-changable constants for the game. ideal for modding"""
@@ -75,6 +76,8 @@ LEGEND = {
     "p": "player",
     "q": "questitem"
 }
+# (blockrow, blockcol) of all blocks of a room, in the order of printroom()
+BLOCKKEYS = [(blockrow, blockcol) for blockrow in range(1, BLOCKROOT + 1) for blockcol in range(1, BLOCKROOT + 1)]
 
 
 class Room(object):
@@ -262,10 +265,12 @@ class Level(object):
     book = {}
 
     #levelnumber = 0
-    def __init__(self, number=1):
+    def __init__(self, number=1, generate=True):
         """create level with random rooms.
         set player_position if levelnumber is 1
-        set questitem if levelnumber is DEEPEST_LEVEL"""
+        set questitem if levelnumber is DEEPEST_LEVEL
+        with generate=False, only the rooms are created (to import a level
+        with importlevel() or frombytes())"""
         self.level = number
         Level.book[number] = self  # store the whole class instance into a class dict
         for row in list(range(1, ROOMROOT + 1)):
@@ -277,7 +282,8 @@ class Level(object):
         #self.dirtyrooms = set() # used for pathfinding. A set has only unique items, no doublets
         #self.used_doors = 0 # check how long pathfinding is running, break if necessary
         self.doors = {}
-        self.unused_doors = {}
+        if not generate:
+            return
         # create stairs
         while len(self.stairsup) < STAIRS:
             row, col, blockrow, blockcol = self.placeme()
@@ -311,60 +317,14 @@ class Level(object):
             row, col, blockrow, blockcol = self.placeme()
             Room.book[(self.level, row, col)].blocks[(blockrow, blockcol)] = "p"
         # --------------- level validation -----------------
-        # test if player can reach a stairdown
-        #self.dirtyrooms.clear() # clear the set
-        self.unused_doors = self.doors.copy()  # have a fresh dict of unused doors
-
-        print("initiating pathfinding...")
-        if self.findpath(row, col, ">"):
-            print("player can reach stair down")
-            #pass
-        else:
-            print("player has no path to stair down")
-            #raise Exception("this level is invalid. please create another one").with_traceback(tracebackobj)
-            # fix this level !
-            target = random.choice(self.stairsdown)  # select one of the stairdowns in this level and create a path to it
-            targetrow = target[0]
-            targetcol = target[1]
-            print("creating tunnel....")
-            self.create_tunnel(row, col, targetrow, targetcol)  # create a tunnel to the target room, by making doors
+        # make doors until each room (and so each stair and the player) can be reached
+        self.connect_rooms()
 
         # set questitem in DEEPEST_LEVEL
         if self.level == DEEPEST_LEVEL:
             row, col, blockrow, blockcol = self.placeme()
             Room.book[(self.level, row, col)].blocks[(blockrow, blockcol)] = "q"
 
-    def create_tunnel(self, startrow, startcol, targetrow, targetcol):
-        """to make walking from startroom to targetroom possible,
-        this method will create some necessary doors"""
-        deltax = targetcol - startcol
-        deltay = targetrow - startrow
-        dx = 0
-        dy = 0
-        if deltax != 0:
-            dx = deltax / abs(deltax)  # if negative, makes -1, else, makes 1
-        if deltay != 0:
-            dy = deltay / abs(deltay)
-        #print("I start tunneling in rwo %i col %i"%(startrow, startcol))
-        for x in list(range(abs(deltax))):
-            if dx == -1:
-                Room.book[(self.level, startrow, startcol + x * dx)].make_door("west")
-                #print('tunneling west')
-            elif dx == 1:
-                Room.book[(self.level, startrow, startcol + x * dx)].make_door("east")
-                #print('tunneling east')
-        for y in list(range(abs(deltay))):
-            print("y::::row: %i col %i ynow: %i xnow: %i" % (startrow, startcol, startrow + y * dy, startcol + x * dx))
-            if dy == -1:
-                # i am not sure but i feel the (x+1) is because i want to be in this room, not just
-                # make a door into this room.
-                Room.book[(self.level, startrow + y * dy, startcol + (x + 1) * dx) ].make_door("north")
-                #print('tunneling north')
-            elif dy == 1:
-                Room.book[(self.level, startrow + y * dy, startcol + (x + 1) * dx) ].make_door("south")
-                #print('tunneling south')
-        self.recalculate_directions()  # update level map
-
     def recalculate_directions(self):
         """after importing a level from textfile,
         after generating a level, or after creating doors,
@@ -427,32 +387,62 @@ class Level(object):
                                 self.doors[(row, col)].append("east")
                                 break
 
+    def connect_rooms(self):
+        """make doors between rooms until each room can be reached from each other room.
+        rooms connected by doors (or missing walls) are one group (union-find),
+        each wall between rooms of two different groups (in random order) gets a door
+        and the groups are joined. returns the number of new doors"""
+        group = {}  # room: another room of the same group, or itself
+
+        def find(room):
+            while group[room] != room:
+                group[room] = group[group[room]]  # shorten the way for the next search
+                room = group[room]
+            return room
+
+        for row in list(range(1, ROOMROOT + 1)):
+            for col in list(range(1, ROOMROOT + 1)):
+                group[(row, col)] = (row, col)
+        for (row, col), directions in self.doors.items():
+            for direction in directions:
+                # cardinalsdict is {dir:(counterdir, dy, dx)}
+                group[find((row, col))] = find((row + CARDINALSDICT[direction][1], col + CARDINALSDICT[direction][2]))
+        walls = [((row, col), "south") for row in range(1, ROOMROOT) for col in range(1, ROOMROOT + 1)]
+        walls.extend(((row, col), "east") for row in range(1, ROOMROOT + 1) for col in range(1, ROOMROOT))
+        random.shuffle(walls)
+        newdoors = 0
+        for (row, col), direction in walls:
+            counterdirection, dy, dx = CARDINALSDICT[direction]
+            first = find((row, col))
+            second = find((row + dy, col + dx))
+            if first != second:
+                Room.book[(self.level, row, col)].make_door(direction)
+                self.doors[(row, col)].append(direction)  # no need to recalculate all directions
+                self.doors[(row + dy, col + dx)].append(counterdirection)
+                group[first] = second
+                newdoors += 1
+        return newdoors
+
     def findpath(self, row, col, target=">"):
-        """returns True if there exist a path from row/col toward a target block"""
-        print("finding path from %s %s to %s" % (row, col, target))
-        if self.testroom(row, col, target):
-            return True
-        else:
-            if len(self.unused_doors[(row, col)]) > 0:
-                for direction in CARDINALS:
-                    if direction in self.unused_doors[(row, col)]:
-                        self.unused_doors[(row, col)].remove(direction)
-                        # cardinalsdict is {dir:(counterdir, dy, dx)}
-                        dx = CARDINALSDICT[direction][2]
-                        dy = CARDINALSDICT[direction][1]
-                        if self.findpath(row + dy, col + dx, target):
-                            return True
-            else:
-                #self.dirtyrooms.add((row, col)) # this room is searched
-                return False
+        """returns True if there exist a path from row/col toward a target block
+        (breadth first search through the doors of the rooms)"""
+        visited = set([(row, col)])
+        todo = collections.deque([(row, col)])
+        while todo:
+            row, col = todo.popleft()
+            if self.testroom(row, col, target):
+                return True
+            for direction in self.doors[(row, col)]:
+                # cardinalsdict is {dir:(counterdir, dy, dx)}
+                nextroom = (row + CARDINALSDICT[direction][1], col + CARDINALSDICT[direction][2])
+                if nextroom not in visited:
+                    visited.add(nextroom)
+                    todo.append(nextroom)
+        return False
 
     def testroom(self, row, col, target=">"):
         """returns True if the target ist in the room"""
-        teststring = Room.book[(self.level, row, col)].printroom(False)
-        if target in teststring:
-            return True  # valid path in same room
-        else:
-            return False
+        return target in Room.book[(self.level, row, col)].blocks.values()
 
     def placeme(self):
         """returns an empty random position to place stuff"""
@@ -487,6 +477,30 @@ class Level(object):
         f.write(self.printlevel(False))
         f.close()
 
+    def tobytes(self):
+        """returns the whole level as bytes, one byte (char) for each block,
+        like printlevel() without newlines"""
+        return self.printlevel(False).replace("\n", "").encode("ascii")
+
+    def frombytes(self, data):
+        """import a single level from tobytes() data. much faster than importlevel(),
+        because each room gets all of its blocks at once"""
+        text = data.decode("ascii")
+        width = ROOMROOT * BLOCKROOT  # blocks in one line of the level
+        self.stairsdown = []  # stuff that __init__ does normally
+        self.stairsup = []
+        for row in list(range(1, ROOMROOT + 1)):
+            for col in list(range(1, ROOMROOT + 1)):
+                start = (row - 1) * BLOCKROOT * width + (col - 1) * BLOCKROOT  # topleft block of room
+                chars = "".join(text[start + line * width:start + line * width + BLOCKROOT] for line in range(BLOCKROOT))
+                Room.book[(self.level, row, col)].blocks = dict(zip(BLOCKKEYS, chars))
+        for char, stairs in ((">", self.stairsdown), ("<", self.stairsup)):
+            index = text.find(char)
+            while index != -1:
+                y, x = divmod(index, width)
+                stairs.append((y // BLOCKROOT + 1, x // BLOCKROOT + 1, y % BLOCKROOT + 1, x % BLOCKROOT + 1))
+                index = text.find(char, index + 1)
+
     def importlevel(self, filename="level.txt"):
         """import a single level from file"""
         self.stairsdown = []  # stuff that __init__ does normally
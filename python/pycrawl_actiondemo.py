@@ -8,9 +8,24 @@
 # this is a demo where the player (@) can interact with monsters ( battle ), traps, doors etc.
 # the player can pick up and drop items. he also has an inventory
 # later on, certain monsters should also be able to pick up at last one item
+# hostile monsters hunt the player (or flee when badly hurt) along the distance
+# maps of dijkstramap.py, shared by all monsters of a level
+# the player sees only the cells in his field of view (fov.py) and remembers
+# the floor tiles he saw before
 #
 
+import os
 import random
+import sys
+
+# dijkstramap.py and fov.py are in the learn_python_with_roguelikes folder, next
+# to textrogue007.py, the tutorial that explains them. Both games use the same
+# files, so the folder is added to the import path (relative to this file, so
+# the game can be started from any folder). Keep this file and that folder
+# together when you copy the game.
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "learn_python_with_roguelikes"))
+from dijkstramap import DijkstraMap
+from fov import FieldOfView
 
 
 class Game(object):
@@ -24,6 +39,8 @@ class Game(object):
     history = ""
     deadmonsters = []
     gameloop = True  # if False, the game is over
+    huntrange = 20  # hostile monsters farther away (in steps) do not find the player
+    fovradius = 8  # how far the player can see (None: the whole level is visible)
     screen = None  # output = None # output instance
     #            key, x, y # y from top to down, x from left to right
     dirs = {
@@ -100,7 +117,13 @@ class Game(object):
 
 class Level(object):
     """a representation of the current level (lots of GameObjects)
-    The level instances live inside Game.level{} """
+    The level instances live inside Game.level{}
+    items and monsters are also indexed by position: self.items[(x, y)] and
+    self.monsters[(x, y)] are lists of GameObject numbers (in the order they
+    came to this position). Use add_item(), remove_item(), add_monster(),
+    remove_monster() and move_monster() to keep the index up to date.
+    Positions where something changed are collected in self.changed for
+    Output.drawlevel()"""
 
     def __init__(self, rawlevel, levelnumber):
         self.levelnumber = levelnumber
@@ -119,7 +142,18 @@ class Level(object):
                 self.pos[c, r] = -1  # not defined game object number #
         self.monsterkeys = []
         self.itemkeys = []
+        self.items = {}  # (x, y): [itemnumber, ...]
+        self.monsters = {}  # (x, y): [monsternumber, ...]
+        self.changed = set()  # (x, y) positions to draw again
         self.interpret_rawlevel()
+        # steps to the player for all monsters of this level, see update_pathmap()
+        self.pathmap = DijkstraMap(
+            self.cols, self.rows, self.walkable, diagonal=True, limit=Game.huntrange
+        )
+        self.fleemap = None
+        self.fov = FieldOfView(
+            self.cols, self.rows, self.transparent, Game.fovradius or 1
+        )
         self.do_output()
 
     def do_output(self):
@@ -161,34 +195,120 @@ class Level(object):
                         Game.player.levelnumber = self.levelnumber
 
                 elif rawchar in "MZ":  # monster
-                    self.monsterkeys.append(
+                    self.add_monster(
                         Monster(
                             x, y, self.levelnumber, rawchar
                         ).number
                     )
                 elif rawchar in "tbm:":  #item
                     # create Item
-                    self.itemkeys.append(
+                    self.add_item(
                         Item(
                             x, y, self.levelnumber, rawchar
                         ).number
                     )
                 elif rawchar == "?":  # heap of random items
                     for a in range(random.randint(2, 6)):
-                        self.itemkeys.append(
+                        self.add_item(
                             Item(
                                 x, y, self.levelnumber, ":"
                             ).number
                         )
 
+    def walkable(self, x, y):
+        """True if monsters (and the player) can walk on the floor tile at x, y"""
+        return GameObject.book[self.pos[(x, y)]].char not in "#X"
+
+    def transparent(self, x, y):
+        """True if the player can see through the floor tile at x, y"""
+        return GameObject.book[self.pos[(x, y)]].char not in "#XD"
+
+    def look(self):
+        """frozenset of (x, y) positions the player can see on this level
+        (None if Game.fovradius is None: all positions are visible)"""
+        if Game.fovradius is None:
+            return None
+        if Game.player.levelnumber != self.levelnumber:
+            return frozenset()
+        return self.fov.compute(Game.player.x, Game.player.y, Game.fovradius)
+
+    def update_pathmap(self):
+        """once each turn, before the monsters move"""
+        self.pathmap.update([(Game.player.x, Game.player.y)])
+        self.fleemap = None  # made by Monster.hunt() if a monster wants to flee
+
+    def add_item(self, number):
+        """put item number on the floor at the item's x, y"""
+        item = GameObject.book[number]
+        self.itemkeys.append(number)
+        self.items.setdefault((item.x, item.y), []).append(number)
+        self.changed.add((item.x, item.y))
+
+    def remove_item(self, number):
+        """take item number away from the floor (picked up, destroyed)"""
+        item = GameObject.book[number]
+        self.itemkeys.remove(number)
+        here = self.items[(item.x, item.y)]
+        here.remove(number)
+        if not here:
+            del self.items[(item.x, item.y)]
+        self.changed.add((item.x, item.y))
+
+    def add_monster(self, number):
+        monster = GameObject.book[number]
+        self.monsterkeys.append(number)
+        self.monsters.setdefault((monster.x, monster.y), []).append(number)
+        self.changed.add((monster.x, monster.y))
+
+    def remove_monster(self, number):
+        monster = GameObject.book[number]
+        self.monsterkeys.remove(number)
+        here = self.monsters[(monster.x, monster.y)]
+        here.remove(number)
+        if not here:
+            del self.monsters[(monster.x, monster.y)]
+        self.changed.add((monster.x, monster.y))
+
+    def move_monster(self, number, x, y):
+        """move monster number to x, y and update the index"""
+        monster = GameObject.book[number]
+        here = self.monsters[(monster.x, monster.y)]
+        here.remove(number)
+        if not here:
+            del self.monsters[(monster.x, monster.y)]
+        self.changed.add((monster.x, monster.y))
+        monster.x = x
+        monster.y = y
+        self.monsters.setdefault((x, y), []).append(number)
+        self.changed.add((x, y))
+
+    def items_at(self, x, y):
+        """list of itemnumbers at x, y (do not change this list)"""
+        return self.items.get((x, y), [])
+
+    def monsters_at(self, x, y):
+        """list of monsternumbers at x, y (do not change this list)"""
+        return self.monsters.get((x, y), [])
+
+    def char(self, x, y):
+        """the char to display at x, y: player, monster, item(s) or floor tile"""
+        p = Game.player
+        if p.x == x and p.y == y and p.levelnumber == self.levelnumber:
+            return "@"
+        here = self.monsters.get((x, y))
+        if here:
+            return GameObject.book[here[-1]].char
+        here = self.items.get((x, y))
+        if here:
+            if len(here) > 1:
+                return "?"
+            return GameObject.book[here[0]].char
+        return GameObject.book[self.pos[(x, y)]].char
+
     def pickup(self, x, y):
         """a list of items on this positoin, but not traps"""
-        ilist = []
-        for i in self.itemkeys:
-            if GameObject.book[i].char != "t":  # you can not pick up traps
-                if GameObject.book[i].x == x and GameObject.book[i].y == y:
-                    ilist.append(i)
-        return ilist
+        # you can not pick up traps
+        return [i for i in self.items_at(x, y) if GameObject.book[i].char != "t"]
 
     def inspect(self, x, y):
         """gives back a multi-line string describing the actual floor tile, neigboring tiles and all items on this floor tile"""
@@ -223,32 +343,38 @@ class Output(object):
         self.map = []  # self.ground_map = list(map(list, rawlevel.split()))
         # create dummy string of empty tiles
         self.map = [["." for x in range(cols)] for y in range(rows)]
+        self.levelnumber = None  # level drawn into self.map
+        self.visible = frozenset()  # positions visible at the last drawlevel()
 
         #print("map:", self.map)
 
     def drawlevel(self, levelnumber):
+        """draw the positions of the level that changed since the last call
+        (all positions if the level was not drawn before).
+        Positions the player can not see keep the char he saw there before
+        (or are empty if he never saw them).
+        returns the number of drawn positions"""
         level = Game.level[levelnumber]
-        for y in range(level.rows):
-            for x in range(level.cols):
-                # ground
-                char = GameObject.book[level.pos[(x, y)]].char
-                # items
-                itemcount = 0
-                for i in level.itemkeys:
-                    if GameObject.book[i].x == x and GameObject.book[i].y == y:
-                        char = GameObject.book[i].char  #overwrite floor with item
-                        itemcount += 1
-                if itemcount > 1:
-                    char = "?"
-                # monsters
-                for m in level.monsterkeys:
-                    if GameObject.book[m].x == x and GameObject.book[m].y == y:
-                        char = GameObject.book[m].char  #overwrite floor with item
-                # player
-                if Game.player.x == x and Game.player.y == y:
-                    char = "@"
-                #print("y,x",y,x)
-                self.map[y][x] = char  # set char
+        visible = level.look()
+        if levelnumber != self.levelnumber:
+            self.levelnumber = levelnumber
+            cells = level.pos  # all positions
+        elif visible is None:
+            cells = level.changed
+        else:
+            # changes the player can see and positions he sees now, but not before
+            cells = (level.changed & visible) | (visible - self.visible)
+        for (x, y) in cells:
+            if visible is None or (x, y) in visible:
+                self.map[y][x] = level.char(x, y)  # set char
+            elif level.fov.is_explored(x, y):
+                self.map[y][x] = GameObject.book[level.pos[(x, y)]].char  # remembered floor tile
+            else:
+                self.map[y][x] = " "
+        drawn = len(cells)
+        self.visible = visible or frozenset()
+        level.changed.clear()
+        return drawn
 
     def make_screenstring(self):
         return "\n".join(self)
@@ -325,9 +451,9 @@ class Mover(GameObject):
     def trapcheck(self):
         #check if on trap and subtract hitpoints
         mylevel = Game.level[self.levelnumber]
-        for ik in mylevel.itemkeys:
+        for ik in mylevel.items_at(self.x, self.y):
             mi = GameObject.book[ik]
-            if mi.char == "t" and mi.x == self.x and mi.y == self.y:
+            if mi.char == "t":
                 return mi.power  # the damage of the trap
         return 0  # no trap, no damage
 
@@ -346,15 +472,15 @@ class Monster(Mover):
         self.lowenergy = 10
         self.highenergy = 30
         self.hostile = False  # hostile to player ?
+        self.fleehitpoints = 4  # flee from the player with less hitpoints
 
     def kill(self):
         """do all the stuff necessary, like transforming yourself into a corpse etc."""
         mylevel = Game.level[self.levelnumber]
         Game.deadmonsters.append(self.number)  # add my number to the graveyard
-        myindex = mylevel.monsterkeys.index(self.number)
-        del (mylevel.monsterkeys[myindex])
+        mylevel.remove_monster(self.number)
         #create dead corpse item
-        mylevel.itemkeys.append(
+        mylevel.add_item(
             Item(
                 self.x, self.y, self.levelnumber, "m"
             ).number
@@ -364,22 +490,47 @@ class Monster(Mover):
         # staying on a trap cost hitpoints
         if self.trapcheck() > 0:
             #self.msg += "Ouch! You stand on a trap and loose one hitpoint!"
-            self.hitpoints -= self.trapcheck
+            self.hitpoints -= self.trapcheck()
             if self.hitpoints < 0:
                 self.kill()
+                return
 
         if self.mood == "roam":
+            if self.hostile:
+                self.hunt()
             # move around
             self.energy -= 1  # roaming cost energy
             if self.energy < self.lowenergy:
                 self.mood = "sleep"
                 self.char = "Z"  # sleeping Monster
+                Game.level[self.levelnumber].changed.add((self.x, self.y))
 
         elif self.mood == "sleep":
             self.energy += 1  # sleeping regains energy
             if self.energy > self.highenergy:
                 self.mood = "roam"
                 self.char = "M"  # Monster
+                Game.level[self.levelnumber].changed.add((self.x, self.y))
+
+
+    def hunt(self):
+        """attack the player if he is near, else step toward him (or away from
+        him if badly hurt) on the distance maps of the level"""
+        mylevel = Game.level[self.levelnumber]
+        if self.hitpoints < self.fleehitpoints:
+            if mylevel.fleemap is None:
+                mylevel.fleemap = mylevel.pathmap.flee()
+            pathmap = mylevel.fleemap
+        elif mylevel.pathmap.value(self.x, self.y) == 1:  # next to the player
+            # action() first: Player.kill() adds its message to Game.player.msg
+            result = action(self, Game.player, "attack")
+            Game.player.msg += "\n" + result
+            return
+        else:
+            pathmap = mylevel.pathmap
+        dx, dy = pathmap.step(self.x, self.y, mylevel.monsters)
+        if dx != 0 or dy != 0:
+            mylevel.move_monster(self.number, self.x + dx, self.y + dy)
 
 
 class Player(Mover):
@@ -406,13 +557,9 @@ class Player(Mover):
             return False
         else:
             # check if moving into a monster
-            mokeys = Game.level[self.levelnumber].monsterkeys
-            for mk in mokeys:
-                if GameObject.book[mk].x == newx and GameObject.book[
-                    mk
-                ].y == newy:
-                    self.msg = "Moving not possible, You can not walk into a monster. Try action instead."
-                    return False
+            if Game.level[self.levelnumber].monsters_at(newx, newy):
+                self.msg = "Moving not possible, You can not walk into a monster. Try action instead."
+                return False
             return True
 
     def statstring(self):
@@ -434,8 +581,11 @@ class Player(Mover):
                 self.kill()
 
     def move(self, dx, dy):
+        changed = Game.level[self.levelnumber].changed
+        changed.add((self.x, self.y))
         self.x = self.x + dx
         self.y = self.y + dy
+        changed.add((self.x, self.y))
         self.msg = "Moving (dx: %i dy: %i) sucessfull" % (dx, dy)
 
     def inventory(self):
@@ -481,11 +631,7 @@ class Player(Mover):
                     ], groundaction
                 )
             )
-        actionitemkeys = []
-        for k in Game.level[self.levelnumber].itemkeys:
-            if GameObject.book[k].x == x and GameObject.book[k].y == y:
-                actionitemkeys.append(k)
-        for ak in actionitemkeys:
+        for ak in Game.level[self.levelnumber].items_at(x, y):
             aklist = GameObject.book[ak].actionlist
             for aka in aklist:
                 li.append(
@@ -494,12 +640,7 @@ class Player(Mover):
                             ak].longtext, self, GameObject.book[ak], aka
                     )
                 )
-        monsterkeys = Game.level[self.levelnumber].monsterkeys
-        actionmonsterkeys = []
-        for mk in monsterkeys:
-            if GameObject.book[mk].x == x and GameObject.book[mk].y == y:
-                actionmonsterkeys.append(mk)
-        for monsterkey in actionmonsterkeys:
+        for monsterkey in Game.level[self.levelnumber].monsters_at(x, y):
             ml = GameObject.book[monsterkey].actionlist
             for action in ml:
                 li.append(
@@ -518,8 +659,7 @@ class Player(Mover):
         else:
             for f in foundlist:
                 self.itemkeys.append(f)
-                i = Game.level[self.levelnumber].itemkeys.index(f)
-                del Game.level[self.levelnumber].itemkeys[i]
+                Game.level[self.levelnumber].remove_item(f)
             self.msg = "%i item(s) picked up and added to inventory" % len(
                 foundlist
             )
@@ -539,7 +679,7 @@ class Player(Mover):
             # update Item x,y with player x,y
             GameObject.book[itemnumber].x = self.x
             GameObject.book[itemnumber].y = self.y
-            Game.level[self.levelnumber].itemkeys.append(itemnumber)
+            Game.level[self.levelnumber].add_item(itemnumber)
             i = self.itemkeys.index(itemnumber)
             del self.itemkeys[i]
             self.msg = "item dropped"
@@ -570,7 +710,7 @@ def action(actor, victim, functionstring):
             )
             actor.hitpoints -= damage
             if actor.hitpoints < 0:
-                msg += "% dies!" % actor.shorttext
+                msg += "%s dies!" % actor.shorttext
                 actor.kill()
         else:
             msg += "%s dies!" % victim.shorttext
@@ -609,16 +749,15 @@ def action(actor, victim, functionstring):
         )
         mylevel = Game.level[Game.player.levelnumber]
         trapkey = victim.number
-        i = mylevel.itemkeys.index(trapkey)
         if actor.trapskill > difficulty * 2:
             msg += "Your excellent trap skill allows you tu disarm and re-use the trap ! The trap is now in your inventory.\n"
             # remove trap from level
-            del (mylevel.itemkeys[i])
+            mylevel.remove_item(trapkey)
             # add trap to player inventory
             actor.itemkeys.append(victim.number)
         elif actor.trapskill > difficulty:
             msg += "You manage to disarm the trap. The trap is destroyed"
-            del (mylevel.itemkeys[i])
+            mylevel.remove_item(trapkey)
         else:
             actor.hitpoints -= victim.power
             msg += "Ouch ! You fail at disarming and loose %i hitpoints. The trap is still dangerous.\n" % victim.power
@@ -683,9 +822,7 @@ XXXXXXXXXXXXXXXXXXXXXXXXX
         elif i in Game.dirs.keys():
             dx, dy = Game.dirs[i]
             if p.checkmove(dx, dy):
-                p.move(dx, dy)
-                Game.screen.drawlevel(Game.player.levelnumber)
-                print(Game.screen.make_screenstring())
+                p.move(dx, dy)  # the screen is printed after the monsters moved
         elif i == "p":  #pickup
             p.pickup()
         elif i == "d":  # drop
@@ -735,21 +872,22 @@ XXXXXXXXXXXXXXXXXXXXXXXXX
                 else:
                     selected = alist[int(i3)]  # ( actiontext, actor, victim, function)
                     p.msg = "You try to perform this action: %s" % selected[0]
-                    p.msg += "\n" + action(
-                        selected[1], selected[2], selected[3]
-                    )
+                    result = action(selected[1], selected[2], selected[3])
+                    p.msg += "\n" + result  # after action(): it may add the death message
                 #p.msg = "" # clear player status message
             else:
                 p.msg = "unknown direction for action. action canceled"
         # ------------- update ----------
         p.update()  # player is on a trap ?
-        for mok in Game.level[p.levelnumber].monsterkeys:
+        Game.level[p.levelnumber].update_pathmap()
+        for mok in list(Game.level[p.levelnumber].monsterkeys):
             GameObject.book[mok].update()  # update each monster
         # ------------ output -----------
         if p.msg:  # if p.msg != ""
             print(p.msg)
-        # force redraw when changing levels
-        if oldlevelnumber != Game.player.levelnumber:
+        # print the screen once, after the player and the monsters moved:
+        # when changing levels or if anything changed on the level
+        if oldlevelnumber != Game.player.levelnumber or Game.level[p.levelnumber].changed:
             Game.screen.drawlevel(Game.player.levelnumber)
             print(Game.screen.make_screenstring())
 
@@ -0,0 +1,130 @@
+# pycrawl_levelgen
+# generate many pycrawl levels at once and store them in one compact binary file
+# 2012 by Horst JENS   horstjens@gmail.com
+# license: gpl3 see http://www.gnu.org/copyleft/gpl.html
+# this game is a part of http://ThePythonGameBook.com
+
+# short description:
+# each level is made by pycrawl.Level (rooms, doors, stairs; all rooms are
+# connected with pycrawl.Level.connect_rooms()), with its own random seed,
+# so level i of a batch is always the same, no matter how many processes
+# (ProcessPoolExecutor) made the batch.
+# the levels are written into one binary file:
+#   header: MAGIC, version, ROOMROOT, BLOCKROOT, number of levels
+#   zlib compressed: for each level the level number, the seed and
+#                    one byte (char) for each block (pycrawl.Level.tobytes())
+# loading this file does not need to parse each char like
+# pycrawl.Level.importlevel(): see load() and pycrawl.Level.frombytes()
+#
+# example:
+# python pycrawl_levelgen.py --levels 1000 --seed 1 --out levels.bin
+# (prints levels per second for generating, saving and loading)
+
+import argparse
+import concurrent.futures
+import os
+import random
+import shutil
+import struct
+import tempfile
+import time
+import zlib
+
+import pycrawl
+
+MAGIC = b"PCRL"
+VERSION = 1
+HEADER = struct.Struct("<4sBBBI")  # magic, version, roomroot, blockroot, number of levels
+RECORD = struct.Struct("<HI")  # level number, seed
+LEVELSIZE = (pycrawl.ROOMROOT * pycrawl.BLOCKROOT) ** 2  # bytes (blocks) of one level
+
+
+def generate_level(job):
+    """worker: job is (level number, seed). returns (level number, seed, bytes of the level)"""
+    number, seed = job
+    random.seed(seed)
+    level = pycrawl.Level(number)
+    return number, seed, level.tobytes()
+
+
+def generate(levels, seed=0, workers=None, chunksize=50):
+    """returns a list of (level number, seed, bytes) for levels levels.
+    level i has the level number i % DEEPEST_LEVEL + 1 and the seed seed * levels + i"""
+    jobs = [(i % pycrawl.DEEPEST_LEVEL + 1, seed * levels + i) for i in range(levels)]
+    if workers == 1:
+        return [generate_level(job) for job in jobs]
+    with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+        return list(pool.map(generate_level, jobs, chunksize=chunksize))
+
+
+def save(filename, batch):
+    """write a list of (level number, seed, bytes) into a binary file"""
+    body = b"".join(RECORD.pack(number, seed) + data for number, seed, data in batch)
+    with open(filename, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, pycrawl.ROOMROOT, pycrawl.BLOCKROOT, len(batch)))
+        f.write(zlib.compress(body))
+
+
+def load(filename):
+    """read a binary file made by save(), returns a list of (level number, seed, bytes)"""
+    with open(filename, "rb") as f:
+        raw = f.read()
+    magic, version, roomroot, blockroot, levels = HEADER.unpack_from(raw)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("{} is not a pycrawl level file (version {})".format(filename, VERSION))
+    if (roomroot, blockroot) != (pycrawl.ROOMROOT, pycrawl.BLOCKROOT):
+        raise ValueError("{} has levels with ROOMROOT {} and BLOCKROOT {}".format(filename, roomroot, blockroot))
+    body = zlib.decompress(raw[HEADER.size:])
+    step = RECORD.size + LEVELSIZE
+    batch = []
+    for start in range(0, levels * step, step):
+        number, seed = RECORD.unpack_from(body, start)
+        batch.append((number, seed, body[start + RECORD.size:start + step]))
+    return batch
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="generate many pycrawl levels")
+    parser.add_argument("--levels", type=int, default=1000, help="number of levels")
+    parser.add_argument("--seed", type=int, default=0, help="master seed")
+    parser.add_argument("--workers", type=int, default=None, help="number of processes")
+    parser.add_argument("--out", default="levels.bin", help="binary file for the levels")
+    options = parser.parse_args(args)
+
+    start = time.time()
+    batch = generate(options.levels, options.seed, options.workers)
+    duration = time.time() - start
+    print("generated {} levels in {:.2f} seconds: {:.0f} levels per second".format(
+        len(batch), duration, len(batch) / duration))
+    start = time.time()
+    save(options.out, batch)
+    print("saved into {} ({} bytes, {:.1f} bytes per level) in {:.3f} seconds".format(
+        options.out, os.path.getsize(options.out), os.path.getsize(options.out) / len(batch),
+        time.time() - start))
+    # ---- loading: binary file into pycrawl levels, compared with importlevel() of text files
+    start = time.time()
+    loaded = load(options.out)
+    for number, seed, data in loaded:
+        level = pycrawl.Level.book.get(number) or pycrawl.Level(number, generate=False)
+        level.frombytes(data)
+    duration = time.time() - start
+    print("loaded {} levels with frombytes() in {:.3f} seconds: {:.0f} levels per second".format(
+        len(loaded), duration, len(loaded) / duration))
+    # the same levels as text files (not timed), then importlevel() of each text file
+    textdir = tempfile.mkdtemp()
+    textfiles = []
+    for i, (number, seed, data) in enumerate(loaded):
+        pycrawl.Level.book[number].frombytes(data)
+        textfiles.append((number, os.path.join(textdir, "level{}.txt".format(i))))
+        pycrawl.Level.book[number].exportlevel(textfiles[-1][1])
+    start = time.time()
+    for number, textfile in textfiles:
+        pycrawl.Level.book[number].importlevel(textfile)
+    duration = time.time() - start
+    shutil.rmtree(textdir)
+    print("loaded the same levels with importlevel() in {:.3f} seconds: {:.0f} levels per second".format(
+        duration, len(loaded) / duration))
+
+
+if __name__ == "__main__":
+    main()